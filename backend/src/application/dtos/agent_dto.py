@@ -23,6 +23,8 @@ class AgentResponseDTO:
     metadata: dict[str, Any]
     post_count: int = 0
     reply_count: int = 0
+    deleted_count: int = 0
+    last_active_at: str | None = None
 
 
 @dataclass
@@ -34,3 +36,5 @@ class AgentListItemDTO:
     created_at: str
     post_count: int = 0
     reply_count: int = 0
+    deleted_count: int = 0
+    last_active_at: str | None = None
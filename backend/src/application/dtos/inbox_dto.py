@@ -0,0 +1,36 @@
+"""Inbox DTOs (Data Transfer Objects)."""
+
+from dataclasses import dataclass, field
+
+
+@dataclass
+class GetInboxDTO:
+    """DTO for reading an agent's notifications."""
+
+    agent_name: str
+    limit: int = 50
+    cursor: int | None = None
+    mark_read: bool = False
+
+
+@dataclass
+class NotificationDTO:
+    """DTO for a reply that concerns an agent."""
+
+    reply_id: str
+    post_id: str
+    parent_id: str
+    agent_name: str
+    reasons: list[str]
+    occurred_at: str
+    title: str | None = None
+    excerpt: str | None = None
+
+
+@dataclass
+class InboxPageDTO:
+    """DTO for one page of notifications."""
+
+    notifications: list[NotificationDTO] = field(default_factory=list)
+    next_cursor: int = 0
+    has_more: bool = False
@@ -44,6 +44,15 @@ class PostListItemDTO:
     deleted: bool = False
 
 
+@dataclass
+class PostPageDTO:
+    """DTO for one page of a post listing."""
+
+    posts: list[PostListItemDTO]
+    next_cursor: str | None = None
+    estimated_total: int | None = None
+
+
 @dataclass
 class ReplyResponseDTO:
     """DTO for reply response."""
@@ -63,7 +72,11 @@ class ReplyResponseDTO:
 
 @dataclass
 class SearchPostsDTO:
-    """DTO for searching posts."""
+    """DTO for searching posts.
+
+    ``tags`` holds tag query terms: a post must carry one of the plain tags,
+    every tag prefixed with '+' and none prefixed with '-'.
+    """
 
     query: str | None = None
     tags: list[str] | None = None
@@ -73,3 +86,13 @@ class SearchPostsDTO:
     include_deleted: bool = False
     limit: int = 50
     offset: int = 0
+    sort_by: str = "newest"
+    cursor: str | None = None
+
+
+@dataclass
+class TagCountDTO:
+    """DTO for a tag and how many visible posts carry it."""
+
+    tag: str
+    post_count: int
@@ -0,0 +1,39 @@
+"""Update DTOs (Data Transfer Objects)."""
+
+from dataclasses import dataclass, field
+
+
+@dataclass
+class GetUpdatesDTO:
+    """DTO for reading the changes made after a sequence number."""
+
+    since: int = 0
+    agent_name: str | None = None
+    scope: str = "all"
+    limit: int = 50
+    include_content: bool = False
+
+
+@dataclass
+class UpdateDTO:
+    """DTO for one change to the board."""
+
+    seq: int
+    type: str
+    occurred_at: str
+    post_id: str
+    agent_name: str
+    reply_id: str | None = None
+    parent_id: str | None = None
+    title: str | None = None
+    content: str | None = None
+
+
+@dataclass
+class UpdatesPageDTO:
+    """DTO for one page of changes."""
+
+    updates: list[UpdateDTO] = field(default_factory=list)
+    next_since: int = 0
+    has_more: bool = False
+    reset: bool = False
@@ -0,0 +1,303 @@
+"""Event handlers that keep indexes, counters, the change feed and inboxes in sync with writes."""
+
+from src.domain.events import (
+    AgentRegistered,
+    DomainEvent,
+    PostCreated,
+    PostDeleted,
+    ReplyAdded,
+    ReplyDeleted,
+)
+from src.domain.repositories.agent_repository import IAgentRepository
+from src.domain.repositories.post_repository import IPostRepository
+from src.domain.repositories.search_repository import ISearchRepository
+from src.domain.value_objects.agent_name import AgentName
+from src.domain.value_objects.post_id import PostId
+from src.infrastructure.events.change_log import ChangeLog
+from src.infrastructure.events.event_bus import EventBus
+from src.infrastructure.indexes.agent_index import AgentIndex
+from src.infrastructure.indexes.post_index import PostIndex
+from src.infrastructure.persistence.agent_inbox import AgentInbox
+
+
+class IndexEventHandler:
+    """Updates the post, agent and full-text indexes after a write.
+
+    The post and agent indexes are only kept by the file backend; without
+    them, only the full-text index is updated. Events only carry IDs, so each
+    handler reloads what it indexes from the repository. Soft-deleted posts
+    and replies are still stored, so an event that is handled after a later
+    delete still finds its data, and the delete event that follows it leaves
+    the indexes consistent.
+    """
+
+    def __init__(
+        self,
+        post_repository: IPostRepository,
+        agent_repository: IAgentRepository,
+        search_repository: ISearchRepository,
+        post_index: PostIndex | None,
+        agent_index: AgentIndex | None,
+    ) -> None:
+        """Initialize handler.
+
+        Args:
+            post_repository: Post repository
+            agent_repository: Agent repository
+            search_repository: Search repository (full-text index)
+            post_index: Post index (None if the backend keeps none)
+            agent_index: Agent index (None if the backend keeps none)
+        """
+        self._post_repository = post_repository
+        self._agent_repository = agent_repository
+        self._search_repository = search_repository
+        self._post_index = post_index
+        self._agent_index = agent_index
+
+    def subscribe(self, event_bus: EventBus) -> None:
+        """Subscribe the handlers to an event bus.
+
+        Args:
+            event_bus: Event bus
+        """
+        event_bus.subscribe(PostCreated, self.on_post_created)
+        event_bus.subscribe(ReplyAdded, self.on_reply_added)
+        event_bus.subscribe(ReplyDeleted, self.on_reply_deleted)
+        if self._post_index is not None:
+            event_bus.subscribe(PostDeleted, self.on_post_deleted)
+        if self._agent_index is not None:
+            event_bus.subscribe(AgentRegistered, self.on_agent_registered)
+
+    def on_post_created(self, event: PostCreated) -> None:
+        """Add a new post to the post index and the full-text index.
+
+        Args:
+            event: Post created event
+        """
+        post = self._post_repository.find_by_id(
+            PostId(event.post_id), include_deleted=True, include_replies=False
+        )
+        if post is None:
+            return
+        if self._post_index is not None:
+            self._post_index.add_post(post.to_dict(include_replies=False))
+        self._search_repository.index_post(post)
+
+    def on_post_deleted(self, event: PostDeleted) -> None:
+        """Mark a deleted post in the post index.
+
+        Args:
+            event: Post deleted event
+        """
+        post = self._post_repository.find_by_id(
+            PostId(event.post_id), include_deleted=True, include_replies=False
+        )
+        if post is None or self._post_index is None:
+            return
+        self._post_index.update_post(event.post_id, post.to_dict(include_replies=False))
+
+    def on_reply_added(self, event: ReplyAdded) -> None:
+        """Add a new reply's text to its post's full-text document.
+
+        Args:
+            event: Reply added event
+        """
+        reply = self._post_repository.find_reply_by_id(PostId(event.post_id), event.reply_id)
+        if reply is not None:
+            self._search_repository.index_reply(reply)
+
+    def on_reply_deleted(self, event: ReplyDeleted) -> None:
+        """Remove a deleted reply's text from its post's full-text document.
+
+        Args:
+            event: Reply deleted event
+        """
+        reply = self._post_repository.find_reply_by_id(PostId(event.post_id), event.reply_id)
+        if reply is not None:
+            self._search_repository.unindex_reply(reply)
+
+    def on_agent_registered(self, event: AgentRegistered) -> None:
+        """Add a new agent to the agent index.
+
+        Args:
+            event: Agent registered event
+        """
+        agent = self._agent_repository.find_by_name(AgentName(event.agent_name))
+        if agent is not None and self._agent_index is not None:
+            self._agent_index.add_agent(agent.to_dict())
+
+
+class AgentStatsEventHandler:
+    """Maintains the per-agent activity counters."""
+
+    def __init__(self, agent_repository: IAgentRepository) -> None:
+        """Initialize handler.
+
+        Args:
+            agent_repository: Agent repository
+        """
+        self._agent_repository = agent_repository
+
+    def subscribe(self, event_bus: EventBus) -> None:
+        """Subscribe the handlers to an event bus.
+
+        Args:
+            event_bus: Event bus
+        """
+        event_bus.subscribe(PostCreated, self.on_post_created)
+        event_bus.subscribe(PostDeleted, self.on_post_deleted)
+        event_bus.subscribe(ReplyAdded, self.on_reply_added)
+        event_bus.subscribe(ReplyDeleted, self.on_reply_deleted)
+
+    def on_post_created(self, event: PostCreated) -> None:
+        """Count a new post.
+
+        Args:
+            event: Post created event
+        """
+        self._agent_repository.update_stats(
+            AgentName(event.agent_name), post_delta=1, active_at=event.occurred_at
+        )
+
+    def on_post_deleted(self, event: PostDeleted) -> None:
+        """Move a post from the live to the deleted count.
+
+        Args:
+            event: Post deleted event
+        """
+        self._agent_repository.update_stats(
+            AgentName(event.agent_name), post_delta=-1, deleted_delta=1, active_at=event.occurred_at
+        )
+
+    def on_reply_added(self, event: ReplyAdded) -> None:
+        """Count a new reply.
+
+        Args:
+            event: Reply added event
+        """
+        self._agent_repository.update_stats(
+            AgentName(event.agent_name), reply_delta=1, active_at=event.occurred_at
+        )
+
+    def on_reply_deleted(self, event: ReplyDeleted) -> None:
+        """Move a reply from the live to the deleted count.
+
+        Args:
+            event: Reply deleted event
+        """
+        self._agent_repository.update_stats(
+            AgentName(event.agent_name),
+            reply_delta=-1,
+            deleted_delta=1,
+            active_at=event.occurred_at,
+        )
+
+
+class ChangeFeedEventHandler:
+    """Records post and reply events in the change log served by the stream endpoint."""
+
+    def __init__(self, change_log: ChangeLog) -> None:
+        """Initialize handler.
+
+        Args:
+            change_log: Change log
+        """
+        self._change_log = change_log
+
+    def subscribe(self, event_bus: EventBus) -> None:
+        """Subscribe the handler to an event bus.
+
+        Args:
+            event_bus: Event bus
+        """
+        for event_type in (PostCreated, PostDeleted, ReplyAdded, ReplyDeleted):
+            event_bus.subscribe(event_type, self.on_change)
+
+    def on_change(self, event: DomainEvent) -> None:
+        """Append an event to the change log.
+
+        Args:
+            event: Post or reply event
+        """
+        self._change_log.append(event)
+
+
+class InboxEventHandler:
+    """Delivers new replies to the inboxes of the agents they concern.
+
+    A reply concerns the author of the post or reply it answers, the author of
+    the thread, and every existing agent it mentions as ``@agent_name``. Each
+    of them gets one notification listing why; the reply's author gets none.
+    """
+
+    REASON_REPLY = "reply"
+    REASON_THREAD = "thread"
+    REASON_MENTION = "mention"
+
+    EXCERPT_LENGTH = 200
+
+    def __init__(
+        self,
+        post_repository: IPostRepository,
+        agent_repository: IAgentRepository,
+        inbox: AgentInbox,
+    ) -> None:
+        """Initialize handler.
+
+        Args:
+            post_repository: Post repository
+            agent_repository: Agent repository (mention lookups)
+            inbox: Agent inboxes
+        """
+        self._post_repository = post_repository
+        self._agent_repository = agent_repository
+        self._inbox = inbox
+
+    def subscribe(self, event_bus: EventBus) -> None:
+        """Subscribe the handler to an event bus.
+
+        Args:
+            event_bus: Event bus
+        """
+        event_bus.subscribe(ReplyAdded, self.on_reply_added)
+
+    def on_reply_added(self, event: ReplyAdded) -> None:
+        """Notify the agents a new reply concerns.
+
+        Args:
+            event: Reply added event
+        """
+        post_id = PostId(event.post_id)
+        reply = self._post_repository.find_reply_by_id(post_id, event.reply_id)
+        summary = self._post_repository.find_summary(post_id, include_deleted=True)
+        if reply is None or summary is None:
+            return
+
+        recipients: dict[str, list[str]] = {}
+        if reply.parent_type == "reply":
+            parent = self._post_repository.find_reply_by_id(post_id, reply.parent_id)
+            if parent is not None:
+                recipients[parent.agent_name.value] = [self.REASON_REPLY]
+        else:
+            recipients[summary.agent_name] = [self.REASON_REPLY]
+        recipients.setdefault(summary.agent_name, []).append(self.REASON_THREAD)
+        for name in reply.content.mentions():
+            if name in recipients or self._agent_repository.exists(AgentName(name)):
+                recipients.setdefault(name, []).append(self.REASON_MENTION)
+        recipients.pop(event.agent_name, None)
+
+        content = reply.content.value
+        for agent_name, reasons in recipients.items():
+            self._inbox.append(
+                agent_name,
+                {
+                    "reply_id": event.reply_id,
+                    "post_id": event.post_id,
+                    "parent_id": event.parent_id,
+                    "agent_name": event.agent_name,
+                    "reasons": reasons,
+                    "occurred_at": event.occurred_at.isoformat(),
+                    "title": summary.title,
+                    "excerpt": content[: self.EXCERPT_LENGTH],
+                },
+            )
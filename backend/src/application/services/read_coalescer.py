@@ -0,0 +1,168 @@
+"""Coalescing of identical concurrent read use case calls."""
+
+import threading
+from typing import Any
+
+from src.domain.events import DomainEvent
+from src.infrastructure.events.event_bus import EventBus
+from src.infrastructure.executor import BlockingExecutor
+from src.shared.single_flight import AsyncSingleFlight, SingleFlight, SingleFlightStats
+
+
+class ReadCoalescer:
+    """Lets identical concurrent reads share one execution.
+
+    Calls through a wrapped use case with equal arguments that overlap in time
+    run once; the other callers wait for that run and receive its result.
+    Callers on a worker thread block on the running call. Callers on the
+    event loop (REST routes and MCP tools) go through ``execute_on`` instead,
+    which coalesces before dispatching to the executor: only the first caller
+    takes a worker thread, and the others await its result without one, so a
+    burst of identical reads cannot fill the pool.
+
+    Every write bumps a generation that is part of the call key, so a read
+    issued after a write returned never joins a read that started before it.
+    """
+
+    def __init__(self) -> None:
+        """Initialize coalescer."""
+        self._flight = SingleFlight()
+        self._async_flight = AsyncSingleFlight()
+        self._lock = threading.Lock()
+        self._generation = 0
+
+    def subscribe(self, event_bus: EventBus) -> None:
+        """Subscribe the write generation to an event bus.
+
+        Args:
+            event_bus: Event bus
+        """
+        event_bus.subscribe(DomainEvent, self.on_write, inline=True)
+
+    def on_write(self, _event: DomainEvent) -> None:
+        """Start a new generation so that later reads do not join earlier ones.
+
+        Args:
+            _event: Any domain event
+        """
+        with self._lock:
+            self._generation += 1
+
+    def wrap(self, use_case: Any) -> "CoalescedUseCase":
+        """Wrap a read use case.
+
+        Args:
+            use_case: Use case with an ``execute`` method
+
+        Returns:
+            Use case whose identical concurrent calls are coalesced
+        """
+        return CoalescedUseCase(self, use_case)
+
+    def run(self, use_case: Any, args: tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
+        """Execute a use case, sharing an identical call already in flight.
+
+        Args:
+            use_case: Wrapped use case
+            args: Positional arguments for ``execute``
+            kwargs: Keyword arguments for ``execute``
+
+        Returns:
+            Result of ``execute`` (shared between callers; do not modify it)
+        """
+        key = self._key(use_case, args, kwargs)
+        return self._flight.do(key, use_case.execute, *args, **kwargs)
+
+    async def run_on(
+        self,
+        executor: BlockingExecutor,
+        use_case: Any,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> Any:
+        """Execute a use case on an executor, awaiting an identical call already in flight.
+
+        Args:
+            executor: Executor the call is run on
+            use_case: Wrapped use case
+            args: Positional arguments for ``execute``
+            kwargs: Keyword arguments for ``execute``
+
+        Returns:
+            Result of ``execute`` (shared between callers; do not modify it)
+        """
+        key = self._key(use_case, args, kwargs)
+        return await self._async_flight.do(
+            key, lambda: executor.run(self._flight.do, key, use_case.execute, *args, **kwargs)
+        )
+
+    def _key(self, use_case: Any, args: tuple[Any, ...], kwargs: dict[str, Any]) -> tuple:
+        """Build the key under which identical calls are shared.
+
+        Args:
+            use_case: Wrapped use case
+            args: Positional arguments for ``execute``
+            kwargs: Keyword arguments for ``execute``
+
+        Returns:
+            Call key, including the current write generation
+        """
+        with self._lock:
+            generation = self._generation
+        # DTO arguments are unhashable dataclasses; their repr covers every field
+        return (id(use_case), generation, repr(args), repr(sorted(kwargs.items())))
+
+    def stats(self) -> SingleFlightStats:
+        """Get a snapshot of the coalescing counters.
+
+        ``executed`` and ``in_flight`` count runs of the use cases; ``shared``
+        counts callers that joined a run, on a worker thread or on the event loop.
+
+        Returns:
+            Single flight stats
+        """
+        stats = self._flight.stats()
+        return SingleFlightStats(
+            executed=stats.executed,
+            shared=stats.shared + self._async_flight.stats().shared,
+            in_flight=stats.in_flight,
+        )
+
+
+class CoalescedUseCase:
+    """Read use case whose identical concurrent calls run once."""
+
+    def __init__(self, coalescer: ReadCoalescer, use_case: Any) -> None:
+        """Initialize wrapper.
+
+        Args:
+            coalescer: Coalescer shared by the wrapped use cases
+            use_case: Use case to wrap
+        """
+        self._coalescer = coalescer
+        self._use_case = use_case
+
+    def execute(self, *args: Any, **kwargs: Any) -> Any:
+        """Execute the wrapped use case.
+
+        Args:
+            *args: Positional arguments for the use case
+            **kwargs: Keyword arguments for the use case
+
+        Returns:
+            Result of the use case
+        """
+        return self._coalescer.run(self._use_case, args, kwargs)
+
+    async def execute_on(self, executor: BlockingExecutor, *args: Any, **kwargs: Any) -> Any:
+        """Execute the wrapped use case on an executor from the event loop.
+
+        Args:
+            executor: Executor the call is run on
+            *args: Positional arguments for the use case
+            **kwargs: Keyword arguments for the use case
+
+        Returns:
+            Result of the use case
+        """
+        return await self._coalescer.run_on(executor, self._use_case, args, kwargs)
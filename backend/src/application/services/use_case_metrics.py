@@ -0,0 +1,90 @@
+"""Latency metrics of use case executions."""
+
+import re
+import time
+from typing import Any
+
+from src.infrastructure.metrics import HistogramFamily, HistogramSnapshot
+from src.infrastructure.tracing import span
+
+
+class UseCaseMetrics:
+    """Records how long each use case takes to execute.
+
+    Wrapped use cases observe their run time into a histogram labelled with
+    the use case name and the outcome ('ok' or 'error'), and record a
+    ``use_case.<name>`` span in sampled traces. Wrapping a use case
+    before it is coalesced measures actual executions, not the callers that
+    joined one.
+    """
+
+    def __init__(self) -> None:
+        """Initialize metrics."""
+        self._latency = HistogramFamily()
+
+    def wrap(self, use_case: Any) -> "TimedUseCase":
+        """Wrap a use case.
+
+        Args:
+            use_case: Use case with an ``execute`` method
+
+        Returns:
+            Use case whose executions are timed
+        """
+        return TimedUseCase(self._latency, use_case)
+
+    def snapshot(self) -> dict[tuple[str, ...], HistogramSnapshot]:
+        """Get the latency histograms.
+
+        Returns:
+            Snapshots keyed by use case name and outcome
+        """
+        return self._latency.snapshot()
+
+
+def use_case_name(use_case: Any) -> str:
+    """Derive a metric label from a use case class name.
+
+    Args:
+        use_case: Use case instance
+
+    Returns:
+        Snake case name without the ``UseCase`` suffix (e.g. 'get_post')
+    """
+    name = type(use_case).__name__.removesuffix("UseCase")
+    return re.sub(r"(?<!^)(?=[A-Z])", "_", name).lower()
+
+
+class TimedUseCase:
+    """Use case whose executions are timed."""
+
+    def __init__(self, latency: HistogramFamily, use_case: Any) -> None:
+        """Initialize wrapper.
+
+        Args:
+            latency: Histograms keyed by use case name and outcome
+            use_case: Use case to wrap
+        """
+        self._latency = latency
+        self._use_case = use_case
+        self._name = use_case_name(use_case)
+
+    def execute(self, *args: Any, **kwargs: Any) -> Any:
+        """Execute the wrapped use case.
+
+        Args:
+            *args: Positional arguments for the use case
+            **kwargs: Keyword arguments for the use case
+
+        Returns:
+            Result of the use case
+        """
+        started = time.perf_counter()
+        try:
+            with span(f"use_case.{self._name}"):
+                result = self._use_case.execute(*args, **kwargs)
+        except BaseException:
+            self._latency.labels(self._name, "error").observe(time.perf_counter() - started)
+            raise
+        self._latency.labels(self._name, "ok").observe(time.perf_counter() - started)
+        return result
@@ -36,14 +36,15 @@ class GetAgentProfileUseCase:
         if agent is None:
             raise AgentNotFoundException(agent_name_str)
 
-        post_count = self._agent_repository.get_post_count(agent_name)
-        reply_count = self._agent_repository.get_reply_count(agent_name)
+        stats = self._agent_repository.get_stats(agent_name)
 
         return AgentResponseDTO(
             agent_name=agent.name.value,
             description=agent.description,
             created_at=agent.created_at.isoformat(),
             metadata=agent.metadata,
-            post_count=post_count,
-            reply_count=reply_count,
+            post_count=stats.post_count,
+            reply_count=stats.reply_count,
+            deleted_count=stats.deleted_count,
+            last_active_at=stats.last_active_at.isoformat() if stats.last_active_at else None,
         )
@@ -0,0 +1,72 @@
+"""Get inbox use case."""
+
+from src.application.dtos.inbox_dto import GetInboxDTO, InboxPageDTO, NotificationDTO
+from src.domain.exceptions.agent_exceptions import AgentNotFoundException
+from src.domain.repositories.agent_repository import IAgentRepository
+from src.domain.value_objects.agent_name import AgentName
+from src.infrastructure.persistence.agent_inbox import AgentInbox
+
+
+class GetInboxUseCase:
+    """Use case for reading the replies and mentions that concern an agent.
+
+    Notifications are written to the agent's inbox as replies are created, so
+    reading the unread ones costs the same however many posts the agent has.
+    """
+
+    MAX_LIMIT = 100
+
+    def __init__(self, agent_repository: IAgentRepository, inbox: AgentInbox) -> None:
+        """Initialize use case.
+
+        Args:
+            agent_repository: Agent repository
+            inbox: Agent inboxes
+        """
+        self._agent_repository = agent_repository
+        self._inbox = inbox
+
+    def execute(self, dto: GetInboxDTO) -> InboxPageDTO:
+        """Execute the use case.
+
+        Args:
+            dto: Get inbox DTO
+
+        Returns:
+            Page of notifications, oldest first. Without a cursor the page
+            starts at the first unread notification; ``next_cursor`` continues
+            after it or marks it read.
+
+        Raises:
+            ValueError: If the agent name, limit or cursor is invalid
+            AgentNotFoundException: If agent not found
+        """
+        if not 1 <= dto.limit <= self.MAX_LIMIT:
+            raise ValueError(f"Limit must be between 1 and {self.MAX_LIMIT}")
+        agent_name = AgentName(dto.agent_name)
+        if not self._agent_repository.exists(agent_name):
+            raise AgentNotFoundException(dto.agent_name)
+
+        records, next_cursor, has_more = self._inbox.read(
+            agent_name.value, dto.cursor, limit=dto.limit
+        )
+        if dto.mark_read:
+            self._inbox.mark_read(agent_name.value, next_cursor)
+
+        return InboxPageDTO(
+            notifications=[
+                NotificationDTO(
+                    reply_id=record["reply_id"],
+                    post_id=record["post_id"],
+                    parent_id=record["parent_id"],
+                    agent_name=record["agent_name"],
+                    reasons=record["reasons"],
+                    occurred_at=record["occurred_at"],
+                    title=record.get("title"),
+                    excerpt=record.get("excerpt"),
+                )
+                for record in records
+            ],
+            next_cursor=next_cursor,
+            has_more=has_more,
+        )
@@ -21,15 +21,21 @@ class ListAgentsUseCase:
         Returns:
             List of agent list item DTOs
         """
-        agents = self._agent_repository.list_all()
-
-        return [
-            AgentListItemDTO(
-                agent_name=agent.name.value,
-                description=agent.description,
-                created_at=agent.created_at.isoformat(),
-                post_count=self._agent_repository.get_post_count(agent.name),
-                reply_count=self._agent_repository.get_reply_count(agent.name),
+        results: list[AgentListItemDTO] = []
+        for agent in self._agent_repository.list_all():
+            stats = self._agent_repository.get_stats(agent.name)
+            results.append(
+                AgentListItemDTO(
+                    agent_name=agent.name.value,
+                    description=agent.description,
+                    created_at=agent.created_at.isoformat(),
+                    post_count=stats.post_count,
+                    reply_count=stats.reply_count,
+                    deleted_count=stats.deleted_count,
+                    last_active_at=(
+                        stats.last_active_at.isoformat() if stats.last_active_at else None
+                    ),
+                )
             )
-            for agent in agents
-        ]
+
+        return results
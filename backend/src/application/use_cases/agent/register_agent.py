@@ -2,10 +2,10 @@
 
 from src.application.dtos.agent_dto import AgentResponseDTO, CreateAgentDTO
 from src.domain.entities.agent import Agent
+from src.domain.events import AgentRegistered, IEventPublisher
 from src.domain.repositories.agent_repository import IAgentRepository
 from src.domain.services.agent_domain_service import AgentDomainService
 from src.domain.value_objects.agent_name import AgentName
-from src.infrastructure.indexes.agent_index import AgentIndex
 
 
 class RegisterAgentUseCase:
@@ -15,18 +15,18 @@ class RegisterAgentUseCase:
         self,
         agent_repository: IAgentRepository,
         agent_domain_service: AgentDomainService,
-        agent_index: AgentIndex,
+        event_publisher: IEventPublisher,
     ) -> None:
         """Initialize use case.
 
         Args:
             agent_repository: Agent repository
             agent_domain_service: Agent domain service
-            agent_index: Agent index
+            event_publisher: Publisher for the agent registered event (agent index)
         """
         self._agent_repository = agent_repository
         self._agent_domain_service = agent_domain_service
-        self._agent_index = agent_index
+        self._event_publisher = event_publisher
 
     def execute(self, dto: CreateAgentDTO) -> AgentResponseDTO:
         """Execute the use case.
@@ -57,8 +57,9 @@ class RegisterAgentUseCase:
         # Save agent
         self._agent_repository.save(agent)
 
-        # Update index
-        self._agent_index.add_agent(agent.to_dict())
+        self._event_publisher.publish(
+            AgentRegistered(occurred_at=agent.created_at, agent_name=agent.name.value)
+        )
 
         # Return response
         return AgentResponseDTO(
@@ -1,8 +1,10 @@
 """Browse posts use case."""
 
-from src.application.dtos.post_dto import PostListItemDTO
+from src.application.dtos.post_dto import PostListItemDTO, PostPageDTO
+from src.domain.entities.post_summary import PostSummary
 from src.domain.repositories.post_repository import IPostRepository
 from src.domain.value_objects.agent_name import AgentName
+from src.domain.value_objects.page_cursor import PageCursor
 
 
 class BrowsePostsUseCase:
@@ -22,37 +24,80 @@ class BrowsePostsUseCase:
         offset: int = 0,
         agent_name: str | None = None,
         include_deleted: bool = False,
-    ) -> list[PostListItemDTO]:
+        cursor: str | None = None,
+        include_total: bool = False,
+    ) -> PostPageDTO:
         """Execute the use case.
 
         Args:
             limit: Maximum number of posts to return
-            offset: Number of posts to skip
+            offset: Number of posts to skip (ignored when a cursor is given)
             agent_name: Optional filter by agent
             include_deleted: Whether to include deleted posts
+            cursor: Cursor returned with the previous page
+            include_total: Whether to include an estimated total count
 
         Returns:
-            List of post list item DTOs
+            Page of post list item DTOs
+
+        Raises:
+            ValueError: If the cursor is invalid
         """
         agent_name_vo = AgentName(agent_name) if agent_name else None
+        after = PageCursor.decode(cursor) if cursor else None
 
-        posts = self._post_repository.find_all(
+        # Fetch one extra post to find out whether there is a next page
+        posts = self._post_repository.find_summaries(
+            limit + 1,
+            after=after,
+            offset=0 if after else offset,
             include_deleted=include_deleted,
-            limit=limit,
-            offset=offset,
             agent_name=agent_name_vo,
         )
 
-        return [
-            PostListItemDTO(
-                post_id=post.post_id.value,
-                title=post.title,
-                agent_name=post.agent_name.value,
-                tags=post.tags.values,
-                created_at=post.created_at.isoformat(),
-                updated_at=post.updated_at.isoformat(),
-                reply_count=post.reply_count,
-                deleted=post.deleted,
-            )
-            for post in posts
-        ]
+        estimated_total = None
+        if include_total:
+            estimated_total = self._post_repository.count_posts(agent_name_vo, include_deleted)
+
+        return PostPageDTO(
+            posts=[to_list_item_dto(post) for post in posts[:limit]],
+            next_cursor=next_page_cursor(posts, limit),
+            estimated_total=estimated_total,
+        )
+
+
+def to_list_item_dto(summary: PostSummary) -> PostListItemDTO:
+    """Convert a post summary to a list item DTO.
+
+    Args:
+        summary: Post summary
+
+    Returns:
+        Post list item DTO
+    """
+    return PostListItemDTO(
+        post_id=summary.post_id,
+        title=summary.title,
+        agent_name=summary.agent_name,
+        tags=list(summary.tags),
+        created_at=summary.created_at.isoformat(),
+        updated_at=summary.updated_at.isoformat(),
+        reply_count=summary.reply_count,
+        deleted=summary.deleted,
+    )
+
+
+def next_page_cursor(posts: list[PostSummary], limit: int) -> str | None:
+    """Build the cursor for the page after ``posts[:limit]``.
+
+    Args:
+        posts: Post summaries fetched with a limit of ``limit + 1``
+        limit: Page size
+
+    Returns:
+        Cursor token, or None if this is the last page
+    """
+    if limit <= 0 or len(posts) <= limit:
+        return None
+    last = posts[limit - 1]
+    return PageCursor(last.created_at, last.post_id).encode()
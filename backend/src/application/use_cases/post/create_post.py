@@ -2,6 +2,7 @@
 
 from src.application.dtos.post_dto import CreatePostDTO, PostResponseDTO
 from src.domain.entities.post import Post
+from src.domain.events import IEventPublisher, PostCreated
 from src.domain.exceptions.agent_exceptions import AgentNotFoundException
 from src.domain.repositories.agent_repository import IAgentRepository
 from src.domain.repositories.post_repository import IPostRepository
@@ -9,7 +10,6 @@ from src.domain.value_objects.agent_name import AgentName
 from src.domain.value_objects.content import Content
 from src.domain.value_objects.post_id import PostId
 from src.domain.value_objects.tags import Tags
-from src.infrastructure.indexes.post_index import PostIndex
 
 
 class CreatePostUseCase:
@@ -19,18 +19,18 @@ class CreatePostUseCase:
         self,
         post_repository: IPostRepository,
         agent_repository: IAgentRepository,
-        post_index: PostIndex,
+        event_publisher: IEventPublisher,
     ) -> None:
         """Initialize use case.
 
         Args:
             post_repository: Post repository
             agent_repository: Agent repository
-            post_index: Post index
+            event_publisher: Publisher for the post created event (indexes, counters)
         """
         self._post_repository = post_repository
         self._agent_repository = agent_repository
-        self._post_index = post_index
+        self._event_publisher = event_publisher
 
     def execute(self, dto: CreatePostDTO) -> PostResponseDTO:
         """Execute the use case.
@@ -67,8 +67,14 @@ class CreatePostUseCase:
         # Save post
         self._post_repository.save(post)
 
-        # Update index
-        self._post_index.add_post(post.to_dict(include_replies=False))
+        self._event_publisher.publish(
+            PostCreated(
+                occurred_at=post.created_at,
+                post_id=post.post_id.value,
+                agent_name=agent_name.value,
+                title=post.title,
+            )
+        )
 
         # Return response
         return self._to_response_dto(post, include_content=True)
@@ -1,12 +1,14 @@
 """Delete post use case."""
 
+from datetime import datetime
+
 from src.application.dtos.reply_dto import DeletePostDTO
+from src.domain.events import IEventPublisher, PostDeleted
 from src.domain.exceptions.post_exceptions import PostNotFoundException
 from src.domain.repositories.post_repository import IPostRepository
 from src.domain.services.post_domain_service import PostDomainService
 from src.domain.value_objects.agent_name import AgentName
 from src.domain.value_objects.post_id import PostId
-from src.infrastructure.indexes.post_index import PostIndex
 
 
 class DeletePostUseCase:
@@ -15,16 +17,16 @@ class DeletePostUseCase:
     def __init__(
         self,
         post_repository: IPostRepository,
-        post_index: PostIndex,
+        event_publisher: IEventPublisher,
     ) -> None:
         """Initialize use case.
 
         Args:
             post_repository: Post repository
-            post_index: Post index
+            event_publisher: Publisher for the post deleted event (indexes, counters)
         """
         self._post_repository = post_repository
-        self._post_index = post_index
+        self._event_publisher = event_publisher
 
     def execute(self, dto: DeletePostDTO) -> None:
         """Execute the use case.
@@ -40,7 +42,9 @@ class DeletePostUseCase:
         agent_name = AgentName(dto.agent_name)
 
         # Get post
-        post = self._post_repository.find_by_id(post_id, include_deleted=False)
+        post = self._post_repository.find_by_id(
+            post_id, include_deleted=False, include_replies=False
+        )
         if post is None:
             raise PostNotFoundException(dto.post_id)
 
@@ -50,7 +54,10 @@ class DeletePostUseCase:
         # Soft delete
         self._post_repository.delete(post_id)
 
-        # Update index
-        post_dict = post.to_dict(include_replies=False)
-        post_dict["deleted"] = True
-        self._post_index.update_post(dto.post_id, post_dict)
+        self._event_publisher.publish(
+            PostDeleted(
+                occurred_at=datetime.utcnow(),
+                post_id=dto.post_id,
+                agent_name=post.agent_name.value,
+            )
+        )
@@ -0,0 +1,160 @@
+"""Get updates use case."""
+
+from typing import Any
+
+from src.application.dtos.update_dto import GetUpdatesDTO, UpdateDTO, UpdatesPageDTO
+from src.domain.repositories.post_repository import IPostRepository
+from src.domain.value_objects.agent_name import AgentName
+from src.domain.value_objects.post_id import PostId
+from src.infrastructure.events.change_log import CHANGE_TYPES, ChangeLog
+
+SCOPE_ALL = "all"
+SCOPE_AUTHORED = "authored"
+SCOPE_PARTICIPATED = "participated"
+UPDATE_SCOPES = (SCOPE_ALL, SCOPE_AUTHORED, SCOPE_PARTICIPATED)
+
+
+class GetUpdatesUseCase:
+    """Use case for reading the changes made after a sequence number.
+
+    Reads the change log from the client's last sequence number instead of
+    re-reading threads, so the cost is proportional to the number of changes
+    since then. Thread filters look up each changed thread once per call.
+    """
+
+    MAX_LIMIT = 100
+
+    # Log records examined per call, so that a narrow filter over a long
+    # stretch of unrelated changes returns promptly with ``has_more``
+    MAX_SCAN = 1000
+
+    READ_BATCH = 200
+
+    def __init__(self, post_repository: IPostRepository, change_log: ChangeLog) -> None:
+        """Initialize use case.
+
+        Args:
+            post_repository: Post repository (thread filters and content)
+            change_log: Change log
+        """
+        self._post_repository = post_repository
+        self._change_log = change_log
+
+    def execute(self, dto: GetUpdatesDTO) -> UpdatesPageDTO:
+        """Execute the use case.
+
+        Args:
+            dto: Get updates DTO
+
+        Returns:
+            Page of updates in sequence order. Pass ``next_since`` as
+            ``since`` to continue; ``reset`` means changes after ``since``
+            are no longer retained and the client should reload its view.
+
+        Raises:
+            ValueError: If the scope, limit, sequence number or agent name is invalid
+        """
+        if dto.scope not in UPDATE_SCOPES:
+            raise ValueError(f"Invalid scope: {dto.scope}")
+        if not 1 <= dto.limit <= self.MAX_LIMIT:
+            raise ValueError(f"Limit must be between 1 and {self.MAX_LIMIT}")
+        if dto.since < 0:
+            raise ValueError("Sequence number cannot be negative")
+        if dto.scope != SCOPE_ALL and not dto.agent_name:
+            raise ValueError(f"An agent name is required for the '{dto.scope}' scope")
+        agent_name = AgentName(dto.agent_name).value if dto.agent_name else None
+
+        cursor, reset = self._change_log.cursor_after(dto.since)
+        page = UpdatesPageDTO(next_since=dto.since)
+        threads: dict[str, set[str]] = {}
+        scanned = 0
+
+        while not page.has_more:
+            records, cursor, missed = self._change_log.read(cursor, limit=self.READ_BATCH)
+            reset = reset or missed
+            if not records:
+                break
+
+            for record in records:
+                if len(page.updates) == dto.limit or scanned == self.MAX_SCAN:
+                    page.has_more = True
+                    break
+                scanned += 1
+                page.next_since = record["seq"]
+                if self._matches(record, dto.scope, agent_name, threads):
+                    page.updates.append(self._to_dto(record, dto.include_content))
+
+        page.reset = reset
+        return page
+
+    def _matches(
+        self,
+        record: dict[str, Any],
+        scope: str,
+        agent_name: str | None,
+        threads: dict[str, set[str]],
+    ) -> bool:
+        """Check whether a change belongs to a thread selected by the scope.
+
+        Args:
+            record: Change log record
+            scope: Update scope
+            agent_name: Agent the scope refers to
+            threads: Cache of thread authors or participants by post ID
+
+        Returns:
+            True if the change should be returned
+        """
+        if scope == SCOPE_ALL:
+            return True
+
+        post_id = record["post_id"]
+        if post_id not in threads:
+            if scope == SCOPE_AUTHORED:
+                summary = self._post_repository.find_summary(PostId(post_id), include_deleted=True)
+                threads[post_id] = {summary.agent_name} if summary else set()
+            else:
+                threads[post_id] = self._post_repository.find_participants(PostId(post_id))
+        return agent_name in threads[post_id]
+
+    def _to_dto(self, record: dict[str, Any], include_content: bool) -> UpdateDTO:
+        """Convert a change log record to an update DTO.
+
+        Args:
+            record: Change log record
+            include_content: Whether to load the text of new posts and replies
+
+        Returns:
+            Update DTO
+        """
+        update = UpdateDTO(
+            seq=record["seq"],
+            type=CHANGE_TYPES.get(record["type"], record["type"]),
+            occurred_at=record["occurred_at"],
+            post_id=record["post_id"],
+            agent_name=record["agent_name"],
+            reply_id=record.get("reply_id"),
+            parent_id=record.get("parent_id"),
+            title=record.get("title"),
+        )
+        if include_content:
+            update.content = self._load_content(update)
+        return update
+
+    def _load_content(self, update: UpdateDTO) -> str | None:
+        """Load the text of a new post or reply.
+
+        Args:
+            update: Update DTO
+
+        Returns:
+            Text, or None for deletions and for posts and replies deleted since
+        """
+        post_id = PostId(update.post_id)
+        if update.type == "reply_added" and update.reply_id:
+            reply = self._post_repository.find_reply_by_id(post_id, update.reply_id)
+            return reply.content.value if reply and not reply.deleted else None
+        if update.type == "post_created":
+            post = self._post_repository.find_by_id(post_id, include_replies=False)
+            return post.content.value if post else None
+        return None
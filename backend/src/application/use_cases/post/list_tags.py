@@ -0,0 +1,37 @@
+"""List tags use case."""
+
+from src.application.dtos.post_dto import TagCountDTO
+from src.domain.repositories.search_repository import ISearchRepository
+
+
+class ListTagsUseCase:
+    """Use case for listing the most used tags (a tag cloud)."""
+
+    MAX_LIMIT = 500
+
+    def __init__(self, search_repository: ISearchRepository) -> None:
+        """Initialize use case.
+
+        Args:
+            search_repository: Search repository
+        """
+        self._search_repository = search_repository
+
+    def execute(self, limit: int = 50) -> list[TagCountDTO]:
+        """Execute the use case.
+
+        Args:
+            limit: Maximum number of tags
+
+        Returns:
+            Tag count DTOs, most used first
+
+        Raises:
+            ValueError: If the limit is out of range
+        """
+        if not 1 <= limit <= self.MAX_LIMIT:
+            raise ValueError(f"Limit must be between 1 and {self.MAX_LIMIT}")
+        return [
+            TagCountDTO(tag=tag, post_count=count)
+            for tag, count in self._search_repository.tag_counts(limit)
+        ]
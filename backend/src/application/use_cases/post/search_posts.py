@@ -2,9 +2,16 @@
 
 from datetime import datetime
 
-from src.application.dtos.post_dto import PostListItemDTO, SearchPostsDTO
-from src.domain.repositories.search_repository import ISearchRepository
+from src.application.dtos.post_dto import PostPageDTO, SearchPostsDTO
+from src.application.use_cases.post.browse_posts import next_page_cursor, to_list_item_dto
+from src.domain.repositories.search_repository import (
+    SEARCH_SORT_ORDERS,
+    SORT_NEWEST,
+    ISearchRepository,
+)
 from src.domain.value_objects.agent_name import AgentName
+from src.domain.value_objects.page_cursor import PageCursor
+from src.domain.value_objects.tag_query import TagQuery
 
 
 class SearchPostsUseCase:
@@ -18,40 +25,45 @@ class SearchPostsUseCase:
         """
         self._search_repository = search_repository
 
-    def execute(self, dto: SearchPostsDTO) -> list[PostListItemDTO]:
+    def execute(self, dto: SearchPostsDTO) -> PostPageDTO:
         """Execute the use case.
 
+        Cursors are only issued and accepted for the newest-first order;
+        relevance-ranked results are paged with offsets.
+
         Args:
             dto: Search posts DTO
 
         Returns:
-            List of matching post list item DTOs
+            Page of matching post list item DTOs
+
+        Raises:
+            ValueError: If the sort order, cursor or a tag is invalid
         """
+        if dto.sort_by not in SEARCH_SORT_ORDERS:
+            raise ValueError(f"Invalid sort order: {dto.sort_by}")
+        if dto.cursor and dto.sort_by != SORT_NEWEST:
+            raise ValueError("Cursors can only be used with the newest sort order")
+        after = PageCursor.decode(dto.cursor) if dto.cursor else None
+
         agent_name = AgentName(dto.agent_name) if dto.agent_name else None
         start_date = datetime.fromisoformat(dto.start_date) if dto.start_date else None
         end_date = datetime.fromisoformat(dto.end_date) if dto.end_date else None
+        tags = TagQuery.parse(dto.tags) if dto.tags else None
 
         posts = self._search_repository.search_posts(
             query=dto.query,
-            tags=dto.tags,
+            tags=tags,
             agent_name=agent_name,
             start_date=start_date,
             end_date=end_date,
             include_deleted=dto.include_deleted,
-            limit=dto.limit,
-            offset=dto.offset,
+            limit=dto.limit + 1,
+            offset=0 if after else dto.offset,
+            sort_by=dto.sort_by,
+            after=after,
         )
 
-        return [
-            PostListItemDTO(
-                post_id=post.post_id.value,
-                title=post.title,
-                agent_name=post.agent_name.value,
-                tags=post.tags.values,
-                created_at=post.created_at.isoformat(),
-                updated_at=post.updated_at.isoformat(),
-                reply_count=post.reply_count,
-                deleted=post.deleted,
-            )
-            for post in posts
-        ]
+        items = [to_list_item_dto(post) for post in posts[: dto.limit]]
+        next_cursor = next_page_cursor(posts, dto.limit) if dto.sort_by == SORT_NEWEST else None
+        return PostPageDTO(posts=items, next_cursor=next_cursor)
@@ -3,6 +3,7 @@
 from src.application.dtos.post_dto import ReplyResponseDTO
 from src.application.dtos.reply_dto import CreateReplyDTO
 from src.domain.entities.reply import Reply
+from src.domain.events import IEventPublisher, ReplyAdded
 from src.domain.exceptions.agent_exceptions import AgentNotFoundException
 from src.domain.exceptions.post_exceptions import PostNotFoundException, ReplyNotFoundException
 from src.domain.repositories.agent_repository import IAgentRepository
@@ -19,15 +20,18 @@ class CreateReplyUseCase:
         self,
         post_repository: IPostRepository,
         agent_repository: IAgentRepository,
+        event_publisher: IEventPublisher,
     ) -> None:
         """Initialize use case.
 
         Args:
             post_repository: Post repository
             agent_repository: Agent repository
+            event_publisher: Publisher for the reply added event (indexes, counters)
         """
         self._post_repository = post_repository
         self._agent_repository = agent_repository
+        self._event_publisher = event_publisher
 
     def execute(self, dto: CreateReplyDTO) -> ReplyResponseDTO:
         """Execute the use case.
@@ -51,8 +55,7 @@ class CreateReplyUseCase:
 
         # Validate post exists
         post_id = PostId(dto.post_id)
-        post = self._post_repository.find_by_id(post_id)
-        if post is None:
+        if self._post_repository.find_summary(post_id) is None:
             raise PostNotFoundException(dto.post_id)
 
         # Validate parent exists
@@ -78,6 +81,16 @@ class CreateReplyUseCase:
         # Save reply
         self._post_repository.save_reply(post_id, reply)
 
+        self._event_publisher.publish(
+            ReplyAdded(
+                occurred_at=reply.created_at,
+                reply_id=reply.reply_id,
+                post_id=reply.post_id,
+                parent_id=reply.parent_id,
+                agent_name=agent_name.value,
+            )
+        )
+
         # Return response
         return ReplyResponseDTO(
             reply_id=reply.reply_id,
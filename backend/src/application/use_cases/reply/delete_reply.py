@@ -1,6 +1,9 @@
 """Delete reply use case."""
 
+from datetime import datetime
+
 from src.application.dtos.reply_dto import DeleteReplyDTO
+from src.domain.events import IEventPublisher, ReplyDeleted
 from src.domain.exceptions.post_exceptions import PostNotFoundException, ReplyNotFoundException
 from src.domain.repositories.post_repository import IPostRepository
 from src.domain.services.post_domain_service import PostDomainService
@@ -11,13 +14,19 @@ from src.domain.value_objects.post_id import PostId
 class DeleteReplyUseCase:
     """Use case for soft deleting a reply."""
 
-    def __init__(self, post_repository: IPostRepository) -> None:
+    def __init__(
+        self,
+        post_repository: IPostRepository,
+        event_publisher: IEventPublisher,
+    ) -> None:
         """Initialize use case.
 
         Args:
             post_repository: Post repository
+            event_publisher: Publisher for the reply deleted event (indexes, counters)
         """
         self._post_repository = post_repository
+        self._event_publisher = event_publisher
 
     def execute(self, dto: DeleteReplyDTO) -> None:
         """Execute the use case.
@@ -33,9 +42,8 @@ class DeleteReplyUseCase:
         post_id = PostId(dto.post_id)
         agent_name = AgentName(dto.agent_name)
 
-        # Get post
-        post = self._post_repository.find_by_id(post_id, include_deleted=False)
-        if post is None:
+        # Validate post exists
+        if self._post_repository.find_summary(post_id) is None:
             raise PostNotFoundException(dto.post_id)
 
         # Get reply
@@ -48,3 +56,12 @@ class DeleteReplyUseCase:
 
         # Soft delete
         self._post_repository.delete_reply(post_id, dto.reply_id)
+
+        self._event_publisher.publish(
+            ReplyDeleted(
+                occurred_at=datetime.utcnow(),
+                reply_id=dto.reply_id,
+                post_id=dto.post_id,
+                agent_name=reply.agent_name.value,
+            )
+        )
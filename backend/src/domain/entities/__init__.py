@@ -1,7 +1,9 @@
 """Domain entities."""
 
 from src.domain.entities.agent import Agent
+from src.domain.entities.agent_stats import AgentStats
 from src.domain.entities.post import Post
+from src.domain.entities.post_summary import PostSummary
 from src.domain.entities.reply import Reply
 
-__all__ = ["Agent", "Post", "Reply"]
+__all__ = ["Agent", "AgentStats", "Post", "PostSummary", "Reply"]
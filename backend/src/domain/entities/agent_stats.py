@@ -0,0 +1,84 @@
+"""Agent statistics read model."""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+
+@dataclass(frozen=True)
+class AgentStats:
+    """Activity counters of an agent.
+
+    ``post_count`` and ``reply_count`` cover visible (not deleted) posts and
+    replies; ``deleted_count`` is the number of the agent's posts and replies
+    that have been deleted. ``last_active_at`` is the time of the agent's
+    latest post, reply or deletion.
+    """
+
+    post_count: int = 0
+    reply_count: int = 0
+    deleted_count: int = 0
+    last_active_at: datetime | None = None
+
+    def apply(
+        self,
+        post_delta: int = 0,
+        reply_delta: int = 0,
+        deleted_delta: int = 0,
+        active_at: datetime | None = None,
+    ) -> "AgentStats":
+        """Return the counters after a change.
+
+        Args:
+            post_delta: Change in the number of posts
+            reply_delta: Change in the number of replies
+            deleted_delta: Change in the number of deleted posts and replies
+            active_at: Time of the activity, if any
+
+        Returns:
+            Updated AgentStats instance
+        """
+        last_active_at = self.last_active_at
+        if active_at and (last_active_at is None or active_at > last_active_at):
+            last_active_at = active_at
+
+        return AgentStats(
+            post_count=max(self.post_count + post_delta, 0),
+            reply_count=max(self.reply_count + reply_delta, 0),
+            deleted_count=max(self.deleted_count + deleted_delta, 0),
+            last_active_at=last_active_at,
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert stats to dictionary.
+
+        Returns:
+            Dictionary representation of stats
+        """
+        return {
+            "post_count": self.post_count,
+            "reply_count": self.reply_count,
+            "deleted_count": self.deleted_count,
+            "last_active_at": self.last_active_at.isoformat() if self.last_active_at else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "AgentStats":
+        """Create stats from a dictionary produced by ``to_dict``.
+
+        Args:
+            data: Stats dictionary
+
+        Returns:
+            AgentStats instance
+
+        Raises:
+            ValueError: If the timestamp is malformed
+        """
+        last_active_at = data.get("last_active_at")
+        return cls(
+            post_count=int(data.get("post_count", 0)),
+            reply_count=int(data.get("reply_count", 0)),
+            deleted_count=int(data.get("deleted_count", 0)),
+            last_active_at=datetime.fromisoformat(last_active_at) if last_active_at else None,
+        )
@@ -0,0 +1,52 @@
+"""Post summary read model."""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+
+@dataclass(frozen=True)
+class PostSummary:
+    """Lightweight projection of a post for list and search views.
+
+    Built from post metadata only: it carries no content and no reply tree,
+    and ``reply_count`` is the counter stored with the post rather than a
+    count over its replies.
+    """
+
+    post_id: str
+    title: str
+    agent_name: str
+    created_at: datetime
+    updated_at: datetime
+    tags: list[str] = field(default_factory=list)
+    reply_count: int = 0
+    deleted: bool = False
+    deleted_at: datetime | None = None
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "PostSummary":
+        """Create a summary from post metadata as produced by ``Post.to_dict``.
+
+        Args:
+            data: Post metadata dictionary
+
+        Returns:
+            PostSummary instance
+
+        Raises:
+            KeyError: If a required field is missing
+            ValueError: If a timestamp is malformed
+        """
+        deleted_at = data.get("deleted_at")
+        return cls(
+            post_id=data["post_id"],
+            title=data["title"],
+            agent_name=data["agent_name"],
+            created_at=datetime.fromisoformat(data["created_at"]),
+            updated_at=datetime.fromisoformat(data["updated_at"]),
+            tags=list(data.get("tags", [])),
+            reply_count=int(data.get("reply_count", 0)),
+            deleted=bool(data.get("deleted", False)),
+            deleted_at=datetime.fromisoformat(deleted_at) if deleted_at else None,
+        )
@@ -1,5 +1,6 @@
 """Domain events."""
 
+from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime
 
@@ -52,3 +53,16 @@ class AgentRegistered(DomainEvent):
     """Event raised when an agent is registered."""
 
     agent_name: str
+
+
+class IEventPublisher(ABC):
+    """Interface for publishing domain events after a write."""
+
+    @abstractmethod
+    def publish(self, event: DomainEvent) -> None:
+        """Publish an event to its subscribers.
+
+        Args:
+            event: Domain event
+        """
+        pass
@@ -1,8 +1,10 @@
 """Agent repository interface."""
 
 from abc import ABC, abstractmethod
+from datetime import datetime
 
 from src.domain.entities.agent import Agent
+from src.domain.entities.agent_stats import AgentStats
 from src.domain.value_objects.agent_name import AgentName
 
 
@@ -77,3 +79,44 @@ class IAgentRepository(ABC):
             Number of replies
         """
         pass
+
+    @abstractmethod
+    def get_stats(self, name: AgentName) -> AgentStats:
+        """Get the activity counters of an agent.
+
+        Args:
+            name: Agent name
+
+        Returns:
+            Agent statistics (all zero for unknown agents)
+        """
+        pass
+
+    @abstractmethod
+    def update_stats(
+        self,
+        name: AgentName,
+        post_delta: int = 0,
+        reply_delta: int = 0,
+        deleted_delta: int = 0,
+        active_at: datetime | None = None,
+    ) -> None:
+        """Atomically apply a change to the activity counters of an agent.
+
+        Args:
+            name: Agent name
+            post_delta: Change in the number of posts
+            reply_delta: Change in the number of replies
+            deleted_delta: Change in the number of deleted posts and replies
+            active_at: Time of the activity, if any
+        """
+        pass
+
+    @abstractmethod
+    def rebuild_stats(self) -> int:
+        """Recompute the activity counters of every agent from stored posts.
+
+        Returns:
+            Number of agents whose counters were written
+        """
+        pass
@@ -3,8 +3,10 @@
 from abc import ABC, abstractmethod
 
 from src.domain.entities.post import Post
+from src.domain.entities.post_summary import PostSummary
 from src.domain.entities.reply import Reply
 from src.domain.value_objects.agent_name import AgentName
+from src.domain.value_objects.page_cursor import PageCursor
 from src.domain.value_objects.post_id import PostId
 
 
@@ -21,12 +23,15 @@ class IPostRepository(ABC):
         pass
 
     @abstractmethod
-    def find_by_id(self, post_id: PostId, include_deleted: bool = False) -> Post | None:
+    def find_by_id(
+        self, post_id: PostId, include_deleted: bool = False, include_replies: bool = True
+    ) -> Post | None:
         """Find a post by ID.
 
         Args:
             post_id: Post ID to search for
             include_deleted: Whether to include deleted posts
+            include_replies: Whether to load the reply tree
 
         Returns:
             Post if found, None otherwise
@@ -54,6 +59,42 @@ class IPostRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def find_summary(self, post_id: PostId, include_deleted: bool = False) -> PostSummary | None:
+        """Find a post summary by ID without loading content or replies.
+
+        Args:
+            post_id: Post ID to search for
+            include_deleted: Whether to include deleted posts
+
+        Returns:
+            Post summary if found, None otherwise
+        """
+        pass
+
+    @abstractmethod
+    def find_summaries(
+        self,
+        limit: int,
+        after: PageCursor | None = None,
+        offset: int = 0,
+        include_deleted: bool = False,
+        agent_name: AgentName | None = None,
+    ) -> list[PostSummary]:
+        """Find one page of post summaries, newest first, using keyset pagination.
+
+        Args:
+            limit: Maximum number of posts to return
+            after: Cursor of the last post on the previous page
+            offset: Number of posts to skip after the cursor
+            include_deleted: Whether to include deleted posts
+            agent_name: Filter by agent name
+
+        Returns:
+            List of summaries ordered by creation time and post ID, descending
+        """
+        pass
+
     @abstractmethod
     def delete(self, post_id: PostId) -> None:
         """Soft delete a post.
@@ -83,6 +124,8 @@ class IPostRepository(ABC):
     def find_reply_by_id(self, post_id: PostId, reply_id: str) -> Reply | None:
         """Find a reply by ID within a post.
 
+        Only the reply itself is read; its nested replies are not attached.
+
         Args:
             post_id: ID of the post
             reply_id: ID of the reply
@@ -92,6 +135,19 @@ class IPostRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def find_participants(self, post_id: PostId) -> set[str]:
+        """Find the agents taking part in a thread.
+
+        Args:
+            post_id: ID of the post
+
+        Returns:
+            Names of the post author and of every agent that replied (including
+            deleted replies); empty if the post does not exist
+        """
+        pass
+
     @abstractmethod
     def delete_reply(self, post_id: PostId, reply_id: str) -> None:
         """Soft delete a reply.
@@ -112,6 +168,9 @@ class IPostRepository(ABC):
     ) -> int:
         """Count posts.
 
+        Implementations may serve this from an index, so the result can be an
+        estimate that briefly lags concurrent writes.
+
         Args:
             agent_name: Optional filter by agent
             include_deleted: Whether to include deleted posts
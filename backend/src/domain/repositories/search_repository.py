@@ -4,7 +4,16 @@ from abc import ABC, abstractmethod
 from datetime import datetime
 
 from src.domain.entities.post import Post
+from src.domain.entities.post_summary import PostSummary
+from src.domain.entities.reply import Reply
 from src.domain.value_objects.agent_name import AgentName
+from src.domain.value_objects.page_cursor import PageCursor
+from src.domain.value_objects.tag_query import TagQuery
+
+# Result orders supported by search_posts
+SORT_NEWEST = "newest"
+SORT_RELEVANCE = "relevance"
+SEARCH_SORT_ORDERS = (SORT_NEWEST, SORT_RELEVANCE)
 
 
 class ISearchRepository(ABC):
@@ -14,28 +23,71 @@ class ISearchRepository(ABC):
     def search_posts(
         self,
         query: str | None = None,
-        tags: list[str] | None = None,
+        tags: TagQuery | None = None,
         agent_name: AgentName | None = None,
         start_date: datetime | None = None,
         end_date: datetime | None = None,
         include_deleted: bool = False,
         limit: int = 50,
         offset: int = 0,
-    ) -> list[Post]:
+        sort_by: str = SORT_NEWEST,
+        after: PageCursor | None = None,
+    ) -> list[PostSummary]:
         """Search posts with various filters.
 
         Args:
-            query: Text search query (searches title and content)
-            tags: Filter by tags
+            query: Text search query (searches title, content and replies)
+            tags: Tag query (alternative, required and excluded tags)
             agent_name: Filter by agent
             start_date: Filter posts created after this date
             end_date: Filter posts created before this date
             include_deleted: Whether to include deleted posts
             limit: Maximum number of results
             offset: Number of results to skip
+            sort_by: 'newest' or 'relevance' (relevance requires a query)
+            after: Cursor of the last post on the previous page (newest order only)
+
+        Returns:
+            List of matching post summaries
+        """
+        pass
+
+    @abstractmethod
+    def tag_counts(self, limit: int = 50) -> list[tuple[str, int]]:
+        """Get the most used tags.
+
+        Args:
+            limit: Maximum number of tags
 
         Returns:
-            List of matching posts
+            Tags with their number of visible posts, most used first (ties by tag)
+        """
+        pass
+
+    @abstractmethod
+    def index_post(self, post: Post) -> None:
+        """Add a new post's title and content to the full-text index.
+
+        Args:
+            post: Newly created post
+        """
+        pass
+
+    @abstractmethod
+    def index_reply(self, reply: Reply) -> None:
+        """Add a new reply's content to its post's full-text document.
+
+        Args:
+            reply: Newly created reply
+        """
+        pass
+
+    @abstractmethod
+    def unindex_reply(self, reply: Reply) -> None:
+        """Remove a deleted reply's content from its post's full-text document.
+
+        Args:
+            reply: Reply that was deleted
         """
         pass
 
@@ -1,5 +1,6 @@
 """Content value object for posts and replies."""
 
+import re
 from typing import Any
 
 
@@ -9,6 +10,10 @@ class Content:
     MIN_LENGTH = 1
     MAX_LENGTH = 50000
 
+    # "@name" where name is a valid agent name not preceded by a word character
+    # (so e-mail addresses are not mentions)
+    MENTION_PATTERN = re.compile(r"(?<![\w@])@([A-Za-z0-9_-]{3,50})(?![\w-])")
+
     def __init__(self, value: str) -> None:
         """Initialize content with validation.
 
@@ -44,6 +49,14 @@ class Content:
         """Get the content value."""
         return self._value
 
+    def mentions(self) -> list[str]:
+        """Get the agent names mentioned as ``@agent_name``.
+
+        Returns:
+            Mentioned names in order of first appearance, without duplicates
+        """
+        return list(dict.fromkeys(self.MENTION_PATTERN.findall(self._value)))
+
     def __str__(self) -> str:
         """String representation."""
         return self._value
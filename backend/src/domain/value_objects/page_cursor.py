@@ -0,0 +1,93 @@
+"""Page cursor value object."""
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any
+
+
+class PageCursor:
+    """Value object for keyset pagination over posts ordered newest first.
+
+    A cursor points just past the last post of a page, identified by its
+    ``(created_at, post_id)`` sort key, so the next page starts at the same
+    place no matter how many posts were created in the meantime. It is handed
+    to clients as an opaque URL-safe token.
+    """
+
+    def __init__(self, created_at: datetime, post_id: str) -> None:
+        """Initialize page cursor.
+
+        Args:
+            created_at: Creation time of the last post on the previous page
+            post_id: ID of the last post on the previous page
+
+        Raises:
+            ValueError: If post ID is empty
+        """
+        if not post_id:
+            raise ValueError("Cursor post ID cannot be empty")
+        self._created_at = created_at
+        self._post_id = post_id
+
+    @classmethod
+    def decode(cls, token: str) -> "PageCursor":
+        """Decode a cursor token.
+
+        Args:
+            token: Token returned by ``encode``
+
+        Returns:
+            PageCursor instance
+
+        Raises:
+            ValueError: If the token is malformed
+        """
+        try:
+            data = json.loads(base64.urlsafe_b64decode(token.encode("ascii") + b"=="))
+            created_at = datetime.fromisoformat(data["t"])
+            if created_at.tzinfo is not None:
+                # Post times are stored without an offset and cannot be compared to this one
+                raise ValueError("Cursor time must not carry a UTC offset")
+            return cls(created_at, str(data["id"]))
+        except (binascii.Error, UnicodeError, TypeError, KeyError, ValueError) as e:
+            raise ValueError("Invalid pagination cursor") from e
+
+    def encode(self) -> str:
+        """Encode the cursor as an opaque token.
+
+        Returns:
+            URL-safe token
+        """
+        data = json.dumps({"t": self._created_at.isoformat(), "id": self._post_id})
+        return base64.urlsafe_b64encode(data.encode("utf-8")).rstrip(b"=").decode("ascii")
+
+    @property
+    def created_at(self) -> datetime:
+        """Get the creation time of the last post on the previous page."""
+        return self._created_at
+
+    @property
+    def post_id(self) -> str:
+        """Get the ID of the last post on the previous page."""
+        return self._post_id
+
+    @property
+    def sort_key(self) -> tuple[datetime, str]:
+        """Get the ``(created_at, post_id)`` key; later pages have smaller keys."""
+        return (self._created_at, self._post_id)
+
+    def __repr__(self) -> str:
+        """Developer representation."""
+        return f"PageCursor({self._created_at.isoformat()!r}, {self._post_id!r})"
+
+    def __eq__(self, other: Any) -> bool:
+        """Check equality."""
+        if not isinstance(other, PageCursor):
+            return False
+        return self.sort_key == other.sort_key
+
+    def __hash__(self) -> int:
+        """Hash for use in sets and dicts."""
+        return hash(self.sort_key)
@@ -0,0 +1,149 @@
+"""Tag query value object."""
+
+from collections.abc import Iterable
+from typing import Any
+
+from src.domain.value_objects.tags import Tags
+
+
+class TagQuery:
+    """Value object for a tag filter combining OR, AND and NOT terms.
+
+    A post matches if it carries at least one of the ``any_of`` tags (when
+    there are any), every one of the ``all_of`` tags and none of the
+    ``none_of`` tags. In the text form used by the APIs, plain terms are
+    alternatives, ``+tag`` is required and ``-tag`` is excluded, so
+    ``["python", "rust", "+async", "-draft"]`` finds posts about Python or
+    Rust that are tagged ``async`` and not ``draft``.
+    """
+
+    REQUIRED_PREFIX = "+"
+    EXCLUDED_PREFIX = "-"
+
+    def __init__(
+        self,
+        any_of: Iterable[str] = (),
+        all_of: Iterable[str] = (),
+        none_of: Iterable[str] = (),
+    ) -> None:
+        """Initialize tag query with validation.
+
+        Args:
+            any_of: Tags of which a post must carry at least one
+            all_of: Tags a post must all carry
+            none_of: Tags a post must not carry
+
+        Raises:
+            ValueError: If a tag is invalid or a group has too many tags
+        """
+        self._any_of = self._normalize(any_of)
+        self._all_of = self._normalize(all_of)
+        self._none_of = self._normalize(none_of)
+
+    @staticmethod
+    def _normalize(tags: Iterable[str]) -> tuple[str, ...]:
+        """Validate and normalize one group of tags.
+
+        Args:
+            tags: Tags as given
+
+        Returns:
+            Sorted, lowercased tags without duplicates
+
+        Raises:
+            ValueError: If a tag is invalid or there are too many tags
+        """
+        return tuple(sorted(set(Tags(list(tags)))))
+
+    @classmethod
+    def parse(cls, terms: Iterable[str]) -> "TagQuery":
+        """Parse a tag query from its text form.
+
+        Args:
+            terms: Tags, each optionally prefixed with '+' (required) or '-' (excluded)
+
+        Returns:
+            TagQuery instance
+
+        Raises:
+            ValueError: If a term is empty or not a valid tag
+        """
+        any_of: list[str] = []
+        all_of: list[str] = []
+        none_of: list[str] = []
+        for term in terms:
+            term = term.strip()
+            if term.startswith(cls.REQUIRED_PREFIX):
+                all_of.append(term[1:])
+            elif term.startswith(cls.EXCLUDED_PREFIX):
+                none_of.append(term[1:])
+            else:
+                any_of.append(term)
+        return cls(any_of, all_of, none_of)
+
+    @property
+    def any_of(self) -> tuple[str, ...]:
+        """Get the alternative tags."""
+        return self._any_of
+
+    @property
+    def all_of(self) -> tuple[str, ...]:
+        """Get the required tags."""
+        return self._all_of
+
+    @property
+    def none_of(self) -> tuple[str, ...]:
+        """Get the excluded tags."""
+        return self._none_of
+
+    def is_empty(self) -> bool:
+        """Check whether the query has no terms and so matches every post.
+
+        Returns:
+            True if there are no terms
+        """
+        return not (self._any_of or self._all_of or self._none_of)
+
+    def matches(self, tags: Iterable[str]) -> bool:
+        """Check whether a post's tags satisfy the query.
+
+        Args:
+            tags: Tags of the post
+
+        Returns:
+            True if the post matches
+        """
+        carried = set(tags)
+        if self._any_of and carried.isdisjoint(self._any_of):
+            return False
+        return carried.issuperset(self._all_of) and carried.isdisjoint(self._none_of)
+
+    def to_terms(self) -> list[str]:
+        """Convert the query back to its text form.
+
+        Returns:
+            Terms accepted by ``parse``
+        """
+        return [
+            *self._any_of,
+            *(self.REQUIRED_PREFIX + tag for tag in self._all_of),
+            *(self.EXCLUDED_PREFIX + tag for tag in self._none_of),
+        ]
+
+    def __repr__(self) -> str:
+        """Developer representation."""
+        return f"TagQuery({self.to_terms()})"
+
+    def __eq__(self, other: Any) -> bool:
+        """Check equality."""
+        if not isinstance(other, TagQuery):
+            return False
+        return (self._any_of, self._all_of, self._none_of) == (
+            other._any_of,
+            other._all_of,
+            other._none_of,
+        )
+
+    def __hash__(self) -> int:
+        """Get hash value."""
+        return hash((self._any_of, self._all_of, self._none_of))
@@ -0,0 +1,127 @@
+"""Runtime configuration for the BBS backend."""
+
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+STORAGE_BACKENDS = ("file", "sqlite")
+EVENT_DISPATCH_MODES = ("background", "inline")
+
+
+@dataclass(frozen=True)
+class Settings:
+    """Backend settings resolved from arguments and environment variables.
+
+    Environment variables:
+        BBS_DATA_DIR: Root data directory (default: ./data)
+        BBS_STORAGE_BACKEND: Storage engine, 'file' or 'sqlite' (default: file)
+        BBS_SQLITE_PATH: SQLite database file (default: <data_dir>/bbs.sqlite3)
+        BBS_EXECUTOR_WORKERS: Threads running blocking storage calls (default: 16)
+        BBS_EXECUTOR_QUEUE_LIMIT: Calls allowed to wait for a thread, 0 for
+            no limit (default: 256)
+        BBS_EVENT_DISPATCH: Run index and counter updates on a 'background'
+            thread or 'inline' in the request (default: background)
+        BBS_EVENT_OUTBOX: Persist events to an outbox file before handling
+            them, '1' to enable (default: 0)
+        BBS_POST_CACHE_BYTES: Memory for threads cached by the file backend,
+            0 to disable (default: 64 MiB)
+        BBS_RESPONSE_CACHE_BYTES: Memory for serialized post responses, 0 to
+            disable (default: 16 MiB)
+        BBS_POST_INDEX_SHARDS: Number of files the file backend's post index
+            is split into, each with its own lock (default: 1)
+        BBS_TRACE_SAMPLE_RATE: Fraction of requests and tool calls traced,
+            between 0 and 1 (default: 0, tracing off)
+        BBS_TRACE_MIN_DURATION_MS: Only export traces of requests that took at
+            least this long (default: 0)
+        BBS_TRACE_FILE: JSONL file traces are appended to
+            (default: <data_dir>/traces.jsonl)
+    """
+
+    data_dir: Path
+    storage_backend: str = "file"
+    sqlite_path: Path | None = None
+    executor_workers: int = 16
+    executor_queue_limit: int = 256
+    event_dispatch: str = "background"
+    event_outbox: bool = False
+    post_cache_bytes: int = 64 * 1024 * 1024
+    response_cache_bytes: int = 16 * 1024 * 1024
+    post_index_shards: int = 1
+    trace_sample_rate: float = 0.0
+    trace_min_duration_ms: float = 0.0
+    trace_file: Path | None = None
+
+    def __post_init__(self) -> None:
+        """Validate settings."""
+        if self.storage_backend not in STORAGE_BACKENDS:
+            raise ValueError(
+                f"Unknown storage backend '{self.storage_backend}', "
+                f"expected one of: {', '.join(STORAGE_BACKENDS)}"
+            )
+        if self.executor_workers < 1:
+            raise ValueError("BBS_EXECUTOR_WORKERS must be at least 1")
+        if self.executor_queue_limit < 0:
+            raise ValueError("BBS_EXECUTOR_QUEUE_LIMIT cannot be negative")
+        if self.event_dispatch not in EVENT_DISPATCH_MODES:
+            raise ValueError(
+                f"Unknown event dispatch mode '{self.event_dispatch}', "
+                f"expected one of: {', '.join(EVENT_DISPATCH_MODES)}"
+            )
+        if self.post_cache_bytes < 0:
+            raise ValueError("BBS_POST_CACHE_BYTES cannot be negative")
+        if self.response_cache_bytes < 0:
+            raise ValueError("BBS_RESPONSE_CACHE_BYTES cannot be negative")
+        if self.post_index_shards < 1:
+            raise ValueError("BBS_POST_INDEX_SHARDS must be at least 1")
+        if not 0.0 <= self.trace_sample_rate <= 1.0:
+            raise ValueError("BBS_TRACE_SAMPLE_RATE must be between 0 and 1")
+        if self.trace_min_duration_ms < 0:
+            raise ValueError("BBS_TRACE_MIN_DURATION_MS cannot be negative")
+
+    @property
+    def database_path(self) -> Path:
+        """Get the SQLite database path."""
+        return self.sqlite_path or self.data_dir / "bbs.sqlite3"
+
+    @property
+    def trace_path(self) -> Path:
+        """Get the file traces are exported to."""
+        return self.trace_file or self.data_dir / "traces.jsonl"
+
+    @classmethod
+    def from_env(
+        cls,
+        data_dir: Path | None = None,
+        storage_backend: str | None = None,
+    ) -> "Settings":
+        """Build settings, letting explicit arguments override the environment.
+
+        Args:
+            data_dir: Optional data directory override
+            storage_backend: Optional storage backend override
+
+        Returns:
+            Settings instance
+
+        Raises:
+            ValueError: If the storage backend or dispatch mode is unknown or a number is invalid
+        """
+        sqlite_path = os.environ.get("BBS_SQLITE_PATH")
+        trace_file = os.environ.get("BBS_TRACE_FILE")
+        return cls(
+            data_dir=data_dir or Path(os.environ.get("BBS_DATA_DIR", "data")),
+            storage_backend=storage_backend or os.environ.get("BBS_STORAGE_BACKEND", "file"),
+            sqlite_path=Path(sqlite_path) if sqlite_path else None,
+            executor_workers=int(os.environ.get("BBS_EXECUTOR_WORKERS", "16")),
+            executor_queue_limit=int(os.environ.get("BBS_EXECUTOR_QUEUE_LIMIT", "256")),
+            event_dispatch=os.environ.get("BBS_EVENT_DISPATCH", "background"),
+            event_outbox=os.environ.get("BBS_EVENT_OUTBOX", "0").lower() in ("1", "true", "yes"),
+            post_cache_bytes=int(os.environ.get("BBS_POST_CACHE_BYTES", str(64 * 1024 * 1024))),
+            response_cache_bytes=int(
+                os.environ.get("BBS_RESPONSE_CACHE_BYTES", str(16 * 1024 * 1024))
+            ),
+            post_index_shards=int(os.environ.get("BBS_POST_INDEX_SHARDS", "1")),
+            trace_sample_rate=float(os.environ.get("BBS_TRACE_SAMPLE_RATE", "0")),
+            trace_min_duration_ms=float(os.environ.get("BBS_TRACE_MIN_DURATION_MS", "0")),
+            trace_file=Path(trace_file) if trace_file else None,
+        )
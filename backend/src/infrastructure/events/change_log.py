@@ -0,0 +1,343 @@
+"""Sequence-numbered log of board changes for the change feed."""
+
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from src.domain.events import DomainEvent
+from src.infrastructure.events.event_outbox import event_to_dict
+from src.infrastructure.persistence.file_storage import FileStorage
+
+# Public name of each change log record type
+CHANGE_TYPES = {
+    "PostCreated": "post_created",
+    "PostDeleted": "post_deleted",
+    "ReplyAdded": "reply_added",
+    "ReplyDeleted": "reply_deleted",
+}
+
+
+@dataclass(frozen=True)
+class ChangeCursor:
+    """Position of a change feed reader.
+
+    ``inode`` identifies the segment file being read; None means the current
+    segment, whichever file that turns out to be, from its start.
+    """
+
+    inode: int | None
+    offset: int
+
+
+class ChangeLog:
+    """Append-only JSON Lines log of domain events with monotonic sequence numbers.
+
+    Each record is an event as written to the outbox plus a ``seq`` field that
+    is one higher than the previous record's. Sequence numbers are assigned
+    under the ``change_log`` file lock, so they stay monotonic across processes.
+
+    The log is kept as two segments: once the current segment grows past
+    ``SEGMENT_BYTES`` it is renamed over the previous one and a new one is
+    started, so at least ``SEGMENT_BYTES`` of history is retained. Readers
+    follow a segment by inode, so a rename never makes them skip or repeat
+    records; only a reader that falls more than a full segment behind loses
+    its place.
+    """
+
+    SEGMENT_BYTES = 4 * 1024 * 1024
+    TAIL_BYTES = 16 * 1024
+
+    def __init__(self, file_storage: FileStorage) -> None:
+        """Initialize change log.
+
+        Args:
+            file_storage: File storage instance
+        """
+        self._storage = file_storage
+        events_dir = file_storage.data_dir / "events"
+        events_dir.mkdir(parents=True, exist_ok=True)
+        self._current_path = events_dir / "changes.jsonl"
+        self._previous_path = events_dir / "changes.1.jsonl"
+        self._tail_cache: tuple[int, int, int] | None = None
+
+    def append(self, event: DomainEvent) -> int:
+        """Append an event with the next sequence number.
+
+        Args:
+            event: Domain event
+
+        Returns:
+            Sequence number of the event
+        """
+        with self._storage.get_lock("change_log"):
+            seq = self._last_seq() + 1
+            self._storage.append_jsonl(self._current_path, [{"seq": seq, **event_to_dict(event)}])
+            stat = self._current_path.stat()
+            self._tail_cache = (stat.st_ino, stat.st_size, seq)
+            if stat.st_size > self.SEGMENT_BYTES:
+                self._current_path.replace(self._previous_path)
+            return seq
+
+    def last_seq(self) -> int:
+        """Get the sequence number of the newest event.
+
+        Returns:
+            Sequence number (0 if the log is empty)
+        """
+        with self._storage.get_lock("change_log"):
+            return self._last_seq()
+
+    def first_seq(self) -> int | None:
+        """Get the sequence number of the oldest retained event.
+
+        Returns:
+            Sequence number, or None if the log is empty
+        """
+        for path in (self._previous_path, self._current_path):
+            first = self._first_seq(path)
+            if first is not None:
+                return first
+        return None
+
+    def cursor_after(self, seq: int | None) -> tuple[ChangeCursor, bool]:
+        """Position a reader just after an event.
+
+        The position is found by binary search over the segment files, so
+        resuming costs a few small reads regardless of the size of the log.
+
+        Args:
+            seq: Sequence number of the last event the reader has seen, or
+                None to start at the end of the log
+
+        Returns:
+            Tuple of the cursor and whether events the reader has not seen
+            are no longer retained (or ``seq`` is unknown to this log)
+        """
+        segments = [
+            (path, stat, *self._tail(path, stat.st_size))
+            for path in (self._previous_path, self._current_path)
+            if (stat := self._stat(path)) is not None
+        ]
+        if not segments:
+            return ChangeCursor(None, 0), bool(seq)
+
+        _, last_stat, _, last_end = segments[-1]
+        end = ChangeCursor(last_stat.st_ino, last_end)
+        if seq is None:
+            return end, False
+
+        oldest = next(
+            (first for path, _, _, _ in segments if (first := self._first_seq(path)) is not None),
+            None,
+        )
+        for path, stat, _, complete_end in segments:
+            offset = self._seek_after(path, seq, complete_end)
+            if offset < complete_end:
+                return ChangeCursor(stat.st_ino, offset), oldest is not None and seq < oldest - 1
+
+        # Every retained event is at or before ``seq``; a larger ``seq`` is not from this log
+        newest = next((last for _, _, last, _ in reversed(segments) if last is not None), 0)
+        return end, seq > newest
+
+    def read(
+        self, cursor: ChangeCursor, limit: int = 500
+    ) -> tuple[list[dict[str, Any]], ChangeCursor, bool]:
+        """Read the records after a cursor.
+
+        Args:
+            cursor: Position returned by ``cursor_after`` or a previous ``read``
+            limit: Maximum number of records to return
+
+        Returns:
+            Tuple of records in sequence order, the new cursor, and whether
+            records were lost because the reader fell more than a segment
+            behind (the cursor is then moved to the oldest retained record)
+        """
+        current = self._stat(self._current_path)
+        missed = False
+
+        if cursor.inode is not None and (current is None or cursor.inode != current.st_ino):
+            previous = self._stat(self._previous_path)
+            if previous is not None and cursor.inode == previous.st_ino:
+                records, offset = self._read_from(self._previous_path, cursor.offset, limit)
+                if len(records) == limit or offset < previous.st_size:
+                    return records, ChangeCursor(cursor.inode, offset), False
+                cursor = ChangeCursor(None, 0)
+            else:
+                missed = True
+                if previous is not None:
+                    records, offset = self._read_from(self._previous_path, 0, limit)
+                    return records, ChangeCursor(previous.st_ino, offset), True
+                records = []
+                cursor = ChangeCursor(None, 0)
+        else:
+            records = []
+
+        if current is None:
+            return records, cursor, missed
+
+        more, offset = self._read_from(self._current_path, cursor.offset, limit - len(records))
+        return records + more, ChangeCursor(current.st_ino, offset), missed
+
+    def _last_seq(self) -> int:
+        """Get the newest sequence number; the change log lock must be held.
+
+        Returns:
+            Sequence number (0 if the log is empty)
+        """
+        current = self._stat(self._current_path)
+        if current is not None and self._tail_cache and self._tail_cache[0] == current.st_ino:
+            records, offset = self._read_from(self._current_path, self._tail_cache[1], limit=None)
+            seq = records[-1]["seq"] if records else self._tail_cache[2]
+        else:
+            seq, offset = self._tail(self._current_path, current.st_size) if current else (None, 0)
+            if seq is None:
+                previous = self._stat(self._previous_path)
+                seq = self._tail(self._previous_path, previous.st_size)[0] if previous else None
+            seq = seq or 0
+
+        if current is not None:
+            self._tail_cache = (current.st_ino, offset, seq)
+        return seq
+
+    def _first_seq(self, path: Path) -> int | None:
+        """Get the sequence number of the first record in a segment.
+
+        Args:
+            path: Segment file
+
+        Returns:
+            Sequence number, or None if the segment has no complete record
+        """
+        try:
+            with open(path, "rb") as f:
+                return self._record_at(f, 0, os.fstat(f.fileno()).st_size)[0]
+        except FileNotFoundError:
+            return None
+
+    def _tail(self, path: Path, size: int) -> tuple[int | None, int]:
+        """Find the last complete record of a segment.
+
+        Args:
+            path: Segment file
+            size: Size of the segment
+
+        Returns:
+            Tuple of the record's sequence number (None if there is none) and
+            the byte offset just past the last complete line
+        """
+        chunk = self.TAIL_BYTES
+        while True:
+            try:
+                with open(path, "rb") as f:
+                    f.seek(max(size - chunk, 0))
+                    data = f.read(min(size, chunk))
+            except FileNotFoundError:
+                return None, 0
+
+            complete = data.rfind(b"\n") + 1
+            lines = data[:complete].splitlines()
+            if size > chunk:
+                # The first line may start before the chunk
+                lines = lines[1:]
+            for line in reversed(lines):
+                records, _ = self._storage.parse_jsonl(line + b"\n")
+                if records and isinstance(records[0].get("seq"), int):
+                    return records[0]["seq"], size - len(data) + complete
+            if size <= chunk:
+                return None, size - len(data) + complete
+            chunk *= 4
+
+    def _seek_after(self, path: Path, seq: int, end: int) -> int:
+        """Binary search a segment for the first record after a sequence number.
+
+        Args:
+            path: Segment file
+            seq: Sequence number
+            end: Byte offset just past the last complete line
+
+        Returns:
+            Byte offset of the first record with a larger sequence number, or
+            ``end`` if there is none
+        """
+        with open(path, "rb") as f:
+            low, high = 0, end
+            while low < high:
+                middle = (low + high) // 2
+                line_seq, _ = self._record_at(f, middle, end)
+                if line_seq is None or line_seq > seq:
+                    high = middle
+                else:
+                    low = middle + 1
+            return self._record_at(f, low, end)[1]
+
+    def _record_at(self, f: BinaryIO, offset: int, end: int) -> tuple[int | None, int]:
+        """Find the first valid record starting at or after a byte offset.
+
+        Args:
+            f: Open segment file
+            offset: Byte offset (need not be at a line start)
+            end: Byte offset just past the last complete line
+
+        Returns:
+            Tuple of the record's sequence number (None if there is none
+            before ``end``) and the offset where it starts
+        """
+        if offset > 0:
+            f.seek(offset - 1)
+            f.readline()
+            offset = f.tell()
+        else:
+            f.seek(0)
+
+        while offset < end:
+            line = f.readline()
+            records, _ = self._storage.parse_jsonl(line)
+            if records and isinstance(records[0].get("seq"), int):
+                return records[0]["seq"], offset
+            offset += len(line)
+        return None, end
+
+    def _read_from(
+        self, path: Path, offset: int, limit: int | None
+    ) -> tuple[list[dict[str, Any]], int]:
+        """Read complete records from a segment.
+
+        Args:
+            path: Segment file
+            offset: Byte offset to start at
+            limit: Maximum number of records (None for all)
+
+        Returns:
+            Tuple of records and the byte offset just past the last one returned
+        """
+        records = []
+        try:
+            with open(path, "rb") as f:
+                f.seek(offset)
+                for line in f:
+                    if not line.endswith(b"\n") or (limit is not None and len(records) >= limit):
+                        break
+                    offset += len(line)
+                    parsed, _ = self._storage.parse_jsonl(line)
+                    if parsed and "seq" in parsed[0]:
+                        records.append(parsed[0])
+        except FileNotFoundError:
+            pass
+        return records, offset
+
+    @staticmethod
+    def _stat(path: Path) -> os.stat_result | None:
+        """Stat a segment file.
+
+        Args:
+            path: Segment file
+
+        Returns:
+            Stat result, or None if the file does not exist
+        """
+        try:
+            return os.stat(path)
+        except FileNotFoundError:
+            return None
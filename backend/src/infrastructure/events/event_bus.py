@@ -0,0 +1,256 @@
+"""In-process domain event bus."""
+
+import logging
+import queue
+import threading
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from src.domain.events import DomainEvent, IEventPublisher
+from src.infrastructure.events.event_outbox import EventOutbox
+
+logger = logging.getLogger(__name__)
+
+EventHandler = Callable[[Any], None]
+
+
+@dataclass(frozen=True)
+class EventBusStats:
+    """Point-in-time counters of an ``EventBus``."""
+
+    published: int
+    handled: int
+    failed: int
+    pending: int
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert stats to dictionary.
+
+        Returns:
+            Dictionary representation of stats
+        """
+        return asdict(self)
+
+
+class EventBus(IEventPublisher):
+    """Dispatches domain events to the handlers subscribed to their type.
+
+    Use cases publish an event after their primary write; index, counter and
+    cache maintenance subscribe to it. Once ``start`` is called, events are
+    handed to a single background thread, so handlers run off the request
+    path, one event at a time and in publication order. Before that (and in
+    ``inline`` deployments) handlers run synchronously inside ``publish``.
+
+    Handlers subscribed with ``inline=True`` always run inside ``publish``,
+    before the event is queued; they are meant for cheap bookkeeping (such as
+    cache invalidation) that must take effect before the write returns.
+
+    A failing handler is logged and counted; it does not affect the other
+    handlers or the publisher. With an ``EventOutbox``, events are written to
+    disk before they are queued, and events left over by a previous process
+    are replayed by ``start``. The bus owns the outbox from its creation until
+    ``shutdown``.
+    """
+
+    # Events handled before the outbox offset is recorded
+    COMMIT_BATCH = 100
+
+    def __init__(self, outbox: EventOutbox | None = None) -> None:
+        """Initialize event bus.
+
+        Args:
+            outbox: Optional durable outbox
+
+        Raises:
+            OutboxInUseError: If another process owns the outbox
+        """
+        if outbox is not None:
+            outbox.claim()
+        self._outbox = outbox
+        self._handlers: dict[type[DomainEvent], list[EventHandler]] = {}
+        self._inline_handlers: dict[type[DomainEvent], list[EventHandler]] = {}
+        self._queue: queue.Queue[tuple[DomainEvent, int | None] | None] = queue.Queue()
+        self._worker: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._published = 0
+        self._handled = 0
+        self._failed = 0
+        self._pending = 0
+
+    def subscribe(
+        self, event_type: type[DomainEvent], handler: EventHandler, inline: bool = False
+    ) -> None:
+        """Subscribe a handler to an event type (and its subclasses).
+
+        Args:
+            event_type: Event class
+            handler: Callable receiving the event
+            inline: Whether to run the handler in the publishing thread even
+                when the background worker is running
+        """
+        handlers = self._inline_handlers if inline else self._handlers
+        handlers.setdefault(event_type, []).append(handler)
+
+    def publish(self, event: DomainEvent) -> None:
+        """Publish an event to its subscribers.
+
+        Args:
+            event: Domain event
+        """
+        position = self._outbox.append(event) if self._outbox is not None else None
+        self._handle(event, self._inline_handlers)
+        with self._lock:
+            self._published += 1
+            self._pending += 1
+            background = self._worker is not None
+
+        if background:
+            self._queue.put((event, position))
+        else:
+            self._handle(event)
+            self._commit(position)
+            self._done(1)
+
+    def start(self) -> None:
+        """Replay outstanding outbox events and start the background worker."""
+        with self._lock:
+            if self._worker is not None:
+                return
+            self._worker = threading.Thread(target=self._run, name="bbs-events", daemon=True)
+
+        if self._outbox is not None:
+            pending = self._outbox.pending()
+            with self._lock:
+                self._pending += len(pending)
+            for item in pending:
+                self._queue.put(item)
+
+        self._worker.start()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until every published event has been handled.
+
+        Args:
+            timeout: Maximum number of seconds to wait (None to wait forever)
+
+        Returns:
+            True if the bus is idle, False if the timeout expired
+        """
+        with self._idle:
+            return self._idle.wait_for(lambda: self._pending == 0, timeout)
+
+    def shutdown(self, timeout: float | None = None) -> None:
+        """Handle the queued events, stop the background worker and release the outbox.
+
+        The outbox stays owned if the worker does not stop within ``timeout``.
+
+        Args:
+            timeout: Maximum number of seconds to wait for the worker
+        """
+        with self._lock:
+            worker, self._worker = self._worker, None
+        if worker is not None:
+            self._queue.put(None)
+            worker.join(timeout)
+
+            # Events queued by publishers that raced the shutdown
+            leftover = []
+            while not worker.is_alive():
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is not None:
+                    leftover.append(item)
+            self._handle_batch(leftover)
+
+        if self._outbox is not None and (worker is None or not worker.is_alive()):
+            self._outbox.release()
+
+    def stats(self) -> EventBusStats:
+        """Get a snapshot of the bus counters.
+
+        Returns:
+            Event bus statistics
+        """
+        with self._lock:
+            return EventBusStats(
+                published=self._published,
+                handled=self._handled,
+                failed=self._failed,
+                pending=self._pending,
+            )
+
+    def _run(self) -> None:
+        """Worker loop: handle queued events in batches until shut down."""
+        stopping = False
+        while not stopping:
+            batch = [self._queue.get()]
+            while len(batch) < self.COMMIT_BATCH:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            if None in batch:
+                stopping = True
+                batch = [item for item in batch if item is not None]
+            self._handle_batch(batch)
+
+    def _handle_batch(self, batch: list[Any]) -> None:
+        """Handle queued events and record their progress.
+
+        Args:
+            batch: Pairs of event and outbox position, in publication order
+        """
+        if not batch:
+            return
+        for event, _ in batch:
+            self._handle(event)
+        self._commit(batch[-1][1])
+        self._done(len(batch))
+
+    def _handle(
+        self,
+        event: DomainEvent,
+        subscriptions: dict[type[DomainEvent], list[EventHandler]] | None = None,
+    ) -> None:
+        """Run every handler subscribed to an event.
+
+        Args:
+            event: Domain event
+            subscriptions: Handlers by event type (defaults to the queued handlers)
+        """
+        if subscriptions is None:
+            subscriptions = self._handlers
+        for event_type, handlers in subscriptions.items():
+            if not isinstance(event, event_type):
+                continue
+            for handler in handlers:
+                try:
+                    handler(event)
+                except Exception:
+                    logger.exception("Handler %r failed for %r", handler, event)
+                    with self._lock:
+                        self._failed += 1
+
+    def _commit(self, position: int | None) -> None:
+        """Record the outbox position of the last handled event.
+
+        Args:
+            position: Outbox offset, or None if the event has none
+        """
+        if self._outbox is not None and position is not None:
+            self._outbox.commit(position)
+
+    def _done(self, count: int) -> None:
+        """Mark events as handled and wake up ``flush`` callers.
+
+        Args:
+            count: Number of handled events
+        """
+        with self._idle:
+            self._handled += count
+            self._pending -= count
+            self._idle.notify_all()
@@ -0,0 +1,185 @@
+"""Durable outbox for domain events."""
+
+import dataclasses
+import fcntl
+import os
+from datetime import datetime
+from typing import Any
+
+from src.domain.events import (
+    AgentRegistered,
+    DomainEvent,
+    PostCreated,
+    PostDeleted,
+    ReplyAdded,
+    ReplyDeleted,
+)
+from src.infrastructure.persistence.file_storage import FileStorage
+
+EVENT_TYPES: dict[str, type[DomainEvent]] = {
+    cls.__name__: cls
+    for cls in (PostCreated, ReplyAdded, PostDeleted, ReplyDeleted, AgentRegistered)
+}
+
+
+def event_to_dict(event: DomainEvent) -> dict[str, Any]:
+    """Convert an event to an outbox record.
+
+    Args:
+        event: Domain event
+
+    Returns:
+        Dictionary with the event type and its fields
+    """
+    data = dataclasses.asdict(event)
+    data["occurred_at"] = event.occurred_at.isoformat()
+    return {"type": type(event).__name__, **data}
+
+
+def event_from_dict(data: dict[str, Any]) -> DomainEvent | None:
+    """Create an event from an outbox record.
+
+    Args:
+        data: Record produced by ``event_to_dict``
+
+    Returns:
+        Domain event, or None if the record is of an unknown type or malformed
+    """
+    event_type = EVENT_TYPES.get(data.get("type", ""))
+    if event_type is None:
+        return None
+
+    fields = {f.name: data.get(f.name) for f in dataclasses.fields(event_type)}
+    try:
+        fields["occurred_at"] = datetime.fromisoformat(fields["occurred_at"])
+        return event_type(**fields)
+    except (TypeError, ValueError):
+        return None
+
+
+class OutboxInUseError(RuntimeError):
+    """Raised when the event outbox of a data directory is owned by another process."""
+
+
+class EventOutbox:
+    """Append-only JSON Lines file of published events plus a processed offset.
+
+    Every event is appended before it is handed to the background worker, and
+    the worker records the byte offset of the last event it has handled.
+    Events after that offset (published by a process that stopped before its
+    worker caught up) are replayed on the next start, so subscribers see each
+    event at least once. Once every event has been handled and the file has
+    grown past ``COMPACT_BYTES`` it is truncated.
+
+    The outbox belongs to one server process per data directory: the event
+    bus using it holds an exclusive lock on it (see ``claim``), so a second
+    process, such as another uvicorn worker, fails to start instead of
+    replaying and committing the first one's events.
+    """
+
+    COMPACT_BYTES = 1024 * 1024
+
+    def __init__(self, file_storage: FileStorage) -> None:
+        """Initialize outbox.
+
+        Args:
+            file_storage: File storage instance
+        """
+        self._storage = file_storage
+        self._events_dir = file_storage.data_dir / "events"
+        self._outbox_path = self._events_dir / "outbox.jsonl"
+        self._offset_path = self._events_dir / "outbox_offset.json"
+        self._events_dir.mkdir(parents=True, exist_ok=True)
+        self._owner_fd: int | None = None
+
+    def claim(self) -> None:
+        """Take ownership of the outbox until ``release`` is called.
+
+        The lock is held on a file descriptor of its own rather than through
+        ``FileStorage.get_lock``, whose locks are short-lived and measured.
+
+        Raises:
+            OutboxInUseError: If another process or event bus owns the outbox
+        """
+        if self._owner_fd is not None:
+            return
+        lock_path = self._storage.locks_dir / "event_outbox_owner.lock"
+        fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            raise OutboxInUseError(
+                f"The event outbox in {self._events_dir} is used by another process; "
+                "BBS_EVENT_OUTBOX needs a single server process per data directory"
+            ) from None
+        self._owner_fd = fd
+
+    def release(self) -> None:
+        """Give up ownership of the outbox."""
+        if self._owner_fd is not None:
+            os.close(self._owner_fd)
+            self._owner_fd = None
+
+    def append(self, event: DomainEvent) -> int:
+        """Append an event.
+
+        Args:
+            event: Domain event
+
+        Returns:
+            Byte offset just past the appended record
+        """
+        with self._storage.get_lock("event_outbox"):
+            self._storage.append_jsonl(self._outbox_path, [event_to_dict(event)])
+            return self._outbox_path.stat().st_size
+
+    def pending(self) -> list[tuple[DomainEvent, int]]:
+        """Get the events that were appended but not yet handled.
+
+        Returns:
+            Pairs of event and the byte offset just past it, in publication order
+        """
+        if not self._storage.file_exists(self._outbox_path):
+            return []
+
+        offset = self._committed_offset()
+        if offset > self._outbox_path.stat().st_size:
+            # Crashed between truncating the outbox and resetting the offset
+            offset = 0
+
+        pending = []
+        with open(self._outbox_path, "rb") as f:
+            f.seek(offset)
+            for line in f:
+                offset += len(line)
+                if not line.endswith(b"\n"):
+                    break
+                records, _ = self._storage.parse_jsonl(line)
+                event = event_from_dict(records[0]) if records else None
+                if event is not None:
+                    pending.append((event, offset))
+        return pending
+
+    def commit(self, position: int) -> None:
+        """Record that every event up to ``position`` has been handled.
+
+        Args:
+            position: Byte offset returned by ``append`` or ``pending``
+        """
+        with self._storage.get_lock("event_outbox"):
+            size = self._outbox_path.stat().st_size if self._outbox_path.exists() else 0
+            if position >= size and size > self.COMPACT_BYTES:
+                self._outbox_path.write_bytes(b"")
+                position = 0
+            self._storage.write_json(self._offset_path, {"offset": position})
+
+    def _committed_offset(self) -> int:
+        """Get the offset recorded by the last ``commit``.
+
+        Returns:
+            Byte offset (0 if nothing was committed yet)
+        """
+        if not self._storage.file_exists(self._offset_path):
+            return 0
+        return int(self._storage.read_json(self._offset_path).get("offset", 0))
@@ -0,0 +1,238 @@
+"""Bounded thread pool for running blocking use cases from async code."""
+
+import asyncio
+import contextvars
+import functools
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Any, TypeVar
+
+from src.infrastructure.config import Settings
+from src.infrastructure.tracing import add_span
+
+T = TypeVar("T")
+
+
+class ExecutorOverloadedError(RuntimeError):
+    """Raised when too many calls are already waiting for a worker thread."""
+
+
+@dataclass(frozen=True)
+class ExecutorStats:
+    """Point-in-time counters of a ``BlockingExecutor``."""
+
+    max_workers: int
+    queue_limit: int
+    active: int
+    queued: int
+    submitted: int
+    completed: int
+    failed: int
+    rejected: int
+    cancelled: int
+    total_wait_seconds: float
+    max_wait_seconds: float
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert stats to dictionary.
+
+        Returns:
+            Dictionary representation of stats
+        """
+        return asdict(self)
+
+
+class _QueueSlot:
+    """A call's place in the wait queue, released once by whoever gets to it first."""
+
+    __slots__ = ("waiting",)
+
+    def __init__(self) -> None:
+        self.waiting = True
+
+
+class BlockingExecutor:
+    """Runs blocking calls (file I/O, ``flock``, SQLite) off the event loop.
+
+    The use cases and repositories are synchronous; the REST routes and MCP
+    tools await them through this executor so that a slow disk operation
+    only occupies one worker thread instead of stalling every request
+    served by the event loop. The pool size bounds how many blocking calls
+    run at once, and ``queue_limit`` bounds how many may wait for a worker:
+    beyond that, calls fail fast with ``ExecutorOverloadedError`` instead of
+    piling up. A call whose caller is cancelled (e.g. the client disconnected)
+    while it waits gives up its place and never runs.
+    """
+
+    def __init__(self, max_workers: int, queue_limit: int = 0) -> None:
+        """Initialize executor.
+
+        Args:
+            max_workers: Number of worker threads
+            queue_limit: Maximum number of calls waiting for a worker (0 for no limit)
+
+        Raises:
+            ValueError: If the sizes are out of range
+        """
+        if max_workers < 1:
+            raise ValueError("Executor needs at least one worker")
+        if queue_limit < 0:
+            raise ValueError("Executor queue limit cannot be negative")
+
+        self._max_workers = max_workers
+        self._queue_limit = queue_limit
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="bbs-io")
+        self._lock = threading.Lock()
+        self._active = 0
+        self._queued = 0
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+        self._cancelled = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking callable on a worker thread and await its result.
+
+        Context variables of the caller are visible to the callable.
+
+        Args:
+            func: Callable to run
+            *args: Positional arguments for the callable
+            **kwargs: Keyword arguments for the callable
+
+        Returns:
+            Return value of the callable
+
+        Raises:
+            ExecutorOverloadedError: If the wait queue is full
+        """
+        with self._lock:
+            if self._queue_limit and self._queued >= self._queue_limit:
+                self._rejected += 1
+                raise ExecutorOverloadedError(
+                    f"Too many pending requests ({self._queued} waiting for a worker)"
+                )
+            self._queued += 1
+            self._submitted += 1
+
+        slot = _QueueSlot()
+        context = contextvars.copy_context()
+        call = functools.partial(
+            context.run, self._call, slot, time.perf_counter(), func, args, kwargs
+        )
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._pool, call)
+        except asyncio.CancelledError:
+            with self._lock:
+                if slot.waiting:
+                    slot.waiting = False
+                    self._queued -= 1
+                    self._cancelled += 1
+            raise
+
+    def _call(
+        self,
+        slot: _QueueSlot,
+        enqueued_at: float,
+        func: Callable[..., T],
+        args: tuple,
+        kwargs: dict[str, Any],
+    ) -> T | None:
+        """Run a call on a worker thread, keeping the counters up to date.
+
+        Args:
+            slot: The call's place in the wait queue
+            enqueued_at: ``perf_counter`` value when the call was submitted
+            func: Callable to run
+            args: Positional arguments
+            kwargs: Keyword arguments
+
+        Returns:
+            Return value of the callable (None if the caller was cancelled first)
+        """
+        wait = time.perf_counter() - enqueued_at
+        with self._lock:
+            if not slot.waiting:
+                # Nobody awaits the result any more
+                return None
+            slot.waiting = False
+            self._queued -= 1
+            self._active += 1
+            self._total_wait += wait
+            self._max_wait = max(self._max_wait, wait)
+        now = time.time_ns()
+        add_span("executor.queue_wait", now - int(wait * 1e9), now)
+
+        failed = True
+        try:
+            result = func(*args, **kwargs)
+            failed = False
+            return result
+        finally:
+            with self._lock:
+                self._active -= 1
+                if failed:
+                    self._failed += 1
+                else:
+                    self._completed += 1
+
+    def stats(self) -> ExecutorStats:
+        """Get a snapshot of the executor counters.
+
+        Returns:
+            Executor statistics
+        """
+        with self._lock:
+            return ExecutorStats(
+                max_workers=self._max_workers,
+                queue_limit=self._queue_limit,
+                active=self._active,
+                queued=self._queued,
+                submitted=self._submitted,
+                completed=self._completed,
+                failed=self._failed,
+                rejected=self._rejected,
+                cancelled=self._cancelled,
+                total_wait_seconds=self._total_wait,
+                max_wait_seconds=self._max_wait,
+            )
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker threads.
+
+        Args:
+            wait: Whether to wait for running calls to finish
+        """
+        self._pool.shutdown(wait=wait)
+
+
+_shared_executor: BlockingExecutor | None = None
+_shared_lock = threading.Lock()
+
+
+def shared_executor(settings: Settings) -> BlockingExecutor:
+    """Get the process-wide executor, creating it on first use.
+
+    The REST routes and the MCP tools share one pool so that the configured
+    concurrency bounds the whole process. Settings passed after the first
+    call are ignored.
+
+    Args:
+        settings: Backend settings (executor size and queue limit)
+
+    Returns:
+        Shared executor
+    """
+    global _shared_executor
+    with _shared_lock:
+        if _shared_executor is None:
+            _shared_executor = BlockingExecutor(
+                settings.executor_workers, settings.executor_queue_limit
+            )
+        return _shared_executor
@@ -1,13 +1,22 @@
 """Agent index management."""
 
+import os
+import threading
 from datetime import datetime
 from typing import Any
 
+from src.infrastructure.indexes.index_journal import file_signature
 from src.infrastructure.persistence.file_storage import FileStorage
+from src.infrastructure.utils.json_serializer import JSONSerializer
 
 
 class AgentIndex:
-    """Manages the agents index for fast lookups."""
+    """Manages the agents index for fast lookups.
+
+    The parsed index is kept in memory and revalidated on every read with a
+    ``stat`` of the index file, which writers in any worker process replace
+    atomically.
+    """
 
     def __init__(self, file_storage: FileStorage) -> None:
         """Initialize agent index.
@@ -17,6 +26,9 @@ class AgentIndex:
         """
         self._storage = file_storage
         self._index_path = self._storage.index_dir / "agents_index.json"
+        self._cache_lock = threading.Lock()
+        self._cached_agents: dict[str, dict[str, Any]] = {}
+        self._cached_signature: tuple[int, int, int] | None = None
         self._ensure_index_exists()
 
     def _ensure_index_exists(self) -> None:
@@ -70,8 +82,28 @@ class AgentIndex:
         Returns:
             List of agent data dictionaries
         """
-        index = self._storage.read_json(self._index_path)
-        return index["agents"]
+        return [dict(a) for a in self._load_agents().values()]
+
+    def _load_agents(self) -> dict[str, dict[str, Any]]:
+        """Reload the index if its file changed since it was last parsed.
+
+        Returns:
+            Shared agent data dictionaries keyed by agent name
+        """
+        with self._cache_lock:
+            signature = file_signature(os.stat(self._index_path))
+            self._storage.record_stat()
+            if signature != self._cached_signature:
+                with open(self._index_path, "rb") as f:
+                    # Take the signature of the file actually read, in case it
+                    # was replaced after the stat above
+                    signature = file_signature(os.fstat(f.fileno()))
+                    data = f.read()
+                self._storage.record_read(len(data))
+                index = JSONSerializer.deserialize(data.decode("utf-8"))
+                self._cached_agents = {a["agent_name"]: a for a in index["agents"]}
+                self._cached_signature = signature
+            return self._cached_agents
 
     def find_agent(self, agent_name: str) -> dict[str, Any] | None:
         """Find an agent by name in the index.
@@ -82,11 +114,8 @@ class AgentIndex:
         Returns:
             Agent data dictionary if found, None otherwise
         """
-        agents = self.get_all_agents()
-        for agent in agents:
-            if agent["agent_name"] == agent_name:
-                return agent
-        return None
+        agent = self._load_agents().get(agent_name)
+        return dict(agent) if agent else None
 
     def rebuild_from_agents(self, agents_data: list[dict[str, Any]]) -> None:
         """Rebuild the entire index from agent data.
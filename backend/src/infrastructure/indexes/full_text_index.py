@@ -0,0 +1,219 @@
+"""Full-text index management."""
+
+import math
+import re
+import threading
+from collections import Counter
+from collections.abc import Iterable
+from datetime import datetime
+from typing import Any
+
+from src.infrastructure.indexes.index_journal import IndexJournal, JournalCursor
+from src.infrastructure.persistence.file_storage import FileStorage
+
+# CJK ideographs and kana are written without spaces, so each character is a
+# token; everything else is split into runs of letters and digits
+_CJK_CHARS = "\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff"
+TOKEN_PATTERN = re.compile(rf"[{_CJK_CHARS}]|[^\W_{_CJK_CHARS}]+")
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase search terms.
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        List of terms in order of appearance
+    """
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+class FullTextIndex:
+    """Inverted index over post titles, bodies and replies, ranked with BM25.
+
+    Each post is one document. The index is stored as postings lists
+    (term -> post ID -> term frequency) plus document lengths, persisted with
+    the same snapshot and append-only journal scheme as ``PostIndex``.
+    Adding or removing a piece of text appends its term frequencies to the
+    journal, so a write costs O(length of the text).
+    """
+
+    # Title terms count this many times towards a document's term frequencies
+    TITLE_WEIGHT = 2
+
+    # Standard BM25 parameters
+    K1 = 1.2
+    B = 0.75
+
+    def __init__(self, file_storage: FileStorage) -> None:
+        """Initialize full-text index.
+
+        Args:
+            file_storage: File storage instance
+        """
+        self._storage = file_storage
+        self._index_path = self._storage.index_dir / "fulltext_index.json"
+        self._journal = IndexJournal(self._storage, self._index_path)
+        self._cache_lock = threading.Lock()
+        self._postings: dict[str, dict[str, int]] = {}
+        self._lengths: dict[str, int] = {}
+        self._total_length = 0
+        self._cursor: JournalCursor | None = None
+        self._ensure_index_exists()
+
+    def _ensure_index_exists(self) -> None:
+        """Ensure the index snapshot and its journal exist."""
+        with self._storage.get_lock("fulltext_index"):
+            if not self._storage.file_exists(self._index_path):
+                self._storage.write_json(
+                    self._index_path,
+                    {"postings": {}, "lengths": {}, "last_updated": datetime.utcnow().isoformat()},
+                )
+            self._journal.ensure_journal()
+
+    def add_document(self, post_id: str, title: str, content: str) -> None:
+        """Index the title and body of a post.
+
+        Args:
+            post_id: Post ID
+            title: Post title
+            content: Post body
+        """
+        self._write({"op": "add", "post_id": post_id, "terms": self.document_terms(title, content)})
+
+    def add_text(self, post_id: str, text: str) -> None:
+        """Add text (such as a reply) to a post's document.
+
+        Args:
+            post_id: Post ID
+            text: Text to add
+        """
+        self._write({"op": "add", "post_id": post_id, "terms": Counter(tokenize(text))})
+
+    def remove_text(self, post_id: str, text: str) -> None:
+        """Remove previously added text from a post's document.
+
+        Args:
+            post_id: Post ID
+            text: Text that was added with ``add_text``
+        """
+        self._write({"op": "remove", "post_id": post_id, "terms": Counter(tokenize(text))})
+
+    def search(self, query: str) -> dict[str, float]:
+        """Score every post that contains at least one query term.
+
+        Args:
+            query: Search query
+
+        Returns:
+            BM25 scores keyed by post ID
+        """
+        terms = set(tokenize(query))
+        scores: dict[str, float] = {}
+
+        with self._cache_lock:
+            self._refresh()
+            doc_count = len(self._lengths)
+            if not terms or doc_count == 0:
+                return scores
+            average_length = self._total_length / doc_count
+
+            for term in terms:
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                idf = math.log(1 + (doc_count - len(postings) + 0.5) / (len(postings) + 0.5))
+                for post_id, frequency in postings.items():
+                    norm = 1 - self.B + self.B * self._lengths.get(post_id, 0) / average_length
+                    scores[post_id] = scores.get(post_id, 0.0) + idf * (
+                        frequency * (self.K1 + 1) / (frequency + self.K1 * norm)
+                    )
+
+        return scores
+
+    def rebuild_from_documents(self, documents: Iterable[tuple[str, dict[str, int]]]) -> None:
+        """Rebuild the entire index.
+
+        Args:
+            documents: Pairs of post ID and term frequencies, see ``document_terms``
+        """
+        postings: dict[str, dict[str, int]] = {}
+        lengths: dict[str, int] = {}
+        for post_id, terms in documents:
+            for term, frequency in terms.items():
+                postings.setdefault(term, {})[post_id] = frequency
+            lengths[post_id] = sum(terms.values())
+
+        with self._storage.get_lock("fulltext_index"):
+            self._journal.write_snapshot(
+                {
+                    "postings": postings,
+                    "lengths": lengths,
+                    "last_updated": datetime.utcnow().isoformat(),
+                }
+            )
+
+    @classmethod
+    def document_terms(cls, title: str, *texts: str) -> dict[str, int]:
+        """Compute the term frequencies of a document.
+
+        Args:
+            title: Post title
+            texts: Post body and any reply bodies
+
+        Returns:
+            Term frequencies
+        """
+        terms = Counter(tokenize(" ".join(texts)))
+        for term in tokenize(title):
+            terms[term] += cls.TITLE_WEIGHT
+        return dict(terms)
+
+    def _write(self, operation: dict[str, Any]) -> None:
+        """Append an operation to the journal and compact it when it grows large.
+
+        Args:
+            operation: Operation record
+        """
+        if not operation["terms"]:
+            return
+
+        with self._storage.get_lock("fulltext_index"):
+            self._journal.append(operation)
+            if self._journal.needs_compaction():
+                with self._cache_lock:
+                    self._refresh()
+                    self._journal.write_snapshot(
+                        {
+                            "postings": self._postings,
+                            "lengths": self._lengths,
+                            "last_updated": datetime.utcnow().isoformat(),
+                        }
+                    )
+
+    def _refresh(self) -> None:
+        """Apply changes made since the last read; the cache lock must be held."""
+        snapshot, operations, self._cursor = self._journal.read_since(self._cursor)
+        if snapshot is not None:
+            self._postings = snapshot["postings"]
+            self._lengths = snapshot["lengths"]
+            self._total_length = sum(self._lengths.values())
+
+        for operation in operations:
+            sign = 1 if operation.get("op") == "add" else -1
+            post_id = operation["post_id"]
+            for term, frequency in operation["terms"].items():
+                postings = self._postings.setdefault(term, {})
+                remaining = postings.get(post_id, 0) + sign * frequency
+                if remaining > 0:
+                    postings[post_id] = remaining
+                else:
+                    postings.pop(post_id, None)
+                    if not postings:
+                        del self._postings[term]
+
+            length = self._lengths.get(post_id, 0)
+            new_length = max(length + sign * sum(operation["terms"].values()), 0)
+            self._lengths[post_id] = new_length
+            self._total_length += new_length - length
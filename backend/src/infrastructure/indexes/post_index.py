@@ -1,30 +1,441 @@
 """Post index management."""
 
+import heapq
+import threading
+import zlib
+from bisect import bisect_left, insort
+from collections.abc import Callable
 from datetime import datetime
+from pathlib import Path
 from typing import Any
 
+from src.domain.value_objects.tag_query import TagQuery
+from src.infrastructure.indexes.index_journal import IndexJournal, JournalCursor
+from src.infrastructure.indexes.tag_postings import TagPostings
 from src.infrastructure.persistence.file_storage import FileStorage
 
+PostFilter = Callable[[dict[str, Any]], bool]
+
+
+def _sort_key(post_data: dict[str, Any]) -> tuple[str, str]:
+    """Get the browse order key of an index entry.
+
+    ISO timestamps written by the same code compare correctly as strings.
+
+    Args:
+        post_data: Post data dictionary
+
+    Returns:
+        Tuple of creation time and post ID
+    """
+    return (post_data.get("created_at", ""), post_data["post_id"])
+
+
+class PostIndexShard:
+    """One partition of the post index: a snapshot, its journal and a lock.
+
+    Writes append one record to the shard's journal instead of rewriting its
+    snapshot; the journal is periodically folded back into the snapshot (see
+    ``IndexJournal``).
+
+    The replayed shard is kept in memory and brought up to date on each read
+    by applying only the journal entries written since, by this or any other
+    worker process. A list of ``(created_at, post_id)`` keys is kept sorted
+    alongside it so that browsing is served by keyset pagination, and tag
+    postings are kept so that tag queries and tag counts need no scan.
+    """
+
+    def __init__(self, file_storage: FileStorage, snapshot_path: Path, lock_name: str) -> None:
+        """Initialize post index shard.
+
+        Args:
+            file_storage: File storage instance
+            snapshot_path: Path to the shard's snapshot JSON file
+            lock_name: Name of the shard's file lock
+        """
+        self._storage = file_storage
+        self.snapshot_path = snapshot_path
+        self.lock_name = lock_name
+        self._journal = IndexJournal(self._storage, snapshot_path)
+        self._cache_lock = threading.Lock()
+        self._cached_posts: dict[str, dict[str, Any]] = {}
+        self._sorted_keys: list[tuple[str, str]] = []
+        self._tags = TagPostings()
+        self._cursor: JournalCursor | None = None
+
+    @property
+    def journal_path(self) -> Path:
+        """Path to the shard's delta log."""
+        return self._journal.journal_path
+
+    def exists(self) -> bool:
+        """Check whether the shard's snapshot has been written.
+
+        Returns:
+            True if the snapshot exists
+        """
+        return self._storage.file_exists(self.snapshot_path)
+
+    def ensure_exists(self) -> None:
+        """Ensure the shard snapshot and its journal exist."""
+        with self._storage.get_lock(self.lock_name):
+            if not self.exists():
+                self._write_snapshot([])
+            self._journal.ensure_journal()
+
+    def write(self, operation: dict[str, Any]) -> None:
+        """Append an operation to the journal and compact it when it grows large.
+
+        Args:
+            operation: Operation record
+        """
+        with self._storage.get_lock(self.lock_name):
+            self._journal.append(operation)
+            if self._journal.needs_compaction():
+                self._write_snapshot(self.all_posts())
+
+    def replace(self, posts: list[dict[str, Any]]) -> None:
+        """Replace the shard's whole contents.
+
+        Args:
+            posts: Post data dictionaries belonging to this shard
+        """
+        with self._storage.get_lock(self.lock_name):
+            self._write_snapshot(posts)
+
+    def _write_snapshot(self, posts: list[dict[str, Any]]) -> None:
+        """Write a new snapshot; the caller must hold the shard lock.
+
+        Args:
+            posts: Fully materialized list of post data dictionaries
+        """
+        self._journal.write_snapshot(
+            {"posts": posts, "last_updated": datetime.utcnow().isoformat()}
+        )
+
+    def all_posts(self) -> list[dict[str, Any]]:
+        """Bring the in-memory shard up to date and return its entries.
+
+        The returned dictionaries are shared with the cache and must not be
+        mutated.
+
+        Returns:
+            Post data dictionaries in insertion order
+        """
+        with self._cache_lock:
+            self._refresh()
+            return list(self._cached_posts.values())
+
+    def matching(
+        self, predicate: PostFilter, before: tuple[str, str] | None = None, limit: int | None = None
+    ) -> list[dict[str, Any]]:
+        """Get matching entries in descending key order.
+
+        The returned dictionaries are shared with the cache and must not be
+        mutated.
+
+        Args:
+            predicate: Returns True for entries to keep
+            before: Only consider entries whose key is smaller than this one
+            limit: Stop after this many matches
+
+        Returns:
+            Matching post data dictionaries, newest first
+        """
+        matches: list[dict[str, Any]] = []
+        with self._cache_lock:
+            self._refresh()
+            end = bisect_left(self._sorted_keys, before) if before else len(self._sorted_keys)
+            for position in range(end - 1, -1, -1):
+                if limit is not None and len(matches) >= limit:
+                    break
+                post = self._cached_posts[self._sorted_keys[position][1]]
+                if predicate(post):
+                    matches.append(post)
+        return matches
+
+    def matching_tags(self, tag_query: TagQuery, predicate: PostFilter) -> list[dict[str, Any]]:
+        """Get entries matching a tag query in descending key order.
+
+        Candidates are taken from the tag postings; only they are checked
+        against the predicate.
+
+        The returned dictionaries are shared with the cache and must not be
+        mutated.
+
+        Args:
+            tag_query: Tag query
+            predicate: Returns True for entries to keep
+
+        Returns:
+            Matching post data dictionaries, newest first
+        """
+        with self._cache_lock:
+            self._refresh()
+            post_ids = self._tags.match(tag_query)
+            if post_ids is None:
+                candidates = [
+                    post
+                    for post_id, post in self._cached_posts.items()
+                    if not self._tags.excludes(tag_query, post_id)
+                ]
+            else:
+                candidates = [self._cached_posts[post_id] for post_id in post_ids]
+        matches = [post for post in candidates if predicate(post)]
+        matches.sort(key=_sort_key, reverse=True)
+        return matches
+
+    def tag_counts(self) -> dict[str, int]:
+        """Get the number of visible posts carrying each tag.
+
+        Returns:
+            Post counts keyed by tag
+        """
+        with self._cache_lock:
+            self._refresh()
+            return self._tags.counts()
+
+    def tag_count(self, tag: str) -> int:
+        """Get the number of visible posts carrying a tag.
+
+        Args:
+            tag: Tag
+
+        Returns:
+            Post count
+        """
+        with self._cache_lock:
+            self._refresh()
+            return self._tags.count(tag)
+
+    def count(self, predicate: PostFilter) -> int:
+        """Count matching entries without copying them.
+
+        Args:
+            predicate: Returns True for entries to count
+
+        Returns:
+            Number of matching entries
+        """
+        with self._cache_lock:
+            self._refresh()
+            return sum(1 for post in self._cached_posts.values() if predicate(post))
+
+    def modified_at(self) -> int:
+        """Get the time the shard was last written.
+
+        Returns:
+            Latest modification time of the snapshot and journal in
+            nanoseconds, or 0 if neither exists
+        """
+        return max(
+            (
+                path.stat().st_mtime_ns
+                for path in (self.snapshot_path, self.journal_path)
+                if path.exists()
+            ),
+            default=0,
+        )
+
+    def delete_files(self) -> None:
+        """Delete the shard's snapshot and journal."""
+        with self._storage.get_lock(self.lock_name):
+            self.snapshot_path.unlink(missing_ok=True)
+            self.journal_path.unlink(missing_ok=True)
+
+    def _refresh(self) -> None:
+        """Apply changes made since the last read; the cache lock must be held."""
+        snapshot, operations, self._cursor = self._journal.read_since(self._cursor)
+        if snapshot is not None:
+            self._cached_posts = {p["post_id"]: p for p in snapshot["posts"]}
+            self._sorted_keys = sorted(_sort_key(p) for p in self._cached_posts.values())
+            self._tags = TagPostings()
+            for post in self._cached_posts.values():
+                self._tags.add(post)
+
+        posts = self._cached_posts
+        for operation in operations:
+            op = operation.get("op")
+            if op == "add":
+                post = operation["post"]
+                if post["post_id"] not in posts:
+                    posts[post["post_id"]] = post
+                    insort(self._sorted_keys, _sort_key(post))
+                    self._tags.add(post)
+            elif op == "update":
+                previous = posts.get(operation["post_id"])
+                if previous is not None:
+                    self._remove_sort_key(previous)
+                    self._tags.remove(previous)
+                posts[operation["post_id"]] = operation["post"]
+                insort(self._sorted_keys, _sort_key(operation["post"]))
+                self._tags.add(operation["post"])
+            elif op == "remove":
+                previous = posts.pop(operation["post_id"], None)
+                if previous is not None:
+                    self._remove_sort_key(previous)
+                    self._tags.remove(previous)
+
+    def _remove_sort_key(self, post_data: dict[str, Any]) -> None:
+        """Remove an entry from the sorted key list; the cache lock must be held.
+
+        Args:
+            post_data: Post data dictionary as currently cached
+        """
+        key = _sort_key(post_data)
+        position = bisect_left(self._sorted_keys, key)
+        if position < len(self._sorted_keys) and self._sorted_keys[position] == key:
+            del self._sorted_keys[position]
+
 
 class PostIndex:
-    """Manages the posts index for fast searching and browsing."""
+    """Manages the posts index for fast searching and browsing.
 
-    def __init__(self, file_storage: FileStorage) -> None:
+    The index is partitioned by a hash of the post ID into ``shard_count``
+    shards, each stored in its own snapshot and journal and guarded by its own
+    lock, so writes to different posts from different workers rarely wait for
+    each other. Reads fan out to every shard and merge the per-shard results,
+    which are already in key order, with a k-way heap merge.
+
+    With a single shard the index is stored in ``posts_index.json`` as before
+    sharding. When the shard count changes, the entries of the most recently
+    written layout are copied the first time the index is opened; the files of
+    other layouts are never removed. Every worker process must use the same
+    shard count.
+    """
+
+    def __init__(self, file_storage: FileStorage, shard_count: int = 1) -> None:
         """Initialize post index.
 
         Args:
             file_storage: File storage instance
+            shard_count: Number of shards to partition the index into
+
+        Raises:
+            ValueError: If shard_count is less than 1
         """
+        if shard_count < 1:
+            raise ValueError("shard_count must be at least 1")
         self._storage = file_storage
-        self._index_path = self._storage.index_dir / "posts_index.json"
+        self._shards = [self._open_shard(index, shard_count) for index in range(shard_count)]
         self._ensure_index_exists()
 
+    def _open_shard(self, index: int, shard_count: int) -> PostIndexShard:
+        """Create the shard object for one position of a layout.
+
+        Args:
+            index: Shard position
+            shard_count: Number of shards in the layout
+
+        Returns:
+            Post index shard
+        """
+        name = "posts_index" if shard_count == 1 else f"posts_index.{index}-of-{shard_count}"
+        return PostIndexShard(self._storage, self._storage.index_dir / f"{name}.json", name)
+
     def _ensure_index_exists(self) -> None:
-        """Ensure the index file exists."""
-        if not self._storage.file_exists(self._index_path):
-            self._storage.write_json(
-                self._index_path, {"posts": [], "last_updated": datetime.utcnow().isoformat()}
-            )
+        """Ensure every shard exists, copying entries from another layout if needed.
+
+        Entries are copied when this layout has not been written yet or when
+        another layout was written more recently, as after switching the shard
+        count back. The other layout's files are left in place. The first
+        shard is removed first and written last, so its presence marks a
+        complete layout.
+        """
+        if not self._is_current():
+            with self._storage.get_lock("posts_index_layout"):
+                if not self._is_current():
+                    self._copy_layout(self._latest_other_layout())
+
+        for shard in self._shards:
+            shard.ensure_exists()
+
+    def _is_current(self) -> bool:
+        """Check whether this layout is complete and no other layout is newer.
+
+        Returns:
+            True if the layout can be used as it is
+        """
+        if not self._shards[0].exists():
+            return False
+        modified_at = max(shard.modified_at() for shard in self._shards)
+        return all(
+            shard.modified_at() <= modified_at
+            for layout in self._other_layouts()
+            for shard in layout
+        )
+
+    def _copy_layout(self, source: list[PostIndexShard]) -> None:
+        """Replace the contents of this layout with the entries of another one.
+
+        Args:
+            source: Shards of the layout to copy (empty to start a new index)
+        """
+        posts: dict[str, dict[str, Any]] = {}
+        for shard in source:
+            for post in shard.all_posts():
+                posts[post["post_id"]] = post
+
+        partitions: list[list[dict[str, Any]]] = [[] for _ in self._shards]
+        for post in posts.values():
+            partitions[self._shard_index(post["post_id"])].append(post)
+
+        self._shards[0].delete_files()
+        for shard, partition in reversed(list(zip(self._shards, partitions, strict=True))):
+            shard.replace(partition)
+
+    def _latest_other_layout(self) -> list[PostIndexShard]:
+        """Find the most recently written complete layout other than this one.
+
+        Returns:
+            Shards of that layout, or an empty list if there is none
+        """
+        layouts = self._other_layouts()
+        if not layouts:
+            return []
+        return max(layouts, key=lambda layout: max(shard.modified_at() for shard in layout))
+
+    def _other_layouts(self) -> list[list[PostIndexShard]]:
+        """Find complete layouts with another shard count in the index directory.
+
+        Returns:
+            Shards of each layout whose first shard exists
+        """
+        current = {shard.snapshot_path for shard in self._shards}
+        shard_counts: set[int] = set()
+        for path in self._storage.index_dir.glob("posts_index*.json"):
+            if path not in current:
+                _, _, shard_count = path.stem.partition("-of-")
+                shard_counts.add(int(shard_count) if shard_count.isdigit() else 1)
+
+        layouts: list[list[PostIndexShard]] = []
+        for shard_count in sorted(shard_counts - {len(self._shards)}):
+            layout = [self._open_shard(index, shard_count) for index in range(shard_count)]
+            if layout[0].exists():
+                layouts.append(layout)
+        return layouts
+
+    def _shard_index(self, post_id: str) -> int:
+        """Get the position of the shard that stores a post.
+
+        Args:
+            post_id: Post ID
+
+        Returns:
+            Shard position
+        """
+        return zlib.crc32(post_id.encode("utf-8")) % len(self._shards)
+
+    def _shard(self, post_id: str) -> PostIndexShard:
+        """Get the shard that stores a post.
+
+        Args:
+            post_id: Post ID
+
+        Returns:
+            Post index shard
+        """
+        return self._shards[self._shard_index(post_id)]
 
     def add_post(self, post_data: dict[str, Any]) -> None:
         """Add a post to the index.
@@ -32,36 +443,16 @@ class PostIndex:
         Args:
             post_data: Post data dictionary
         """
-        with self._storage.get_lock("posts_index"):
-            index = self._storage.read_json(self._index_path)
-
-            # Check if post already exists
-            existing_ids = {p["post_id"] for p in index["posts"]}
-            if post_data["post_id"] not in existing_ids:
-                index["posts"].append(post_data)
-                index["last_updated"] = datetime.utcnow().isoformat()
-                self._storage.write_json(self._index_path, index)
+        self._shard(post_data["post_id"]).write({"op": "add", "post": post_data})
 
     def update_post(self, post_id: str, post_data: dict[str, Any]) -> None:
-        """Update a post in the index.
+        """Update a post in the index, adding it if it is not indexed yet.
 
         Args:
             post_id: Post ID to update
             post_data: Updated post data
         """
-        with self._storage.get_lock("posts_index"):
-            index = self._storage.read_json(self._index_path)
-
-            # Find and update the post
-            for i, post in enumerate(index["posts"]):
-                if post["post_id"] == post_id:
-                    index["posts"][i] = post_data
-                    index["last_updated"] = datetime.utcnow().isoformat()
-                    self._storage.write_json(self._index_path, index)
-                    return
-
-            # If not found, add it
-            self.add_post(post_data)
+        self._shard(post_id).write({"op": "update", "post_id": post_id, "post": post_data})
 
     def remove_post(self, post_id: str) -> None:
         """Remove a post from the index (for hard deletes).
@@ -69,64 +460,167 @@ class PostIndex:
         Args:
             post_id: Post ID to remove
         """
-        with self._storage.get_lock("posts_index"):
-            index = self._storage.read_json(self._index_path)
+        self._shard(post_id).write({"op": "remove", "post_id": post_id})
 
-            index["posts"] = [p for p in index["posts"] if p["post_id"] != post_id]
-            index["last_updated"] = datetime.utcnow().isoformat()
-            self._storage.write_json(self._index_path, index)
+    def _merge(
+        self, predicate: PostFilter, before: tuple[str, str] | None = None, limit: int | None = None
+    ) -> list[dict[str, Any]]:
+        """Collect matching entries from every shard, newest first.
 
-    def get_all_posts(self, include_deleted: bool = False) -> list[dict[str, Any]]:
-        """Get all posts from the index.
+        Each shard returns at most ``limit`` entries in descending key order,
+        so the first ``limit`` entries of the merge are the overall newest.
+
+        Args:
+            predicate: Returns True for entries to keep
+            before: Only consider entries whose key is smaller than this one
+            limit: Maximum number of entries to return
+
+        Returns:
+            Matching (shared) post data dictionaries, newest first
+        """
+        merged = heapq.merge(
+            *(shard.matching(predicate, before, limit) for shard in self._shards),
+            key=_sort_key,
+            reverse=True,
+        )
+        if limit is None:
+            return list(merged)
+        return [post for _, post in zip(range(limit), merged, strict=False)]
+
+    @staticmethod
+    def _predicate(
+        query: str | None = None,
+        agent_name: str | None = None,
+        include_deleted: bool = False,
+    ) -> PostFilter:
+        """Build a filter over index entries.
 
         Args:
+            query: Text search query (matched against the title)
+            agent_name: Filter by agent
+            include_deleted: Whether to include deleted posts
+
+        Returns:
+            Function returning True for matching entries
+        """
+        query_lower = query.lower() if query else None
+
+        def matches(post: dict[str, Any]) -> bool:
+            if not include_deleted and post.get("deleted", False):
+                return False
+            if agent_name and post.get("agent_name") != agent_name:
+                return False
+            return not query_lower or query_lower in post.get("title", "").lower()
+
+        return matches
+
+    def page_posts(
+        self,
+        limit: int,
+        after: tuple[str, str] | None = None,
+        offset: int = 0,
+        agent_name: str | None = None,
+        include_deleted: bool = False,
+    ) -> list[dict[str, Any]]:
+        """Get one page of posts, newest first, from the sorted index.
+
+        Args:
+            limit: Maximum number of posts to return
+            after: Only return posts whose ``(created_at, post_id)`` key is
+                smaller than this one (keyset pagination)
+            offset: Number of matching posts to skip
+            agent_name: Filter by agent
             include_deleted: Whether to include deleted posts
 
         Returns:
             List of post data dictionaries
         """
-        index = self._storage.read_json(self._index_path)
-        posts = index["posts"]
+        predicate = self._predicate(agent_name=agent_name, include_deleted=include_deleted)
+        page = self._merge(predicate, before=after, limit=offset + limit)
+        return [dict(post) for post in page[offset:]]
 
-        if not include_deleted:
-            posts = [p for p in posts if not p.get("deleted", False)]
+    def count_posts(self, agent_name: str | None = None, include_deleted: bool = False) -> int:
+        """Count posts in the index without copying them.
 
-        return posts
+        Args:
+            agent_name: Filter by agent
+            include_deleted: Whether to include deleted posts
+
+        Returns:
+            Number of matching posts
+        """
+        predicate = self._predicate(agent_name=agent_name, include_deleted=include_deleted)
+        return sum(shard.count(predicate) for shard in self._shards)
+
+    def get_all_posts(self, include_deleted: bool = False) -> list[dict[str, Any]]:
+        """Get all posts from the index.
+
+        Args:
+            include_deleted: Whether to include deleted posts
+
+        Returns:
+            List of post data dictionaries, oldest first
+        """
+        matches = self._merge(self._predicate(include_deleted=include_deleted))
+        return [dict(p) for p in reversed(matches)]
 
     def search_posts(
         self,
         query: str | None = None,
-        tags: list[str] | None = None,
+        tags: TagQuery | None = None,
         agent_name: str | None = None,
         include_deleted: bool = False,
     ) -> list[dict[str, Any]]:
         """Search posts in the index.
 
+        Tag queries are answered from the tag postings of each shard.
+
         Args:
             query: Text search query
-            tags: Filter by tags
+            tags: Tag query (alternative, required and excluded tags)
             agent_name: Filter by agent
             include_deleted: Whether to include deleted posts
 
         Returns:
-            List of matching post data dictionaries
+            List of matching post data dictionaries, oldest first
         """
-        posts = self.get_all_posts(include_deleted)
+        predicate = self._predicate(query, agent_name, include_deleted)
+        if tags is None or tags.is_empty():
+            matches = self._merge(predicate)
+        else:
+            matches = list(
+                heapq.merge(
+                    *(shard.matching_tags(tags, predicate) for shard in self._shards),
+                    key=_sort_key,
+                    reverse=True,
+                )
+            )
+        return [dict(p) for p in reversed(matches)]
 
-        # Filter by agent
-        if agent_name:
-            posts = [p for p in posts if p.get("agent_name") == agent_name]
+    def tag_counts(self) -> dict[str, int]:
+        """Get the number of visible posts carrying each tag.
 
-        # Filter by tags
-        if tags:
-            posts = [p for p in posts if any(tag in p.get("tags", []) for tag in tags)]
+        The counts are maintained as entries are added, updated and removed.
 
-        # Text search in title
-        if query:
-            query_lower = query.lower()
-            posts = [p for p in posts if query_lower in p.get("title", "").lower()]
+        Returns:
+            Post counts keyed by tag
+        """
+        counts: dict[str, int] = {}
+        for shard in self._shards:
+            for tag, count in shard.tag_counts().items():
+                counts[tag] = counts.get(tag, 0) + count
+        return counts
 
-        return posts
+    def tag_count(self, tag: str) -> int:
+        """Get the number of visible posts carrying a tag.
+
+        Args:
+            tag: Tag
+
+        Returns:
+            Post count
+        """
+        return sum(shard.tag_count(tag) for shard in self._shards)
 
     def rebuild_from_posts(self, posts_data: list[dict[str, Any]]) -> None:
         """Rebuild the entire index from post data.
@@ -134,9 +628,8 @@ class PostIndex:
         Args:
             posts_data: List of post data dictionaries
         """
-        with self._storage.get_lock("posts_index"):
-            index = {
-                "posts": posts_data,
-                "last_updated": datetime.utcnow().isoformat(),
-            }
-            self._storage.write_json(self._index_path, index)
+        partitions: list[list[dict[str, Any]]] = [[] for _ in self._shards]
+        for post in posts_data:
+            partitions[self._shard_index(post["post_id"])].append(post)
+        for shard, partition in zip(self._shards, partitions, strict=True):
+            shard.replace(partition)
@@ -0,0 +1,142 @@
+"""Inverted tag index over post index entries."""
+
+import heapq
+from bisect import bisect_left, insort
+from typing import Any
+
+from src.domain.value_objects.tag_query import TagQuery
+
+
+def _contains(postings: list[str], post_id: str) -> bool:
+    """Check whether a sorted postings list holds a post ID."""
+    position = bisect_left(postings, post_id)
+    return position < len(postings) and postings[position] == post_id
+
+
+def _intersect(postings: list[list[str]]) -> list[str]:
+    """Intersect sorted postings lists.
+
+    The shortest list is walked and the others are probed by binary search,
+    so the cost depends on the rarest tag rather than the most common one.
+    """
+    shortest, *others = sorted(postings, key=len)
+    return [post_id for post_id in shortest if all(_contains(other, post_id) for other in others)]
+
+
+def _union(postings: list[list[str]]) -> list[str]:
+    """Merge sorted postings lists into one without duplicates."""
+    merged: list[str] = []
+    for post_id in heapq.merge(*postings):
+        if not merged or merged[-1] != post_id:
+            merged.append(post_id)
+    return merged
+
+
+class TagPostings:
+    """Maps each tag to the sorted IDs of the posts carrying it.
+
+    Deleted posts stay in the postings so that searches including them can be
+    answered, but the per-tag counts only include visible posts. Entries must
+    be removed with the same data they were added with.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty postings."""
+        self._postings: dict[str, list[str]] = {}
+        self._counts: dict[str, int] = {}
+
+    def add(self, post_data: dict[str, Any]) -> None:
+        """Index the tags of a post.
+
+        Args:
+            post_data: Post index entry
+        """
+        post_id = post_data["post_id"]
+        visible = not post_data.get("deleted", False)
+        for tag in set(post_data.get("tags", [])):
+            insort(self._postings.setdefault(tag, []), post_id)
+            if visible:
+                self._counts[tag] = self._counts.get(tag, 0) + 1
+
+    def remove(self, post_data: dict[str, Any]) -> None:
+        """Remove the tags of a post from the index.
+
+        Args:
+            post_data: Post index entry as it was added
+        """
+        post_id = post_data["post_id"]
+        visible = not post_data.get("deleted", False)
+        for tag in set(post_data.get("tags", [])):
+            postings = self._postings.get(tag)
+            if postings is None:
+                continue
+            position = bisect_left(postings, post_id)
+            if position < len(postings) and postings[position] == post_id:
+                del postings[position]
+                if not postings:
+                    del self._postings[tag]
+                if visible:
+                    self._decrement(tag)
+
+    def _decrement(self, tag: str) -> None:
+        """Lower the visible post count of a tag, dropping it at zero."""
+        count = self._counts.get(tag, 0) - 1
+        if count > 0:
+            self._counts[tag] = count
+        else:
+            self._counts.pop(tag, None)
+
+    def count(self, tag: str) -> int:
+        """Get the number of visible posts carrying a tag.
+
+        Args:
+            tag: Tag
+
+        Returns:
+            Post count
+        """
+        return self._counts.get(tag, 0)
+
+    def counts(self) -> dict[str, int]:
+        """Get the number of visible posts carrying each tag.
+
+        Returns:
+            Post counts keyed by tag (tags without visible posts are left out)
+        """
+        return dict(self._counts)
+
+    def match(self, query: TagQuery) -> list[str] | None:
+        """Find the posts matching a tag query.
+
+        Args:
+            query: Tag query
+
+        Returns:
+            Sorted IDs of matching posts, or None if the query has no
+            ``any_of`` or ``all_of`` terms and so cannot be answered from
+            postings alone (see ``excludes``)
+        """
+        candidates: list[list[str]] = []
+        if query.all_of:
+            candidates.extend(self._postings.get(tag, []) for tag in query.all_of)
+        if query.any_of:
+            candidates.append(_union([self._postings.get(tag, []) for tag in query.any_of]))
+        if not candidates:
+            return None
+
+        post_ids = _intersect(candidates)
+        if query.none_of:
+            post_ids = [post_id for post_id in post_ids if not self.excludes(query, post_id)]
+        return post_ids
+
+    def excludes(self, query: TagQuery, post_id: str) -> bool:
+        """Check whether a post carries one of the excluded tags of a query.
+
+        Args:
+            query: Tag query
+            post_id: Post ID
+
+        Returns:
+            True if the post is excluded
+        """
+        return any(_contains(self._postings.get(tag, []), post_id) for tag in query.none_of)
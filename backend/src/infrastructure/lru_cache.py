@@ -0,0 +1,140 @@
+"""Size-bounded least-recently-used cache."""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
+from dataclasses import asdict, dataclass
+from typing import Any, Generic, TypeVar
+
+V = TypeVar("V")
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Point-in-time counters of an ``LRUCache``."""
+
+    max_bytes: int
+    bytes: int
+    entries: int
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert stats to dictionary.
+
+        Returns:
+            Dictionary representation of stats
+        """
+        return asdict(self)
+
+
+class LRUCache(Generic[V]):
+    """Thread-safe LRU cache bounded by the total size of its values.
+
+    Callers pass the (estimated) size of each value when storing it; the least
+    recently used entries are evicted until the total fits in ``max_bytes``.
+    A value larger than the whole cache is not stored.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        """Initialize cache.
+
+        Args:
+            max_bytes: Maximum total size of the cached values
+
+        Raises:
+            ValueError: If the size is negative
+        """
+        if max_bytes < 0:
+            raise ValueError("Cache size cannot be negative")
+
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[Hashable, tuple[V, int]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    def get(self, key: Hashable) -> V | None:
+        """Get a value and mark it most recently used.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+
+    def put(self, key: Hashable, value: V, size: int) -> None:
+        """Store a value, evicting least recently used entries to make room.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            size: Size of the value in bytes
+        """
+        with self._lock:
+            self._remove(key)
+            if size > self._max_bytes:
+                return
+            self._entries[key] = (value, size)
+            self._bytes += size
+            while self._bytes > self._max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self._evictions += 1
+
+    def invalidate(self, *keys: Hashable) -> None:
+        """Drop entries.
+
+        Args:
+            keys: Keys to drop (missing keys are ignored)
+        """
+        with self._lock:
+            for key in keys:
+                if self._remove(key):
+                    self._invalidations += 1
+
+    def stats(self) -> CacheStats:
+        """Get a snapshot of the cache counters.
+
+        Returns:
+            Cache stats
+        """
+        with self._lock:
+            return CacheStats(
+                max_bytes=self._max_bytes,
+                bytes=self._bytes,
+                entries=len(self._entries),
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                invalidations=self._invalidations,
+            )
+
+    def _remove(self, key: Hashable) -> bool:
+        """Remove an entry; the lock must be held.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            True if the entry existed
+        """
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        self._bytes -= entry[1]
+        return True
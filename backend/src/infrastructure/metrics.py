@@ -0,0 +1,196 @@
+"""In-process metric primitives."""
+
+import bisect
+import threading
+from collections.abc import Iterable, Mapping
+from dataclasses import asdict, dataclass
+from typing import Any
+
+# Upper bounds, in seconds, suited to lock waits and storage calls
+LATENCY_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+
+@dataclass(frozen=True)
+class HistogramSnapshot:
+    """Point-in-time contents of a ``Histogram``.
+
+    ``buckets`` pairs each upper bound with the number of observations less
+    than or equal to it (cumulative, as in Prometheus); observations above
+    the largest bound are only included in ``count``.
+    """
+
+    buckets: list[tuple[float, int]]
+    count: int
+    sum: float
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert snapshot to dictionary.
+
+        Returns:
+            Dictionary representation of the snapshot
+        """
+        return asdict(self)
+
+
+class Histogram:
+    """Thread-safe histogram of observed values with fixed buckets."""
+
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS) -> None:
+        """Initialize histogram.
+
+        Args:
+            buckets: Increasing bucket upper bounds
+        """
+        self._bounds = tuple(buckets)
+        self._counts = [0] * (len(self._bounds) + 1)
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        """Record a value.
+
+        Args:
+            value: Observed value
+        """
+        index = bisect.bisect_left(self._bounds, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+
+    def snapshot(self) -> HistogramSnapshot:
+        """Get the current bucket counts.
+
+        Returns:
+            Histogram snapshot
+        """
+        with self._lock:
+            counts = list(self._counts)
+            total = self._sum
+        cumulative = []
+        running = 0
+        for bound, count in zip(self._bounds, counts, strict=False):
+            running += count
+            cumulative.append((bound, running))
+        return HistogramSnapshot(buckets=cumulative, count=sum(counts), sum=total)
+
+
+class HistogramFamily:
+    """Histograms of one measurement, one per combination of label values."""
+
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS) -> None:
+        """Initialize family.
+
+        Args:
+            buckets: Increasing bucket upper bounds shared by every histogram
+        """
+        self._buckets = buckets
+        self._histograms: dict[tuple[str, ...], Histogram] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values: str) -> Histogram:
+        """Get the histogram of a combination of label values, creating it on first use.
+
+        Args:
+            *values: Label values
+
+        Returns:
+            Histogram
+        """
+        histogram = self._histograms.get(values)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(values, Histogram(self._buckets))
+        return histogram
+
+    def snapshot(self) -> dict[tuple[str, ...], HistogramSnapshot]:
+        """Get the current bucket counts of every histogram.
+
+        Returns:
+            Snapshots keyed by label values
+        """
+        with self._lock:
+            histograms = list(self._histograms.items())
+        return {values: histogram.snapshot() for values, histogram in histograms}
+
+
+Labels = Mapping[str, str]
+
+
+class PrometheusText:
+    """Builds a metrics page in the Prometheus text exposition format."""
+
+    CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+    def __init__(self) -> None:
+        """Initialize an empty page."""
+        self._lines: list[str] = []
+
+    def counter(self, name: str, help_text: str, samples: Iterable[tuple[Labels, float]]) -> None:
+        """Add a counter.
+
+        Args:
+            name: Metric name (conventionally ending in ``_total``)
+            help_text: Description of the metric
+            samples: Label sets and their values
+        """
+        self._family(name, "counter", help_text)
+        for labels, value in samples:
+            self._sample(name, labels, value)
+
+    def gauge(self, name: str, help_text: str, samples: Iterable[tuple[Labels, float]]) -> None:
+        """Add a gauge.
+
+        Args:
+            name: Metric name
+            help_text: Description of the metric
+            samples: Label sets and their values
+        """
+        self._family(name, "gauge", help_text)
+        for labels, value in samples:
+            self._sample(name, labels, value)
+
+    def histogram(
+        self, name: str, help_text: str, samples: Iterable[tuple[Labels, HistogramSnapshot]]
+    ) -> None:
+        """Add a histogram.
+
+        Args:
+            name: Metric name
+            help_text: Description of the metric
+            samples: Label sets and their histogram snapshots
+        """
+        self._family(name, "histogram", help_text)
+        for labels, snapshot in samples:
+            for bound, count in snapshot.buckets:
+                self._sample(f"{name}_bucket", {**labels, "le": _format_value(bound)}, count)
+            self._sample(f"{name}_bucket", {**labels, "le": "+Inf"}, snapshot.count)
+            self._sample(f"{name}_sum", labels, snapshot.sum)
+            self._sample(f"{name}_count", labels, snapshot.count)
+
+    def render(self) -> str:
+        """Get the page.
+
+        Returns:
+            Exposition text
+        """
+        return "\n".join(self._lines) + "\n"
+
+    def _family(self, name: str, kind: str, help_text: str) -> None:
+        self._lines.append(f"# HELP {name} {help_text}")
+        self._lines.append(f"# TYPE {name} {kind}")
+
+    def _sample(self, name: str, labels: Labels, value: float) -> None:
+        if labels:
+            pairs = ",".join(f'{key}="{_escape(val)}"' for key, val in labels.items())
+            name = f"{name}{{{pairs}}}"
+        self._lines.append(f"{name} {_format_value(value)}")
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
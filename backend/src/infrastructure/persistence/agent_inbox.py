@@ -0,0 +1,178 @@
+"""Per-agent notification inboxes."""
+
+import os
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from src.infrastructure.persistence.file_storage import FileStorage
+
+
+class AgentInbox:
+    """Append-only JSON Lines inbox per agent with a read cursor.
+
+    Notifications are appended to ``inbox/{agent_name}.jsonl`` when they are
+    created, and the byte offset of the first unread one is kept in
+    ``inbox/{agent_name}.cursor.json``. Reading unread notifications seeks to
+    the cursor, so it costs the same however long the inbox has grown.
+    """
+
+    # Bytes at the end of an inbox checked for a notification that is being
+    # delivered again (events are delivered at least once)
+    DUPLICATE_WINDOW_BYTES = 16 * 1024
+
+    def __init__(self, file_storage: FileStorage) -> None:
+        """Initialize inboxes.
+
+        Args:
+            file_storage: File storage instance
+        """
+        self._storage = file_storage
+        self._inbox_dir = file_storage.data_dir / "inbox"
+        self._inbox_dir.mkdir(parents=True, exist_ok=True)
+
+    def append(self, agent_name: str, notification: dict[str, Any]) -> bool:
+        """Add a notification to an agent's inbox.
+
+        Args:
+            agent_name: Recipient
+            notification: Notification with a ``reply_id`` identifying it
+
+        Returns:
+            False if the notification was already delivered
+        """
+        path = self._inbox_path(agent_name)
+        with self._storage.get_lock(f"inbox_{agent_name}"):
+            if self._recently_delivered(path, notification["reply_id"]):
+                return False
+            self._storage.append_jsonl(path, [notification])
+            return True
+
+    def read(
+        self, agent_name: str, offset: int | None = None, limit: int = 50
+    ) -> tuple[list[dict[str, Any]], int, bool]:
+        """Read notifications in delivery order.
+
+        Args:
+            agent_name: Inbox owner
+            offset: Byte offset to start at (None for the read cursor)
+            limit: Maximum number of notifications
+
+        Returns:
+            Tuple of notifications, the byte offset just past the last one
+            returned, and whether more notifications follow it
+
+        Raises:
+            ValueError: If the offset is not the start of a notification
+        """
+        path = self._inbox_path(agent_name)
+        if offset is None:
+            offset = self.cursor(agent_name)
+
+        notifications = []
+        try:
+            with open(path, "rb") as f:
+                self._check_offset(f, offset)
+                f.seek(offset)
+                for line in f:
+                    if not line.endswith(b"\n") or len(notifications) >= limit:
+                        break
+                    offset += len(line)
+                    records, _ = self._storage.parse_jsonl(line)
+                    notifications.extend(records)
+                has_more = offset < os.fstat(f.fileno()).st_size
+        except FileNotFoundError:
+            return [], 0, False
+        return notifications, offset, has_more
+
+    def cursor(self, agent_name: str) -> int:
+        """Get the byte offset of an agent's first unread notification.
+
+        Args:
+            agent_name: Inbox owner
+
+        Returns:
+            Byte offset (0 if nothing has been read)
+        """
+        path = self._cursor_path(agent_name)
+        if not path.exists():
+            return 0
+        return self._storage.read_json(path).get("offset", 0)
+
+    def mark_read(self, agent_name: str, offset: int) -> int:
+        """Move an agent's read cursor forward.
+
+        The cursor never moves backwards, so acknowledging an older page again
+        does not mark newer notifications unread.
+
+        Args:
+            agent_name: Inbox owner
+            offset: Byte offset returned by ``read``
+
+        Returns:
+            New cursor
+
+        Raises:
+            ValueError: If the offset is not the start of a notification
+        """
+        with self._storage.get_lock(f"inbox_{agent_name}"):
+            try:
+                with open(self._inbox_path(agent_name), "rb") as f:
+                    self._check_offset(f, offset)
+            except FileNotFoundError:
+                if offset:
+                    raise ValueError(f"Invalid inbox cursor: {offset}")
+            current = self.cursor(agent_name)
+            if offset > current:
+                self._storage.write_json(self._cursor_path(agent_name), {"offset": offset})
+                current = offset
+            return current
+
+    def _recently_delivered(self, path: Path, reply_id: str) -> bool:
+        """Check whether a notification is among the last ones in an inbox.
+
+        Args:
+            path: Inbox file
+            reply_id: Notification ID
+
+        Returns:
+            True if it was already appended
+        """
+        try:
+            with open(path, "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                f.seek(max(size - self.DUPLICATE_WINDOW_BYTES, 0))
+                data = f.read()
+        except FileNotFoundError:
+            return False
+        if reply_id.encode("utf-8") not in data:
+            return False
+        records, _ = self._storage.parse_jsonl(data)
+        return any(
+            isinstance(record, dict) and record.get("reply_id") == reply_id for record in records
+        )
+
+    @staticmethod
+    def _check_offset(f: BinaryIO, offset: int) -> None:
+        """Check that an offset is the start of a line within an inbox.
+
+        Args:
+            f: Open inbox file
+            offset: Byte offset
+
+        Raises:
+            ValueError: If the offset is past the end or in the middle of a line
+        """
+        if offset < 0 or offset > os.fstat(f.fileno()).st_size:
+            raise ValueError(f"Invalid inbox cursor: {offset}")
+        if offset > 0:
+            f.seek(offset - 1)
+            if f.read(1) != b"\n":
+                raise ValueError(f"Invalid inbox cursor: {offset}")
+
+    def _inbox_path(self, agent_name: str) -> Path:
+        """Get the inbox file of an agent."""
+        return self._inbox_dir / f"{agent_name}.jsonl"
+
+    def _cursor_path(self, agent_name: str) -> Path:
+        """Get the read cursor file of an agent."""
+        return self._inbox_dir / f"{agent_name}.cursor.json"
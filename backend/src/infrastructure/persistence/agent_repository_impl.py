@@ -1,13 +1,16 @@
 """Agent repository implementation."""
 
+import contextlib
 from datetime import datetime
 from pathlib import Path
 
 from src.domain.entities.agent import Agent
+from src.domain.entities.agent_stats import AgentStats
 from src.domain.exceptions.agent_exceptions import AgentAlreadyExistsException
 from src.domain.repositories.agent_repository import IAgentRepository
 from src.domain.value_objects.agent_name import AgentName
 from src.infrastructure.persistence.file_storage import FileStorage
+from src.infrastructure.tracing import traced
 
 
 class AgentRepositoryImpl(IAgentRepository):
@@ -43,6 +46,18 @@ class AgentRepositoryImpl(IAgentRepository):
         """
         return self._get_agent_dir(name) / "profile.json"
 
+    def _get_stats_path(self, name: AgentName) -> Path:
+        """Get stats file path for an agent.
+
+        Args:
+            name: Agent name
+
+        Returns:
+            Path to stats.json
+        """
+        return self._get_agent_dir(name) / "stats.json"
+
+    @traced("agent_repository.save")
     def save(self, agent: Agent) -> None:
         """Save an agent.
 
@@ -59,7 +74,9 @@ class AgentRepositoryImpl(IAgentRepository):
 
         with self._storage.get_lock(f"agent_{agent.name.value}"):
             self._storage.write_json(profile_path, agent.to_dict())
+            self._storage.write_json(self._get_stats_path(agent.name), AgentStats().to_dict())
 
+    @traced("agent_repository.find_by_name")
     def find_by_name(self, name: AgentName) -> Agent | None:
         """Find an agent by name.
 
@@ -80,6 +97,7 @@ class AgentRepositoryImpl(IAgentRepository):
         except FileNotFoundError:
             return None
 
+    @traced("agent_repository.exists")
     def exists(self, name: AgentName) -> bool:
         """Check if an agent exists.
 
@@ -92,6 +110,7 @@ class AgentRepositoryImpl(IAgentRepository):
         profile_path = self._get_profile_path(name)
         return self._storage.file_exists(profile_path)
 
+    @traced("agent_repository.list_all")
     def list_all(self) -> list[Agent]:
         """List all agents.
 
@@ -122,17 +141,7 @@ class AgentRepositoryImpl(IAgentRepository):
         Returns:
             Number of posts
         """
-        count = 0
-        for post_dir in self._storage.list_directories(self._storage.posts_dir):
-            metadata_path = post_dir / "metadata.json"
-            if self._storage.file_exists(metadata_path):
-                try:
-                    data = self._storage.read_json(metadata_path)
-                    if data.get("agent_name") == name.value and not data.get("deleted", False):
-                        count += 1
-                except Exception:
-                    continue
-        return count
+        return self.get_stats(name).post_count
 
     def get_reply_count(self, name: AgentName) -> int:
         """Get the number of replies by an agent.
@@ -143,41 +152,143 @@ class AgentRepositoryImpl(IAgentRepository):
         Returns:
             Number of replies
         """
-        count = 0
-        # Iterate through all posts
-        for post_dir in self._storage.list_directories(self._storage.posts_dir):
-            replies_dir = post_dir / "replies"
-            if self._storage.directory_exists(replies_dir):
-                count += self._count_replies_recursive(replies_dir, name)
-        return count
+        return self.get_stats(name).reply_count
 
-    def _count_replies_recursive(self, replies_dir, agent_name: AgentName) -> int:
-        """Recursively count replies by an agent.
+    @traced("agent_repository.get_stats")
+    def get_stats(self, name: AgentName) -> AgentStats:
+        """Get the activity counters of an agent from its stats.json.
+
+        Counters of agents registered before they were stored are written by
+        ``backfill_stats``; until then they read as zero.
 
         Args:
-            replies_dir: Directory containing replies
-            agent_name: Agent name to count
+            name: Agent name
 
         Returns:
-            Number of replies by the agent
+            Agent statistics (all zero for unknown agents)
         """
-        count = 0
-        for reply_dir in self._storage.list_directories(replies_dir):
-            metadata_path = reply_dir / "metadata.json"
-            if self._storage.file_exists(metadata_path):
-                try:
-                    data = self._storage.read_json(metadata_path)
-                    if data.get("agent_name") == agent_name.value and not data.get(
-                        "deleted", False
-                    ):
-                        count += 1
-                    # Count nested replies
-                    nested_replies_dir = reply_dir / "replies"
-                    if self._storage.directory_exists(nested_replies_dir):
-                        count += self._count_replies_recursive(nested_replies_dir, agent_name)
-                except Exception:
-                    continue
-        return count
+        try:
+            return AgentStats.from_dict(self._storage.read_json(self._get_stats_path(name)))
+        except FileNotFoundError:
+            return AgentStats()
+
+    @traced("agent_repository.update_stats")
+    def update_stats(
+        self,
+        name: AgentName,
+        post_delta: int = 0,
+        reply_delta: int = 0,
+        deleted_delta: int = 0,
+        active_at: datetime | None = None,
+    ) -> None:
+        """Atomically apply a change to the activity counters of an agent.
+
+        Agents without a stats.json are left alone: ``backfill_stats`` counts
+        the data tree, which already includes the change.
+
+        Args:
+            name: Agent name
+            post_delta: Change in the number of posts
+            reply_delta: Change in the number of replies
+            deleted_delta: Change in the number of deleted posts and replies
+            active_at: Time of the activity, if any
+        """
+        with self._storage.get_lock(f"agent_{name.value}"):
+            stats_path = self._get_stats_path(name)
+            try:
+                stats = AgentStats.from_dict(self._storage.read_json(stats_path))
+            except FileNotFoundError:
+                return
+            stats = stats.apply(post_delta, reply_delta, deleted_delta, active_at)
+            self._storage.write_json(stats_path, stats.to_dict())
+
+    def backfill_stats(self) -> int:
+        """Write counters for agents registered before counters were stored.
+
+        The data tree is walked once for all such agents, and only if there
+        are any, so that reads and writes never have to count it. Agents that
+        already have counters are left alone.
+
+        Returns:
+            Number of agents whose counters were written
+        """
+        missing = [
+            agent_dir.name
+            for agent_dir in self._storage.list_directories(self._storage.agents_dir)
+            if self._storage.file_exists(agent_dir / "profile.json")
+            and not self._storage.file_exists(agent_dir / "stats.json")
+        ]
+        if not missing:
+            return 0
+
+        collected = self._collect_stats()
+        written = 0
+        for agent_name in missing:
+            stats_path = self._storage.agents_dir / agent_name / "stats.json"
+            with self._storage.get_lock(f"agent_{agent_name}"):
+                if not self._storage.file_exists(stats_path):
+                    stats = collected.get(agent_name, AgentStats())
+                    self._storage.write_json(stats_path, stats.to_dict())
+                    written += 1
+        return written
+
+    def rebuild_stats(self) -> int:
+        """Recompute the activity counters of every agent in one pass over posts.
+
+        Returns:
+            Number of agents whose counters were written
+        """
+        collected = self._collect_stats()
+
+        agents = self.list_all()
+        for agent in agents:
+            with self._storage.get_lock(f"agent_{agent.name.value}"):
+                stats = collected.get(agent.name.value, AgentStats())
+                self._storage.write_json(self._get_stats_path(agent.name), stats.to_dict())
+
+        return len(agents)
+
+    def _collect_stats(self) -> dict[str, AgentStats]:
+        """Count posts and replies of all agents with a single walk of the data tree.
+
+        Returns:
+            Statistics keyed by agent name
+        """
+        collected: dict[str, AgentStats] = {}
+
+        def record(data: dict, is_post: bool) -> None:
+            agent_name = data.get("agent_name")
+            if not agent_name:
+                return
+            deleted = bool(data.get("deleted", False))
+            stats = collected.get(agent_name, AgentStats())
+            for timestamp in (data.get("created_at"), data.get("deleted_at")):
+                if timestamp:
+                    stats = stats.apply(active_at=datetime.fromisoformat(timestamp))
+            collected[agent_name] = stats.apply(
+                post_delta=int(is_post and not deleted),
+                reply_delta=int(not is_post and not deleted),
+                deleted_delta=int(deleted),
+            )
+
+        def walk_replies(replies_dir: Path) -> None:
+            for reply_dir in self._storage.list_directories(replies_dir):
+                with contextlib.suppress(FileNotFoundError, ValueError):
+                    record(self._storage.read_json(reply_dir / "metadata.json"), is_post=False)
+                nested_replies_dir = reply_dir / "replies"
+                if self._storage.directory_exists(nested_replies_dir):
+                    walk_replies(nested_replies_dir)
+
+        for post_dir in self._storage.list_directories(self._storage.posts_dir):
+            try:
+                record(self._storage.read_json(post_dir / "metadata.json"), is_post=True)
+            except (FileNotFoundError, ValueError):
+                continue
+            replies_dir = post_dir / "replies"
+            if self._storage.directory_exists(replies_dir):
+                walk_replies(replies_dir)
+
+        return collected
 
     def _deserialize_agent(self, data: dict) -> Agent:
         """Deserialize agent from dictionary.
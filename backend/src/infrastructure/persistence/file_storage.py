@@ -1,15 +1,49 @@
 """File storage foundation for the BBS system."""
 
+import os
 import shutil
+import threading
+from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Any
 
+from src.infrastructure.tracing import Span, span
 from src.infrastructure.utils.file_lock import FileLock
 from src.infrastructure.utils.json_serializer import JSONSerializer
 
+# Locks of individual records are reported under the kind of record
+RECORD_LOCK_PREFIXES = ("post_", "agent_", "inbox_")
+
+
+@dataclass(frozen=True)
+class StorageIOStats:
+    """Point-in-time I/O counters of a ``FileStorage``."""
+
+    files_read: int
+    files_written: int
+    bytes_read: int
+    bytes_written: int
+    stat_calls: int
+    directory_listings: int
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert stats to dictionary.
+
+        Returns:
+            Dictionary representation of stats
+        """
+        return asdict(self)
+
 
 class FileStorage:
-    """Foundation class for file-based storage operations."""
+    """Foundation class for file-based storage operations.
+
+    Counts the files, bytes, ``stat`` calls and directory listings it
+    performs. Indexes and logs that read files directly report their I/O
+    through the ``record_*`` methods, so that ``io_stats`` covers the data
+    directory as a whole. In sampled traces every primitive records a
+    ``storage.*`` span with the path and size.
+    """
 
     def __init__(self, data_dir: Path) -> None:
         """Initialize file storage.
@@ -29,6 +63,68 @@ class FileStorage:
         self.index_dir.mkdir(parents=True, exist_ok=True)
         self.locks_dir.mkdir(parents=True, exist_ok=True)
 
+        self._io_lock = threading.Lock()
+        self._files_read = 0
+        self._files_written = 0
+        self._bytes_read = 0
+        self._bytes_written = 0
+        self._stat_calls = 0
+        self._directory_listings = 0
+
+    def record_read(self, size: int) -> None:
+        """Count a file read.
+
+        Args:
+            size: Number of bytes read
+        """
+        with self._io_lock:
+            self._files_read += 1
+            self._bytes_read += size
+
+    def record_write(self, size: int) -> None:
+        """Count a file write.
+
+        Args:
+            size: Number of bytes written
+        """
+        with self._io_lock:
+            self._files_written += 1
+            self._bytes_written += size
+
+    def record_stat(self, count: int = 1) -> None:
+        """Count ``stat`` calls (including existence and type checks).
+
+        Args:
+            count: Number of calls
+        """
+        with self._io_lock:
+            self._stat_calls += count
+
+    def io_stats(self) -> StorageIOStats:
+        """Get a snapshot of the I/O counters.
+
+        Returns:
+            Storage I/O statistics
+        """
+        with self._io_lock:
+            return StorageIOStats(
+                files_read=self._files_read,
+                files_written=self._files_written,
+                bytes_read=self._bytes_read,
+                bytes_written=self._bytes_written,
+                stat_calls=self._stat_calls,
+                directory_listings=self._directory_listings,
+            )
+
+    def _annotate(self, current: Span | None, path: Path, size: int | None = None) -> None:
+        """Add the path (relative to the data directory) and size to a span."""
+        if current is None:
+            return
+        relative = path.relative_to(self.data_dir) if path.is_relative_to(self.data_dir) else path
+        current.set("bbs.path", str(relative))
+        if size is not None:
+            current.set("bbs.bytes", size)
+
     def read_json(self, path: Path) -> dict[str, Any]:
         """Read JSON file.
 
@@ -41,9 +137,15 @@ class FileStorage:
         Raises:
             FileNotFoundError: If file doesn't exist
         """
-        if not path.exists():
-            raise FileNotFoundError(f"File not found: {path}")
-        return JSONSerializer.load_file(path)
+        with span("storage.read_json") as current:
+            self.record_stat()
+            if not path.exists():
+                raise FileNotFoundError(f"File not found: {path}")
+            data = path.read_bytes()
+            self.record_read(len(data))
+            self._annotate(current, path, len(data))
+            with span("json.decode"):
+                return JSONSerializer.deserialize(data.decode("utf-8"))
 
     def write_json(self, path: Path, data: dict[str, Any]) -> None:
         """Write JSON file atomically.
@@ -54,12 +156,17 @@ class FileStorage:
         """
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Write to temporary file first
-        temp_path = path.with_suffix(".tmp")
-        JSONSerializer.save_file(temp_path, data)
+        with span("storage.write_json") as current:
+            # Write to temporary file first
+            temp_path = path.with_suffix(".tmp")
+            with span("json.encode"):
+                payload = JSONSerializer.serialize(data).encode("utf-8")
+            temp_path.write_bytes(payload)
+            self.record_write(len(payload))
+            self._annotate(current, path, len(payload))
 
-        # Atomic rename
-        temp_path.replace(path)
+            # Atomic rename
+            temp_path.replace(path)
 
     def read_markdown(self, path: Path) -> str:
         """Read markdown file.
@@ -73,9 +180,14 @@ class FileStorage:
         Raises:
             FileNotFoundError: If file doesn't exist
         """
-        if not path.exists():
-            raise FileNotFoundError(f"File not found: {path}")
-        return path.read_text(encoding="utf-8")
+        with span("storage.read_markdown") as current:
+            self.record_stat()
+            if not path.exists():
+                raise FileNotFoundError(f"File not found: {path}")
+            data = path.read_bytes()
+            self.record_read(len(data))
+            self._annotate(current, path, len(data))
+            return data.decode("utf-8")
 
     def write_markdown(self, path: Path, content: str) -> None:
         """Write markdown file atomically.
@@ -86,24 +198,101 @@ class FileStorage:
         """
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Write to temporary file first
-        temp_path = path.with_suffix(".tmp")
-        temp_path.write_text(content, encoding="utf-8")
+        with span("storage.write_markdown") as current:
+            # Write to temporary file first
+            temp_path = path.with_suffix(".tmp")
+            payload = content.encode("utf-8")
+            temp_path.write_bytes(payload)
+            self.record_write(len(payload))
+            self._annotate(current, path, len(payload))
+
+            # Atomic rename
+            temp_path.replace(path)
+
+    def append_jsonl(self, path: Path, records: list[dict[str, Any]]) -> None:
+        """Append records to a JSON Lines file.
+
+        All records are written with a single write call so that concurrent
+        readers never observe a record split across two reads. If a previous
+        writer died mid-record, the torn line is terminated first so that it
+        cannot swallow the new records.
+
+        Args:
+            path: Path to JSONL file
+            records: Records to append
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = "".join(JSONSerializer.serialize_line(r) + "\n" for r in records)
+        with span("storage.append_jsonl") as current, open(path, "a+b") as f:
+            if f.tell() > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    payload = "\n" + payload
+            data = payload.encode("utf-8")
+            f.write(data)
+            self._annotate(current, path, len(data))
+        self.record_write(len(data))
+
+    def read_jsonl(self, path: Path, offset: int = 0) -> tuple[list[dict[str, Any]], int]:
+        """Read complete records from a JSON Lines file.
+
+        A trailing line without a newline is a record still being written and
+        is left for the next read. Lines that are not valid JSON (torn writes
+        from a crashed writer) are skipped.
+
+        Args:
+            path: Path to JSONL file
+            offset: Byte offset to start reading from
 
-        # Atomic rename
-        temp_path.replace(path)
+        Returns:
+            Tuple of records and the byte offset just past the last complete record
 
-    def get_lock(self, name: str) -> FileLock:
+        Raises:
+            FileNotFoundError: If file doesn't exist
+        """
+        with span("storage.read_jsonl") as current:
+            with open(path, "rb") as f:
+                f.seek(offset)
+                data = f.read()
+            self.record_read(len(data))
+            self._annotate(current, path, len(data))
+            records, consumed = self.parse_jsonl(data)
+        return records, offset + consumed
+
+    def parse_jsonl(self, data: bytes) -> tuple[list[dict[str, Any]], int]:
+        """Parse the complete records in a chunk of a JSON Lines file.
+
+        Args:
+            data: Raw bytes read from a JSONL file
+
+        Returns:
+            Tuple of records and the number of bytes they span
+        """
+        end = data.rfind(b"\n") + 1
+        records = []
+        for line in data[:end].splitlines():
+            if not line.strip():
+                continue
+            try:
+                records.append(JSONSerializer.deserialize(line.decode("utf-8")))
+            except ValueError:
+                continue
+        return records, end
+
+    def get_lock(self, name: str, shared: bool = False, timeout: float | None = None) -> FileLock:
         """Get a file lock for synchronization.
 
         Args:
             name: Name of the lock
+            shared: Take a shared (read) lock instead of an exclusive one
+            timeout: Seconds to wait before raising LockTimeoutError (None waits forever)
 
         Returns:
             FileLock instance
         """
         lock_file = self.locks_dir / f"{name}.lock"
-        return FileLock(lock_file)
+        label = next((p[:-1] for p in RECORD_LOCK_PREFIXES if name.startswith(p)), name)
+        return FileLock(lock_file, shared=shared, timeout=timeout, label=label)
 
     def list_directories(self, parent_dir: Path) -> list[Path]:
         """List all directories in a parent directory.
@@ -114,9 +303,16 @@ class FileStorage:
         Returns:
             List of directory paths
         """
-        if not parent_dir.exists():
-            return []
-        return [p for p in parent_dir.iterdir() if p.is_dir()]
+        with span("storage.list_directories") as current:
+            if not parent_dir.exists():
+                self.record_stat()
+                return []
+            children = list(parent_dir.iterdir())
+            with self._io_lock:
+                self._directory_listings += 1
+                self._stat_calls += 1 + len(children)
+            self._annotate(current, parent_dir)
+            return [p for p in children if p.is_dir()]
 
     def directory_exists(self, path: Path) -> bool:
         """Check if a directory exists.
@@ -127,6 +323,7 @@ class FileStorage:
         Returns:
             True if directory exists
         """
+        self.record_stat(2)
         return path.exists() and path.is_dir()
 
     def file_exists(self, path: Path) -> bool:
@@ -138,6 +335,7 @@ class FileStorage:
         Returns:
             True if file exists
         """
+        self.record_stat(2)
         return path.exists() and path.is_file()
 
     def delete_directory(self, path: Path) -> None:
@@ -1,29 +1,60 @@
 """Post repository implementation."""
 
+import os
+import sys
 from datetime import datetime
 from pathlib import Path
 
 from src.domain.entities.post import Post
+from src.domain.entities.post_summary import PostSummary
 from src.domain.entities.reply import Reply
 from src.domain.exceptions.post_exceptions import PostNotFoundException, ReplyNotFoundException
 from src.domain.repositories.post_repository import IPostRepository
 from src.domain.value_objects.agent_name import AgentName
 from src.domain.value_objects.content import Content
+from src.domain.value_objects.page_cursor import PageCursor
 from src.domain.value_objects.post_id import PostId
 from src.domain.value_objects.tags import Tags
+from src.infrastructure.indexes.post_index import PostIndex
+from src.infrastructure.lru_cache import LRUCache
 from src.infrastructure.persistence.file_storage import FileStorage
+from src.infrastructure.tracing import current_span, traced
+
+# Stat results (inode, mtime, size) of the files every write to a thread changes
+ThreadSignature = tuple[tuple[int, int, int] | None, ...]
 
 
 class PostRepositoryImpl(IPostRepository):
-    """File-based implementation of post repository."""
+    """File-based implementation of post repository.
+
+    With a post cache, whole threads returned by ``find_by_id`` are kept in
+    memory. Writes through this repository invalidate them, and each hit is
+    checked against the stat results of the post's metadata and reply
+    manifest, which every write replaces or appends to, so changes made by
+    other processes are picked up as well.
+    """
+
+    # Estimated memory per cached post or reply beyond its text
+    ENTITY_OVERHEAD_BYTES = 1024
 
-    def __init__(self, file_storage: FileStorage) -> None:
+    def __init__(
+        self,
+        file_storage: FileStorage,
+        post_index: PostIndex | None = None,
+        post_cache: LRUCache[tuple[ThreadSignature, Post]] | None = None,
+    ) -> None:
         """Initialize repository.
 
         Args:
             file_storage: File storage instance
+            post_index: Post index used to serve pages and counts without
+                scanning every post directory (optional)
+            post_cache: Cache of loaded threads (optional). Cached posts are
+                shared between callers and must not be modified.
         """
         self._storage = file_storage
+        self._post_index = post_index
+        self._post_cache = post_cache
 
     def _get_post_dir(self, post_id: PostId) -> Path:
         """Get directory path for a post.
@@ -69,6 +100,17 @@ class PostRepositoryImpl(IPostRepository):
         """
         return self._get_post_dir(post_id) / "replies"
 
+    def _get_manifest_path(self, post_id: PostId) -> Path:
+        """Get reply manifest path for a post.
+
+        Args:
+            post_id: Post ID
+
+        Returns:
+            Path to reply_manifest.jsonl
+        """
+        return self._get_post_dir(post_id) / "reply_manifest.jsonl"
+
     def _get_reply_dir(self, post_id: PostId, reply_id: str) -> Path:
         """Get directory path for a reply.
 
@@ -105,6 +147,7 @@ class PostRepositoryImpl(IPostRepository):
         """
         return self._get_reply_dir(post_id, reply_id) / "content.md"
 
+    @traced("post_repository.save")
     def save(self, post: Post) -> None:
         """Save a post.
 
@@ -115,8 +158,10 @@ class PostRepositoryImpl(IPostRepository):
         content_path = self._get_content_path(post.post_id)
 
         with self._storage.get_lock(f"post_{post.post_id.value}"):
-            # Save metadata
-            self._storage.write_json(metadata_path, post.to_dict(include_replies=False))
+            # Save metadata; the stored reply counter covers visible replies only
+            metadata = post.to_dict(include_replies=False)
+            metadata["reply_count"] = self._visible_reply_count(post.replies)
+            self._storage.write_json(metadata_path, metadata)
 
             # Save content
             self._storage.write_markdown(content_path, post.content.value)
@@ -125,32 +170,183 @@ class PostRepositoryImpl(IPostRepository):
             for reply in post.replies:
                 self._save_reply_recursive(post.post_id, reply)
 
+            # A post that never had replies starts with an empty manifest
+            if not self._storage.directory_exists(self._get_replies_dir(post.post_id)):
+                self._storage.append_jsonl(self._get_manifest_path(post.post_id), [])
+
+            self._invalidate(post.post_id)
+
     def _save_reply_recursive(self, post_id: PostId, reply: Reply) -> None:
-        """Save a reply and its nested replies recursively.
+        """Save a reply and its nested replies, and record them in the manifest.
+
+        Every reply is stored flat under the post's ``replies/`` directory;
+        the tree structure lives in the reply manifest. The post lock must be
+        held.
 
         Args:
             post_id: Post ID
             reply: Reply to save
         """
-        reply_metadata_path = self._get_reply_metadata_path(post_id, reply.reply_id)
-        reply_content_path = self._get_reply_content_path(post_id, reply.reply_id)
+        records: list[dict] = []
+        pending = [reply]
+        while pending:
+            current = pending.pop()
+            self._storage.write_json(
+                self._get_reply_metadata_path(post_id, current.reply_id),
+                current.to_dict(include_replies=False),
+            )
+            self._storage.write_markdown(
+                self._get_reply_content_path(post_id, current.reply_id), current.content.value
+            )
+            records.append(self._manifest_record(current))
+            pending.extend(current.replies)
+
+        # Append after the files exist so readers never see a dangling entry
+        self._storage.append_jsonl(self._get_manifest_path(post_id), records)
+
+    def _manifest_record(self, reply: Reply) -> dict:
+        """Build the manifest record of a reply.
+
+        Args:
+            reply: Reply
+
+        Returns:
+            Manifest record
+        """
+        return {
+            "reply_id": reply.reply_id,
+            "parent_id": reply.parent_id,
+            "parent_type": reply.parent_type,
+            "created_at": reply.created_at.isoformat(),
+            "deleted": reply.deleted,
+            "agent_name": reply.agent_name.value,
+        }
+
+    def _read_manifest(self, post_id: PostId) -> dict[str, dict]:
+        """Read the reply manifest of a post.
+
+        The manifest is append-only; the last record of a reply wins.
+
+        Args:
+            post_id: Post ID
+
+        Returns:
+            Manifest records keyed by reply ID (empty if there is no manifest)
+        """
+        try:
+            records, _ = self._storage.read_jsonl(self._get_manifest_path(post_id))
+        except FileNotFoundError:
+            return {}
+        return {record["reply_id"]: record for record in records}
+
+    @traced("post_repository.ensure_manifest")
+    def _ensure_manifest(self, post_id: PostId) -> None:
+        """Create the reply manifest of a post written before manifests existed.
+
+        Replies found nested under ``<reply>/replies`` are moved to the flat
+        layout. Must be called without the post lock held.
+
+        Args:
+            post_id: Post ID
+        """
+        manifest_path = self._get_manifest_path(post_id)
+        if self._storage.file_exists(manifest_path):
+            return
 
-        # Save reply metadata
-        self._storage.write_json(reply_metadata_path, reply.to_dict(include_replies=False))
+        with self._storage.get_lock(f"post_{post_id.value}"):
+            if self._storage.file_exists(manifest_path):
+                return
 
-        # Save reply content
-        self._storage.write_markdown(reply_content_path, reply.content.value)
+            replies_dir = self._get_replies_dir(post_id)
+            records: list[dict] = []
+            pending = self._storage.list_directories(replies_dir)
+            while pending:
+                reply_dir = pending.pop()
+                for nested_dir in self._storage.list_directories(reply_dir / "replies"):
+                    flat_dir = replies_dir / nested_dir.name
+                    if not flat_dir.exists():
+                        nested_dir.replace(flat_dir)
+                        pending.append(flat_dir)
+                try:
+                    reply = self._deserialize_reply(
+                        self._storage.read_json(reply_dir / "metadata.json"),
+                        self._storage.read_markdown(reply_dir / "content.md"),
+                    )
+                except (FileNotFoundError, KeyError, ValueError):
+                    continue
+                records.append(self._manifest_record(reply))
 
-        # Save nested replies
-        for nested_reply in reply.replies:
-            self._save_reply_recursive(post_id, nested_reply)
+            temp_path = manifest_path.with_suffix(".tmp")
+            temp_path.unlink(missing_ok=True)
+            self._storage.append_jsonl(temp_path, records)
+            temp_path.replace(manifest_path)
 
-    def find_by_id(self, post_id: PostId, include_deleted: bool = False) -> Post | None:
+    @traced("post_repository.find_by_id")
+    def find_by_id(
+        self, post_id: PostId, include_deleted: bool = False, include_replies: bool = True
+    ) -> Post | None:
         """Find a post by ID.
 
         Args:
             post_id: Post ID to search for
-            include_deleted: Whether to include deleted posts
+            include_deleted: Whether to include deleted posts and replies
+            include_replies: Whether to load the reply tree
+
+        Returns:
+            Post if found, None otherwise
+        """
+        if self._post_cache is None or not include_replies:
+            return self._load_post(post_id, include_deleted, include_replies)
+
+        key = (post_id.value, include_deleted)
+        signature = self._thread_signature(post_id)
+        cached = self._post_cache.get(key)
+        hit = cached is not None and cached[0] == signature
+        if (current := current_span()) is not None:
+            current.set("bbs.cache_hit", hit)
+        if hit:
+            return cached[1]
+
+        # The signature is taken before reading, so a write that races with
+        # the read leaves a stale signature and the entry is reloaded next time
+        post = self._load_post(post_id, include_deleted, include_replies=True)
+        if post is None:
+            self._post_cache.invalidate(key)
+        else:
+            self._post_cache.put(key, (signature, post), self._estimate_size(post))
+        return post
+
+    def _load_post(
+        self, post_id: PostId, include_deleted: bool, include_replies: bool
+    ) -> Post | None:
+        """Read a post from disk under a shared post lock.
+
+        The shared lock keeps the read from observing a post that a writer
+        has only partly saved.
+
+        Args:
+            post_id: Post ID
+            include_deleted: Whether to include deleted posts and replies
+            include_replies: Whether to load the reply tree
+
+        Returns:
+            Post if found, None otherwise
+        """
+        if include_replies:
+            self._ensure_manifest(post_id)
+        with self._storage.get_lock(f"post_{post_id.value}", shared=True):
+            return self._read_post(post_id, include_deleted, include_replies)
+
+    @traced("post_repository.read_post")
+    def _read_post(
+        self, post_id: PostId, include_deleted: bool, include_replies: bool
+    ) -> Post | None:
+        """Read a post from disk; the post lock must be held.
+
+        Args:
+            post_id: Post ID
+            include_deleted: Whether to include deleted posts and replies
+            include_replies: Whether to load the reply tree
 
         Returns:
             Post if found, None otherwise
@@ -163,20 +359,17 @@ class PostRepositoryImpl(IPostRepository):
 
         try:
             metadata = self._storage.read_json(metadata_path)
-            content_text = self._storage.read_markdown(content_path)
 
             # Check if deleted
             if metadata.get("deleted", False) and not include_deleted:
                 return None
 
             # Deserialize post
-            post = self._deserialize_post(metadata, content_text)
+            post = self._deserialize_post(metadata, self._storage.read_markdown(content_path))
 
             # Load replies
-            replies_dir = self._get_replies_dir(post_id)
-            if self._storage.directory_exists(replies_dir):
-                replies = self._load_replies(post_id, post_id.value, "post", include_deleted)
-                for reply in replies:
+            if include_replies:
+                for reply in self._load_replies(post_id, include_deleted):
                     post.add_reply(reply)
 
             return post
@@ -184,65 +377,93 @@ class PostRepositoryImpl(IPostRepository):
         except (FileNotFoundError, KeyError, ValueError):
             return None
 
-    def _load_replies(
-        self, post_id: PostId, parent_id: str, parent_type: str, include_deleted: bool
-    ) -> list[Reply]:
-        """Load replies for a parent (post or reply).
+    def _thread_signature(self, post_id: PostId) -> ThreadSignature:
+        """Get the stat results that change whenever a post's thread is written.
 
         Args:
             post_id: Post ID
-            parent_id: Parent ID
-            parent_type: Parent type ('post' or 'reply')
-            include_deleted: Whether to include deleted replies
 
         Returns:
-            List of replies
+            Inode, modification time and size of the metadata and reply manifest
         """
-        replies: list[Reply] = []
+        signature = []
+        self._storage.record_stat(2)
+        for path in (self._get_metadata_path(post_id), self._get_manifest_path(post_id)):
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                signature.append(None)
+                continue
+            signature.append((stat.st_ino, stat.st_mtime_ns, stat.st_size))
+        return tuple(signature)
 
-        if parent_type == "post":
-            replies_dir = self._get_replies_dir(post_id)
-        else:
-            replies_dir = self._get_reply_dir(post_id, parent_id) / "replies"
+    def _estimate_size(self, post: Post) -> int:
+        """Estimate the memory held by a loaded thread.
 
-        if not self._storage.directory_exists(replies_dir):
-            return replies
+        Args:
+            post: Post with its replies
 
-        for reply_dir in self._storage.list_directories(replies_dir):
-            reply_id = reply_dir.name
-            metadata_path = reply_dir / "metadata.json"
-            content_path = reply_dir / "content.md"
+        Returns:
+            Size in bytes
+        """
+        size = (
+            self.ENTITY_OVERHEAD_BYTES
+            + sys.getsizeof(post.title)
+            + sys.getsizeof(post.content.value)
+        )
+        pending = list(post.replies)
+        while pending:
+            reply = pending.pop()
+            size += self.ENTITY_OVERHEAD_BYTES + sys.getsizeof(reply.content.value)
+            pending.extend(reply.replies)
+        return size
 
-            if not self._storage.file_exists(metadata_path):
-                continue
+    def _invalidate(self, post_id: PostId) -> None:
+        """Drop a post's cached threads after a write.
 
-            try:
-                metadata = self._storage.read_json(metadata_path)
-                content_text = self._storage.read_markdown(content_path)
+        Args:
+            post_id: Post ID
+        """
+        if self._post_cache is not None:
+            self._post_cache.invalidate((post_id.value, False), (post_id.value, True))
 
-                # Check if deleted
-                if metadata.get("deleted", False) and not include_deleted:
-                    continue
+    @traced("post_repository.load_replies")
+    def _load_replies(self, post_id: PostId, include_deleted: bool) -> list[Reply]:
+        """Load the reply tree of a post in one pass over its reply manifest.
 
-                # Check if this reply belongs to the parent
-                if metadata.get("parent_id") != parent_id:
-                    continue
+        Siblings are ordered by creation time. Deleted replies are skipped
+        together with their subtrees unless ``include_deleted`` is set. The
+        manifest must already exist (see ``_ensure_manifest``).
 
-                # Deserialize reply
-                reply = self._deserialize_reply(metadata, content_text)
+        Args:
+            post_id: Post ID
+            include_deleted: Whether to include deleted replies
 
-                # Load nested replies recursively
-                nested_replies = self._load_replies(post_id, reply_id, "reply", include_deleted)
-                for nested_reply in nested_replies:
+        Returns:
+            Top-level replies with their nested replies attached
+        """
+        children: dict[str, list[dict]] = {}
+        for record in self._read_manifest(post_id).values():
+            if record["deleted"] and not include_deleted:
+                continue
+            children.setdefault(record["parent_id"], []).append(record)
+
+        def build(parent_id: str) -> list[Reply]:
+            replies: list[Reply] = []
+            for record in sorted(
+                children.get(parent_id, []), key=lambda r: (r["created_at"], r["reply_id"])
+            ):
+                reply = self._read_reply(post_id, record["reply_id"])
+                if reply is None:
+                    continue
+                for nested_reply in build(reply.reply_id):
                     reply.add_reply(nested_reply)
-
                 replies.append(reply)
+            return replies
 
-            except (FileNotFoundError, KeyError, ValueError):
-                continue
-
-        return replies
+        return build(post_id.value)
 
+    @traced("post_repository.find_all")
     def find_all(
         self,
         include_deleted: bool = False,
@@ -265,7 +486,8 @@ class PostRepositoryImpl(IPostRepository):
 
         for post_dir in self._storage.list_directories(self._storage.posts_dir):
             post_id = PostId(post_dir.name)
-            post = self.find_by_id(post_id, include_deleted)
+            # Read past the cache so that a full scan does not evict the hot threads
+            post = self._load_post(post_id, include_deleted, include_replies=True)
 
             if post is None:
                 continue
@@ -287,41 +509,140 @@ class PostRepositoryImpl(IPostRepository):
 
         return posts
 
+    @traced("post_repository.find_summary")
+    def find_summary(self, post_id: PostId, include_deleted: bool = False) -> PostSummary | None:
+        """Find a post summary by ID, reading only the post's metadata.json.
+
+        Args:
+            post_id: Post ID to search for
+            include_deleted: Whether to include deleted posts
+
+        Returns:
+            Post summary if found, None otherwise
+        """
+        try:
+            summary = PostSummary.from_dict(
+                self._storage.read_json(self._get_metadata_path(post_id))
+            )
+        except (FileNotFoundError, KeyError, ValueError):
+            return None
+
+        if summary.deleted and not include_deleted:
+            return None
+        return summary
+
+    @traced("post_repository.find_summaries")
+    def find_summaries(
+        self,
+        limit: int,
+        after: PageCursor | None = None,
+        offset: int = 0,
+        include_deleted: bool = False,
+        agent_name: AgentName | None = None,
+    ) -> list[PostSummary]:
+        """Find one page of post summaries, newest first, using keyset pagination.
+
+        With a post index, the page is selected from the index and only the
+        metadata of the posts on it is read.
+
+        Args:
+            limit: Maximum number of posts to return
+            after: Cursor of the last post on the previous page
+            offset: Number of posts to skip after the cursor
+            include_deleted: Whether to include deleted posts
+            agent_name: Filter by agent name
+
+        Returns:
+            List of summaries ordered by creation time and post ID, descending
+        """
+        if self._post_index is None:
+            summaries = [
+                summary
+                for post_dir in self._storage.list_directories(self._storage.posts_dir)
+                if (summary := self.find_summary(PostId(post_dir.name), include_deleted))
+                and (agent_name is None or summary.agent_name == agent_name.value)
+            ]
+            summaries.sort(key=lambda s: (s.created_at, s.post_id), reverse=True)
+            if after:
+                summaries = [s for s in summaries if (s.created_at, s.post_id) < after.sort_key]
+            return summaries[offset : offset + limit]
+
+        entries = self._post_index.page_posts(
+            limit,
+            after=(after.created_at.isoformat(), after.post_id) if after else None,
+            offset=offset,
+            agent_name=agent_name.value if agent_name else None,
+            include_deleted=include_deleted,
+        )
+
+        summaries: list[PostSummary] = []
+        for entry in entries:
+            summary = self.find_summary(PostId(entry["post_id"]), include_deleted)
+            if summary:
+                summaries.append(summary)
+        return summaries
+
+    @traced("post_repository.delete")
     def delete(self, post_id: PostId) -> None:
-        """Soft delete a post.
+        """Soft delete a post by patching its metadata in place.
 
         Args:
             post_id: ID of post to delete
 
         Raises:
             PostNotFoundException: If post not found
+            ValueError: If post is already deleted
         """
-        post = self.find_by_id(post_id, include_deleted=True)
-        if post is None:
-            raise PostNotFoundException(post_id.value)
+        metadata_path = self._get_metadata_path(post_id)
+
+        with self._storage.get_lock(f"post_{post_id.value}"):
+            try:
+                metadata = self._storage.read_json(metadata_path)
+            except FileNotFoundError:
+                raise PostNotFoundException(post_id.value)
+            if metadata.get("deleted", False):
+                raise ValueError("Post is already deleted")
 
-        post.soft_delete()
-        self.save(post)
+            now = datetime.utcnow().isoformat()
+            metadata.update(deleted=True, deleted_at=now, updated_at=now)
+            self._storage.write_json(metadata_path, metadata)
+            self._invalidate(post_id)
 
+    @traced("post_repository.save_reply")
     def save_reply(self, post_id: PostId, reply: Reply) -> None:
-        """Save a reply to a post.
+        """Save a reply to a post without loading the post's thread.
 
         Args:
             post_id: ID of the post
             reply: Reply to save
 
         Raises:
-            PostNotFoundException: If post not found
+            PostNotFoundException: If post not found or deleted
         """
-        post = self.find_by_id(post_id, include_deleted=False)
-        if post is None:
-            raise PostNotFoundException(post_id.value)
-
+        self._ensure_manifest(post_id)
         with self._storage.get_lock(f"post_{post_id.value}"):
+            # Checked under the lock so that the post cannot be deleted in between
+            try:
+                metadata = self._storage.read_json(self._get_metadata_path(post_id))
+            except FileNotFoundError:
+                raise PostNotFoundException(post_id.value)
+            if metadata.get("deleted", False):
+                raise PostNotFoundException(post_id.value)
+
+            # A reply under a deleted reply is part of an invisible subtree
+            visible = self._is_visible(
+                self._read_manifest(post_id), reply.parent_id, reply.parent_type
+            )
             self._save_reply_recursive(post_id, reply)
+            if visible:
+                self._adjust_reply_count(post_id, self._visible_reply_count([reply]))
+            self._invalidate(post_id)
 
+    @traced("post_repository.find_reply_by_id")
     def find_reply_by_id(self, post_id: PostId, reply_id: str) -> Reply | None:
-        """Find a reply by ID within a post.
+        """Find a reply by ID within a post, reading only that reply's files.
+
+        Nested replies are not attached to the returned reply.
 
         Args:
             post_id: ID of the post
@@ -330,35 +651,55 @@ class PostRepositoryImpl(IPostRepository):
         Returns:
             Reply if found, None otherwise
         """
-        post = self.find_by_id(post_id, include_deleted=True)
-        if post is None:
-            return None
+        self._ensure_manifest(post_id)
+        with self._storage.get_lock(f"post_{post_id.value}", shared=True):
+            return self._read_reply(post_id, reply_id)
 
-        return self._find_reply_in_tree(reply_id, post.replies)
-
-    def _find_reply_in_tree(self, reply_id: str, replies: list[Reply]) -> Reply | None:
-        """Find a reply in a tree of replies recursively.
+    @traced("post_repository.find_participants")
+    def find_participants(self, post_id: PostId) -> set[str]:
+        """Find the agents taking part in a thread from its metadata and reply manifest.
 
         Args:
-            reply_id: Reply ID to find
-            replies: List of replies to search
+            post_id: ID of the post
 
         Returns:
-            Reply if found, None otherwise
+            Names of the post author and of every agent that replied
         """
-        for reply in replies:
-            if reply.reply_id == reply_id:
-                return reply
+        summary = self.find_summary(post_id, include_deleted=True)
+        if summary is None:
+            return set()
+
+        self._ensure_manifest(post_id)
+        participants = {summary.agent_name}
+        for record in self._read_manifest(post_id).values():
+            if record.get("agent_name"):
+                participants.add(record["agent_name"])
+        return participants
+
+    def _read_reply(self, post_id: PostId, reply_id: str) -> Reply | None:
+        """Read a single reply from its directory.
 
-            # Search nested replies
-            nested_result = self._find_reply_in_tree(reply_id, reply.replies)
-            if nested_result:
-                return nested_result
+        Args:
+            post_id: ID of the post
+            reply_id: ID of the reply
 
-        return None
+        Returns:
+            Reply without nested replies, or None if it does not exist in this post
+        """
+        try:
+            metadata = self._storage.read_json(self._get_reply_metadata_path(post_id, reply_id))
+            if metadata.get("post_id") != post_id.value:
+                return None
+            return self._deserialize_reply(
+                metadata,
+                self._storage.read_markdown(self._get_reply_content_path(post_id, reply_id)),
+            )
+        except (FileNotFoundError, KeyError, ValueError):
+            return None
 
+    @traced("post_repository.delete_reply")
     def delete_reply(self, post_id: PostId, reply_id: str) -> None:
-        """Soft delete a reply.
+        """Soft delete a reply by patching its metadata in place.
 
         Args:
             post_id: ID of the post
@@ -367,17 +708,115 @@ class PostRepositoryImpl(IPostRepository):
         Raises:
             PostNotFoundException: If post not found
             ReplyNotFoundException: If reply not found
+            ValueError: If reply is already deleted
         """
-        reply = self.find_reply_by_id(post_id, reply_id)
-        if reply is None:
-            raise ReplyNotFoundException(reply_id)
-
-        reply.soft_delete()
+        self._ensure_manifest(post_id)
 
-        # Save the reply
         with self._storage.get_lock(f"post_{post_id.value}"):
-            self._save_reply_recursive(post_id, reply)
+            reply = self._read_reply(post_id, reply_id)
+            if reply is None:
+                raise ReplyNotFoundException(reply_id)
+            reply.soft_delete()
+            # Replies under a deleted ancestor were already left out of the count
+            visible = self._is_visible(
+                self._read_manifest(post_id), reply.parent_id, reply.parent_type
+            )
+
+            self._storage.write_json(
+                self._get_reply_metadata_path(post_id, reply_id),
+                reply.to_dict(include_replies=False),
+            )
+            self._storage.append_jsonl(
+                self._get_manifest_path(post_id), [self._manifest_record(reply)]
+            )
+
+            if visible:
+                # The reply and its visible subtree drop out of the count
+                children: dict[str, list[str]] = {}
+                for record in self._read_manifest(post_id).values():
+                    if not record["deleted"]:
+                        children.setdefault(record["parent_id"], []).append(record["reply_id"])
+
+                def count_visible(parent_id: str) -> int:
+                    return sum(1 + count_visible(child) for child in children.get(parent_id, []))
+
+                self._adjust_reply_count(post_id, -1 - count_visible(reply_id))
+            self._invalidate(post_id)
+
+    def _is_visible(self, manifest: dict[str, dict], parent_id: str, parent_type: str) -> bool:
+        """Check whether replies under a parent are counted, i.e. no ancestor is deleted.
+
+        Args:
+            manifest: Manifest records keyed by reply ID
+            parent_id: ID of the parent post or reply
+            parent_type: 'post' or 'reply'
+
+        Returns:
+            True if every reply on the path to the post is visible
+        """
+        while parent_type == "reply":
+            record = manifest.get(parent_id)
+            if record is None or record["deleted"]:
+                return False
+            parent_id, parent_type = record["parent_id"], record["parent_type"]
+        return True
+
+    def _adjust_reply_count(self, post_id: PostId, delta: int) -> None:
+        """Update the reply counter in post metadata; the post lock must be held.
+
+        Args:
+            post_id: Post ID
+            delta: Change in the number of visible replies
+        """
+        if delta == 0:
+            return
+        metadata_path = self._get_metadata_path(post_id)
+        metadata = self._storage.read_json(metadata_path)
+        metadata["reply_count"] = max(metadata.get("reply_count", 0) + delta, 0)
+        self._storage.write_json(metadata_path, metadata)
+
+    def _visible_reply_count(self, replies: list[Reply]) -> int:
+        """Count replies in a tree, skipping deleted replies and their subtrees.
+
+        Args:
+            replies: Replies to count
+
+        Returns:
+            Number of visible replies
+        """
+        return sum(
+            1 + self._visible_reply_count(reply.replies) for reply in replies if not reply.deleted
+        )
+
+    def rebuild_reply_counts(self) -> int:
+        """Recompute the reply counter of every post from its reply tree.
+
+        Needed once for data written before the counter was maintained.
+
+        Returns:
+            Number of posts whose counter changed
+        """
+        changed = 0
+        for post_dir in self._storage.list_directories(self._storage.posts_dir):
+            post_id = PostId(post_dir.name)
+            self._ensure_manifest(post_id)
+            with self._storage.get_lock(f"post_{post_id.value}"):
+                post = self._read_post(post_id, include_deleted=True, include_replies=True)
+                if post is None:
+                    continue
+
+                metadata_path = self._get_metadata_path(post_id)
+                metadata = self._storage.read_json(metadata_path)
+                reply_count = self._visible_reply_count(post.replies)
+                if metadata.get("reply_count") != reply_count:
+                    metadata["reply_count"] = reply_count
+                    self._storage.write_json(metadata_path, metadata)
+                    self._invalidate(post_id)
+                    changed += 1
+
+        return changed
 
+    @traced("post_repository.count_posts")
     def count_posts(
         self, agent_name: AgentName | None = None, include_deleted: bool = False
     ) -> int:
@@ -388,8 +827,13 @@ class PostRepositoryImpl(IPostRepository):
             include_deleted: Whether to include deleted posts
 
         Returns:
-            Number of posts
+            Number of posts (from the post index when available)
         """
+        if self._post_index is not None:
+            return self._post_index.count_posts(
+                agent_name=agent_name.value if agent_name else None,
+                include_deleted=include_deleted,
+            )
         return len(self.find_all(include_deleted, agent_name=agent_name))
 
     def _deserialize_post(self, metadata: dict, content_text: str) -> Post:
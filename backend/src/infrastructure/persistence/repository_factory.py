@@ -0,0 +1,71 @@
+"""Selects repository implementations for the configured storage backend."""
+
+from dataclasses import dataclass
+
+from src.domain.repositories.agent_repository import IAgentRepository
+from src.domain.repositories.post_repository import IPostRepository
+from src.domain.repositories.search_repository import ISearchRepository
+from src.infrastructure.config import Settings
+from src.infrastructure.indexes.full_text_index import FullTextIndex
+from src.infrastructure.indexes.post_index import PostIndex
+from src.infrastructure.lru_cache import LRUCache
+from src.infrastructure.persistence.agent_repository_impl import AgentRepositoryImpl
+from src.infrastructure.persistence.file_storage import FileStorage
+from src.infrastructure.persistence.post_repository_impl import PostRepositoryImpl
+from src.infrastructure.persistence.search_repository_impl import SearchRepositoryImpl
+from src.infrastructure.persistence.sqlite_agent_repository_impl import SqliteAgentRepositoryImpl
+from src.infrastructure.persistence.sqlite_database import SQLiteDatabase
+from src.infrastructure.persistence.sqlite_post_repository_impl import SqlitePostRepositoryImpl
+from src.infrastructure.persistence.sqlite_search_repository_impl import (
+    SqliteSearchRepositoryImpl,
+)
+
+
+@dataclass
+class Repositories:
+    """Repository instances for one storage backend."""
+
+    post_repository: IPostRepository
+    agent_repository: IAgentRepository
+    search_repository: ISearchRepository
+    post_cache: LRUCache | None = None
+    post_index: PostIndex | None = None
+
+
+def create_repositories(settings: Settings, file_storage: FileStorage) -> Repositories:
+    """Create repositories for the configured storage backend.
+
+    The file backend also gets its post index; the SQLite backend answers
+    the same queries from its tables.
+
+    Args:
+        settings: Backend settings
+        file_storage: File storage instance (used by the file backend)
+
+    Returns:
+        Repositories for the selected backend
+    """
+    if settings.storage_backend == "sqlite":
+        database = SQLiteDatabase(settings.database_path)
+        sqlite_post_repository = SqlitePostRepositoryImpl(database)
+        return Repositories(
+            post_repository=sqlite_post_repository,
+            agent_repository=SqliteAgentRepositoryImpl(database),
+            search_repository=SqliteSearchRepositoryImpl(database, sqlite_post_repository),
+        )
+
+    post_index = PostIndex(file_storage, settings.post_index_shards)
+    post_cache = LRUCache(settings.post_cache_bytes) if settings.post_cache_bytes else None
+    post_repository = PostRepositoryImpl(file_storage, post_index, post_cache)
+    agent_repository = AgentRepositoryImpl(file_storage)
+    # One walk of the data tree for agents registered before counters were stored
+    agent_repository.backfill_stats()
+    return Repositories(
+        post_repository=post_repository,
+        agent_repository=agent_repository,
+        search_repository=SearchRepositoryImpl(
+            post_index, post_repository, FullTextIndex(file_storage)
+        ),
+        post_cache=post_cache,
+        post_index=post_index,
+    )
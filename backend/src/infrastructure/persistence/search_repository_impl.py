@@ -1,62 +1,95 @@
 """Search repository implementation."""
 
+import heapq
+from collections.abc import Iterator
 from datetime import datetime
 
 from src.domain.entities.post import Post
+from src.domain.entities.post_summary import PostSummary
+from src.domain.entities.reply import Reply
 from src.domain.repositories.post_repository import IPostRepository
-from src.domain.repositories.search_repository import ISearchRepository
+from src.domain.repositories.search_repository import SORT_NEWEST, SORT_RELEVANCE, ISearchRepository
 from src.domain.value_objects.agent_name import AgentName
+from src.domain.value_objects.page_cursor import PageCursor
 from src.domain.value_objects.post_id import PostId
+from src.domain.value_objects.tag_query import TagQuery
+from src.infrastructure.indexes.full_text_index import FullTextIndex
 from src.infrastructure.indexes.post_index import PostIndex
+from src.infrastructure.tracing import traced
 
 
 class SearchRepositoryImpl(ISearchRepository):
-    """Search repository implementation using post index."""
+    """Search repository implementation using the post and full-text indexes."""
 
-    def __init__(self, post_index: PostIndex, post_repository: IPostRepository) -> None:
+    def __init__(
+        self,
+        post_index: PostIndex,
+        post_repository: IPostRepository,
+        full_text_index: FullTextIndex,
+    ) -> None:
         """Initialize search repository.
 
         Args:
             post_index: Post index instance
-            post_repository: Post repository for loading full posts
+            post_repository: Post repository for loading posts and summaries
+            full_text_index: Full-text index over titles, bodies and replies
         """
         self._post_index = post_index
         self._post_repository = post_repository
+        self._full_text_index = full_text_index
 
+    @traced("search_repository.search_posts")
     def search_posts(
         self,
         query: str | None = None,
-        tags: list[str] | None = None,
+        tags: TagQuery | None = None,
         agent_name: AgentName | None = None,
         start_date: datetime | None = None,
         end_date: datetime | None = None,
         include_deleted: bool = False,
         limit: int = 50,
         offset: int = 0,
-    ) -> list[Post]:
+        sort_by: str = SORT_NEWEST,
+        after: PageCursor | None = None,
+    ) -> list[PostSummary]:
         """Search posts with various filters.
 
+        A post matches a query if its title, content or replies contain any of
+        the query terms, or if its title contains the query as a substring.
+
         Args:
-            query: Text search query (searches title and content)
-            tags: Filter by tags
+            query: Text search query (searches title, content and replies)
+            tags: Tag query (alternative, required and excluded tags)
             agent_name: Filter by agent
             start_date: Filter posts created after this date
             end_date: Filter posts created before this date
             include_deleted: Whether to include deleted posts
             limit: Maximum number of results
             offset: Number of results to skip
+            sort_by: 'newest' or 'relevance' (BM25 score, newest first on ties)
+            after: Cursor of the last post on the previous page (newest order only)
 
         Returns:
-            List of matching posts
+            List of summaries of matching posts
         """
-        # Search in index
+        # Filter metadata in the post index
         post_data_list = self._post_index.search_posts(
-            query=query,
             tags=tags,
             agent_name=agent_name.value if agent_name else None,
             include_deleted=include_deleted,
         )
 
+        # Match text in the full-text index
+        scores: dict[str, float] = {}
+        if query:
+            scores = self._full_text_index.search(query)
+            query_lower = query.lower()
+            post_data_list = [
+                p
+                for p in post_data_list
+                if p["post_id"] in scores or query_lower in p.get("title", "").lower()
+            ]
+
         # Filter by date
         if start_date:
             post_data_list = [
@@ -68,21 +101,73 @@ class SearchRepositoryImpl(ISearchRepository):
                 p for p in post_data_list if datetime.fromisoformat(p["created_at"]) <= end_date
             ]
 
+        # Continue after the cursor
+        if after:
+            post_data_list = [
+                p
+                for p in post_data_list
+                if (datetime.fromisoformat(p["created_at"]), p["post_id"]) < after.sort_key
+            ]
+
         # Sort by creation date (newest first)
-        post_data_list.sort(key=lambda p: datetime.fromisoformat(p["created_at"]), reverse=True)
+        post_data_list.sort(
+            key=lambda p: (datetime.fromisoformat(p["created_at"]), p["post_id"]), reverse=True
+        )
+        if sort_by == SORT_RELEVANCE and scores:
+            post_data_list.sort(key=lambda p: scores.get(p["post_id"], 0.0), reverse=True)
 
         # Apply offset and limit
         post_data_list = post_data_list[offset : offset + limit]
 
-        # Load full posts
-        posts: list[Post] = []
+        # Load summaries; content and reply trees are not needed for results
+        summaries: list[PostSummary] = []
         for post_data in post_data_list:
             post_id = PostId(post_data["post_id"])
-            post = self._post_repository.find_by_id(post_id, include_deleted)
-            if post:
-                posts.append(post)
+            summary = self._post_repository.find_summary(post_id, include_deleted)
+            if summary:
+                summaries.append(summary)
 
-        return posts
+        return summaries
+
+    @traced("search_repository.tag_counts")
+    def tag_counts(self, limit: int = 50) -> list[tuple[str, int]]:
+        """Get the most used tags from the counts kept by the post index.
+
+        Args:
+            limit: Maximum number of tags
+
+        Returns:
+            Tags with their number of visible posts, most used first (ties by tag)
+        """
+        counts = self._post_index.tag_counts()
+        return heapq.nsmallest(limit, counts.items(), key=lambda item: (-item[1], item[0]))
+
+    @traced("search_repository.index_post")
+    def index_post(self, post: Post) -> None:
+        """Add a new post's title and content to the full-text index.
+
+        Args:
+            post: Newly created post
+        """
+        self._full_text_index.add_document(post.post_id.value, post.title, post.content.value)
+
+    @traced("search_repository.index_reply")
+    def index_reply(self, reply: Reply) -> None:
+        """Add a new reply's content to its post's full-text document.
+
+        Args:
+            reply: Newly created reply
+        """
+        self._full_text_index.add_text(reply.post_id, reply.content.value)
+
+    @traced("search_repository.unindex_reply")
+    def unindex_reply(self, reply: Reply) -> None:
+        """Remove a deleted reply's content from its post's full-text document.
+
+        Args:
+            reply: Reply that was deleted
+        """
+        self._full_text_index.remove_text(reply.post_id, reply.content.value)
 
     def rebuild_index(self) -> None:
         """Rebuild the search index from scratch."""
@@ -92,5 +177,29 @@ class SearchRepositoryImpl(ISearchRepository):
         # Convert to index format
         posts_data = [post.to_dict(include_replies=False) for post in all_posts]
 
-        # Rebuild index
+        # Rebuild indexes
         self._post_index.rebuild_from_posts(posts_data)
+        self._full_text_index.rebuild_from_documents(
+            (
+                post.post_id.value,
+                FullTextIndex.document_terms(
+                    post.title, post.content.value, *self._reply_texts(post.replies)
+                ),
+            )
+            for post in all_posts
+        )
+
+    def _reply_texts(self, replies: list[Reply]) -> Iterator[str]:
+        """Yield the content of visible replies in a reply tree.
+
+        Args:
+            replies: Replies to walk
+
+        Yields:
+            Reply contents
+        """
+        for reply in replies:
+            if reply.deleted:
+                continue
+            yield reply.content.value
+            yield from self._reply_texts(reply.replies)
@@ -0,0 +1,253 @@
+"""SQLite agent repository implementation."""
+
+import json
+import sqlite3
+from datetime import datetime
+
+from src.domain.entities.agent import Agent
+from src.domain.entities.agent_stats import AgentStats
+from src.domain.exceptions.agent_exceptions import AgentAlreadyExistsException
+from src.domain.repositories.agent_repository import IAgentRepository
+from src.domain.value_objects.agent_name import AgentName
+from src.infrastructure.persistence.sqlite_database import SQLiteDatabase
+from src.infrastructure.tracing import traced
+
+
+class SqliteAgentRepositoryImpl(IAgentRepository):
+    """SQLite-based implementation of agent repository."""
+
+    # Computes agent_stats rows from posts and replies, optionally for one agent
+    COLLECT_STATS_QUERY = """
+        SELECT
+            a.agent_name,
+            coalesce(sum(e.is_post AND NOT e.deleted), 0),
+            coalesce(sum(NOT e.is_post AND NOT e.deleted), 0),
+            coalesce(sum(e.deleted), 0),
+            nullif(max(max(coalesce(e.created_at, ''), coalesce(e.deleted_at, ''))), '')
+        FROM agents a
+        LEFT JOIN (
+            SELECT agent_name, 1 AS is_post, deleted, created_at, deleted_at FROM posts
+            UNION ALL
+            SELECT agent_name, 0, deleted, created_at, deleted_at FROM replies
+        ) e ON e.agent_name = a.agent_name
+        WHERE ? IS NULL OR a.agent_name = ?
+        GROUP BY a.agent_name
+    """
+
+    def __init__(self, database: SQLiteDatabase) -> None:
+        """Initialize repository.
+
+        Args:
+            database: SQLite database instance
+        """
+        self._db = database
+
+    @traced("agent_repository.save")
+    def save(self, agent: Agent) -> None:
+        """Save an agent.
+
+        Args:
+            agent: Agent to save
+
+        Raises:
+            AgentAlreadyExistsException: If agent already exists
+        """
+        try:
+            with self._db.transaction() as conn:
+                conn.execute(
+                    """
+                    INSERT INTO agents (agent_name, description, metadata, created_at)
+                    VALUES (?, ?, ?, ?)
+                    """,
+                    (
+                        agent.name.value,
+                        agent.description,
+                        json.dumps(agent.metadata, ensure_ascii=False),
+                        agent.created_at.isoformat(),
+                    ),
+                )
+                conn.execute(
+                    "INSERT OR IGNORE INTO agent_stats (agent_name) VALUES (?)",
+                    (agent.name.value,),
+                )
+        except sqlite3.IntegrityError:
+            raise AgentAlreadyExistsException(agent.name.value)
+
+    @traced("agent_repository.find_by_name")
+    def find_by_name(self, name: AgentName) -> Agent | None:
+        """Find an agent by name.
+
+        Args:
+            name: Agent name to search for
+
+        Returns:
+            Agent if found, None otherwise
+        """
+        row = (
+            self._db.connection()
+            .execute("SELECT * FROM agents WHERE agent_name = ?", (name.value,))
+            .fetchone()
+        )
+        return self._deserialize_agent(row) if row else None
+
+    @traced("agent_repository.exists")
+    def exists(self, name: AgentName) -> bool:
+        """Check if an agent exists.
+
+        Args:
+            name: Agent name to check
+
+        Returns:
+            True if agent exists, False otherwise
+        """
+        row = (
+            self._db.connection()
+            .execute("SELECT 1 FROM agents WHERE agent_name = ?", (name.value,))
+            .fetchone()
+        )
+        return row is not None
+
+    @traced("agent_repository.list_all")
+    def list_all(self) -> list[Agent]:
+        """List all agents.
+
+        Returns:
+            List of all agents
+        """
+        rows = self._db.connection().execute("SELECT * FROM agents ORDER BY agent_name").fetchall()
+        return [self._deserialize_agent(row) for row in rows]
+
+    def get_post_count(self, name: AgentName) -> int:
+        """Get the number of posts by an agent.
+
+        Args:
+            name: Agent name
+
+        Returns:
+            Number of posts
+        """
+        return self.get_stats(name).post_count
+
+    def get_reply_count(self, name: AgentName) -> int:
+        """Get the number of replies by an agent.
+
+        Args:
+            name: Agent name
+
+        Returns:
+            Number of replies
+        """
+        return self.get_stats(name).reply_count
+
+    @traced("agent_repository.get_stats")
+    def get_stats(self, name: AgentName) -> AgentStats:
+        """Get the activity counters of an agent.
+
+        Args:
+            name: Agent name
+
+        Returns:
+            Agent statistics (all zero for unknown agents)
+        """
+        row = (
+            self._db.connection()
+            .execute("SELECT * FROM agent_stats WHERE agent_name = ?", (name.value,))
+            .fetchone()
+        )
+        if row is None:
+            # Agents imported before counters were stored get theirs computed once
+            with self._db.transaction() as conn:
+                conn.execute(
+                    f"INSERT OR IGNORE INTO agent_stats {self.COLLECT_STATS_QUERY}",
+                    (name.value, name.value),
+                )
+                row = conn.execute(
+                    "SELECT * FROM agent_stats WHERE agent_name = ?", (name.value,)
+                ).fetchone()
+            if row is None:
+                return AgentStats()
+
+        return AgentStats(
+            post_count=row["post_count"],
+            reply_count=row["reply_count"],
+            deleted_count=row["deleted_count"],
+            last_active_at=(
+                datetime.fromisoformat(row["last_active_at"]) if row["last_active_at"] else None
+            ),
+        )
+
+    @traced("agent_repository.update_stats")
+    def update_stats(
+        self,
+        name: AgentName,
+        post_delta: int = 0,
+        reply_delta: int = 0,
+        deleted_delta: int = 0,
+        active_at: datetime | None = None,
+    ) -> None:
+        """Atomically apply a change to the activity counters of an agent.
+
+        Args:
+            name: Agent name
+            post_delta: Change in the number of posts
+            reply_delta: Change in the number of replies
+            deleted_delta: Change in the number of deleted posts and replies
+            active_at: Time of the activity, if any
+        """
+        with self._db.transaction() as conn:
+            exists = conn.execute(
+                "SELECT 1 FROM agent_stats WHERE agent_name = ?", (name.value,)
+            ).fetchone()
+            if exists is None:
+                # Counting the tables already includes the change being recorded
+                conn.execute(
+                    f"INSERT INTO agent_stats {self.COLLECT_STATS_QUERY}",
+                    (name.value, name.value),
+                )
+                post_delta = reply_delta = deleted_delta = 0
+
+            conn.execute(
+                """
+                UPDATE agent_stats SET
+                    post_count = max(post_count + ?, 0),
+                    reply_count = max(reply_count + ?, 0),
+                    deleted_count = max(deleted_count + ?, 0),
+                    last_active_at = nullif(max(coalesce(last_active_at, ''), ?), '')
+                WHERE agent_name = ?
+                """,
+                (
+                    post_delta,
+                    reply_delta,
+                    deleted_delta,
+                    active_at.isoformat() if active_at else "",
+                    name.value,
+                ),
+            )
+
+    def rebuild_stats(self) -> int:
+        """Recompute the activity counters of every agent with one aggregate query.
+
+        Returns:
+            Number of agents whose counters were written
+        """
+        with self._db.transaction() as conn:
+            conn.execute("DELETE FROM agent_stats")
+            conn.execute(f"INSERT INTO agent_stats {self.COLLECT_STATS_QUERY}", (None, None))
+            row = conn.execute("SELECT COUNT(*) FROM agent_stats").fetchone()
+        return int(row[0])
+
+    def _deserialize_agent(self, row: sqlite3.Row) -> Agent:
+        """Deserialize agent from a database row.
+
+        Args:
+            row: Agent row
+
+        Returns:
+            Agent instance
+        """
+        return Agent(
+            name=AgentName(row["agent_name"]),
+            description=row["description"],
+            metadata=json.loads(row["metadata"]),
+            created_at=datetime.fromisoformat(row["created_at"]),
+        )
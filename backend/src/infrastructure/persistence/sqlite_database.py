@@ -0,0 +1,145 @@
+"""SQLite storage foundation for the BBS system."""
+
+import sqlite3
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS agents (
+    agent_name TEXT PRIMARY KEY,
+    description TEXT NOT NULL,
+    metadata TEXT NOT NULL DEFAULT '{}',
+    created_at TEXT NOT NULL
+);
+
+-- Activity counters maintained by the use cases; see rebuild_stats
+CREATE TABLE IF NOT EXISTS agent_stats (
+    agent_name TEXT PRIMARY KEY,
+    post_count INTEGER NOT NULL DEFAULT 0,
+    reply_count INTEGER NOT NULL DEFAULT 0,
+    deleted_count INTEGER NOT NULL DEFAULT 0,
+    last_active_at TEXT
+);
+
+CREATE TABLE IF NOT EXISTS posts (
+    post_id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    agent_name TEXT NOT NULL,
+    content TEXT NOT NULL,
+    tags TEXT NOT NULL DEFAULT '[]',
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    deleted INTEGER NOT NULL DEFAULT 0,
+    deleted_at TEXT
+);
+
+CREATE INDEX IF NOT EXISTS idx_posts_created_at ON posts (created_at DESC, post_id DESC);
+CREATE INDEX IF NOT EXISTS idx_posts_agent_name ON posts (agent_name, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_posts_deleted ON posts (deleted, created_at DESC);
+
+CREATE TABLE IF NOT EXISTS post_tags (
+    tag TEXT NOT NULL,
+    post_id TEXT NOT NULL REFERENCES posts (post_id) ON DELETE CASCADE,
+    PRIMARY KEY (tag, post_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_post_tags_post_id ON post_tags (post_id);
+
+CREATE TABLE IF NOT EXISTS replies (
+    reply_id TEXT PRIMARY KEY,
+    post_id TEXT NOT NULL REFERENCES posts (post_id) ON DELETE CASCADE,
+    parent_id TEXT NOT NULL,
+    parent_type TEXT NOT NULL,
+    agent_name TEXT NOT NULL,
+    content TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    deleted INTEGER NOT NULL DEFAULT 0,
+    deleted_at TEXT
+);
+
+CREATE INDEX IF NOT EXISTS idx_replies_post_id ON replies (post_id, created_at);
+CREATE INDEX IF NOT EXISTS idx_replies_parent_id ON replies (parent_id);
+CREATE INDEX IF NOT EXISTS idx_replies_agent_name ON replies (agent_name, deleted);
+
+-- One full-text document per post (title, plus body and visible replies),
+-- keyed by a stable integer doc_id that is used as the FTS rowid
+CREATE TABLE IF NOT EXISTS search_documents (
+    doc_id INTEGER PRIMARY KEY,
+    post_id TEXT NOT NULL UNIQUE REFERENCES posts (post_id) ON DELETE CASCADE
+);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS posts_fts USING fts5 (
+    title, body, tokenize = 'unicode61 remove_diacritics 2'
+);
+"""
+
+
+class SQLiteDatabase:
+    """Thread-aware SQLite connection manager running in WAL mode.
+
+    Each thread gets its own connection, so the database can be shared by
+    request handlers running on different threads and by several worker
+    processes pointing at the same file.
+    """
+
+    def __init__(self, path: Path, busy_timeout_ms: int = 5000) -> None:
+        """Initialize the database and create the schema if needed.
+
+        Args:
+            path: Path to the SQLite database file
+            busy_timeout_ms: How long to wait for a locked database
+        """
+        self.path = path
+        self._busy_timeout_ms = busy_timeout_ms
+        self._local = threading.local()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection().executescript(SCHEMA)
+
+    def connection(self) -> sqlite3.Connection:
+        """Get the connection for the current thread.
+
+        Returns:
+            SQLite connection
+        """
+        conn: sqlite3.Connection | None = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self.path, timeout=self._busy_timeout_ms / 1000, isolation_level=None
+            )
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA foreign_keys=ON")
+            conn.execute(f"PRAGMA busy_timeout={self._busy_timeout_ms}")
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run statements in a write transaction.
+
+        The transaction starts with BEGIN IMMEDIATE so concurrent writers
+        queue on the busy timeout instead of failing on lock upgrade.
+
+        Yields:
+            SQLite connection inside an open transaction
+        """
+        conn = self.connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.rollback()
+            raise
+        else:
+            conn.commit()
+
+    def close(self) -> None:
+        """Close the connection of the current thread."""
+        conn: sqlite3.Connection | None = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
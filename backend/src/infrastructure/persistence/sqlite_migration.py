@@ -0,0 +1,200 @@
+"""Import an existing file-based data tree into the SQLite storage engine."""
+
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from src.domain.entities.post import Post
+from src.domain.entities.reply import Reply
+from src.domain.exceptions.agent_exceptions import AgentAlreadyExistsException
+from src.domain.value_objects.agent_name import AgentName
+from src.domain.value_objects.content import Content
+from src.domain.value_objects.post_id import PostId
+from src.domain.value_objects.tags import Tags
+from src.infrastructure.persistence.agent_repository_impl import AgentRepositoryImpl
+from src.infrastructure.persistence.file_storage import FileStorage
+from src.infrastructure.persistence.sqlite_agent_repository_impl import SqliteAgentRepositoryImpl
+from src.infrastructure.persistence.sqlite_database import SQLiteDatabase
+from src.infrastructure.persistence.sqlite_post_repository_impl import SqlitePostRepositoryImpl
+from src.infrastructure.persistence.sqlite_search_repository_impl import (
+    SqliteSearchRepositoryImpl,
+)
+
+
+@dataclass
+class MigrationReport:
+    """Summary of a file tree import."""
+
+    agents: int = 0
+    posts: int = 0
+    replies: int = 0
+    skipped: int = 0
+
+
+class FileTreeImporter:
+    """Copies agents, posts and replies from a data directory into SQLite.
+
+    The import is idempotent: posts and replies that already exist are updated
+    in place and existing agents are kept, so it can be re-run after new writes
+    landed in the file tree.
+    """
+
+    def __init__(self, file_storage: FileStorage, database: SQLiteDatabase) -> None:
+        """Initialize importer.
+
+        Args:
+            file_storage: File storage pointing at the source data tree
+            database: Target SQLite database
+        """
+        self._storage = file_storage
+        self._db = database
+        self._file_agents = AgentRepositoryImpl(file_storage)
+        self._sqlite_agents = SqliteAgentRepositoryImpl(database)
+        self._sqlite_posts = SqlitePostRepositoryImpl(database)
+
+    def run(self) -> MigrationReport:
+        """Import the whole data tree.
+
+        Returns:
+            Migration report
+        """
+        report = MigrationReport()
+
+        for agent in self._file_agents.list_all():
+            try:
+                self._sqlite_agents.save(agent)
+                report.agents += 1
+            except AgentAlreadyExistsException:
+                continue
+
+        for post_dir in self._storage.list_directories(self._storage.posts_dir):
+            try:
+                metadata = self._storage.read_json(post_dir / "metadata.json")
+                post = self._deserialize_post(
+                    metadata, self._storage.read_markdown(post_dir / "content.md")
+                )
+            except (FileNotFoundError, KeyError, ValueError):
+                report.skipped += 1
+                continue
+
+            replies = self._collect_replies(post_dir / "replies", report)
+            report.replies += self._attach_replies(post, replies, report)
+
+            self._sqlite_posts.save(post)
+            # Attaching replies bumps updated_at; keep the original timestamp
+            with self._db.transaction() as conn:
+                conn.execute(
+                    "UPDATE posts SET updated_at = ? WHERE post_id = ?",
+                    (metadata["updated_at"], post.post_id.value),
+                )
+            report.posts += 1
+
+        SqliteSearchRepositoryImpl(self._db, self._sqlite_posts).rebuild_index()
+        self._sqlite_agents.rebuild_stats()
+        return report
+
+    def _collect_replies(self, replies_dir: Path, report: MigrationReport) -> list[Reply]:
+        """Collect every reply below a replies directory, flat or nested.
+
+        Args:
+            replies_dir: Directory containing reply directories
+            report: Report to record skipped entries on
+
+        Returns:
+            List of replies
+        """
+        replies: list[Reply] = []
+
+        for reply_dir in self._storage.list_directories(replies_dir):
+            try:
+                replies.append(
+                    self._deserialize_reply(
+                        self._storage.read_json(reply_dir / "metadata.json"),
+                        self._storage.read_markdown(reply_dir / "content.md"),
+                    )
+                )
+            except (FileNotFoundError, KeyError, ValueError):
+                report.skipped += 1
+
+            replies.extend(self._collect_replies(reply_dir / "replies", report))
+
+        return replies
+
+    def _attach_replies(self, post: Post, replies: list[Reply], report: MigrationReport) -> int:
+        """Assemble collected replies into the post's reply tree.
+
+        Args:
+            post: Post to attach replies to
+            replies: Flat list of replies
+            report: Report to record orphaned replies on
+
+        Returns:
+            Number of replies attached
+        """
+        by_id = {reply.reply_id: reply for reply in replies}
+        attached = 0
+
+        for reply in sorted(by_id.values(), key=lambda r: r.created_at):
+            if reply.parent_type == "post" and reply.parent_id == post.post_id.value:
+                post.add_reply(reply)
+            elif reply.parent_id in by_id:
+                by_id[reply.parent_id].add_reply(reply)
+            else:
+                report.skipped += 1
+                continue
+            attached += 1
+
+        return attached
+
+    def _deserialize_post(self, metadata: dict[str, Any], content_text: str) -> Post:
+        """Deserialize post from metadata and content.
+
+        Args:
+            metadata: Post metadata dictionary
+            content_text: Post content text
+
+        Returns:
+            Post instance
+        """
+        return Post(
+            post_id=PostId(metadata["post_id"]),
+            title=metadata["title"],
+            agent_name=AgentName(metadata["agent_name"]),
+            content=Content(content_text),
+            tags=Tags(metadata.get("tags", [])),
+            created_at=datetime.fromisoformat(metadata["created_at"]),
+            updated_at=datetime.fromisoformat(metadata["updated_at"]),
+            deleted=metadata.get("deleted", False),
+            deleted_at=(
+                datetime.fromisoformat(metadata["deleted_at"])
+                if metadata.get("deleted_at")
+                else None
+            ),
+        )
+
+    def _deserialize_reply(self, metadata: dict[str, Any], content_text: str) -> Reply:
+        """Deserialize reply from metadata and content.
+
+        Args:
+            metadata: Reply metadata dictionary
+            content_text: Reply content text
+
+        Returns:
+            Reply instance
+        """
+        return Reply(
+            reply_id=metadata["reply_id"],
+            post_id=metadata["post_id"],
+            parent_id=metadata["parent_id"],
+            parent_type=metadata["parent_type"],
+            agent_name=AgentName(metadata["agent_name"]),
+            content=Content(content_text),
+            created_at=datetime.fromisoformat(metadata["created_at"]),
+            deleted=metadata.get("deleted", False),
+            deleted_at=(
+                datetime.fromisoformat(metadata["deleted_at"])
+                if metadata.get("deleted_at")
+                else None
+            ),
+        )
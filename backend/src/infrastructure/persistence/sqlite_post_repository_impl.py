@@ -0,0 +1,539 @@
+"""SQLite post repository implementation."""
+
+import json
+import sqlite3
+from collections.abc import Sequence
+from datetime import datetime
+
+from src.domain.entities.post import Post
+from src.domain.entities.post_summary import PostSummary
+from src.domain.entities.reply import Reply
+from src.domain.exceptions.post_exceptions import PostNotFoundException, ReplyNotFoundException
+from src.domain.repositories.post_repository import IPostRepository
+from src.domain.value_objects.agent_name import AgentName
+from src.domain.value_objects.content import Content
+from src.domain.value_objects.page_cursor import PageCursor
+from src.domain.value_objects.post_id import PostId
+from src.domain.value_objects.tags import Tags
+from src.infrastructure.persistence.sqlite_database import SQLiteDatabase
+from src.infrastructure.tracing import traced
+
+
+class SqlitePostRepositoryImpl(IPostRepository):
+    """SQLite-based implementation of post repository."""
+
+    # Stay well below SQLite's bound-parameter limit when loading replies
+    QUERY_BATCH_SIZE = 500
+
+    # Columns needed to build a PostSummary; list views never read content
+    SUMMARY_COLUMNS = (
+        "post_id, title, agent_name, tags, created_at, updated_at, deleted, deleted_at"
+    )
+
+    def __init__(self, database: SQLiteDatabase) -> None:
+        """Initialize repository.
+
+        Args:
+            database: SQLite database instance
+        """
+        self._db = database
+
+    @traced("post_repository.save")
+    def save(self, post: Post) -> None:
+        """Save a post.
+
+        Args:
+            post: Post to save
+        """
+        with self._db.transaction() as conn:
+            conn.execute(
+                """
+                INSERT INTO posts (
+                    post_id, title, agent_name, content, tags,
+                    created_at, updated_at, deleted, deleted_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (post_id) DO UPDATE SET
+                    title = excluded.title,
+                    content = excluded.content,
+                    tags = excluded.tags,
+                    updated_at = excluded.updated_at,
+                    deleted = excluded.deleted,
+                    deleted_at = excluded.deleted_at
+                """,
+                (
+                    post.post_id.value,
+                    post.title,
+                    post.agent_name.value,
+                    post.content.value,
+                    json.dumps(post.tags.values),
+                    post.created_at.isoformat(),
+                    post.updated_at.isoformat(),
+                    int(post.deleted),
+                    post.deleted_at.isoformat() if post.deleted_at else None,
+                ),
+            )
+            conn.execute("DELETE FROM post_tags WHERE post_id = ?", (post.post_id.value,))
+            conn.executemany(
+                "INSERT INTO post_tags (tag, post_id) VALUES (?, ?)",
+                [(tag, post.post_id.value) for tag in post.tags],
+            )
+
+            for reply in post.replies:
+                self._save_reply_recursive(conn, reply)
+
+    def _save_reply_recursive(self, conn: sqlite3.Connection, reply: Reply) -> None:
+        """Save a reply and its nested replies recursively.
+
+        Args:
+            conn: Connection inside an open transaction
+            reply: Reply to save
+        """
+        conn.execute(
+            """
+            INSERT INTO replies (
+                reply_id, post_id, parent_id, parent_type, agent_name,
+                content, created_at, deleted, deleted_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (reply_id) DO UPDATE SET
+                content = excluded.content,
+                deleted = excluded.deleted,
+                deleted_at = excluded.deleted_at
+            """,
+            (
+                reply.reply_id,
+                reply.post_id,
+                reply.parent_id,
+                reply.parent_type,
+                reply.agent_name.value,
+                reply.content.value,
+                reply.created_at.isoformat(),
+                int(reply.deleted),
+                reply.deleted_at.isoformat() if reply.deleted_at else None,
+            ),
+        )
+
+        for nested_reply in reply.replies:
+            self._save_reply_recursive(conn, nested_reply)
+
+    @traced("post_repository.find_by_id")
+    def find_by_id(
+        self, post_id: PostId, include_deleted: bool = False, include_replies: bool = True
+    ) -> Post | None:
+        """Find a post by ID.
+
+        Args:
+            post_id: Post ID to search for
+            include_deleted: Whether to include deleted posts
+            include_replies: Whether to load the reply tree
+
+        Returns:
+            Post if found, None otherwise
+        """
+        row = (
+            self._db.connection()
+            .execute("SELECT * FROM posts WHERE post_id = ?", (post_id.value,))
+            .fetchone()
+        )
+
+        if row is None or (row["deleted"] and not include_deleted):
+            return None
+        if not include_replies:
+            return self._deserialize_post(row)
+
+        return self._load_posts([row], include_deleted)[0]
+
+    @traced("post_repository.find_all")
+    def find_all(
+        self,
+        include_deleted: bool = False,
+        limit: int | None = None,
+        offset: int = 0,
+        agent_name: AgentName | None = None,
+    ) -> list[Post]:
+        """Find all posts with optional filtering.
+
+        Args:
+            include_deleted: Whether to include deleted posts
+            limit: Maximum number of posts to return
+            offset: Number of posts to skip
+            agent_name: Filter by agent name
+
+        Returns:
+            List of posts
+        """
+        where, params = self._build_filters(agent_name, include_deleted)
+
+        sql = f"SELECT * FROM posts {where} ORDER BY created_at DESC, post_id DESC"
+        if limit is not None or offset > 0:
+            sql += " LIMIT ? OFFSET ?"
+            params.extend([limit if limit is not None else -1, offset])
+
+        rows = self._db.connection().execute(sql, params).fetchall()
+        return self._load_posts(rows, include_deleted)
+
+    @traced("post_repository.find_summary")
+    def find_summary(self, post_id: PostId, include_deleted: bool = False) -> PostSummary | None:
+        """Find a post summary by ID without loading content or replies.
+
+        Args:
+            post_id: Post ID to search for
+            include_deleted: Whether to include deleted posts
+
+        Returns:
+            Post summary if found, None otherwise
+        """
+        row = (
+            self._db.connection()
+            .execute(
+                f"SELECT {self.SUMMARY_COLUMNS} FROM posts WHERE post_id = ?", (post_id.value,)
+            )
+            .fetchone()
+        )
+
+        if row is None or (row["deleted"] and not include_deleted):
+            return None
+
+        return self.load_summaries([row])[0]
+
+    @traced("post_repository.find_summaries")
+    def find_summaries(
+        self,
+        limit: int,
+        after: PageCursor | None = None,
+        offset: int = 0,
+        include_deleted: bool = False,
+        agent_name: AgentName | None = None,
+    ) -> list[PostSummary]:
+        """Find one page of post summaries, newest first, using keyset pagination.
+
+        Args:
+            limit: Maximum number of posts to return
+            after: Cursor of the last post on the previous page
+            offset: Number of posts to skip after the cursor
+            include_deleted: Whether to include deleted posts
+            agent_name: Filter by agent name
+
+        Returns:
+            List of summaries ordered by creation time and post ID, descending
+        """
+        where, params = self._build_filters(agent_name, include_deleted, after)
+        rows = (
+            self._db.connection()
+            .execute(
+                f"SELECT {self.SUMMARY_COLUMNS} FROM posts {where} "
+                "ORDER BY created_at DESC, post_id DESC LIMIT ? OFFSET ?",
+                [*params, limit, offset],
+            )
+            .fetchall()
+        )
+        return self.load_summaries(rows)
+
+    @traced("post_repository.delete")
+    def delete(self, post_id: PostId) -> None:
+        """Soft delete a post.
+
+        Args:
+            post_id: ID of post to delete
+
+        Raises:
+            PostNotFoundException: If post not found
+        """
+        with self._db.transaction() as conn:
+            row = conn.execute(
+                "SELECT deleted FROM posts WHERE post_id = ?", (post_id.value,)
+            ).fetchone()
+            if row is None:
+                raise PostNotFoundException(post_id.value)
+            if row["deleted"]:
+                raise ValueError("Post is already deleted")
+
+            now = datetime.utcnow().isoformat()
+            conn.execute(
+                "UPDATE posts SET deleted = 1, deleted_at = ?, updated_at = ? WHERE post_id = ?",
+                (now, now, post_id.value),
+            )
+
+    @traced("post_repository.save_reply")
+    def save_reply(self, post_id: PostId, reply: Reply) -> None:
+        """Save a reply to a post.
+
+        Args:
+            post_id: ID of the post
+            reply: Reply to save
+
+        Raises:
+            PostNotFoundException: If post not found
+        """
+        with self._db.transaction() as conn:
+            row = conn.execute(
+                "SELECT 1 FROM posts WHERE post_id = ? AND deleted = 0", (post_id.value,)
+            ).fetchone()
+            if row is None:
+                raise PostNotFoundException(post_id.value)
+
+            self._save_reply_recursive(conn, reply)
+
+    @traced("post_repository.find_reply_by_id")
+    def find_reply_by_id(self, post_id: PostId, reply_id: str) -> Reply | None:
+        """Find a reply by ID within a post.
+
+        Args:
+            post_id: ID of the post
+            reply_id: ID of the reply
+
+        Returns:
+            Reply if found, None otherwise
+        """
+        row = (
+            self._db.connection()
+            .execute(
+                "SELECT * FROM replies WHERE reply_id = ? AND post_id = ?",
+                (reply_id, post_id.value),
+            )
+            .fetchone()
+        )
+        if row is None:
+            return None
+
+        return self._deserialize_reply(row)
+
+    @traced("post_repository.find_participants")
+    def find_participants(self, post_id: PostId) -> set[str]:
+        """Find the agents taking part in a thread.
+
+        Args:
+            post_id: ID of the post
+
+        Returns:
+            Names of the post author and of every agent that replied
+        """
+        rows = (
+            self._db.connection()
+            .execute(
+                "SELECT agent_name FROM posts WHERE post_id = ? "
+                "UNION SELECT agent_name FROM replies WHERE post_id = ? "
+                "AND EXISTS (SELECT 1 FROM posts WHERE post_id = ?)",
+                (post_id.value, post_id.value, post_id.value),
+            )
+            .fetchall()
+        )
+        return {row["agent_name"] for row in rows}
+
+    @traced("post_repository.delete_reply")
+    def delete_reply(self, post_id: PostId, reply_id: str) -> None:
+        """Soft delete a reply.
+
+        Args:
+            post_id: ID of the post
+            reply_id: ID of the reply
+
+        Raises:
+            PostNotFoundException: If post not found
+            ReplyNotFoundException: If reply not found
+        """
+        with self._db.transaction() as conn:
+            row = conn.execute(
+                "SELECT deleted FROM replies WHERE reply_id = ? AND post_id = ?",
+                (reply_id, post_id.value),
+            ).fetchone()
+            if row is None:
+                raise ReplyNotFoundException(reply_id)
+            if row["deleted"]:
+                raise ValueError("Reply is already deleted")
+
+            conn.execute(
+                "UPDATE replies SET deleted = 1, deleted_at = ? WHERE reply_id = ?",
+                (datetime.utcnow().isoformat(), reply_id),
+            )
+
+    @traced("post_repository.count_posts")
+    def count_posts(
+        self, agent_name: AgentName | None = None, include_deleted: bool = False
+    ) -> int:
+        """Count posts.
+
+        Args:
+            agent_name: Optional filter by agent
+            include_deleted: Whether to include deleted posts
+
+        Returns:
+            Number of posts
+        """
+        where, params = self._build_filters(agent_name, include_deleted)
+        row = (
+            self._db.connection().execute(f"SELECT COUNT(*) FROM posts {where}", params).fetchone()
+        )
+        return int(row[0])
+
+    def _build_filters(
+        self,
+        agent_name: AgentName | None,
+        include_deleted: bool,
+        after: PageCursor | None = None,
+    ) -> tuple[str, list[object]]:
+        """Build the WHERE clause shared by listing and counting.
+
+        Args:
+            agent_name: Optional filter by agent
+            include_deleted: Whether to include deleted posts
+            after: Optional keyset pagination cursor
+
+        Returns:
+            Tuple of WHERE clause and its parameters
+        """
+        clauses: list[str] = []
+        params: list[object] = []
+
+        if not include_deleted:
+            clauses.append("deleted = 0")
+        if agent_name:
+            clauses.append("agent_name = ?")
+            params.append(agent_name.value)
+        if after:
+            clauses.append("(created_at, post_id) < (?, ?)")
+            params.extend([after.created_at.isoformat(), after.post_id])
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        return where, params
+
+    def _load_posts(self, rows: Sequence[sqlite3.Row], include_deleted: bool) -> list[Post]:
+        """Deserialize post rows and attach their reply trees.
+
+        All replies of all requested posts are fetched with a single query.
+
+        Args:
+            rows: Post rows
+            include_deleted: Whether to include deleted replies
+
+        Returns:
+            List of posts in the order of the given rows
+        """
+        posts = [self._deserialize_post(row) for row in rows]
+        if not posts:
+            return posts
+
+        post_ids = [post.post_id.value for post in posts]
+        reply_rows: list[sqlite3.Row] = []
+        for start in range(0, len(post_ids), self.QUERY_BATCH_SIZE):
+            batch = post_ids[start : start + self.QUERY_BATCH_SIZE]
+            placeholders = ", ".join("?" for _ in batch)
+            reply_rows.extend(
+                self._db.connection()
+                .execute(
+                    f"SELECT * FROM replies WHERE post_id IN ({placeholders}) "
+                    "ORDER BY created_at, reply_id",
+                    batch,
+                )
+                .fetchall()
+            )
+
+        children: dict[str, list[Reply]] = {}
+        for reply_row in reply_rows:
+            if reply_row["deleted"] and not include_deleted:
+                continue
+            reply = self._deserialize_reply(reply_row)
+            children.setdefault(reply.parent_id, []).append(reply)
+
+        for post in posts:
+            for reply in children.get(post.post_id.value, []):
+                if reply.parent_type == "post":
+                    self._attach_children(reply, children)
+                    post.add_reply(reply)
+
+        return posts
+
+    def load_summaries(self, rows: Sequence[sqlite3.Row]) -> list[PostSummary]:
+        """Build summaries from post rows, counting visible replies per post.
+
+        Only reply IDs and parents are read, with a single query per batch.
+
+        Args:
+            rows: Post rows with at least ``SUMMARY_COLUMNS``
+
+        Returns:
+            List of summaries in the order of the given rows
+        """
+        post_ids = [row["post_id"] for row in rows]
+        children: dict[str, list[str]] = {}
+        for start in range(0, len(post_ids), self.QUERY_BATCH_SIZE):
+            batch = post_ids[start : start + self.QUERY_BATCH_SIZE]
+            placeholders = ", ".join("?" for _ in batch)
+            for reply_id, parent_id in self._db.connection().execute(
+                f"SELECT reply_id, parent_id FROM replies "
+                f"WHERE post_id IN ({placeholders}) AND deleted = 0",
+                batch,
+            ):
+                children.setdefault(parent_id, []).append(reply_id)
+
+        def count_visible(parent_id: str) -> int:
+            return sum(1 + count_visible(child) for child in children.get(parent_id, []))
+
+        return [
+            PostSummary(
+                post_id=row["post_id"],
+                title=row["title"],
+                agent_name=row["agent_name"],
+                created_at=datetime.fromisoformat(row["created_at"]),
+                updated_at=datetime.fromisoformat(row["updated_at"]),
+                tags=json.loads(row["tags"]),
+                reply_count=count_visible(row["post_id"]),
+                deleted=bool(row["deleted"]),
+                deleted_at=(
+                    datetime.fromisoformat(row["deleted_at"]) if row["deleted_at"] else None
+                ),
+            )
+            for row in rows
+        ]
+
+    def _attach_children(self, reply: Reply, children: dict[str, list[Reply]]) -> None:
+        """Attach nested replies to a reply recursively.
+
+        Args:
+            reply: Parent reply
+            children: Replies grouped by parent ID
+        """
+        for child in children.get(reply.reply_id, []):
+            self._attach_children(child, children)
+            reply.add_reply(child)
+
+    def _deserialize_post(self, row: sqlite3.Row) -> Post:
+        """Deserialize post from a database row.
+
+        Args:
+            row: Post row
+
+        Returns:
+            Post instance
+        """
+        return Post(
+            post_id=PostId(row["post_id"]),
+            title=row["title"],
+            agent_name=AgentName(row["agent_name"]),
+            content=Content(row["content"]),
+            tags=Tags(json.loads(row["tags"])),
+            created_at=datetime.fromisoformat(row["created_at"]),
+            updated_at=datetime.fromisoformat(row["updated_at"]),
+            deleted=bool(row["deleted"]),
+            deleted_at=datetime.fromisoformat(row["deleted_at"]) if row["deleted_at"] else None,
+        )
+
+    def _deserialize_reply(self, row: sqlite3.Row) -> Reply:
+        """Deserialize reply from a database row.
+
+        Args:
+            row: Reply row
+
+        Returns:
+            Reply instance
+        """
+        return Reply(
+            reply_id=row["reply_id"],
+            post_id=row["post_id"],
+            parent_id=row["parent_id"],
+            parent_type=row["parent_type"],
+            agent_name=AgentName(row["agent_name"]),
+            content=Content(row["content"]),
+            created_at=datetime.fromisoformat(row["created_at"]),
+            deleted=bool(row["deleted"]),
+            deleted_at=datetime.fromisoformat(row["deleted_at"]) if row["deleted_at"] else None,
+        )
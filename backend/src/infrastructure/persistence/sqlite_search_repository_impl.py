@@ -0,0 +1,246 @@
+"""SQLite search repository implementation."""
+
+import sqlite3
+from datetime import datetime
+
+from src.domain.entities.post import Post
+from src.domain.entities.post_summary import PostSummary
+from src.domain.entities.reply import Reply
+from src.domain.repositories.search_repository import SORT_NEWEST, SORT_RELEVANCE, ISearchRepository
+from src.domain.value_objects.agent_name import AgentName
+from src.domain.value_objects.page_cursor import PageCursor
+from src.domain.value_objects.tag_query import TagQuery
+from src.infrastructure.indexes.full_text_index import tokenize
+from src.infrastructure.persistence.sqlite_database import SQLiteDatabase
+from src.infrastructure.persistence.sqlite_post_repository_impl import SqlitePostRepositoryImpl
+from src.infrastructure.tracing import traced
+
+
+class SqliteSearchRepositoryImpl(ISearchRepository):
+    """Search repository implementation using SQL filters and an FTS5 index.
+
+    Each post has one FTS5 document made of its title and the text of its body
+    and visible replies; ``bm25()`` provides relevance ranking.
+    """
+
+    # bm25() column weights for (title, body), matching FullTextIndex.TITLE_WEIGHT
+    BM25_WEIGHTS = (2.0, 1.0)
+
+    def __init__(self, database: SQLiteDatabase, post_repository: SqlitePostRepositoryImpl) -> None:
+        """Initialize search repository.
+
+        Args:
+            database: SQLite database instance
+            post_repository: Post repository for loading posts and summaries
+        """
+        self._db = database
+        self._post_repository = post_repository
+
+    @traced("search_repository.search_posts")
+    def search_posts(
+        self,
+        query: str | None = None,
+        tags: TagQuery | None = None,
+        agent_name: AgentName | None = None,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        include_deleted: bool = False,
+        limit: int = 50,
+        offset: int = 0,
+        sort_by: str = SORT_NEWEST,
+        after: PageCursor | None = None,
+    ) -> list[PostSummary]:
+        """Search posts with various filters.
+
+        A post matches a query if its title, content or replies contain any of
+        the query terms, or if its title contains the query as a substring.
+
+        Args:
+            query: Text search query (searches title, content and replies)
+            tags: Tag query (alternative, required and excluded tags)
+            agent_name: Filter by agent
+            start_date: Filter posts created after this date
+            end_date: Filter posts created before this date
+            include_deleted: Whether to include deleted posts
+            limit: Maximum number of results
+            offset: Number of results to skip
+            sort_by: 'newest' or 'relevance' (BM25 score, newest first on ties)
+            after: Cursor of the last post on the previous page (newest order only)
+
+        Returns:
+            List of summaries of matching posts
+        """
+        clauses: list[str] = []
+        params: list[object] = []
+        join = ""
+        order = "p.created_at DESC, p.post_id DESC"
+
+        if not include_deleted:
+            clauses.append("p.deleted = 0")
+        if agent_name:
+            clauses.append("p.agent_name = ?")
+            params.append(agent_name.value)
+        if tags:
+            self._tag_clauses(tags, clauses, params)
+        if query:
+            terms = sorted(set(tokenize(query)))
+            if terms:
+                join = (
+                    "LEFT JOIN (SELECT d.post_id, bm25(posts_fts, ?, ?) AS score "
+                    "FROM posts_fts JOIN search_documents d ON d.doc_id = posts_fts.rowid "
+                    "WHERE posts_fts MATCH ?) m ON m.post_id = p.post_id"
+                )
+                params[:0] = [*self.BM25_WEIGHTS, " OR ".join(f'"{t}"' for t in terms)]
+                clauses.append("(m.post_id IS NOT NULL OR instr(lower(p.title), ?) > 0)")
+                if sort_by == SORT_RELEVANCE:
+                    # bm25() is negative; lower is more relevant
+                    order = f"m.score IS NULL, m.score, {order}"
+            else:
+                clauses.append("instr(lower(p.title), ?) > 0")
+            params.append(query.lower())
+        if start_date:
+            clauses.append("p.created_at >= ?")
+            params.append(start_date.isoformat())
+        if end_date:
+            clauses.append("p.created_at <= ?")
+            params.append(end_date.isoformat())
+        if after:
+            clauses.append("(p.created_at, p.post_id) < (?, ?)")
+            params.extend([after.created_at.isoformat(), after.post_id])
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        columns = ", ".join(
+            f"p.{column}" for column in SqlitePostRepositoryImpl.SUMMARY_COLUMNS.split(", ")
+        )
+        rows = (
+            self._db.connection()
+            .execute(
+                f"SELECT {columns} FROM posts p {join} {where} ORDER BY {order} LIMIT ? OFFSET ?",
+                [*params, limit, offset],
+            )
+            .fetchall()
+        )
+        return self._post_repository.load_summaries(rows)
+
+    @staticmethod
+    def _tag_clauses(tags: TagQuery, clauses: list[str], params: list[object]) -> None:
+        """Add the conditions of a tag query, each answered from the post_tags key.
+
+        Args:
+            tags: Tag query
+            clauses: WHERE conditions to extend
+            params: Query parameters to extend
+        """
+        if tags.any_of:
+            placeholders = ", ".join("?" for _ in tags.any_of)
+            clauses.append(
+                "EXISTS (SELECT 1 FROM post_tags t "
+                f"WHERE t.post_id = p.post_id AND t.tag IN ({placeholders}))"
+            )
+            params.extend(tags.any_of)
+        for tag in tags.all_of:
+            clauses.append(
+                "EXISTS (SELECT 1 FROM post_tags t WHERE t.post_id = p.post_id AND t.tag = ?)"
+            )
+            params.append(tag)
+        if tags.none_of:
+            placeholders = ", ".join("?" for _ in tags.none_of)
+            clauses.append(
+                "NOT EXISTS (SELECT 1 FROM post_tags t "
+                f"WHERE t.post_id = p.post_id AND t.tag IN ({placeholders}))"
+            )
+            params.extend(tags.none_of)
+
+    @traced("search_repository.tag_counts")
+    def tag_counts(self, limit: int = 50) -> list[tuple[str, int]]:
+        """Get the most used tags.
+
+        Args:
+            limit: Maximum number of tags
+
+        Returns:
+            Tags with their number of visible posts, most used first (ties by tag)
+        """
+        rows = (
+            self._db.connection()
+            .execute(
+                "SELECT t.tag, COUNT(*) AS post_count FROM post_tags t "
+                "JOIN posts p ON p.post_id = t.post_id WHERE p.deleted = 0 "
+                "GROUP BY t.tag ORDER BY post_count DESC, t.tag LIMIT ?",
+                (limit,),
+            )
+            .fetchall()
+        )
+        return [(row["tag"], row["post_count"]) for row in rows]
+
+    @traced("search_repository.index_post")
+    def index_post(self, post: Post) -> None:
+        """Add a new post's title and content to the full-text index.
+
+        Args:
+            post: Newly created post
+        """
+        with self._db.transaction() as conn:
+            self._refresh_document(conn, post.post_id.value)
+
+    @traced("search_repository.index_reply")
+    def index_reply(self, reply: Reply) -> None:
+        """Add a new reply's content to its post's full-text document.
+
+        Args:
+            reply: Newly created reply
+        """
+        with self._db.transaction() as conn:
+            self._refresh_document(conn, reply.post_id)
+
+    @traced("search_repository.unindex_reply")
+    def unindex_reply(self, reply: Reply) -> None:
+        """Remove a deleted reply's content from its post's full-text document.
+
+        Args:
+            reply: Reply that was deleted
+        """
+        with self._db.transaction() as conn:
+            self._refresh_document(conn, reply.post_id)
+
+    def rebuild_index(self) -> None:
+        """Rebuild the search index from scratch."""
+        with self._db.transaction() as conn:
+            conn.execute("DELETE FROM posts_fts")
+            conn.execute("DELETE FROM search_documents")
+            for row in conn.execute("SELECT post_id FROM posts").fetchall():
+                self._refresh_document(conn, row["post_id"])
+            conn.execute("INSERT INTO posts_fts (posts_fts) VALUES ('optimize')")
+
+        conn = self._db.connection()
+        conn.execute("REINDEX")
+        conn.execute("ANALYZE")
+
+    def _refresh_document(self, conn: sqlite3.Connection, post_id: str) -> None:
+        """Rewrite a post's full-text document from its current rows.
+
+        Args:
+            conn: Connection inside an open transaction
+            post_id: Post ID
+        """
+        post = conn.execute(
+            "SELECT title, content FROM posts WHERE post_id = ?", (post_id,)
+        ).fetchone()
+        if post is None:
+            return
+
+        replies = conn.execute(
+            "SELECT content FROM replies WHERE post_id = ? AND deleted = 0 ORDER BY created_at",
+            (post_id,),
+        ).fetchall()
+        body = "\n\n".join([post["content"], *(reply["content"] for reply in replies)])
+
+        conn.execute("INSERT OR IGNORE INTO search_documents (post_id) VALUES (?)", (post_id,))
+        doc_id = conn.execute(
+            "SELECT doc_id FROM search_documents WHERE post_id = ?", (post_id,)
+        ).fetchone()["doc_id"]
+        conn.execute("DELETE FROM posts_fts WHERE rowid = ?", (doc_id,))
+        conn.execute(
+            "INSERT INTO posts_fts (rowid, title, body) VALUES (?, ?, ?)",
+            (doc_id, post["title"], body),
+        )
@@ -0,0 +1,393 @@
+"""Lightweight request tracing with an OpenTelemetry-compatible JSONL exporter.
+
+A trace is started for each sampled REST request or MCP tool call with
+``start_trace``; code running on its behalf opens nested spans with ``span``.
+The active span is held in a context variable, which ``BlockingExecutor``
+copies into its worker threads, so spans opened by use cases, repositories
+and ``FileStorage`` nest under the request that caused them. Outside a
+sampled trace, ``span`` costs one context variable lookup.
+
+Finished traces are appended to a JSON Lines file, one OTLP/JSON
+``ExportTraceServiceRequest`` per line (the format read by the OpenTelemetry
+Collector's ``otlpjsonfile`` receiver).
+"""
+
+import functools
+import json
+import os
+import random
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+SERVICE_NAME = "llm-agent-bbs"
+
+# Spans kept per trace; long-lived requests (change streams) stop recording beyond it
+MAX_SPANS_PER_TRACE = 2000
+
+# OTLP status codes
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+
+class Span:
+    """A timed operation within a trace."""
+
+    __slots__ = (
+        "trace",
+        "span_id",
+        "parent_id",
+        "name",
+        "start_ns",
+        "end_ns",
+        "attributes",
+        "error",
+    )
+
+    def __init__(self, trace: "Trace", name: str, parent_id: str | None) -> None:
+        """Start a span.
+
+        Args:
+            trace: Trace the span belongs to
+            name: Operation name
+            parent_id: Span ID of the enclosing span (None for the root)
+        """
+        self.trace = trace
+        self.span_id = f"{random.getrandbits(64):016x}"
+        self.parent_id = parent_id
+        self.name = name
+        self.start_ns = time.time_ns()
+        self.end_ns = 0
+        self.attributes: dict[str, Any] = {}
+        self.error: str | None = None
+
+    def set(self, key: str, value: Any) -> None:
+        """Set an attribute.
+
+        Args:
+            key: Attribute name (e.g. 'bbs.post_id')
+            value: String, number or boolean value
+        """
+        self.attributes[key] = value
+
+    def to_otlp(self) -> dict[str, Any]:
+        """Convert span to its OTLP/JSON representation.
+
+        Returns:
+            OTLP span dictionary
+        """
+        otlp: dict[str, Any] = {
+            "traceId": self.trace.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": 2 if self.parent_id is None else 1,  # SERVER for roots, INTERNAL otherwise
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": [
+                {"key": key, "value": _otlp_value(value)} for key, value in self.attributes.items()
+            ],
+            "status": {"code": STATUS_OK}
+            if self.error is None
+            else {"code": STATUS_ERROR, "message": self.error},
+        }
+        if self.parent_id is not None:
+            otlp["parentSpanId"] = self.parent_id
+        return otlp
+
+
+def _otlp_value(value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+class Trace:
+    """The spans recorded for one sampled request."""
+
+    def __init__(self, tracer: "Tracer") -> None:
+        """Initialize trace.
+
+        Args:
+            tracer: Tracer that exports the trace when its root span ends
+        """
+        self.tracer = tracer
+        self.trace_id = f"{random.getrandbits(128):032x}"
+        self.spans: list[Span] = []
+        self.dropped = 0
+
+    def add(self, span: Span) -> None:
+        """Keep a finished span.
+
+        Args:
+            span: Finished span
+        """
+        if len(self.spans) < MAX_SPANS_PER_TRACE:
+            self.spans.append(span)
+        else:
+            self.dropped += 1
+
+
+class JsonlSpanExporter:
+    """Appends finished traces to a JSON Lines file in OTLP/JSON format."""
+
+    def __init__(self, path: Path) -> None:
+        """Initialize exporter.
+
+        Args:
+            path: Output file (created on first export)
+        """
+        self.path = path
+        self._lock = threading.Lock()
+
+    def export(self, trace: Trace) -> None:
+        """Write one trace as a single line.
+
+        Args:
+            trace: Finished trace
+        """
+        request = {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": [
+                            {"key": "service.name", "value": {"stringValue": SERVICE_NAME}},
+                            {"key": "process.pid", "value": {"intValue": str(os.getpid())}},
+                        ]
+                    },
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": "bbs"},
+                            "spans": [span.to_otlp() for span in trace.spans],
+                        }
+                    ],
+                }
+            ]
+        }
+        line = (json.dumps(request, separators=(",", ":")) + "\n").encode("utf-8")
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # One write on an O_APPEND descriptor keeps lines of concurrent workers whole
+            fd = os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+            try:
+                os.write(fd, line)
+            finally:
+                os.close(fd)
+
+
+class Tracer:
+    """Decides which requests are traced and exports their traces.
+
+    ``sample_rate`` is the fraction of requests that record spans; of those,
+    only traces whose root span took at least ``min_duration_ms`` are
+    exported, so that a high sample rate can be used to catch slow requests
+    without writing every fast one.
+    """
+
+    def __init__(
+        self, exporter: JsonlSpanExporter, sample_rate: float, min_duration_ms: float = 0.0
+    ) -> None:
+        """Initialize tracer.
+
+        Args:
+            exporter: Destination of finished traces
+            sample_rate: Fraction of requests to trace, between 0 and 1
+            min_duration_ms: Minimum root span duration of exported traces
+
+        Raises:
+            ValueError: If the sample rate is out of range
+        """
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError("Trace sample rate must be between 0 and 1")
+        self.exporter = exporter
+        self.sample_rate = sample_rate
+        self.min_duration_ns = int(min_duration_ms * 1_000_000)
+
+    def sampled(self) -> bool:
+        """Decide whether to trace a new request.
+
+        Returns:
+            True if the request should record spans
+        """
+        return self.sample_rate >= 1.0 or random.random() < self.sample_rate
+
+    def finish(self, trace: Trace, root: Span) -> None:
+        """Export a trace whose root span has ended, if it was slow enough.
+
+        Args:
+            trace: Finished trace
+            root: Its root span
+        """
+        if root.end_ns - root.start_ns < self.min_duration_ns:
+            return
+        if trace.dropped:
+            root.set("bbs.dropped_spans", trace.dropped)
+        self.exporter.export(trace)
+
+
+_tracer: Tracer | None = None
+_current: ContextVar[Span | None] = ContextVar("current_span", default=None)
+
+
+def configure_tracing(tracer: Tracer | None) -> None:
+    """Install the process-wide tracer.
+
+    Args:
+        tracer: Tracer, or None to disable tracing
+    """
+    global _tracer
+    _tracer = tracer
+
+
+def current_span() -> Span | None:
+    """Get the innermost active span of a sampled trace.
+
+    Returns:
+        Active span, or None outside a sampled trace
+    """
+    return _current.get()
+
+
+@contextmanager
+def start_trace(name: str, **attributes: Any) -> Iterator[Span | None]:
+    """Start a new trace for a request, if it is sampled.
+
+    A new trace is started even if a span is active, since a streamed MCP
+    session runs tool calls in the context of the request that opened it.
+
+    Args:
+        name: Root span name (e.g. 'GET /api/v1/posts/{post_id}')
+        **attributes: Root span attributes
+
+    Yields:
+        Root span, or None if the request is not traced
+    """
+    tracer = _tracer
+    if tracer is None or not tracer.sampled():
+        token = _current.set(None)
+        try:
+            yield None
+        finally:
+            _current.reset(token)
+        return
+
+    trace = Trace(tracer)
+    root = Span(trace, name, None)
+    root.attributes.update(attributes)
+    token = _current.set(root)
+    try:
+        yield root
+    except BaseException as e:
+        root.error = type(e).__name__
+        raise
+    finally:
+        _current.reset(token)
+        root.end_ns = time.time_ns()
+        trace.add(root)
+        tracer.finish(trace, root)
+
+
+class _NoSpan:
+    """Context manager used for spans outside a sampled trace."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        return None
+
+
+_NO_SPAN = _NoSpan()
+
+
+class _SpanScope:
+    """Makes a span the active one for the duration of a ``with`` block."""
+
+    __slots__ = ("_span", "_token")
+
+    def __init__(self, span: Span) -> None:
+        self._span = span
+
+    def __enter__(self) -> Span:
+        self._token = _current.set(self._span)
+        return self._span
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        _current.reset(self._token)
+        self._span.end_ns = time.time_ns()
+        if exc_type is not None:
+            self._span.error = exc_type.__name__
+        self._span.trace.add(self._span)
+
+
+def span(name: str, **attributes: Any) -> _SpanScope | _NoSpan:
+    """Record a nested span within the active trace.
+
+    Used as a context manager that yields the span, or None outside a
+    sampled trace.
+
+    Args:
+        name: Span name (e.g. 'storage.read_json')
+        **attributes: Span attributes
+
+    Returns:
+        Context manager
+    """
+    parent = _current.get()
+    if parent is None:
+        return _NO_SPAN
+    child = Span(parent.trace, name, parent.span_id)
+    if attributes:
+        child.attributes.update(attributes)
+    return _SpanScope(child)
+
+
+def add_span(name: str, start_ns: int, end_ns: int, **attributes: Any) -> None:
+    """Record a finished span whose times were measured elsewhere (e.g. a queue wait).
+
+    Args:
+        name: Span name
+        start_ns: Start time in nanoseconds since the epoch
+        end_ns: End time in nanoseconds since the epoch
+        **attributes: Span attributes
+    """
+    parent = _current.get()
+    if parent is None:
+        return
+    child = Span(parent.trace, name, parent.span_id)
+    child.start_ns = start_ns
+    child.end_ns = end_ns
+    child.attributes.update(attributes)
+    parent.trace.add(child)
+
+
+def traced(name: str) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """Decorate a function so that each call records a span.
+
+    Args:
+        name: Span name
+
+    Returns:
+        Decorator
+    """
+
+    def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> T:
+            with span(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -1,33 +1,452 @@
-"""File lock utility for preventing concurrent writes."""
+"""File lock utility for coordinating readers and writers."""
 
 import fcntl
 import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+from src.infrastructure.metrics import Histogram, HistogramSnapshot
+from src.infrastructure.tracing import span
+
+# Lock file descriptors kept open while no FileLock uses them
+MAX_IDLE_FDS = 256
+
+# Bounds of the polling interval while waiting for another process with a timeout
+_POLL_MIN_SECONDS = 0.001
+_POLL_MAX_SECONDS = 0.05
+
+
+class LockTimeoutError(TimeoutError):
+    """Raised when a lock could not be acquired within its timeout."""
+
+
+@dataclass(frozen=True)
+class LockModeStats:
+    """Contention counters of one lock mode."""
+
+    acquired: int
+    timeouts: int
+    wait_seconds: HistogramSnapshot
+    hold_seconds: HistogramSnapshot
+
+
+@dataclass(frozen=True)
+class LockStats:
+    """Point-in-time contention counters of every ``FileLock`` in the process."""
+
+    shared: LockModeStats
+    exclusive: LockModeStats
+    open_fds: int
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert stats to dictionary.
+
+        Returns:
+            Dictionary representation of stats
+        """
+        return {
+            "shared": _mode_dict(self.shared),
+            "exclusive": _mode_dict(self.exclusive),
+            "open_fds": self.open_fds,
+        }
+
+
+def _mode_dict(stats: LockModeStats) -> dict[str, Any]:
+    return {
+        "acquired": stats.acquired,
+        "timeouts": stats.timeouts,
+        "wait_seconds": stats.wait_seconds.to_dict(),
+        "hold_seconds": stats.hold_seconds.to_dict(),
+    }
+
+
+class _ModeMetrics:
+    """Wait and hold histograms of one lock mode."""
+
+    def __init__(self) -> None:
+        self.wait = Histogram()
+        self.hold = Histogram()
+        self.timeouts = 0
+        self._lock = threading.Lock()
+
+    def timed_out(self) -> None:
+        with self._lock:
+            self.timeouts += 1
+
+    def stats(self) -> LockModeStats:
+        wait = self.wait.snapshot()
+        return LockModeStats(
+            acquired=wait.count,
+            timeouts=self.timeouts,
+            wait_seconds=wait,
+            hold_seconds=self.hold.snapshot(),
+        )
+
+
+class _LockState:
+    """Process-wide state of one lock file.
+
+    ``flock`` locks belong to the open file description, so two threads using
+    the same cached fd would not exclude each other. Threads are therefore
+    coordinated by an in-process reader/writer lock, and the fd holds the
+    ``flock`` on behalf of all of them: the first reader takes ``LOCK_SH`` and
+    the last one releases it, a writer takes ``LOCK_EX`` for itself.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.fd: int | None = None
+        self.users = 0
+        self.cond = threading.Condition()
+        self.readers = 0
+        self.writer = False
+        self.writers_waiting = 0
+        # Set while the first reader takes the flock for the readers after it
+        self.sharing = False
+
+
+class _LockPool:
+    """Cached lock file descriptors shared by every ``FileLock`` of the process."""
+
+    def __init__(self, max_idle: int = MAX_IDLE_FDS) -> None:
+        self._max_idle = max_idle
+        self._lock = threading.Lock()
+        self._states: OrderedDict[Path, _LockState] = OrderedDict()
+
+    def checkout(self, path: Path) -> _LockState:
+        with self._lock:
+            state = self._states.get(path)
+            if state is None:
+                state = self._states[path] = _LockState(path)
+            else:
+                self._states.move_to_end(path)
+            if state.fd is None:
+                state.fd = os.open(path, os.O_CREAT | os.O_RDWR)
+            state.users += 1
+            return state
+
+    def checkin(self, state: _LockState) -> None:
+        with self._lock:
+            state.users -= 1
+            excess = len(self._states) - self._max_idle
+            if excess <= 0:
+                return
+            # Close the least recently used fds that no lock is holding or waiting for
+            for path, idle in list(self._states.items()):
+                if excess <= 0:
+                    break
+                if idle.users == 0:
+                    if idle.fd is not None:
+                        os.close(idle.fd)
+                    del self._states[path]
+                    excess -= 1
+
+    def open_fds(self) -> int:
+        with self._lock:
+            return len(self._states)
+
+    def reset_after_fork(self) -> None:
+        # A forked child shares the parent's open file descriptions, and with
+        # them the parent's flocks; it must open lock files afresh
+        self._lock = threading.Lock()
+        for state in self._states.values():
+            if state.fd is not None:
+                os.close(state.fd)
+        self._states.clear()
+
+
+class LockWaitRecorder:
+    """Accumulates the time spent waiting for file locks by a group of calls.
+
+    Activated with ``record_lock_waits``; because ``BlockingExecutor`` runs
+    calls in a copy of the caller's context, the waits of storage calls made
+    on worker threads are credited to the request that made them.
+    """
+
+    def __init__(self) -> None:
+        """Initialize recorder."""
+        self._lock = threading.Lock()
+        self.acquisitions = 0
+        self.wait_seconds = 0.0
+
+    def add(self, wait_seconds: float) -> None:
+        """Record one acquisition.
+
+        Args:
+            wait_seconds: Time spent waiting for the lock
+        """
+        with self._lock:
+            self.acquisitions += 1
+            self.wait_seconds += wait_seconds
+
+
+_pool = _LockPool()
+_metrics = {True: _ModeMetrics(), False: _ModeMetrics()}
+# Metrics per lock label and mode, in addition to the process-wide ones above
+_named_metrics: dict[tuple[str, bool], _ModeMetrics] = {}
+_named_metrics_lock = threading.Lock()
+_recorder: ContextVar[LockWaitRecorder | None] = ContextVar("lock_wait_recorder", default=None)
+os.register_at_fork(after_in_child=_pool.reset_after_fork)
+
+
+@contextmanager
+def record_lock_waits(recorder: LockWaitRecorder) -> Iterator[LockWaitRecorder]:
+    """Credit lock waits in the current context to a recorder.
+
+    Args:
+        recorder: Recorder to add waits to
+
+    Yields:
+        The recorder
+    """
+    token = _recorder.set(recorder)
+    try:
+        yield recorder
+    finally:
+        _recorder.reset(token)
+
+
+def lock_stats() -> LockStats:
+    """Get the contention counters of all file locks in this process.
+
+    Returns:
+        Lock stats
+    """
+    return LockStats(
+        shared=_metrics[True].stats(),
+        exclusive=_metrics[False].stats(),
+        open_fds=_pool.open_fds(),
+    )
+
+
+def lock_stats_by_name() -> dict[tuple[str, str], LockModeStats]:
+    """Get the contention counters of file locks per label and mode.
+
+    Returns:
+        Lock mode stats keyed by label and mode ('shared' or 'exclusive')
+    """
+    with _named_metrics_lock:
+        metrics = list(_named_metrics.items())
+    return {
+        (label, "shared" if shared else "exclusive"): mode.stats()
+        for (label, shared), mode in sorted(metrics)
+    }
+
+
+def _named(label: str, shared: bool) -> _ModeMetrics:
+    metrics = _named_metrics.get((label, shared))
+    if metrics is None:
+        with _named_metrics_lock:
+            metrics = _named_metrics.setdefault((label, shared), _ModeMetrics())
+    return metrics
+
+
+def _remaining(deadline: float | None) -> float | None:
+    return None if deadline is None else max(0.0, deadline - time.monotonic())
+
+
+def _flock(fd: int, operation: int, deadline: float | None) -> bool:
+    """Take an flock, polling without blocking when a deadline is given."""
+    if deadline is None:
+        fcntl.flock(fd, operation)
+        return True
+    delay = _POLL_MIN_SECONDS
+    while True:
+        try:
+            fcntl.flock(fd, operation | fcntl.LOCK_NB)
+            return True
+        except BlockingIOError:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, _POLL_MAX_SECONDS)
+
 
 class FileLock:
-    """Context manager for file locking."""
+    """Reader/writer lock on a file, shared between threads and processes.
+
+    Exclusive locks (the default) are held by one holder at a time; shared
+    locks may be held by any number of readers while no exclusive lock is
+    held. Waiting writers take precedence over newly arriving readers. Locks
+    are not reentrant: a holder must not acquire the same lock again.
 
-    def __init__(self, lock_file: Path) -> None:
+    Used as a context manager, the lock waits up to ``timeout`` seconds and
+    raises ``LockTimeoutError`` if it cannot be acquired.
+
+    Wait and hold times are recorded for the whole process and per ``label``;
+    locks of individual records should share a label so that the number of
+    labels stays small.
+    """
+
+    def __init__(
+        self,
+        lock_file: Path,
+        shared: bool = False,
+        timeout: float | None = None,
+        label: str | None = None,
+    ) -> None:
         """Initialize file lock.
 
         Args:
             lock_file: Path to lock file
+            shared: Take a shared (read) lock instead of an exclusive one
+            timeout: Seconds to wait in ``__enter__`` (None waits forever, 0 only tries)
+            label: Name the lock's metrics are reported under (defaults to the file name)
         """
         self.lock_file = lock_file
         self.lock_file.parent.mkdir(parents=True, exist_ok=True)
-        self._fd: int | None = None
+        self.shared = shared
+        self.timeout = timeout
+        self.label = label or lock_file.stem
+        self._named_metrics = _named(self.label, shared)
+        self._state: _LockState | None = None
+        self._acquired_at = 0.0
+
+    @property
+    def locked(self) -> bool:
+        """Whether this lock is currently held."""
+        return self._state is not None
+
+    def acquire(self, timeout: float | None = None) -> bool:
+        """Acquire the lock.
+
+        Args:
+            timeout: Seconds to wait (None waits forever, 0 only tries)
+
+        Returns:
+            True if the lock was acquired, False if the timeout expired
+
+        Raises:
+            RuntimeError: If this lock is already held
+        """
+        if self._state is not None:
+            raise RuntimeError(f"Lock already held: {self.lock_file}")
+        started = time.monotonic()
+        deadline = None if timeout is None else started + timeout
+        state = _pool.checkout(self.lock_file)
+        try:
+            with span("lock.acquire", **{"bbs.lock": self.label, "bbs.shared": self.shared}):
+                if self.shared:
+                    acquired = self._acquire_shared(state, deadline)
+                else:
+                    acquired = self._acquire_exclusive(state, deadline)
+        except BaseException:
+            _pool.checkin(state)
+            raise
+
+        if not acquired:
+            _pool.checkin(state)
+            _metrics[self.shared].timed_out()
+            self._named_metrics.timed_out()
+            return False
+        self._state = state
+        self._acquired_at = time.monotonic()
+        _metrics[self.shared].wait.observe(self._acquired_at - started)
+        self._named_metrics.wait.observe(self._acquired_at - started)
+        recorder = _recorder.get()
+        if recorder is not None:
+            recorder.add(self._acquired_at - started)
+        return True
+
+    def release(self) -> None:
+        """Release the lock.
+
+        Raises:
+            RuntimeError: If this lock is not held
+        """
+        state = self._state
+        if state is None:
+            raise RuntimeError(f"Lock not held: {self.lock_file}")
+        self._state = None
+        with state.cond:
+            if self.shared:
+                state.readers -= 1
+                if state.readers == 0:
+                    fcntl.flock(state.fd, fcntl.LOCK_UN)
+            else:
+                fcntl.flock(state.fd, fcntl.LOCK_UN)
+                state.writer = False
+            state.cond.notify_all()
+        held = time.monotonic() - self._acquired_at
+        _metrics[self.shared].hold.observe(held)
+        self._named_metrics.hold.observe(held)
+        _pool.checkin(state)
+
+    def _acquire_shared(self, state: _LockState, deadline: float | None) -> bool:
+        with state.cond:
+            if not state.cond.wait_for(
+                lambda: not (state.writer or state.writers_waiting or state.sharing),
+                _remaining(deadline),
+            ):
+                return False
+            first = state.readers == 0
+            state.readers += 1
+            state.sharing = first
+        if not first:
+            return True
+
+        # The first reader takes the flock outside the condition so that other
+        # threads can still time out while it waits for another process
+        try:
+            acquired = _flock(state.fd, fcntl.LOCK_SH, deadline)
+        except BaseException:
+            acquired = False
+            raise
+        finally:
+            with state.cond:
+                state.sharing = False
+                if not acquired:
+                    state.readers -= 1
+                state.cond.notify_all()
+        return acquired
+
+    def _acquire_exclusive(self, state: _LockState, deadline: float | None) -> bool:
+        with state.cond:
+            state.writers_waiting += 1
+            try:
+                if not state.cond.wait_for(
+                    lambda: not (state.writer or state.readers or state.sharing),
+                    _remaining(deadline),
+                ):
+                    return False
+                state.writer = True
+            finally:
+                state.writers_waiting -= 1
+                state.cond.notify_all()
+
+        try:
+            acquired = _flock(state.fd, fcntl.LOCK_EX, deadline)
+        except BaseException:
+            acquired = False
+            raise
+        finally:
+            if not acquired:
+                with state.cond:
+                    state.writer = False
+                    state.cond.notify_all()
+        return acquired
 
     def __enter__(self) -> "FileLock":
-        """Acquire the lock."""
-        self._fd = os.open(self.lock_file, os.O_CREAT | os.O_RDWR)
-        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        """Acquire the lock.
+
+        Raises:
+            LockTimeoutError: If the lock could not be acquired within ``timeout``
+        """
+        if not self.acquire(self.timeout):
+            mode = "shared" if self.shared else "exclusive"
+            raise LockTimeoutError(
+                f"Timed out acquiring {mode} lock {self.lock_file} after {self.timeout}s"
+            )
         return self
 
     def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
         """Release the lock."""
-        if self._fd is not None:
-            fcntl.flock(self._fd, fcntl.LOCK_UN)
-            os.close(self._fd)
-            self._fd = None
+        self.release()
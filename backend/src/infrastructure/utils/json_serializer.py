@@ -21,6 +21,20 @@ class JSONSerializer:
         """
         return json.dumps(data, indent=2, ensure_ascii=False, default=JSONSerializer._default)
 
+    @staticmethod
+    def serialize_line(data: Any) -> str:
+        """Serialize data to a single-line JSON string (for JSON Lines files).
+
+        Args:
+            data: Data to serialize
+
+        Returns:
+            Compact JSON string without newlines
+        """
+        return json.dumps(
+            data, ensure_ascii=False, separators=(",", ":"), default=JSONSerializer._default
+        )
+
     @staticmethod
     def deserialize(json_str: str) -> Any:
         """Deserialize JSON string to data.
@@ -1,31 +1,57 @@
 """FastAPI application for BBS REST API."""
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from datetime import datetime
 from pathlib import Path
 
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 
+from ...infrastructure.executor import ExecutorOverloadedError
+from ...infrastructure.utils.file_lock import lock_stats
+from ..container import Container, set_container
 from .middleware.cors import setup_cors
-from .routes import create_agents_router, create_posts_router, create_search_router
-
-
-def create_app(data_dir: Path | None = None) -> FastAPI:
+from .middleware.metrics import setup_metrics
+from .middleware.tracing import setup_tracing
+from .routes import (
+    create_agents_router,
+    create_metrics_router,
+    create_posts_router,
+    create_search_router,
+    create_stream_router,
+    create_updates_router,
+)
+
+
+def create_app(data_dir: Path | None = None, storage_backend: str | None = None) -> FastAPI:
     """Create and configure FastAPI application.
 
+    The app builds one container at startup and shares it between the REST
+    routers and the mounted MCP server; it is also available as
+    ``app.state.container``.
+
     Args:
-        data_dir: Data directory path (defaults to ./data)
+        data_dir: Data directory path (defaults to BBS_DATA_DIR or ./data)
+        storage_backend: 'file' or 'sqlite' (defaults to BBS_STORAGE_BACKEND or file)
 
     Returns:
         Configured FastAPI application
     """
-    if data_dir is None:
-        data_dir = Path("data")
+    container = Container(data_dir, storage_backend)
+    set_container(container)
 
     # Import MCP server and create HTTP app
     from ..mcp.fastmcp_server import mcp
     mcp_app = mcp.http_app(path="/")
 
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        """Run the MCP server and drain pending events on shutdown."""
+        async with mcp_app.lifespan(app):
+            yield
+        container.event_bus.shutdown(timeout=10)
+
     app = FastAPI(
         title="LLM Agent BBS API",
         description="REST API for LLM Agent Bulletin Board System",
@@ -33,16 +59,22 @@ def create_app(data_dir: Path | None = None) -> FastAPI:
         docs_url="/api/docs",
         redoc_url="/api/redoc",
         openapi_url="/api/openapi.json",
-        lifespan=mcp_app.lifespan,
+        lifespan=lifespan,
     )
+    app.state.container = container
 
-    # Setup CORS
+    # Setup CORS, request latency metrics and tracing (outermost)
     setup_cors(app)
+    setup_metrics(app, container.route_latency)
+    setup_tracing(app)
 
     # Register routers
-    app.include_router(create_posts_router(data_dir), prefix="/api/v1")
-    app.include_router(create_agents_router(data_dir), prefix="/api/v1")
-    app.include_router(create_search_router(data_dir), prefix="/api/v1")
+    app.include_router(create_posts_router(container), prefix="/api/v1")
+    app.include_router(create_agents_router(container), prefix="/api/v1")
+    app.include_router(create_search_router(container), prefix="/api/v1")
+    app.include_router(create_stream_router(container), prefix="/api/v1")
+    app.include_router(create_updates_router(container), prefix="/api/v1")
+    app.include_router(create_metrics_router(container))
 
     # Mount MCP HTTP server
     app.mount("/mcp", mcp_app)
@@ -61,10 +93,33 @@ def create_app(data_dir: Path | None = None) -> FastAPI:
         """Health check endpoint."""
         return {
             "success": True,
-            "data": {"status": "healthy"},
+            "data": {
+                "status": "healthy",
+                "executor": container.executor.stats().to_dict(),
+                "events": container.event_bus.stats().to_dict(),
+                "post_cache": container.post_cache.stats().to_dict()
+                if container.post_cache
+                else None,
+                "response_cache": container.response_cache.stats().to_dict(),
+                "coalescing": container.read_coalescer.stats().to_dict(),
+                "locks": lock_stats().to_dict(),
+            },
             "meta": {"timestamp": datetime.now().isoformat()},
         }
 
+    @app.exception_handler(ExecutorOverloadedError)
+    async def overloaded_exception_handler(_request: Request, exc: ExecutorOverloadedError):
+        """Shed load when too many requests are waiting for storage."""
+        return JSONResponse(
+            status_code=503,
+            headers={"Retry-After": "1"},
+            content={
+                "success": False,
+                "message": str(exc),
+                "meta": {"timestamp": datetime.now().isoformat()},
+            },
+        )
+
     @app.exception_handler(Exception)
     async def global_exception_handler(_request: Request, exc: Exception):
         """Global exception handler."""
@@ -80,11 +135,24 @@ def create_app(data_dir: Path | None = None) -> FastAPI:
     return app
 
 
-# Create default app instance
-app = create_app()
+_default_app: FastAPI | None = None
+
+
+def __getattr__(name: str) -> FastAPI:
+    """Create the default app instance on first access of ``app``.
+
+    Building the app opens the data directory, so it is deferred until a
+    server asks for ``main:app`` instead of happening on import.
+    """
+    global _default_app
+    if name != "app":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    if _default_app is None:
+        _default_app = create_app()
+    return _default_app
 
 
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    uvicorn.run(create_app(), host="0.0.0.0", port=8000)
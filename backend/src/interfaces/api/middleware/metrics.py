@@ -0,0 +1,99 @@
+"""Request latency middleware."""
+
+import time
+from typing import Any
+
+from fastapi import FastAPI
+
+from ....infrastructure.metrics import HistogramFamily
+
+UNMATCHED_ROUTE = "unmatched"
+
+
+def route_template(scope: dict[str, Any]) -> str:
+    """Get the path template of the route that handled a request.
+
+    The matched route's path does not include the prefixes it was included
+    or mounted under, so those are taken from the leading segments of the
+    request path.
+
+    Args:
+        scope: ASGI scope after routing
+
+    Returns:
+        Path template such as ``/api/v1/posts/{post_id}``, or 'unmatched'
+    """
+    route = scope.get("route")
+    template = getattr(route, "path", None)
+    if template is None:
+        return UNMATCHED_ROUTE
+    path = scope["path"]
+    prefix_segments = path.count("/") - template.count("/") + 1
+    return "/".join(path.split("/")[:prefix_segments]) + template
+
+
+class RouteMetricsMiddleware:
+    """Records the latency of every HTTP request per route, method and status.
+
+    Latency is measured up to the start of the response, so that streamed
+    responses (the change stream, MCP sessions) report their time to first
+    byte rather than their lifetime. Routes are labelled with their path
+    template, e.g. ``/api/v1/posts/{post_id}``, to keep the number of labels
+    bounded.
+    """
+
+    def __init__(self, app: Any, latency: HistogramFamily) -> None:
+        """Initialize middleware.
+
+        Args:
+            app: ASGI application to wrap
+            latency: Histograms keyed by route, method and status code
+        """
+        self.app = app
+        self.latency = latency
+
+    async def __call__(self, scope: dict[str, Any], receive: Any, send: Any) -> None:
+        """Handle an ASGI request.
+
+        Args:
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        responded = False
+
+        def observe(status: int) -> None:
+            # The router has stored the matched route in the scope by now
+            self.latency.labels(route_template(scope), scope["method"], str(status)).observe(
+                time.perf_counter() - started
+            )
+
+        async def timed_send(message: dict[str, Any]) -> None:
+            nonlocal responded
+            if message["type"] == "http.response.start":
+                responded = True
+                observe(message["status"])
+            await send(message)
+
+        try:
+            await self.app(scope, receive, timed_send)
+        except Exception:
+            # Unhandled errors are turned into a 500 response further out
+            if not responded:
+                observe(500)
+            raise
+
+
+def setup_metrics(app: FastAPI, latency: HistogramFamily) -> None:
+    """Record request latencies of the FastAPI app.
+
+    Args:
+        app: FastAPI application instance
+        latency: Histograms keyed by route, method and status code
+    """
+    app.add_middleware(RouteMetricsMiddleware, latency=latency)
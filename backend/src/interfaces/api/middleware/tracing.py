@@ -0,0 +1,65 @@
+"""Request tracing middleware."""
+
+from typing import Any
+
+from fastapi import FastAPI
+
+from ....infrastructure.tracing import start_trace
+from .metrics import route_template
+
+
+class TracingMiddleware:
+    """Starts a trace for every sampled HTTP request.
+
+    The root span is named after the method and route template once the
+    request has been routed, and ends when the response is complete.
+    """
+
+    def __init__(self, app: Any) -> None:
+        """Initialize middleware.
+
+        Args:
+            app: ASGI application to wrap
+        """
+        self.app = app
+
+    async def __call__(self, scope: dict[str, Any], receive: Any, send: Any) -> None:
+        """Handle an ASGI request.
+
+        Args:
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with start_trace(
+            f"{scope['method']} {scope['path']}",
+            **{"http.request.method": scope["method"], "url.path": scope["path"]},
+        ) as root:
+            if root is None:
+                await self.app(scope, receive, send)
+                return
+
+            async def traced_send(message: dict[str, Any]) -> None:
+                if message["type"] == "http.response.start":
+                    root.set("http.response.status_code", message["status"])
+                await send(message)
+
+            try:
+                await self.app(scope, receive, traced_send)
+            finally:
+                route = route_template(scope)
+                root.name = f"{scope['method']} {route}"
+                root.set("http.route", route)
+
+
+def setup_tracing(app: FastAPI) -> None:
+    """Trace sampled requests of the FastAPI app.
+
+    Args:
+        app: FastAPI application instance
+    """
+    app.add_middleware(TracingMiddleware)
@@ -0,0 +1,252 @@
+"""Versioned cache of serialized API responses with ETag support."""
+
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Any
+
+from ...domain.events import PostCreated, PostDeleted, ReplyAdded, ReplyDeleted
+from ...infrastructure.events.change_log import ChangeCursor, ChangeLog
+from ...infrastructure.events.event_bus import EventBus
+from ...infrastructure.events.event_outbox import event_to_dict
+from ...infrastructure.lru_cache import CacheStats, LRUCache
+
+
+@dataclass(frozen=True)
+class ResourceVersion:
+    """Version of a cached resource.
+
+    ``etag`` is a strong entity tag (quoted); ``modified_at`` is the Unix time
+    at which the change that produced this version was observed.
+    """
+
+    etag: str
+    modified_at: float
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check an ``If-None-Match`` header against the current entity tag.
+
+    Args:
+        if_none_match: Header value (a list of entity tags)
+        etag: Current entity tag
+
+    Returns:
+        True if the client's copy is current
+    """
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    # Weak comparison, as required for If-None-Match
+    return any(tag.removeprefix("W/") == etag for tag in candidates)
+
+
+class ResponseCache:
+    """Keeps serialized post responses and the versions that validate them.
+
+    Every thread has a version, and the board has one for listings. Versions
+    are sequence numbers of the change log: a thread's is that of the last
+    change to it and the board's is that of the newest change. Every worker
+    process reads the same log, so all of them hand out the same entity tags,
+    and the tags survive restarts. Threads whose last change the log no longer
+    retains share the version just below its oldest change, so only threads
+    changed within the retained log are tracked one by one.
+
+    Versions are held in memory and brought up to date by following the change
+    log at most every ``REFRESH_SECONDS`` and on the first request after this
+    process records a change, so answering a conditional request with
+    ``304 Not Modified`` does not touch the disk otherwise. A thread changed by
+    this process gets a provisional version inside ``publish``, before the
+    write returns, which it keeps until the change is read back from the log.
+
+    Response bodies are kept in an LRU cache bounded by their size, each
+    stored with the entity tag it was rendered under.
+    """
+
+    REFRESH_SECONDS = 1.0
+
+    def __init__(self, change_log: ChangeLog, max_bytes: int) -> None:
+        """Initialize cache.
+
+        Args:
+            change_log: Change log the versions are taken from
+            max_bytes: Maximum total size of cached response bodies
+        """
+        self._change_log = change_log
+        self._responses: LRUCache[tuple[str, bytes]] = LRUCache(max_bytes)
+        # Provisional tags must not match those of another process
+        self._epoch = uuid.uuid4().hex[:8]
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._counter = 0
+        self._floor = (0, time.time())
+        self._board = self._floor
+        self._posts: dict[str, tuple[int, float]] = {}
+        self._provisional: dict[str, tuple[dict[str, Any], int, float]] = {}
+        self._cursor: ChangeCursor | None = None
+        self._next_refresh = 0.0
+
+    def subscribe(self, event_bus: EventBus) -> None:
+        """Subscribe the versions to an event bus.
+
+        Args:
+            event_bus: Event bus
+        """
+        for event_type in (PostCreated, PostDeleted, ReplyAdded, ReplyDeleted):
+            event_bus.subscribe(event_type, self.on_post_changed, inline=True)
+            event_bus.subscribe(event_type, self.on_change_recorded)
+
+    def on_post_changed(self, event: PostCreated | PostDeleted | ReplyAdded | ReplyDeleted) -> None:
+        """Give a changed thread a provisional version.
+
+        Args:
+            event: Post or reply event
+        """
+        with self._lock:
+            self._counter += 1
+            self._provisional[event.post_id] = (event_to_dict(event), self._counter, time.time())
+
+    def on_change_recorded(
+        self, _event: PostCreated | PostDeleted | ReplyAdded | ReplyDeleted
+    ) -> None:
+        """Follow the change log on the next request.
+
+        Runs after the index handlers and the change log handler, so listings
+        rendered under the new board version are served from fresh indexes.
+
+        Args:
+            _event: Post or reply event
+        """
+        self._next_refresh = 0.0
+
+    def post_version(self, post_id: str) -> ResourceVersion:
+        """Get the current version of a thread.
+
+        Args:
+            post_id: Post ID
+
+        Returns:
+            Resource version
+        """
+        with self._lock:
+            provisional = self._provisional.get(post_id)
+            if provisional is not None:
+                _, counter, modified_at = provisional
+                return ResourceVersion(etag=f'"{self._epoch}-{counter}"', modified_at=modified_at)
+            return self._to_version(max(self._posts.get(post_id, self._floor), self._floor))
+
+    def board_version(self) -> ResourceVersion:
+        """Get the current version of the post listings.
+
+        Returns:
+            Resource version
+        """
+        with self._lock:
+            return self._to_version(self._board)
+
+    def get(self, key: str, version: ResourceVersion) -> bytes | None:
+        """Get a response body rendered under a version.
+
+        Args:
+            key: Request key (path and query)
+            version: Current version of the resource
+
+        Returns:
+            Response body, or None if it is not cached for this version
+        """
+        entry = self._responses.get(key)
+        if entry is None or entry[0] != version.etag:
+            return None
+        return entry[1]
+
+    def put(self, key: str, version: ResourceVersion, body: bytes) -> None:
+        """Store a response body.
+
+        The version must have been taken before the data was read, so that a
+        write racing with the read leaves the body under an outdated tag.
+
+        Args:
+            key: Request key (path and query)
+            version: Version of the resource the body was rendered from
+            body: Serialized response
+        """
+        self._responses.put(key, (version.etag, body), len(body))
+
+    def refresh_due(self) -> bool:
+        """Check whether the change log should be followed before answering.
+
+        Returns:
+            True if ``refresh`` has not run for ``REFRESH_SECONDS``
+        """
+        return time.monotonic() >= self._next_refresh
+
+    def refresh(self) -> None:
+        """Bring the versions up to date with the change log (blocking)."""
+        with self._refresh_lock:
+            self._next_refresh = time.monotonic() + self.REFRESH_SECONDS
+            if self._cursor is None:
+                # Start at the oldest retained change, like every other process
+                self._cursor, _ = self._change_log.cursor_after(0)
+
+            while True:
+                records, self._cursor, missed = self._change_log.read(self._cursor)
+                observed_at = time.time()
+                with self._lock:
+                    if missed:
+                        # Reading resumes at the oldest retained change
+                        self._posts.clear()
+                    for record in records:
+                        self._apply(record, observed_at)
+                if not records:
+                    break
+            self._prune()
+
+    def _apply(self, record: dict[str, Any], observed_at: float) -> None:
+        """Record a change read from the log; the lock must be held.
+
+        Args:
+            record: Change log record
+            observed_at: Time the record was read
+        """
+        post_id = record["post_id"]
+        version = (record["seq"], observed_at)
+        self._posts[post_id] = version
+        self._board = version
+        provisional = self._provisional.get(post_id)
+        if provisional is not None and provisional[0] == {
+            key: value for key, value in record.items() if key != "seq"
+        }:
+            del self._provisional[post_id]
+
+    def _prune(self) -> None:
+        """Forget the versions of threads whose last change the log no longer retains."""
+        first_seq = self._change_log.first_seq()
+        if first_seq is None or first_seq - 1 <= self._floor[0]:
+            return
+        with self._lock:
+            self._floor = (first_seq - 1, time.time())
+            self._posts = {
+                post_id: version
+                for post_id, version in self._posts.items()
+                if version[0] > self._floor[0]
+            }
+
+    def stats(self) -> CacheStats:
+        """Get a snapshot of the response cache counters.
+
+        Returns:
+            Cache stats
+        """
+        return self._responses.stats()
+
+    def _to_version(self, version: tuple[int, float]) -> ResourceVersion:
+        """Build a resource version from a change log sequence number.
+
+        Args:
+            version: Tuple of the sequence number and the time it was read
+
+        Returns:
+            Resource version
+        """
+        return ResourceVersion(etag=f'"{version[0]}"', modified_at=version[1])
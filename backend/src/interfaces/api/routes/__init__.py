@@ -1,7 +1,17 @@
 """API routes."""
 
 from .agents import create_agents_router
+from .metrics import create_metrics_router
 from .posts import create_posts_router
 from .search import create_search_router
+from .stream import create_stream_router
+from .updates import create_updates_router
 
-__all__ = ["create_posts_router", "create_agents_router", "create_search_router"]
+__all__ = [
+    "create_posts_router",
+    "create_agents_router",
+    "create_search_router",
+    "create_stream_router",
+    "create_updates_router",
+    "create_metrics_router",
+]
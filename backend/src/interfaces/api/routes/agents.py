@@ -1,36 +1,29 @@
 """Agents API routes."""
 
-from pathlib import Path
+from dataclasses import asdict
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
 
-from ....application.use_cases.agent.get_agent_profile import GetAgentProfileUseCase
-from ....application.use_cases.agent.list_agents import ListAgentsUseCase
+from ....application.dtos.inbox_dto import GetInboxDTO
 from ....domain.exceptions.agent_exceptions import AgentNotFoundException
-from ....infrastructure.persistence.agent_repository_impl import (
-    AgentRepositoryImpl,
-)
-from ....infrastructure.persistence.file_storage import FileStorage
-from ....infrastructure.persistence.post_repository_impl import PostRepositoryImpl
+from ...container import Container
 from ..schemas.agent_schema import AgentListResponse, AgentResponse
+from ..schemas.inbox_schema import InboxResponse, NotificationResponse
 from ..schemas.post_schema import PostListResponse, PostResponse
 
 
-def create_agents_router(data_dir: Path) -> APIRouter:
+def create_agents_router(container: Container) -> APIRouter:
     """Create agents router with dependencies.
 
     Args:
-        data_dir: Data directory path
+        container: Application-scoped container holding the use cases and executor
 
     Returns:
         Configured APIRouter
     """
     router = APIRouter(prefix="/agents", tags=["agents"])
 
-    # Initialize dependencies
-    storage = FileStorage(data_dir)
-    agent_repo = AgentRepositoryImpl(storage)
-    post_repo = PostRepositoryImpl(storage)
+    executor = container.executor
 
     @router.get("", response_model=AgentListResponse)
     async def list_agents():
@@ -39,8 +32,8 @@ def create_agents_router(data_dir: Path) -> APIRouter:
         Returns:
             List of all agents with statistics
         """
-        use_case = ListAgentsUseCase(agent_repo)
-        agents_dto = use_case.execute()
+        use_case = container.list_agents_use_case
+        agents_dto = await executor.run(use_case.execute)
 
         agents = [
             AgentResponse(
@@ -49,6 +42,8 @@ def create_agents_router(data_dir: Path) -> APIRouter:
                 created_at=agent.created_at,
                 post_count=agent.post_count,
                 reply_count=agent.reply_count,
+                deleted_count=agent.deleted_count,
+                last_active_at=agent.last_active_at,
                 metadata={},
             )
             for agent in agents_dto
@@ -69,10 +64,10 @@ def create_agents_router(data_dir: Path) -> APIRouter:
         Raises:
             HTTPException: If agent not found
         """
-        use_case = GetAgentProfileUseCase(agent_repo)
+        use_case = container.get_agent_profile_use_case
 
         try:
-            agent_dto = use_case.execute(agent_name)
+            agent_dto = await executor.run(use_case.execute, agent_name)
         except AgentNotFoundException:
             raise HTTPException(status_code=404, detail="Agent not found")
         except ValueError as e:
@@ -84,57 +79,116 @@ def create_agents_router(data_dir: Path) -> APIRouter:
             created_at=agent_dto.created_at,
             post_count=agent_dto.post_count,
             reply_count=agent_dto.reply_count,
+            deleted_count=agent_dto.deleted_count,
+            last_active_at=agent_dto.last_active_at,
             metadata=agent_dto.metadata,
         )
 
     @router.get("/{agent_name}/posts", response_model=PostListResponse)
-    async def get_agent_posts(agent_name: str):
-        """Get all posts by an agent.
+    async def get_agent_posts(
+        agent_name: str,
+        page: int = Query(1, ge=1, description="Page number"),
+        page_size: int = Query(100, ge=1, le=100, description="Posts per page"),
+        cursor: str | None = Query(None, description="Cursor from the previous page"),
+    ):
+        """Get posts by an agent, newest first.
 
         Args:
             agent_name: Agent name
+            page: Page number (1-indexed, ignored when a cursor is given)
+            page_size: Number of posts per page
+            cursor: Cursor returned with the previous page
 
         Returns:
-            List of posts by the agent
+            Paginated list of posts by the agent
 
         Raises:
-            HTTPException: If agent not found
+            HTTPException: If agent not found or the cursor is invalid
         """
         # Check if agent exists
-        use_case = GetAgentProfileUseCase(agent_repo)
+        use_case = container.get_agent_profile_use_case
         try:
-            use_case.execute(agent_name)
+            await executor.run(use_case.execute, agent_name)
         except AgentNotFoundException:
             raise HTTPException(status_code=404, detail="Agent not found")
         except ValueError as e:
             raise HTTPException(status_code=400, detail=str(e))
 
-        # Get all posts by this agent
-        all_posts = post_repo.find_all(include_deleted=False)
-        agent_posts = [post for post in all_posts if post.agent_name.value == agent_name]
+        try:
+            result = await executor.run(
+                container.browse_posts_use_case.execute,
+                limit=page_size,
+                offset=(page - 1) * page_size,
+                agent_name=agent_name,
+                cursor=cursor,
+                include_total=True,
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
 
         posts = [
             PostResponse(
-                post_id=post.post_id.value,
+                post_id=post.post_id,
                 title=post.title,
-                content=post.content.value,
-                agent_name=post.agent_name.value,
-                created_at=post.created_at.isoformat(),
-                updated_at=post.updated_at.isoformat(),
+                content="",  # List view doesn't include full content
+                agent_name=post.agent_name,
+                created_at=post.created_at,
+                updated_at=post.updated_at,
                 deleted=post.deleted,
-                deleted_at=post.deleted_at.isoformat() if post.deleted_at else None,
-                tags=post.tags.values,
-                reply_count=len(post.replies),
+                deleted_at=None,
+                tags=post.tags,
+                reply_count=post.reply_count,
             )
-            for post in agent_posts
+            for post in result.posts
         ]
 
+        total = result.estimated_total or 0
         return PostListResponse(
             posts=posts,
-            total=len(posts),
-            page=1,
-            page_size=len(posts),
-            total_pages=1,
+            total=total,
+            page=None if cursor else page,
+            page_size=page_size,
+            total_pages=(total + page_size - 1) // page_size,
+            next_cursor=result.next_cursor,
+        )
+
+    @router.get("/{agent_name}/inbox", response_model=InboxResponse)
+    async def get_agent_inbox(
+        agent_name: str,
+        cursor: int | None = Query(
+            None, ge=0, description="next_cursor from the previous page (default: first unread)"
+        ),
+        limit: int = Query(50, ge=1, le=100, description="Maximum number of notifications"),
+    ):
+        """Get replies to an agent's posts and replies, and mentions of it.
+
+        Reading does not mark notifications read; agents do that with the
+        ``get_inbox`` MCP tool.
+
+        Args:
+            agent_name: Agent name
+            cursor: Position to read from (defaults to the agent's read cursor)
+            limit: Maximum number of notifications
+
+        Returns:
+            Notifications, oldest first
+
+        Raises:
+            HTTPException: If agent not found or the cursor is invalid
+        """
+        dto = GetInboxDTO(agent_name=agent_name, limit=limit, cursor=cursor)
+
+        try:
+            page = await executor.run(container.get_inbox_use_case.execute, dto)
+        except AgentNotFoundException:
+            raise HTTPException(status_code=404, detail="Agent not found")
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        return InboxResponse(
+            notifications=[NotificationResponse(**asdict(n)) for n in page.notifications],
+            next_cursor=page.next_cursor,
+            has_more=page.has_more,
         )
 
     return router
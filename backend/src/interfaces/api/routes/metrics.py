@@ -0,0 +1,177 @@
+"""Prometheus metrics route."""
+
+import os
+from collections.abc import Iterable
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from ....infrastructure.lru_cache import CacheStats
+from ....infrastructure.metrics import HistogramSnapshot, Labels, PrometheusText
+from ....infrastructure.utils.file_lock import lock_stats, lock_stats_by_name
+from ...container import Container
+
+
+def _labelled(
+    names: tuple[str, ...], snapshots: dict[tuple[str, ...], HistogramSnapshot]
+) -> Iterable[tuple[Labels, HistogramSnapshot]]:
+    """Pair histogram snapshots with their label names."""
+    for values, snapshot in sorted(snapshots.items()):
+        yield dict(zip(names, values, strict=True)), snapshot
+
+
+def _hit_ratio(hits: int, misses: int) -> float:
+    return hits / (hits + misses) if hits + misses else 0.0
+
+
+def _index_sizes(container: Container) -> list[tuple[Labels, float]]:
+    """Get the size of every index file (and the SQLite database when used)."""
+    sizes = []
+    with os.scandir(container.file_storage.index_dir) as entries:
+        for entry in entries:
+            if entry.is_file() and not entry.name.endswith(".tmp"):
+                sizes.append(({"file": entry.name}, entry.stat().st_size))
+    if container.settings.storage_backend == "sqlite":
+        database = container.settings.database_path
+        if database.exists():
+            sizes.append(({"file": database.name}, database.stat().st_size))
+    return sorted(sizes, key=lambda sample: sample[0]["file"])
+
+
+def render_metrics(container: Container) -> str:
+    """Render the metrics of a container and of this process.
+
+    Args:
+        container: Application-scoped container
+
+    Returns:
+        Metrics in the Prometheus text exposition format
+    """
+    page = PrometheusText()
+
+    page.histogram(
+        "bbs_http_request_duration_seconds",
+        "Time to the start of the response of REST requests.",
+        _labelled(("route", "method", "status"), container.route_latency.snapshot()),
+    )
+    page.histogram(
+        "bbs_mcp_tool_duration_seconds",
+        "Duration of MCP tool calls.",
+        _labelled(("tool", "outcome"), container.tool_latency.snapshot()),
+    )
+    page.histogram(
+        "bbs_use_case_duration_seconds",
+        "Duration of use case executions.",
+        _labelled(("use_case", "outcome"), container.use_case_metrics.snapshot()),
+    )
+
+    io = container.file_storage.io_stats()
+    page.counter("bbs_storage_files_read_total", "Files read.", [({}, io.files_read)])
+    page.counter("bbs_storage_files_written_total", "Files written.", [({}, io.files_written)])
+    page.counter("bbs_storage_read_bytes_total", "Bytes read.", [({}, io.bytes_read)])
+    page.counter("bbs_storage_written_bytes_total", "Bytes written.", [({}, io.bytes_written)])
+    page.counter("bbs_storage_stat_calls_total", "File stat calls.", [({}, io.stat_calls)])
+    page.counter(
+        "bbs_storage_directory_listings_total",
+        "Directory listings.",
+        [({}, io.directory_listings)],
+    )
+
+    locks = lock_stats_by_name()
+    page.histogram(
+        "bbs_lock_wait_seconds",
+        "Time spent waiting for file locks.",
+        [
+            ({"lock": name, "mode": mode}, stats.wait_seconds)
+            for (name, mode), stats in locks.items()
+        ],
+    )
+    page.histogram(
+        "bbs_lock_hold_seconds",
+        "Time file locks were held.",
+        [
+            ({"lock": name, "mode": mode}, stats.hold_seconds)
+            for (name, mode), stats in locks.items()
+        ],
+    )
+    page.counter(
+        "bbs_lock_timeouts_total",
+        "File lock acquisitions that timed out.",
+        [({"lock": name, "mode": mode}, stats.timeouts) for (name, mode), stats in locks.items()],
+    )
+    page.gauge("bbs_lock_open_fds", "Open lock file descriptors.", [({}, lock_stats().open_fds)])
+
+    caches: dict[str, CacheStats] = {"response": container.response_cache.stats()}
+    if container.post_cache:
+        caches["post"] = container.post_cache.stats()
+    page.counter(
+        "bbs_cache_hits_total",
+        "Cache hits.",
+        [({"cache": name}, stats.hits) for name, stats in caches.items()],
+    )
+    page.counter(
+        "bbs_cache_misses_total",
+        "Cache misses.",
+        [({"cache": name}, stats.misses) for name, stats in caches.items()],
+    )
+    page.gauge(
+        "bbs_cache_bytes",
+        "Bytes held by caches.",
+        [({"cache": name}, stats.bytes) for name, stats in caches.items()],
+    )
+    coalescing = container.read_coalescer.stats()
+    page.gauge(
+        "bbs_cache_hit_ratio",
+        "Share of lookups answered without storage reads; coalescing counts shared reads.",
+        [
+            *(
+                ({"cache": name}, _hit_ratio(stats.hits, stats.misses))
+                for name, stats in caches.items()
+            ),
+            ({"cache": "coalescing"}, _hit_ratio(coalescing.shared, coalescing.executed)),
+        ],
+    )
+
+    page.gauge("bbs_index_bytes", "Size of index files.", _index_sizes(container))
+
+    executor = container.executor.stats()
+    page.gauge("bbs_executor_active", "Calls running on worker threads.", [({}, executor.active)])
+    page.gauge("bbs_executor_queued", "Calls waiting for a worker.", [({}, executor.queued)])
+    page.counter(
+        "bbs_executor_rejected_total", "Calls rejected by a full queue.", [({}, executor.rejected)]
+    )
+    page.counter(
+        "bbs_executor_cancelled_total",
+        "Calls abandoned by their caller while waiting for a worker.",
+        [({}, executor.cancelled)],
+    )
+    events = container.event_bus.stats()
+    page.gauge("bbs_events_pending", "Events waiting for their handlers.", [({}, events.pending)])
+    page.counter("bbs_events_failed_total", "Failed event handler runs.", [({}, events.failed)])
+    return page.render()
+
+
+def create_metrics_router(container: Container) -> APIRouter:
+    """Create metrics router with dependencies.
+
+    Args:
+        container: Application-scoped container holding the metrics
+
+    Returns:
+        Configured APIRouter
+    """
+    router = APIRouter(tags=["metrics"])
+
+    @router.get("/metrics", response_class=PlainTextResponse)
+    async def metrics():
+        """Get metrics in the Prometheus text format.
+
+        Every value is read from in-memory counters; only the sizes of the
+        index files are taken from the file system.
+
+        Returns:
+            Metrics page
+        """
+        return PlainTextResponse(render_metrics(container), media_type=PrometheusText.CONTENT_TYPE)
+
+    return router
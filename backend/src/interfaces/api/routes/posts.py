@@ -1,14 +1,15 @@
 """Posts API routes."""
 
-from pathlib import Path
+from collections.abc import Awaitable, Callable
+from email.utils import formatdate
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from pydantic import BaseModel
 
-from ....application.use_cases.post.browse_posts import BrowsePostsUseCase
-from ....application.use_cases.post.get_post import GetPostUseCase
 from ....domain.exceptions.post_exceptions import PostNotFoundException
-from ....infrastructure.persistence.file_storage import FileStorage
-from ....infrastructure.persistence.post_repository_impl import PostRepositoryImpl
+from ....infrastructure.tracing import span
+from ...container import Container
+from ..response_cache import ResourceVersion, etag_matches
 from ..schemas.post_schema import (
     PostDetailResponse,
     PostListResponse,
@@ -17,84 +18,146 @@ from ..schemas.post_schema import (
 )
 
 
-def create_posts_router(data_dir: Path) -> APIRouter:
+def create_posts_router(container: Container) -> APIRouter:
     """Create posts router with dependencies.
 
     Args:
-        data_dir: Data directory path
+        container: Application-scoped container holding the use cases and executor
 
     Returns:
         Configured APIRouter
     """
     router = APIRouter(prefix="/posts", tags=["posts"])
 
-    # Initialize dependencies
-    storage = FileStorage(data_dir)
-    post_repo = PostRepositoryImpl(storage)
+    executor = container.executor
+    response_cache = container.response_cache
+
+    async def cached_response(
+        request: Request,
+        get_version: Callable[[], ResourceVersion],
+        render: Callable[[], Awaitable[BaseModel]],
+    ) -> Response:
+        """Answer from the response cache, or with 304 if the client's copy is current.
+
+        Args:
+            request: Incoming request
+            get_version: Returns the current version of the resource
+            render: Builds the response model on a cache miss
+
+        Returns:
+            JSON response with ``ETag`` and ``Last-Modified``, or ``304 Not Modified``
+        """
+        if response_cache.refresh_due():
+            await executor.run(response_cache.refresh)
+        version = get_version()
+        headers = {
+            "ETag": version.etag,
+            "Last-Modified": formatdate(version.modified_at, usegmt=True),
+            "Cache-Control": "no-cache",
+        }
+        if etag_matches(request.headers.get("if-none-match"), version.etag):
+            return Response(status_code=304, headers=headers)
+
+        key = f"{request.url.path}?{request.url.query}"
+        body = response_cache.get(key, version)
+        if body is None:
+            # The render span covers the use case and the conversion to response models
+            with span("response.render"):
+                model = await render()
+            with span("response.serialize"):
+                body = model.model_dump_json().encode("utf-8")
+            response_cache.put(key, version, body)
+        return Response(content=body, media_type="application/json", headers=headers)
 
     @router.get("", response_model=PostListResponse)
     async def list_posts(
+        request: Request,
         page: int = Query(1, ge=1, description="Page number"),
         page_size: int = Query(20, ge=1, le=100, description="Posts per page"),
         include_deleted: bool = Query(False, description="Include deleted posts"),
+        cursor: str | None = Query(None, description="Cursor from the previous page"),
+        include_total: bool = Query(True, description="Include an estimated total"),
     ):
         """List posts with pagination.
 
+        Pages can be requested by number or, preferably, by following
+        ``next_cursor``, which stays stable while new posts are created.
+        Responses carry an ``ETag`` that changes with any post or reply;
+        send it back in ``If-None-Match`` to get ``304 Not Modified``.
+
         Args:
-            page: Page number (1-indexed)
+            request: Incoming request (conditional headers)
+            page: Page number (1-indexed, ignored when a cursor is given)
             page_size: Number of posts per page
             include_deleted: Whether to include deleted posts
+            cursor: Cursor returned with the previous page
+            include_total: Whether to include estimated total and page counts
 
         Returns:
             Paginated list of posts
+
+        Raises:
+            HTTPException: If the cursor is invalid
         """
-        use_case = BrowsePostsUseCase(post_repo)
-
-        offset = (page - 1) * page_size
-        posts_dto = use_case.execute(
-            limit=page_size,
-            offset=offset,
-            include_deleted=include_deleted,
-        )
-
-        # Get total count for pagination
-        all_posts = post_repo.find_all(include_deleted=include_deleted)
-        total = len(all_posts)
-
-        posts = [
-            PostResponse(
-                post_id=post.post_id,
-                title=post.title,
-                content="",  # List view doesn't include full content
-                agent_name=post.agent_name,
-                created_at=post.created_at,
-                updated_at=post.updated_at,
-                deleted=post.deleted,
-                deleted_at=None,
-                tags=post.tags,
-                reply_count=post.reply_count,
-            )
-            for post in posts_dto
-        ]
 
-        total_pages = (total + page_size - 1) // page_size
+        async def render() -> PostListResponse:
+            """Build the page of posts."""
+            use_case = container.browse_posts_use_case
+
+            try:
+                result = await use_case.execute_on(
+                    executor,
+                    limit=page_size,
+                    offset=(page - 1) * page_size,
+                    include_deleted=include_deleted,
+                    cursor=cursor,
+                    include_total=include_total,
+                )
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+
+            posts = [
+                PostResponse(
+                    post_id=post.post_id,
+                    title=post.title,
+                    content="",  # List view doesn't include full content
+                    agent_name=post.agent_name,
+                    created_at=post.created_at,
+                    updated_at=post.updated_at,
+                    deleted=post.deleted,
+                    deleted_at=None,
+                    tags=post.tags,
+                    reply_count=post.reply_count,
+                )
+                for post in result.posts
+            ]
+
+            total = result.estimated_total
+            return PostListResponse(
+                posts=posts,
+                total=total,
+                page=None if cursor else page,
+                page_size=page_size,
+                total_pages=(total + page_size - 1) // page_size if total is not None else None,
+                next_cursor=result.next_cursor,
+            )
 
-        return PostListResponse(
-            posts=posts,
-            total=total,
-            page=page,
-            page_size=page_size,
-            total_pages=total_pages,
-        )
+        return await cached_response(request, response_cache.board_version, render)
 
     @router.get("/{post_id}", response_model=PostDetailResponse)
     async def get_post(
+        request: Request,
         post_id: str,
         include_deleted: bool = Query(False, description="Include deleted replies"),
     ):
         """Get post by ID with all replies.
 
+        Responses carry an ``ETag`` that changes when the post or any of its
+        replies changes; send it back in ``If-None-Match`` to get
+        ``304 Not Modified``.
+
         Args:
+            request: Incoming request (conditional headers)
             post_id: Post ID
             include_deleted: Whether to include deleted replies
 
@@ -104,51 +167,58 @@ def create_posts_router(data_dir: Path) -> APIRouter:
         Raises:
             HTTPException: If post not found
         """
-        use_case = GetPostUseCase(post_repo)
-
-        try:
-            post_dto = use_case.execute(post_id, include_deleted=include_deleted)
-        except PostNotFoundException:
-            raise HTTPException(status_code=404, detail="Post not found")
-        except ValueError as e:
-            raise HTTPException(status_code=400, detail=str(e))
-
-        def convert_reply(reply_dto) -> ReplyResponse:
-            """Convert ReplyResponseDTO to ReplyResponse."""
-            nested_replies = []
-            if reply_dto.replies:
-                nested_replies = [convert_reply(r) for r in reply_dto.replies]
-
-            return ReplyResponse(
-                reply_id=reply_dto.reply_id,
-                post_id=reply_dto.post_id,
-                parent_id=reply_dto.parent_id,
-                parent_type=reply_dto.parent_type,
-                content=reply_dto.content,
-                agent_name=reply_dto.agent_name,
-                created_at=reply_dto.created_at,
-                deleted=reply_dto.deleted,
-                deleted_at=reply_dto.deleted_at,
-                reply_count=reply_dto.reply_count,
-                replies=nested_replies,
+
+        async def render() -> PostDetailResponse:
+            """Build the post with its replies."""
+            use_case = container.get_post_use_case
+
+            try:
+                post_dto = await use_case.execute_on(
+                    executor, post_id, include_deleted=include_deleted
+                )
+            except PostNotFoundException:
+                raise HTTPException(status_code=404, detail="Post not found")
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+
+            def convert_reply(reply_dto) -> ReplyResponse:
+                """Convert ReplyResponseDTO to ReplyResponse."""
+                nested_replies = []
+                if reply_dto.replies:
+                    nested_replies = [convert_reply(r) for r in reply_dto.replies]
+
+                return ReplyResponse(
+                    reply_id=reply_dto.reply_id,
+                    post_id=reply_dto.post_id,
+                    parent_id=reply_dto.parent_id,
+                    parent_type=reply_dto.parent_type,
+                    content=reply_dto.content,
+                    agent_name=reply_dto.agent_name,
+                    created_at=reply_dto.created_at,
+                    deleted=reply_dto.deleted,
+                    deleted_at=reply_dto.deleted_at,
+                    reply_count=reply_dto.reply_count,
+                    replies=nested_replies,
+                )
+
+            replies = []
+            if post_dto.replies:
+                replies = [convert_reply(r) for r in post_dto.replies]
+
+            return PostDetailResponse(
+                post_id=post_dto.post_id,
+                title=post_dto.title,
+                content=post_dto.content,
+                agent_name=post_dto.agent_name,
+                created_at=post_dto.created_at,
+                updated_at=post_dto.updated_at,
+                deleted=post_dto.deleted,
+                deleted_at=post_dto.deleted_at,
+                tags=post_dto.tags,
+                reply_count=post_dto.reply_count,
+                replies=replies,
             )
 
-        replies = []
-        if post_dto.replies:
-            replies = [convert_reply(r) for r in post_dto.replies]
-
-        return PostDetailResponse(
-            post_id=post_dto.post_id,
-            title=post_dto.title,
-            content=post_dto.content,
-            agent_name=post_dto.agent_name,
-            created_at=post_dto.created_at,
-            updated_at=post_dto.updated_at,
-            deleted=post_dto.deleted,
-            deleted_at=post_dto.deleted_at,
-            tags=post_dto.tags,
-            reply_count=post_dto.reply_count,
-            replies=replies,
-        )
+        return await cached_response(request, lambda: response_cache.post_version(post_id), render)
 
     return router
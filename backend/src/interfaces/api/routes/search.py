@@ -1,57 +1,59 @@
 """Search API routes."""
 
-from pathlib import Path
-
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, HTTPException, Query
 
 from ....application.dtos.post_dto import SearchPostsDTO
-from ....application.use_cases.post.search_posts import SearchPostsUseCase
-from ....infrastructure.indexes.post_index import PostIndex
-from ....infrastructure.persistence.file_storage import FileStorage
-from ....infrastructure.persistence.post_repository_impl import PostRepositoryImpl
-from ....infrastructure.persistence.search_repository_impl import (
-    SearchRepositoryImpl,
-)
+from ...container import Container
 from ..schemas.post_schema import PostResponse
-from ..schemas.search_schema import SearchResponse
+from ..schemas.search_schema import SearchResponse, TagCloudResponse, TagCountResponse
 
 
-def create_search_router(data_dir: Path) -> APIRouter:
+def create_search_router(container: Container) -> APIRouter:
     """Create search router with dependencies.
 
     Args:
-        data_dir: Data directory path
+        container: Application-scoped container holding the use cases and executor
 
     Returns:
         Configured APIRouter
     """
     router = APIRouter(prefix="/search", tags=["search"])
 
-    # Initialize dependencies
-    storage = FileStorage(data_dir)
-    post_repo = PostRepositoryImpl(storage)
-    post_index = PostIndex(storage)
-    search_repo = SearchRepositoryImpl(post_index, post_repo)
+    executor = container.executor
 
     @router.get("", response_model=SearchResponse)
     async def search_posts(
         q: str | None = Query(None, description="Search query"),
         agent: str | None = Query(None, description="Filter by agent name"),
-        tags: str | None = Query(None, description="Filter by tags (comma-separated)"),
+        tags: str | None = Query(
+            None,
+            description="Filter by tags (comma-separated; any plain tag, "
+            "every tag prefixed with '+' and none prefixed with '-')",
+        ),
         include_deleted: bool = Query(False, description="Include deleted posts"),
+        sort: str = Query(
+            "newest", pattern="^(newest|relevance)$", description="Sort by newest or relevance"
+        ),
+        limit: int = Query(50, ge=1, le=100, description="Maximum number of results"),
+        cursor: str | None = Query(None, description="Cursor from the previous page"),
     ):
         """Search posts by query, agent, or tags.
 
         Args:
             q: Search query (searches in title and content)
             agent: Filter by agent name
-            tags: Filter by tags (comma-separated)
+            tags: Filter by tags (comma-separated), e.g. 'python,rust,+async,-draft'
+                for posts tagged python or rust, and async, but not draft; '+'
+                must be sent percent-encoded (%2B)
             include_deleted: Whether to include deleted posts
+            sort: 'newest' or 'relevance' (BM25 ranking of the query)
+            limit: Maximum number of results
+            cursor: Cursor returned with the previous page (newest sort only)
 
         Returns:
             Search results
         """
-        use_case = SearchPostsUseCase(search_repo)
+        use_case = container.search_posts_use_case
 
         # Parse tags
         tag_list = [tag.strip() for tag in tags.split(",")] if tags else None
@@ -61,9 +63,15 @@ def create_search_router(data_dir: Path) -> APIRouter:
             agent_name=agent,
             tags=tag_list,
             include_deleted=include_deleted,
+            sort_by=sort,
+            limit=limit,
+            cursor=cursor,
         )
 
-        posts_dto = use_case.execute(dto)
+        try:
+            page = await use_case.execute_on(executor, dto)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
 
         posts = [
             PostResponse(
@@ -78,7 +86,7 @@ def create_search_router(data_dir: Path) -> APIRouter:
                 tags=post.tags,
                 reply_count=post.reply_count,
             )
-            for post in posts_dto
+            for post in page.posts
         ]
 
         filters = {}
@@ -94,6 +102,27 @@ def create_search_router(data_dir: Path) -> APIRouter:
             total=len(posts),
             query=q or "",
             filters=filters,
+            next_cursor=page.next_cursor,
+        )
+
+    @router.get("/tags", response_model=TagCloudResponse)
+    async def list_tags(
+        limit: int = Query(50, ge=1, le=500, description="Maximum number of tags"),
+    ):
+        """Get the most used tags and their post counts.
+
+        Args:
+            limit: Maximum number of tags
+
+        Returns:
+            Tags, most used first
+        """
+        tag_counts = await container.list_tags_use_case.execute_on(executor, limit)
+        return TagCloudResponse(
+            tags=[
+                TagCountResponse(tag=tag_count.tag, post_count=tag_count.post_count)
+                for tag_count in tag_counts
+            ]
         )
 
     return router
@@ -0,0 +1,142 @@
+"""Change feed API routes (Server-Sent Events)."""
+
+import asyncio
+import json
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import Any
+
+from fastapi import APIRouter, Header, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+
+from ....infrastructure.events.change_log import CHANGE_TYPES, ChangeLog
+from ....infrastructure.executor import BlockingExecutor
+from ...container import Container
+
+# How long a client waits before reconnecting, in milliseconds
+RETRY_MILLISECONDS = 3000
+
+
+def format_change(record: dict[str, Any]) -> str:
+    """Format a change log record as an SSE message.
+
+    Args:
+        record: Change log record
+
+    Returns:
+        SSE message with the sequence number as its ID
+    """
+    data = {key: value for key, value in record.items() if key != "type"}
+    return (
+        f"id: {record['seq']}\n"
+        f"event: {CHANGE_TYPES.get(record['type'], 'change')}\n"
+        f"data: {json.dumps(data, ensure_ascii=False)}\n\n"
+    )
+
+
+async def change_stream(
+    change_log: ChangeLog,
+    executor: BlockingExecutor,
+    last_event_id: int | None,
+    is_disconnected: Callable[[], Awaitable[bool]],
+    poll_interval: float = 0.5,
+    heartbeat_interval: float = 15.0,
+) -> AsyncIterator[str]:
+    """Stream change log records as SSE messages until the client disconnects.
+
+    Only the new tail of the log is read on each poll. If events after
+    ``last_event_id`` are no longer retained, a ``reset`` event tells the
+    client to reload its view before following the feed.
+
+    Args:
+        change_log: Change log
+        executor: Executor that runs the blocking log reads
+        last_event_id: Sequence number of the last event the client has
+            seen, or None to start with the next change
+        is_disconnected: Coroutine function reporting a client disconnect
+        poll_interval: Seconds between log reads while idle
+        heartbeat_interval: Seconds of silence before a keep-alive comment
+
+    Yields:
+        SSE messages
+    """
+    yield f"retry: {RETRY_MILLISECONDS}\n\n"
+
+    cursor, missed = await executor.run(change_log.cursor_after, last_event_id)
+    idle = 0.0
+    while True:
+        if missed:
+            yield "event: reset\ndata: {}\n\n"
+
+        records, cursor, missed = await executor.run(change_log.read, cursor)
+        for record in records:
+            yield format_change(record)
+        if records or missed:
+            idle = 0.0
+            continue
+
+        if await is_disconnected():
+            return
+        await asyncio.sleep(poll_interval)
+        idle += poll_interval
+        if idle >= heartbeat_interval:
+            idle = 0.0
+            yield ": keep-alive\n\n"
+
+
+def create_stream_router(container: Container) -> APIRouter:
+    """Create change feed router with dependencies.
+
+    Args:
+        container: Application-scoped container holding the change log and executor
+
+    Returns:
+        Configured APIRouter
+    """
+    router = APIRouter(prefix="/stream", tags=["stream"])
+
+    @router.get("")
+    async def stream_changes(
+        request: Request,
+        last_event_id: str | None = Header(None, description="Resume after this event ID"),
+        since: int | None = Query(
+            None,
+            ge=0,
+            description="Resume after this event ID (for clients that cannot set headers)",
+        ),
+    ):
+        """Stream new posts, replies and deletions as Server-Sent Events.
+
+        Each event carries its sequence number as the SSE ``id``, so a client
+        that reconnects with ``Last-Event-ID`` resumes exactly where it left
+        off. Without one, the stream starts with the next change.
+
+        Args:
+            request: Incoming request (used to detect disconnects)
+            last_event_id: ``Last-Event-ID`` header sent by reconnecting clients
+            since: Same as ``Last-Event-ID``; the header takes precedence
+
+        Returns:
+            ``text/event-stream`` response
+
+        Raises:
+            HTTPException: If the event ID is not a sequence number
+        """
+        resume_after = since
+        if last_event_id:
+            try:
+                resume_after = int(last_event_id)
+            except ValueError:
+                raise HTTPException(status_code=400, detail="Invalid Last-Event-ID")
+
+        return StreamingResponse(
+            change_stream(
+                container.change_log,
+                container.executor,
+                resume_after,
+                request.is_disconnected,
+            ),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    return router
@@ -0,0 +1,71 @@
+"""Updates API routes."""
+
+from dataclasses import asdict
+
+from fastapi import APIRouter, HTTPException, Query
+
+from ....application.dtos.update_dto import GetUpdatesDTO
+from ...container import Container
+from ..schemas.update_schema import UpdateResponse, UpdatesResponse
+
+
+def create_updates_router(container: Container) -> APIRouter:
+    """Create updates router with dependencies.
+
+    Args:
+        container: Application-scoped container holding the use cases and executor
+
+    Returns:
+        Configured APIRouter
+    """
+    router = APIRouter(prefix="/updates", tags=["updates"])
+    executor = container.executor
+
+    @router.get("", response_model=UpdatesResponse)
+    async def get_updates(
+        since: int = Query(0, ge=0, description="Sequence number of the last change seen"),
+        agent: str | None = Query(None, description="Agent the scope refers to"),
+        scope: str = Query(
+            "all",
+            pattern="^(all|authored|participated)$",
+            description="All threads, threads the agent authored, or threads it took part in",
+        ),
+        limit: int = Query(50, ge=1, le=100, description="Maximum number of changes"),
+        include_content: bool = Query(False, description="Include the text of posts and replies"),
+    ):
+        """Get the changes made after a sequence number.
+
+        Args:
+            since: Sequence number of the last change seen (0 for all retained changes)
+            agent: Agent name, required for the authored and participated scopes
+            scope: Which threads to include
+            limit: Maximum number of changes
+            include_content: Whether to include the text of new posts and replies
+
+        Returns:
+            Page of changes
+
+        Raises:
+            HTTPException: If the parameters are invalid
+        """
+        dto = GetUpdatesDTO(
+            since=since,
+            agent_name=agent,
+            scope=scope,
+            limit=limit,
+            include_content=include_content,
+        )
+
+        try:
+            page = await executor.run(container.get_updates_use_case.execute, dto)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        return UpdatesResponse(
+            updates=[UpdateResponse(**asdict(update)) for update in page.updates],
+            next_since=page.next_since,
+            has_more=page.has_more,
+            reset=page.reset,
+        )
+
+    return router
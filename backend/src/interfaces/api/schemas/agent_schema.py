@@ -11,6 +11,10 @@ class AgentResponse(BaseModel):
     created_at: str = Field(..., description="Registration timestamp (ISO format)")
     post_count: int = Field(default=0, description="Number of posts created")
     reply_count: int = Field(default=0, description="Number of replies created")
+    deleted_count: int = Field(default=0, description="Number of posts and replies deleted")
+    last_active_at: str | None = Field(
+        default=None, description="Time of the latest post, reply or deletion (ISO format)"
+    )
     metadata: dict = Field(default_factory=dict, description="Additional metadata")
 
     class Config:
@@ -23,6 +27,8 @@ class AgentResponse(BaseModel):
                 "created_at": "2026-01-31T12:00:00Z",
                 "post_count": 10,
                 "reply_count": 25,
+                "deleted_count": 1,
+                "last_active_at": "2026-02-01T09:30:00",
                 "metadata": {},
             }
         }
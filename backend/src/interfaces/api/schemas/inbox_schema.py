@@ -0,0 +1,26 @@
+"""API schemas for agent inboxes."""
+
+from pydantic import BaseModel, Field
+
+
+class NotificationResponse(BaseModel):
+    """Response schema for a reply that concerns an agent."""
+
+    reply_id: str = Field(..., description="The new reply")
+    post_id: str = Field(..., description="Post the reply belongs to")
+    parent_id: str = Field(..., description="Post or reply it answers")
+    agent_name: str = Field(..., description="Author of the reply")
+    reasons: list[str] = Field(
+        ..., description="Why it concerns the agent: reply, thread and/or mention"
+    )
+    occurred_at: str = Field(..., description="Time of the reply (ISO format)")
+    title: str | None = Field(None, description="Title of the post")
+    excerpt: str | None = Field(None, description="Beginning of the reply text")
+
+
+class InboxResponse(BaseModel):
+    """Response schema for a page of notifications."""
+
+    notifications: list[NotificationResponse] = Field(..., description="Oldest first")
+    next_cursor: int = Field(..., description="Pass as 'cursor' to get the following page")
+    has_more: bool = Field(..., description="Whether more notifications follow")
@@ -81,10 +81,11 @@ class PostListResponse(BaseModel):
     """Response schema for paginated post list."""
 
     posts: list[PostResponse] = Field(..., description="List of posts")
-    total: int = Field(..., description="Total number of posts")
-    page: int = Field(..., description="Current page number")
+    total: int | None = Field(None, description="Estimated total number of posts")
+    page: int | None = Field(None, description="Current page number (page-based requests)")
     page_size: int = Field(..., description="Number of posts per page")
-    total_pages: int = Field(..., description="Total number of pages")
+    total_pages: int | None = Field(None, description="Estimated total number of pages")
+    next_cursor: str | None = Field(None, description="Cursor for the next page, if any")
 
 
 class APIResponse(BaseModel):
@@ -9,6 +9,20 @@ class SearchResponse(BaseModel):
     """Response schema for search results."""
 
     results: list[PostResponse] = Field(..., description="Search results")
-    total: int = Field(..., description="Total number of results")
+    total: int = Field(..., description="Number of results on this page")
     query: str = Field(..., description="Search query")
     filters: dict = Field(default_factory=dict, description="Applied filters")
+    next_cursor: str | None = Field(None, description="Cursor for the next page, if any")
+
+
+class TagCountResponse(BaseModel):
+    """Response schema for a tag and its post count."""
+
+    tag: str = Field(..., description="Tag")
+    post_count: int = Field(..., description="Number of visible posts carrying the tag")
+
+
+class TagCloudResponse(BaseModel):
+    """Response schema for the most used tags."""
+
+    tags: list[TagCountResponse] = Field(..., description="Tags, most used first")
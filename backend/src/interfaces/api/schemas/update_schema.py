@@ -0,0 +1,28 @@
+"""API schemas for updates."""
+
+from pydantic import BaseModel, Field
+
+
+class UpdateResponse(BaseModel):
+    """Response schema for one change to the board."""
+
+    seq: int = Field(..., description="Sequence number of the change")
+    type: str = Field(..., description="post_created, post_deleted, reply_added or reply_deleted")
+    occurred_at: str = Field(..., description="Time of the change (ISO format)")
+    post_id: str = Field(..., description="Post the change belongs to")
+    agent_name: str = Field(..., description="Agent that made the change")
+    reply_id: str | None = Field(None, description="Reply ID for reply changes")
+    parent_id: str | None = Field(None, description="Parent ID for new replies")
+    title: str | None = Field(None, description="Title for new posts")
+    content: str | None = Field(None, description="Text of new posts and replies, if requested")
+
+
+class UpdatesResponse(BaseModel):
+    """Response schema for a page of changes."""
+
+    updates: list[UpdateResponse] = Field(..., description="Changes in sequence order")
+    next_since: int = Field(..., description="Pass as 'since' to get the following changes")
+    has_more: bool = Field(..., description="Whether more changes are already available")
+    reset: bool = Field(
+        False, description="Changes after 'since' are no longer retained; reload instead"
+    )
@@ -0,0 +1,152 @@
+"""Command line entry point for BBS maintenance tasks.
+
+Usage:
+    python -m src.interfaces.cli migrate-sqlite [--data-dir DIR] [--db PATH]
+    python -m src.interfaces.cli rebuild-search-index [--data-dir DIR]
+    python -m src.interfaces.cli rebuild-reply-counts [--data-dir DIR]
+    python -m src.interfaces.cli rebuild-agent-stats [--data-dir DIR]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from src.infrastructure.config import Settings
+from src.infrastructure.persistence.file_storage import FileStorage
+from src.infrastructure.persistence.post_repository_impl import PostRepositoryImpl
+from src.infrastructure.persistence.repository_factory import create_repositories
+from src.infrastructure.persistence.sqlite_database import SQLiteDatabase
+from src.infrastructure.persistence.sqlite_migration import FileTreeImporter
+
+
+def migrate_sqlite(args: argparse.Namespace) -> int:
+    """Import a file-based data tree into the SQLite database.
+
+    Args:
+        args: Parsed command line arguments
+
+    Returns:
+        Process exit code
+    """
+    settings = Settings.from_env(data_dir=args.data_dir, storage_backend="sqlite")
+    database_path = args.db or settings.database_path
+
+    importer = FileTreeImporter(FileStorage(settings.data_dir), SQLiteDatabase(database_path))
+    report = importer.run()
+
+    print(
+        f"Imported {report.agents} agents, {report.posts} posts and {report.replies} replies "
+        f"into {database_path} ({report.skipped} entries skipped)"
+    )
+    return 0
+
+
+def rebuild_search_index(args: argparse.Namespace) -> int:
+    """Rebuild the post and full-text search indexes of the configured backend.
+
+    Args:
+        args: Parsed command line arguments
+
+    Returns:
+        Process exit code
+    """
+    settings = Settings.from_env(data_dir=args.data_dir)
+    storage = FileStorage(settings.data_dir)
+    create_repositories(settings, storage).search_repository.rebuild_index()
+
+    print(f"Rebuilt search index for {settings.data_dir} ({settings.storage_backend} backend)")
+    return 0
+
+
+def rebuild_reply_counts(args: argparse.Namespace) -> int:
+    """Recompute the reply counters stored in file-based post metadata.
+
+    The SQLite backend counts replies when listing, so there is nothing to do.
+
+    Args:
+        args: Parsed command line arguments
+
+    Returns:
+        Process exit code
+    """
+    settings = Settings.from_env(data_dir=args.data_dir)
+    if settings.storage_backend != "file":
+        print(f"Reply counts are computed by the {settings.storage_backend} backend")
+        return 0
+
+    changed = PostRepositoryImpl(FileStorage(settings.data_dir)).rebuild_reply_counts()
+
+    print(f"Rebuilt reply counts for {settings.data_dir} ({changed} posts updated)")
+    return 0
+
+
+def rebuild_agent_stats(args: argparse.Namespace) -> int:
+    """Recompute the per-agent activity counters of the configured backend.
+
+    Args:
+        args: Parsed command line arguments
+
+    Returns:
+        Process exit code
+    """
+    settings = Settings.from_env(data_dir=args.data_dir)
+    storage = FileStorage(settings.data_dir)
+    agents = create_repositories(settings, storage).agent_repository
+    count = agents.rebuild_stats()
+
+    print(f"Rebuilt stats for {count} agents in {settings.data_dir}")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser.
+
+    Returns:
+        Argument parser
+    """
+    parser = argparse.ArgumentParser(prog="python -m src.interfaces.cli")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    migrate = subparsers.add_parser(
+        "migrate-sqlite", help="Import an existing data/ tree into the SQLite backend"
+    )
+    migrate.add_argument("--data-dir", type=Path, default=None, help="Source data directory")
+    migrate.add_argument("--db", type=Path, default=None, help="Target SQLite database file")
+    migrate.set_defaults(handler=migrate_sqlite)
+
+    rebuild = subparsers.add_parser(
+        "rebuild-search-index", help="Rebuild the post and full-text search indexes"
+    )
+    rebuild.add_argument("--data-dir", type=Path, default=None, help="Data directory")
+    rebuild.set_defaults(handler=rebuild_search_index)
+
+    reply_counts = subparsers.add_parser(
+        "rebuild-reply-counts", help="Recompute reply counters stored with file-based posts"
+    )
+    reply_counts.add_argument("--data-dir", type=Path, default=None, help="Data directory")
+    reply_counts.set_defaults(handler=rebuild_reply_counts)
+
+    agent_stats = subparsers.add_parser(
+        "rebuild-agent-stats", help="Recompute per-agent post and reply counters"
+    )
+    agent_stats.add_argument("--data-dir", type=Path, default=None, help="Data directory")
+    agent_stats.set_defaults(handler=rebuild_agent_stats)
+
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the command line interface.
+
+    Args:
+        argv: Command line arguments (defaults to sys.argv)
+
+    Returns:
+        Process exit code
+    """
+    args = build_parser().parse_args(argv)
+    return int(args.handler(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
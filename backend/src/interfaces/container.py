@@ -0,0 +1,196 @@
+"""Dependency injection container for the BBS system."""
+
+import threading
+from pathlib import Path
+
+from src.application.services.event_handlers import (
+    AgentStatsEventHandler,
+    ChangeFeedEventHandler,
+    InboxEventHandler,
+    IndexEventHandler,
+)
+from src.application.services.read_coalescer import ReadCoalescer
+from src.application.services.use_case_metrics import UseCaseMetrics
+from src.application.use_cases.agent.get_agent_profile import GetAgentProfileUseCase
+from src.application.use_cases.agent.get_inbox import GetInboxUseCase
+from src.application.use_cases.agent.list_agents import ListAgentsUseCase
+from src.application.use_cases.agent.register_agent import RegisterAgentUseCase
+from src.application.use_cases.post.browse_posts import BrowsePostsUseCase
+from src.application.use_cases.post.create_post import CreatePostUseCase
+from src.application.use_cases.post.delete_post import DeletePostUseCase
+from src.application.use_cases.post.get_post import GetPostUseCase
+from src.application.use_cases.post.get_updates import GetUpdatesUseCase
+from src.application.use_cases.post.list_tags import ListTagsUseCase
+from src.application.use_cases.post.search_posts import SearchPostsUseCase
+from src.application.use_cases.reply.create_reply import CreateReplyUseCase
+from src.application.use_cases.reply.delete_reply import DeleteReplyUseCase
+from src.domain.services.agent_domain_service import AgentDomainService
+from src.infrastructure.config import Settings
+from src.infrastructure.events.change_log import ChangeLog
+from src.infrastructure.events.event_bus import EventBus
+from src.infrastructure.events.event_outbox import EventOutbox
+from src.infrastructure.executor import shared_executor
+from src.infrastructure.indexes.agent_index import AgentIndex
+from src.infrastructure.metrics import HistogramFamily
+from src.infrastructure.persistence.agent_inbox import AgentInbox
+from src.infrastructure.persistence.file_storage import FileStorage
+from src.infrastructure.persistence.repository_factory import create_repositories
+from src.infrastructure.tracing import JsonlSpanExporter, Tracer, configure_tracing
+from src.interfaces.api.response_cache import ResponseCache
+
+
+class Container:
+    """Dependency injection container.
+
+    Owns every storage, index, repository and use case instance. The REST
+    routers and the MCP tools of one process share a single container (see
+    ``get_container``), so caches and in-memory index state are built once
+    and stay consistent between both interfaces.
+    """
+
+    def __init__(self, data_dir: Path | None = None, storage_backend: str | None = None) -> None:
+        """Initialize container.
+
+        Args:
+            data_dir: Root directory for data storage (defaults to BBS_DATA_DIR or ./data)
+            storage_backend: 'file' or 'sqlite' (defaults to BBS_STORAGE_BACKEND)
+        """
+        self.settings = Settings.from_env(data_dir=data_dir, storage_backend=storage_backend)
+
+        # Infrastructure
+        self.file_storage = FileStorage(self.settings.data_dir)
+        self.executor = shared_executor(self.settings)
+        configure_tracing(
+            Tracer(
+                JsonlSpanExporter(self.settings.trace_path),
+                self.settings.trace_sample_rate,
+                self.settings.trace_min_duration_ms,
+            )
+            if self.settings.trace_sample_rate > 0
+            else None
+        )
+
+        # Repositories
+        repositories = create_repositories(self.settings, self.file_storage)
+        self.agent_repository = repositories.agent_repository
+        self.post_repository = repositories.post_repository
+        self.search_repository = repositories.search_repository
+        self.post_cache = repositories.post_cache
+
+        # JSON indexes, only kept by the file backend
+        self.post_index = repositories.post_index
+        self.agent_index = AgentIndex(self.file_storage) if self.post_index is not None else None
+
+        # Domain Services
+        self.agent_domain_service = AgentDomainService(self.agent_repository)
+
+        # Events: indexes and counters are maintained by subscribers
+        self.event_bus = EventBus(
+            EventOutbox(self.file_storage) if self.settings.event_outbox else None
+        )
+        IndexEventHandler(
+            self.post_repository,
+            self.agent_repository,
+            self.search_repository,
+            self.post_index,
+            self.agent_index,
+        ).subscribe(self.event_bus)
+        AgentStatsEventHandler(self.agent_repository).subscribe(self.event_bus)
+        self.change_log = ChangeLog(self.file_storage)
+        ChangeFeedEventHandler(self.change_log).subscribe(self.event_bus)
+        self.agent_inbox = AgentInbox(self.file_storage)
+        InboxEventHandler(self.post_repository, self.agent_repository, self.agent_inbox).subscribe(
+            self.event_bus
+        )
+        # Subscribed after the index handlers so that listings are re-rendered from fresh indexes
+        self.response_cache = ResponseCache(self.change_log, self.settings.response_cache_bytes)
+        self.response_cache.subscribe(self.event_bus)
+        self.read_coalescer = ReadCoalescer()
+        self.read_coalescer.subscribe(self.event_bus)
+        if self.settings.event_dispatch == "background":
+            self.event_bus.start()
+
+        # Use Cases: every execution is timed, and identical concurrent reads of
+        # hot threads and pages share one execution
+        self.use_case_metrics = UseCaseMetrics()
+        timed = self.use_case_metrics.wrap
+
+        # Use Cases - Agent
+        self.register_agent_use_case = timed(
+            RegisterAgentUseCase(
+                self.agent_repository,
+                self.agent_domain_service,
+                self.event_bus,
+            )
+        )
+        self.get_agent_profile_use_case = timed(GetAgentProfileUseCase(self.agent_repository))
+        self.list_agents_use_case = timed(ListAgentsUseCase(self.agent_repository))
+        self.get_inbox_use_case = timed(GetInboxUseCase(self.agent_repository, self.agent_inbox))
+
+        # Use Cases - Post
+        self.create_post_use_case = timed(
+            CreatePostUseCase(
+                self.post_repository,
+                self.agent_repository,
+                self.event_bus,
+            )
+        )
+        self.get_post_use_case = self.read_coalescer.wrap(
+            timed(GetPostUseCase(self.post_repository))
+        )
+        self.browse_posts_use_case = self.read_coalescer.wrap(
+            timed(BrowsePostsUseCase(self.post_repository))
+        )
+        self.search_posts_use_case = self.read_coalescer.wrap(
+            timed(SearchPostsUseCase(self.search_repository))
+        )
+        self.list_tags_use_case = self.read_coalescer.wrap(
+            timed(ListTagsUseCase(self.search_repository))
+        )
+        self.get_updates_use_case = timed(GetUpdatesUseCase(self.post_repository, self.change_log))
+        self.delete_post_use_case = timed(DeletePostUseCase(self.post_repository, self.event_bus))
+
+        # Use Cases - Reply
+        self.create_reply_use_case = timed(
+            CreateReplyUseCase(
+                self.post_repository,
+                self.agent_repository,
+                self.event_bus,
+            )
+        )
+        self.delete_reply_use_case = timed(DeleteReplyUseCase(self.post_repository, self.event_bus))
+
+        # Request latency, recorded by the REST middleware and the MCP server
+        self.route_latency = HistogramFamily()
+        self.tool_latency = HistogramFamily()
+
+
+_container: Container | None = None
+_container_lock = threading.Lock()
+
+
+def get_container() -> Container:
+    """Get the application-scoped container, creating it from the environment on first use.
+
+    Returns:
+        Shared container
+    """
+    global _container
+    with _container_lock:
+        if _container is None:
+            _container = Container()
+        return _container
+
+
+def set_container(container: Container) -> None:
+    """Install the application-scoped container.
+
+    Called once at startup by ``create_app`` so that the MCP tools mounted in
+    the app use the same container as the REST routers.
+
+    Args:
+        container: Container to share
+    """
+    global _container
+    with _container_lock:
+        _container = container
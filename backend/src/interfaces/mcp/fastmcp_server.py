@@ -1,6 +1,6 @@
 """FastMCP Server for LLM Agent BBS with SSE transport.
 
-This server provides 10 tools for LLM agents to interact with the BBS via HTTP/SSE:
+This server provides 13 tools for LLM agents to interact with the BBS via HTTP/SSE:
 1. register_agent - Register a new agent
 2. create_post - Create a new post
 3. create_reply - Reply to a post or another reply
@@ -11,21 +11,28 @@ This server provides 10 tools for LLM agents to interact with the BBS via HTTP/S
 8. soft_delete_reply - Soft delete a reply
 9. get_agent_profile - Get agent profile and stats
 10. list_agents - List all registered agents
+11. get_updates_since - Get the changes made after a sequence number
+12. get_inbox - Get replies to your posts and replies, and mentions of you
+13. list_tags - List the most used tags
 """
 
-from pathlib import Path
-from typing import Any
+import time
+from typing import TYPE_CHECKING, Any
 
+import mcp.types as mt
 from fastmcp import FastMCP
+from fastmcp.server.middleware import CallNext, Middleware, MiddlewareContext
 
 from src.application.dtos.agent_dto import CreateAgentDTO
+from src.application.dtos.inbox_dto import GetInboxDTO
 from src.application.dtos.post_dto import CreatePostDTO, SearchPostsDTO
 from src.application.dtos.reply_dto import CreateReplyDTO, DeletePostDTO, DeleteReplyDTO
-from src.interfaces.mcp.container import Container
+from src.application.dtos.update_dto import GetUpdatesDTO
+from src.infrastructure.tracing import start_trace
+from src.interfaces.container import get_container
 
-# Initialize container with data directory
-DATA_DIR = Path(__file__).parent.parent.parent.parent / "data"
-container = Container(DATA_DIR)
+if TYPE_CHECKING:
+    from fastmcp.tools.tool import ToolResult
 
 # Create FastMCP server
 mcp = FastMCP(
@@ -43,12 +50,69 @@ Available tools:
 - soft_delete_reply: Delete your own replies
 - get_agent_profile: View agent profiles and stats
 - list_agents: List all registered agents
+- get_updates_since: Check for new posts and replies since your last check
+- get_inbox: Check for replies to you and mentions of you
+- list_tags: See which tags are in use and how many posts carry them
 """,
 )
 
 
+class ToolMetricsMiddleware(Middleware):
+    """Records the latency of every tool call per tool and outcome."""
+
+    async def on_call_tool(
+        self,
+        context: MiddlewareContext[mt.CallToolRequestParams],
+        call_next: "CallNext[mt.CallToolRequestParams, ToolResult]",
+    ) -> "ToolResult":
+        """Time a tool call.
+
+        Args:
+            context: Middleware context holding the tool call request
+            call_next: Next handler
+
+        Returns:
+            Tool result
+        """
+        latency = get_container().tool_latency
+        started = time.perf_counter()
+        try:
+            result = await call_next(context)
+        except Exception:
+            latency.labels(context.message.name, "error").observe(time.perf_counter() - started)
+            raise
+        latency.labels(context.message.name, "ok").observe(time.perf_counter() - started)
+        return result
+
+
+class ToolTracingMiddleware(Middleware):
+    """Starts a trace for every sampled tool call."""
+
+    async def on_call_tool(
+        self,
+        context: MiddlewareContext[mt.CallToolRequestParams],
+        call_next: "CallNext[mt.CallToolRequestParams, ToolResult]",
+    ) -> "ToolResult":
+        """Trace a tool call.
+
+        Args:
+            context: Middleware context holding the tool call request
+            call_next: Next handler
+
+        Returns:
+            Tool result
+        """
+        name = context.message.name
+        with start_trace(f"mcp.tool {name}", **{"mcp.tool.name": name}):
+            return await call_next(context)
+
+
+mcp.add_middleware(ToolTracingMiddleware())
+mcp.add_middleware(ToolMetricsMiddleware())
+
+
 @mcp.tool(description="Register a new agent in the BBS. Each agent must have a unique name.")
-def register_agent(
+async def register_agent(
     agent_name: str,
     description: str,
     metadata: dict[str, Any] | None = None,
@@ -63,12 +127,13 @@ def register_agent(
     Returns:
         Agent registration result
     """
+    container = get_container()
     dto = CreateAgentDTO(
         agent_name=agent_name,
         description=description,
         metadata=metadata,
     )
-    result = container.register_agent_use_case.execute(dto)
+    result = await container.executor.run(container.register_agent_use_case.execute, dto)
     return {
         "success": True,
         "agent": {
@@ -80,7 +145,7 @@ def register_agent(
 
 
 @mcp.tool(description="Create a new post in the BBS.")
-def create_post(
+async def create_post(
     agent_name: str,
     title: str,
     content: str,
@@ -97,13 +162,14 @@ def create_post(
     Returns:
         Created post details
     """
+    container = get_container()
     dto = CreatePostDTO(
         agent_name=agent_name,
         title=title,
         content=content,
         tags=tags,
     )
-    result = container.create_post_use_case.execute(dto)
+    result = await container.executor.run(container.create_post_use_case.execute, dto)
     return {
         "success": True,
         "post": {
@@ -117,7 +183,7 @@ def create_post(
 
 
 @mcp.tool(description="Reply to a post or another reply.")
-def create_reply(
+async def create_reply(
     post_id: str,
     parent_id: str,
     parent_type: str,
@@ -136,6 +202,7 @@ def create_reply(
     Returns:
         Created reply details
     """
+    container = get_container()
     dto = CreateReplyDTO(
         post_id=post_id,
         parent_id=parent_id,
@@ -143,7 +210,7 @@ def create_reply(
         agent_name=agent_name,
         content=content,
     )
-    result = container.create_reply_use_case.execute(dto)
+    result = await container.executor.run(container.create_reply_use_case.execute, dto)
     return {
         "success": True,
         "reply": {
@@ -156,37 +223,49 @@ def create_reply(
     }
 
 
-@mcp.tool(description="Search for posts using various filters.")
-def search_posts(
+@mcp.tool(
+    description="Search posts by text (titles, bodies and replies) and filters, "
+    "sorted by newest or relevance."
+)
+async def search_posts(
     query: str | None = None,
     tags: list[str] | None = None,
     agent_name: str | None = None,
     limit: int = 50,
     offset: int = 0,
+    sort_by: str = "newest",
+    cursor: str | None = None,
 ) -> dict[str, Any]:
     """Search for posts.
 
     Args:
-        query: Text search query (searches in title)
-        tags: Filter by tags
+        query: Text search query (searches titles, post bodies and replies)
+        tags: Filter by tags: posts must carry one of the plain tags, every tag
+            prefixed with '+' and none prefixed with '-' (e.g. ["python", "+async", "-draft"])
         agent_name: Filter by agent name
         limit: Maximum number of results (default: 50)
         offset: Number of results to skip (default: 0)
+        sort_by: 'newest' (default) or 'relevance' to rank by how well posts match the query
+        cursor: next_cursor from the previous call, to fetch the next page (newest order)
 
     Returns:
         Search results
     """
+    container = get_container()
     dto = SearchPostsDTO(
         query=query,
         tags=tags,
         agent_name=agent_name,
         limit=limit,
         offset=offset,
+        sort_by=sort_by,
+        cursor=cursor,
     )
-    results = container.search_posts_use_case.execute(dto)
+    page = await container.search_posts_use_case.execute_on(container.executor, dto)
     return {
         "success": True,
-        "count": len(results),
+        "count": len(page.posts),
+        "next_cursor": page.next_cursor,
         "posts": [
             {
                 "post_id": p.post_id,
@@ -196,7 +275,7 @@ def search_posts(
                 "created_at": p.created_at,
                 "reply_count": p.reply_count,
             }
-            for p in results
+            for p in page.posts
         ],
     }
 
@@ -219,7 +298,7 @@ def _serialize_replies(replies: list) -> list[dict]:
 
 
 @mcp.tool(description="Get a post with all its replies (nested tree structure).")
-def get_post(post_id: str) -> dict[str, Any]:
+async def get_post(post_id: str) -> dict[str, Any]:
     """Get a post with replies.
 
     Args:
@@ -228,7 +307,8 @@ def get_post(post_id: str) -> dict[str, Any]:
     Returns:
         Post with nested replies
     """
-    result = container.get_post_use_case.execute(post_id)
+    container = get_container()
+    result = await container.get_post_use_case.execute_on(container.executor, post_id)
     return {
         "success": True,
         "post": {
@@ -244,30 +324,42 @@ def get_post(post_id: str) -> dict[str, Any]:
     }
 
 
-@mcp.tool(description="Browse recent posts with pagination.")
-def browse_posts(
+@mcp.tool(
+    description="Browse recent posts, newest first. Pass next_cursor back as cursor "
+    "to get the next page."
+)
+async def browse_posts(
     limit: int = 50,
     offset: int = 0,
     agent_name: str | None = None,
+    cursor: str | None = None,
+    include_total: bool = False,
 ) -> dict[str, Any]:
     """Browse recent posts.
 
     Args:
         limit: Maximum number of posts (default: 50)
-        offset: Number of posts to skip (default: 0)
+        offset: Number of posts to skip (default: 0, ignored when a cursor is given)
         agent_name: Optional filter by agent name
+        cursor: next_cursor from the previous call, to fetch the next page
+        include_total: Whether to include an estimated total number of posts
 
     Returns:
         List of recent posts
     """
-    results = container.browse_posts_use_case.execute(
+    container = get_container()
+    page = await container.browse_posts_use_case.execute_on(
+        container.executor,
         limit=limit,
         offset=offset,
         agent_name=agent_name,
+        cursor=cursor,
+        include_total=include_total,
     )
-    return {
+    result: dict[str, Any] = {
         "success": True,
-        "count": len(results),
+        "count": len(page.posts),
+        "next_cursor": page.next_cursor,
         "posts": [
             {
                 "post_id": p.post_id,
@@ -277,13 +369,78 @@ def browse_posts(
                 "created_at": p.created_at,
                 "reply_count": p.reply_count,
             }
-            for p in results
+            for p in page.posts
+        ],
+    }
+    if page.estimated_total is not None:
+        result["estimated_total"] = page.estimated_total
+    return result
+
+
+@mcp.tool(
+    description="Get the posts, replies and deletions made after a sequence number. "
+    "Start with since=0, then pass next_since from the previous call. Use "
+    "scope='participated' with your agent_name to see only threads you took part in, "
+    "instead of re-reading them with get_post."
+)
+async def get_updates_since(
+    since: int = 0,
+    agent_name: str | None = None,
+    scope: str = "all",
+    limit: int = 50,
+    include_content: bool = False,
+) -> dict[str, Any]:
+    """Get the changes made after a sequence number.
+
+    Args:
+        since: next_since from the previous call (0 for all retained changes)
+        agent_name: Agent name, required for the 'authored' and 'participated' scopes
+        scope: 'all', 'authored' (threads you started) or 'participated' (threads you
+            started or replied in)
+        limit: Maximum number of changes (1-100, default: 50)
+        include_content: Whether to include the text of new posts and replies
+
+    Returns:
+        Changes in sequence order and the sequence number to continue from
+    """
+    container = get_container()
+    dto = GetUpdatesDTO(
+        since=since,
+        agent_name=agent_name,
+        scope=scope,
+        limit=limit,
+        include_content=include_content,
+    )
+    page = await container.executor.run(container.get_updates_use_case.execute, dto)
+    return {
+        "success": True,
+        "count": len(page.updates),
+        "next_since": page.next_since,
+        "has_more": page.has_more,
+        "reset": page.reset,
+        "updates": [
+            {
+                key: value
+                for key, value in {
+                    "seq": u.seq,
+                    "type": u.type,
+                    "occurred_at": u.occurred_at,
+                    "post_id": u.post_id,
+                    "agent_name": u.agent_name,
+                    "reply_id": u.reply_id,
+                    "parent_id": u.parent_id,
+                    "title": u.title,
+                    "content": u.content,
+                }.items()
+                if value is not None
+            }
+            for u in page.updates
         ],
     }
 
 
 @mcp.tool(description="Soft delete a post (only the author can delete their posts).")
-def soft_delete_post(post_id: str, agent_name: str) -> dict[str, Any]:
+async def soft_delete_post(post_id: str, agent_name: str) -> dict[str, Any]:
     """Soft delete a post.
 
     Args:
@@ -293,11 +450,12 @@ def soft_delete_post(post_id: str, agent_name: str) -> dict[str, Any]:
     Returns:
         Deletion result
     """
+    container = get_container()
     dto = DeletePostDTO(
         post_id=post_id,
         agent_name=agent_name,
     )
-    container.delete_post_use_case.execute(dto)
+    await container.executor.run(container.delete_post_use_case.execute, dto)
     return {
         "success": True,
         "message": f"Post {post_id} deleted successfully",
@@ -305,7 +463,7 @@ def soft_delete_post(post_id: str, agent_name: str) -> dict[str, Any]:
 
 
 @mcp.tool(description="Soft delete a reply (only the author can delete their replies).")
-def soft_delete_reply(post_id: str, reply_id: str, agent_name: str) -> dict[str, Any]:
+async def soft_delete_reply(post_id: str, reply_id: str, agent_name: str) -> dict[str, Any]:
     """Soft delete a reply.
 
     Args:
@@ -316,12 +474,13 @@ def soft_delete_reply(post_id: str, reply_id: str, agent_name: str) -> dict[str,
     Returns:
         Deletion result
     """
+    container = get_container()
     dto = DeleteReplyDTO(
         post_id=post_id,
         reply_id=reply_id,
         agent_name=agent_name,
     )
-    container.delete_reply_use_case.execute(dto)
+    await container.executor.run(container.delete_reply_use_case.execute, dto)
     return {
         "success": True,
         "message": f"Reply {reply_id} deleted successfully",
@@ -329,7 +488,7 @@ def soft_delete_reply(post_id: str, reply_id: str, agent_name: str) -> dict[str,
 
 
 @mcp.tool(description="Get an agent's profile and statistics.")
-def get_agent_profile(agent_name: str) -> dict[str, Any]:
+async def get_agent_profile(agent_name: str) -> dict[str, Any]:
     """Get agent profile.
 
     Args:
@@ -338,7 +497,8 @@ def get_agent_profile(agent_name: str) -> dict[str, Any]:
     Returns:
         Agent profile with statistics
     """
-    result = container.get_agent_profile_use_case.execute(agent_name)
+    container = get_container()
+    result = await container.executor.run(container.get_agent_profile_use_case.execute, agent_name)
     return {
         "success": True,
         "agent": {
@@ -347,19 +507,22 @@ def get_agent_profile(agent_name: str) -> dict[str, Any]:
             "created_at": result.created_at,
             "post_count": result.post_count,
             "reply_count": result.reply_count,
+            "deleted_count": result.deleted_count,
+            "last_active_at": result.last_active_at,
             "metadata": result.metadata,
         },
     }
 
 
 @mcp.tool(description="List all registered agents.")
-def list_agents() -> dict[str, Any]:
+async def list_agents() -> dict[str, Any]:
     """List all agents.
 
     Returns:
         List of all registered agents
     """
-    results = container.list_agents_use_case.execute()
+    container = get_container()
+    results = await container.executor.run(container.list_agents_use_case.execute)
     return {
         "success": True,
         "count": len(results),
@@ -370,12 +533,78 @@ def list_agents() -> dict[str, Any]:
                 "created_at": a.created_at,
                 "post_count": a.post_count,
                 "reply_count": a.reply_count,
+                "last_active_at": a.last_active_at,
             }
             for a in results
         ],
     }
 
 
+@mcp.tool(
+    description="Get replies to your posts and replies, and mentions of you (@agent_name), "
+    "oldest first. Returns only unread notifications and marks them read, so call it again "
+    "until has_more is false instead of checking each of your posts with get_post."
+)
+async def get_inbox(
+    agent_name: str,
+    limit: int = 50,
+    mark_read: bool = True,
+) -> dict[str, Any]:
+    """Get an agent's unread notifications.
+
+    Args:
+        agent_name: Your agent name
+        limit: Maximum number of notifications (1-100, default: 50)
+        mark_read: Whether to mark the returned notifications read
+
+    Returns:
+        Notifications and whether more unread ones follow
+    """
+    container = get_container()
+    dto = GetInboxDTO(agent_name=agent_name, limit=limit, mark_read=mark_read)
+    page = await container.executor.run(container.get_inbox_use_case.execute, dto)
+    return {
+        "success": True,
+        "count": len(page.notifications),
+        "has_more": page.has_more,
+        "notifications": [
+            {
+                "reply_id": n.reply_id,
+                "post_id": n.post_id,
+                "parent_id": n.parent_id,
+                "agent_name": n.agent_name,
+                "reasons": n.reasons,
+                "occurred_at": n.occurred_at,
+                "title": n.title,
+                "excerpt": n.excerpt,
+            }
+            for n in page.notifications
+        ],
+    }
+
+
+@mcp.tool(
+    description="List the most used tags with the number of posts carrying each, "
+    "to pick tags for search_posts or a new post."
+)
+async def list_tags(limit: int = 50) -> dict[str, Any]:
+    """List the most used tags.
+
+    Args:
+        limit: Maximum number of tags (1-500, default: 50)
+
+    Returns:
+        Tags with their post counts, most used first
+    """
+    container = get_container()
+    results = await container.list_tags_use_case.execute_on(container.executor, limit)
+    return {
+        "success": True,
+        "count": len(results),
+        "tags": [{"tag": t.tag, "post_count": t.post_count} for t in results],
+    }
+
+
 def get_mcp_app():
     """Get the MCP HTTP app for mounting in FastAPI."""
     return mcp.http_app(path="/")
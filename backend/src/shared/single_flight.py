@@ -0,0 +1,178 @@
+"""Coalescing of identical concurrent calls."""
+
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import asdict, dataclass
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class SingleFlightStats:
+    """Point-in-time counters of a ``SingleFlight``."""
+
+    executed: int
+    shared: int
+    in_flight: int
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert stats to dictionary.
+
+        Returns:
+            Dictionary representation of stats
+        """
+        return asdict(self)
+
+
+class _Call:
+    """A call in progress and, once finished, its outcome."""
+
+    def __init__(self) -> None:
+        """Initialize call."""
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Runs at most one call per key at a time and shares its outcome.
+
+    A caller that arrives while a call with the same key is running waits for
+    it and receives the same result (or exception) instead of repeating the
+    work. Nothing is cached: once the call finishes, the next caller with that
+    key runs it again.
+    """
+
+    def __init__(self) -> None:
+        """Initialize single flight group."""
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call] = {}
+        self._executed = 0
+        self._shared = 0
+
+    def do(self, key: Hashable, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a call, or wait for the identical call already running.
+
+        Args:
+            key: Identifies calls that are interchangeable
+            fn: Function to call
+            *args: Positional arguments for ``fn``
+            **kwargs: Keyword arguments for ``fn``
+
+        Returns:
+            Result of the call (shared between the callers; do not modify it)
+
+        Raises:
+            Exception: Whatever the call raised
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self._executed += 1
+            else:
+                self._shared += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn(*args, **kwargs)
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def stats(self) -> SingleFlightStats:
+        """Get a snapshot of the counters.
+
+        Returns:
+            Single flight stats
+        """
+        with self._lock:
+            return SingleFlightStats(
+                executed=self._executed,
+                shared=self._shared,
+                in_flight=len(self._calls),
+            )
+
+
+class AsyncSingleFlight:
+    """Runs at most one coroutine per key at a time and shares its outcome.
+
+    The asynchronous counterpart of ``SingleFlight``: a caller that arrives
+    while a call with the same key is running awaits it, without holding a
+    thread. The call runs in a task of its own, so a caller that is cancelled
+    cancels neither the call nor the other callers. Calls are only shared
+    between callers on the same event loop.
+    """
+
+    def __init__(self) -> None:
+        """Initialize single flight group."""
+        self._lock = threading.Lock()
+        self._tasks: dict[Hashable, asyncio.Task[Any]] = {}
+        self._executed = 0
+        self._shared = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run a call, or await the identical call already running.
+
+        Args:
+            key: Identifies calls that are interchangeable
+            fn: Starts the call
+
+        Returns:
+            Result of the call (shared between the callers; do not modify it)
+
+        Raises:
+            Exception: Whatever the call raised
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            task = self._tasks.get(key)
+            if task is not None and task.get_loop() is loop:
+                self._shared += 1
+            else:
+                task = loop.create_task(fn())
+                self._executed += 1
+                if key not in self._tasks:
+                    self._tasks[key] = task
+                    task.add_done_callback(lambda done: self._finished(key, done))
+        return await asyncio.shield(task)
+
+    def _finished(self, key: Hashable, task: asyncio.Task[Any]) -> None:
+        """Forget a finished call.
+
+        Args:
+            key: Key of the call
+            task: Finished task
+        """
+        with self._lock:
+            if self._tasks.get(key) is task:
+                del self._tasks[key]
+        if not task.cancelled():
+            # Retrieve the exception so that it is not reported when every caller has gone
+            task.exception()
+
+    def stats(self) -> SingleFlightStats:
+        """Get a snapshot of the counters.
+
+        Returns:
+            Single flight stats
+        """
+        with self._lock:
+            return SingleFlightStats(
+                executed=self._executed,
+                shared=self._shared,
+                in_flight=len(self._tasks),
+            )
@@ -0,0 +1,181 @@
+"""Reproducible synthetic corpus for benchmarks and load tests."""
+
+import itertools
+import random
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta
+from typing import Any
+
+from src.domain.entities.agent import Agent
+from src.domain.entities.post import Post
+from src.domain.entities.reply import Reply
+from src.domain.value_objects.agent_name import AgentName
+from src.domain.value_objects.content import Content
+from src.domain.value_objects.post_id import PostId
+from src.domain.value_objects.tags import Tags
+from src.interfaces.container import Container
+
+CORPUS_START = datetime(2025, 1, 1)
+SYLLABLES = ["ka", "lo", "mi", "ren", "to", "sha", "vel", "dor", "qui", "nep", "zu", "ar"]
+
+
+@dataclass(frozen=True)
+class CorpusSpec:
+    """Shape of a synthetic corpus.
+
+    Agents, tags and words are drawn from Zipf-like distributions, so a few
+    agents write most posts and a few tags and words are very common, as on
+    a real board. The same spec and seed always produce the same corpus.
+    """
+
+    posts: int = 1000
+    agents: int = 50
+    tags: int = 200
+    tags_per_post: tuple[int, int] = (0, 4)
+    tag_skew: float = 1.1
+    agent_skew: float = 1.0
+    replies_per_post: tuple[int, int] = (0, 8)
+    reply_depth: int = 4
+    reply_fanout: int = 3
+    post_words: tuple[int, int] = (20, 400)
+    reply_words: tuple[int, int] = (5, 120)
+    vocabulary: int = 5000
+    seed: int = 42
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert spec to dictionary.
+
+        Returns:
+            Dictionary representation of the spec
+        """
+        return asdict(self)
+
+
+@dataclass
+class Corpus:
+    """Names and IDs of a generated corpus, used to pick benchmark inputs."""
+
+    spec: CorpusSpec
+    post_ids: list[str] = field(default_factory=list)
+    agent_names: list[str] = field(default_factory=list)
+    tags: list[str] = field(default_factory=list)
+    words: list[str] = field(default_factory=list)
+    replies: int = 0
+
+
+def _zipf_weights(count: int, skew: float) -> list[float]:
+    """Get cumulative Zipf weights for ``count`` ranked items."""
+    return list(itertools.accumulate(1 / (rank + 1) ** skew for rank in range(count)))
+
+
+class CorpusGenerator:
+    """Writes a synthetic corpus through the repositories of a container.
+
+    Entities are saved directly instead of through the use cases, and the
+    indexes and counters are rebuilt once at the end, which is much faster
+    than publishing an event per write.
+    """
+
+    def __init__(self, spec: CorpusSpec) -> None:
+        """Initialize generator.
+
+        Args:
+            spec: Corpus shape
+        """
+        self.spec = spec
+        self._rng = random.Random(spec.seed)
+        self._words = self._make_vocabulary(spec.vocabulary)
+        self._word_weights = _zipf_weights(len(self._words), 1.0)
+        self._tags = [f"tag-{i:03d}" for i in range(spec.tags)]
+        self._tag_weights = _zipf_weights(len(self._tags), spec.tag_skew)
+        self._agents = [f"agent-{i:04d}" for i in range(spec.agents)]
+        self._agent_weights = _zipf_weights(len(self._agents), spec.agent_skew)
+
+    def _make_vocabulary(self, size: int) -> list[str]:
+        """Make distinct pseudo-words, most frequent first."""
+        words: dict[str, None] = {}
+        while len(words) < size:
+            length = self._rng.randint(2, 4)
+            words["".join(self._rng.choice(SYLLABLES) for _ in range(length))] = None
+        return list(words)
+
+    def _text(self, bounds: tuple[int, int]) -> str:
+        """Make a paragraph of random words."""
+        count = self._rng.randint(*bounds)
+        return " ".join(self._rng.choices(self._words, cum_weights=self._word_weights, k=count))
+
+    def _agent(self) -> AgentName:
+        """Pick an author."""
+        return AgentName(self._rng.choices(self._agents, cum_weights=self._agent_weights)[0])
+
+    def _id(self, prefix: str, created_at: datetime) -> str:
+        """Make an ID in the format of generated post and reply IDs."""
+        return f"{prefix}_{int(created_at.timestamp())}_{self._rng.getrandbits(32):08x}"
+
+    def generate(self, container: Container) -> Corpus:
+        """Write the corpus into an empty container.
+
+        Args:
+            container: Container whose repositories receive the corpus
+
+        Returns:
+            Description of the generated corpus
+        """
+        corpus = Corpus(spec=self.spec, agent_names=list(self._agents), tags=list(self._tags))
+        corpus.words = self._words[:50]
+
+        agents = [
+            Agent(AgentName(name), f"Synthetic agent {name}", created_at=CORPUS_START)
+            for name in self._agents
+        ]
+        for agent in agents:
+            container.agent_repository.save(agent)
+        if container.agent_index is not None:
+            container.agent_index.rebuild_from_agents([agent.to_dict() for agent in agents])
+
+        for number in range(self.spec.posts):
+            post = self._post(CORPUS_START + timedelta(minutes=number))
+            container.post_repository.save(post)
+            corpus.post_ids.append(post.post_id.value)
+            corpus.replies += post.reply_count
+
+        container.search_repository.rebuild_index()
+        container.agent_repository.rebuild_stats()
+        return corpus
+
+    def _post(self, created_at: datetime) -> Post:
+        """Make a post with its reply tree."""
+        tag_count = min(self._rng.randint(*self.spec.tags_per_post), Tags.MAX_TAGS)
+        tags = dict.fromkeys(
+            self._rng.choices(self._tags, cum_weights=self._tag_weights, k=tag_count)
+        )
+        post = Post(
+            post_id=PostId(self._id("post", created_at)),
+            title=self._text((3, 10)).capitalize(),
+            agent_name=self._agent(),
+            content=Content(self._text(self.spec.post_words)),
+            tags=Tags(list(tags)),
+            created_at=created_at,
+            updated_at=created_at,
+        )
+
+        # Each reply goes under a random node that is neither too deep nor too full
+        open_nodes: list[tuple[Post | Reply, int]] = [(post, 0)]
+        for number in range(self._rng.randint(*self.spec.replies_per_post)):
+            parent, depth = self._rng.choice(open_nodes)
+            reply_at = created_at + timedelta(seconds=number + 1)
+            reply = Reply(
+                reply_id=self._id("reply", reply_at),
+                post_id=post.post_id.value,
+                parent_id=post.post_id.value if parent is post else parent.reply_id,
+                parent_type="post" if parent is post else "reply",
+                agent_name=self._agent(),
+                content=Content(self._text(self.spec.reply_words)),
+                created_at=reply_at,
+            )
+            parent.add_reply(reply)
+            if len(parent.replies) >= self.spec.reply_fanout and parent is not post:
+                open_nodes.remove((parent, depth))
+            if depth + 1 < self.spec.reply_depth:
+                open_nodes.append((reply, depth + 1))
+        return post
@@ -0,0 +1,446 @@
+"""Load test driving a mix of REST requests and MCP tool calls against a server.
+
+Usage (from the backend directory):
+    python -m tests.benchmarks.load [--rate 100] [--duration 30] [--posts 1000]
+        [--mix rest:get_post=5,mcp:create_reply=1] [--url http://host:port] [--output load.json]
+
+Without ``--url`` a server is started in this process with ``create_app()``
+on a generated corpus, and the time each endpoint spent waiting for file
+locks is reported alongside its latency. Requests are sent open-loop at the
+target rate: a slow server makes requests overlap instead of slowing the
+generator down, up to ``--max-in-flight`` requests.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import socket
+import sys
+import tempfile
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from contextlib import AsyncExitStack
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import httpx
+import uvicorn
+from fastmcp import Client
+from fastmcp.client.transports import StreamableHttpTransport
+
+from src.infrastructure.utils.file_lock import LockWaitRecorder, record_lock_waits
+from src.interfaces.api.main import create_app
+from src.interfaces.container import Container
+from tests.benchmarks.corpus import CorpusGenerator, CorpusSpec
+from tests.benchmarks.run import percentile
+
+# Request header naming the operation, used to credit lock waits to it
+LABEL_HEADER = "x-load-label"
+
+DEFAULT_MIX = {
+    "rest:list_posts": 20,
+    "rest:get_post": 20,
+    "rest:search": 10,
+    "rest:list_agents": 2,
+    "mcp:get_post": 15,
+    "mcp:browse_posts": 10,
+    "mcp:search_posts": 8,
+    "mcp:get_inbox": 8,
+    "mcp:create_reply": 5,
+    "mcp:create_post": 2,
+}
+
+
+class LockWaitMiddleware:
+    """ASGI middleware crediting lock waits to the operation named in a header.
+
+    MCP sessions keep the context of the request that opened them, so each
+    MCP operation uses its own session with a fixed label.
+    """
+
+    def __init__(self, app: Any) -> None:
+        """Initialize middleware.
+
+        Args:
+            app: ASGI application
+        """
+        self.app = app
+        self.recorders: dict[str, LockWaitRecorder] = {}
+
+    async def __call__(self, scope: dict, receive: Callable, send: Callable) -> None:
+        """Handle a request."""
+        label = dict(scope.get("headers", [])).get(LABEL_HEADER.encode())
+        if scope["type"] != "http" or label is None:
+            await self.app(scope, receive, send)
+            return
+        recorder = self.recorders.setdefault(label.decode(), LockWaitRecorder())
+        with record_lock_waits(recorder):
+            await self.app(scope, receive, send)
+
+
+@dataclass
+class OperationStats:
+    """Outcomes of one operation during a run."""
+
+    latencies_ms: list[float] = field(default_factory=list)
+    errors: dict[str, int] = field(default_factory=dict)
+
+    def record(self, started: float, error: str | None) -> None:
+        """Record one call.
+
+        Args:
+            started: ``perf_counter`` value when the call was sent
+            error: Short error description, None on success
+        """
+        if error is None:
+            self.latencies_ms.append((time.perf_counter() - started) * 1000)
+        else:
+            self.errors[error] = self.errors.get(error, 0) + 1
+
+
+@dataclass
+class Target:
+    """Clients for the server under test and inputs for the operations."""
+
+    http: httpx.AsyncClient
+    mcp: dict[str, Client]
+    post_ids: list[str]
+    agents: list[str]
+    words: list[str]
+    rng: random.Random
+
+    async def rest(self, name: str, path: str, **params: Any) -> None:
+        """Send a REST request, raising on an error status."""
+        response = await self.http.get(path, params=params, headers={LABEL_HEADER: name})
+        response.raise_for_status()
+
+    async def tool(self, name: str, tool: str, **arguments: Any) -> dict[str, Any]:
+        """Call an MCP tool, raising if it fails."""
+        result = await self.mcp[name].call_tool(tool, arguments)
+        data = result.structured_content or {}
+        if not data.get("success", True):
+            raise RuntimeError(data.get("error", "tool failed"))
+        return data
+
+
+async def create_post(target: Target, name: str) -> None:
+    """Create a post and remember it for later reads."""
+    data = await target.tool(
+        name,
+        "create_post",
+        agent_name=target.rng.choice(target.agents),
+        title=" ".join(target.rng.choices(target.words, k=5)),
+        content=" ".join(target.rng.choices(target.words, k=60)),
+    )
+    target.post_ids.append(data["post"]["post_id"])
+
+
+async def create_reply(target: Target, name: str) -> None:
+    """Reply to a random post, mentioning another agent now and then."""
+    post_id = target.rng.choice(target.post_ids)
+    mention = f" @{target.rng.choice(target.agents)}" if target.rng.random() < 0.2 else ""
+    await target.tool(
+        name,
+        "create_reply",
+        post_id=post_id,
+        parent_id=post_id,
+        parent_type="post",
+        agent_name=target.rng.choice(target.agents),
+        content=" ".join(target.rng.choices(target.words, k=20)) + mention,
+    )
+
+
+OPERATIONS: dict[str, Callable[[Target, str], Awaitable[Any]]] = {
+    "rest:list_posts": lambda t, n: t.rest(n, "/api/v1/posts", limit=20),
+    "rest:get_post": lambda t, n: t.rest(n, f"/api/v1/posts/{t.rng.choice(t.post_ids)}"),
+    "rest:search": lambda t, n: t.rest(n, "/api/v1/search", q=t.rng.choice(t.words), limit=20),
+    "rest:list_agents": lambda t, n: t.rest(n, "/api/v1/agents"),
+    "mcp:get_post": lambda t, n: t.tool(n, "get_post", post_id=t.rng.choice(t.post_ids)),
+    "mcp:browse_posts": lambda t, n: t.tool(n, "browse_posts", limit=20),
+    "mcp:search_posts": lambda t, n: t.tool(
+        n, "search_posts", query=t.rng.choice(t.words), limit=20
+    ),
+    "mcp:get_inbox": lambda t, n: t.tool(
+        n, "get_inbox", agent_name=t.rng.choice(t.agents), limit=20
+    ),
+    "mcp:create_reply": create_reply,
+    "mcp:create_post": create_post,
+}
+
+
+def parse_mix(text: str) -> dict[str, int]:
+    """Parse a ``name=weight,...`` operation mix.
+
+    Args:
+        text: Mix specification
+
+    Returns:
+        Operation names mapped to weights
+
+    Raises:
+        ValueError: If an operation is unknown or a weight is not a positive integer
+    """
+    mix: dict[str, int] = {}
+    for item in text.split(","):
+        name, _, weight = item.strip().partition("=")
+        if name not in OPERATIONS:
+            raise ValueError(
+                f"Unknown operation '{name}', expected one of: {', '.join(OPERATIONS)}"
+            )
+        mix[name] = int(weight or 1)
+        if mix[name] < 1:
+            raise ValueError(f"Weight of {name} must be positive")
+    return mix
+
+
+class LocalServer:
+    """A ``create_app()`` instance served by uvicorn on a thread of this process."""
+
+    def __init__(self, data_dir: Path, backend: str) -> None:
+        """Initialize server.
+
+        Args:
+            data_dir: Data directory of the app
+            backend: Storage backend
+        """
+        self.middleware = LockWaitMiddleware(create_app(data_dir, backend))
+        self._socket = socket.socket()
+        # Otherwise responses written in two parts wait for the client's delayed ACK
+        self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._socket.bind(("127.0.0.1", 0))
+        self.url = f"http://127.0.0.1:{self._socket.getsockname()[1]}"
+        self._server = uvicorn.Server(uvicorn.Config(self.middleware, log_level="warning"))
+        self._thread = threading.Thread(
+            target=self._server.run, kwargs={"sockets": [self._socket]}, daemon=True
+        )
+
+    def __enter__(self) -> "LocalServer":
+        """Start serving."""
+        self._thread.start()
+        while not self._server.started:
+            if not self._thread.is_alive():
+                raise RuntimeError("Server failed to start")
+            time.sleep(0.01)
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        """Stop serving."""
+        self._server.should_exit = True
+        self._thread.join(timeout=30)
+
+
+async def drive(
+    url: str, mix: dict[str, int], rate: float, duration: float, max_in_flight: int, seed: int
+) -> tuple[dict[str, OperationStats], int, float, dict[str, Any]]:
+    """Send the operation mix at a fixed rate.
+
+    Args:
+        url: Base URL of the server
+        mix: Operation names mapped to weights
+        rate: Requests per second
+        duration: Seconds to send requests for
+        max_in_flight: Requests allowed to be outstanding; more are dropped
+        seed: Seed for choosing operations and inputs
+
+    Returns:
+        Per-operation stats, number of dropped requests, elapsed seconds and
+        the server's health report after the run
+    """
+    rng = random.Random(seed)
+    stats = {name: OperationStats() for name in mix}
+    async with AsyncExitStack() as stack:
+        http = await stack.enter_async_context(
+            httpx.AsyncClient(base_url=url, timeout=60, limits=httpx.Limits(max_connections=None))
+        )
+        posts = (await http.get("/api/v1/posts", params={"limit": 100})).json()["posts"]
+        agents = (await http.get("/api/v1/agents")).json()["agents"]
+        target = Target(
+            http=http,
+            mcp={},
+            post_ids=[p["post_id"] for p in posts],
+            agents=[a["agent_name"] for a in agents],
+            words=sorted({w.lower() for p in posts for w in p["title"].split()}),
+            rng=rng,
+        )
+        for name in mix:
+            if name.startswith("mcp:"):
+                transport = StreamableHttpTransport(f"{url}/mcp/", headers={LABEL_HEADER: name})
+                target.mcp[name] = await stack.enter_async_context(Client(transport, timeout=60))
+
+        async def call(name: str) -> None:
+            started = time.perf_counter()
+            try:
+                await OPERATIONS[name](target, name)
+                stats[name].record(started, None)
+            except httpx.HTTPStatusError as e:
+                stats[name].record(started, f"HTTP {e.response.status_code}")
+            except Exception as e:
+                stats[name].record(started, type(e).__name__)
+
+        names, weights = list(mix), list(mix.values())
+        pending: set[asyncio.Task] = set()
+        dropped = 0
+        started = time.perf_counter()
+        for number in range(int(rate * duration)):
+            delay = started + number / rate - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            if len(pending) >= max_in_flight:
+                dropped += 1
+                continue
+            task = asyncio.create_task(call(rng.choices(names, weights)[0]))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+        await asyncio.gather(*pending)
+        elapsed = time.perf_counter() - started
+        health = (await http.get("/health")).json()["data"]
+    return stats, dropped, elapsed, health
+
+
+def summarize(
+    stats: dict[str, OperationStats],
+    elapsed: float,
+    recorders: dict[str, LockWaitRecorder] | None,
+) -> list[dict[str, Any]]:
+    """Summarize each operation.
+
+    Args:
+        stats: Per-operation stats
+        elapsed: Length of the run in seconds
+        recorders: Lock waits per operation, None if the server is remote
+
+    Returns:
+        One summary dictionary per operation
+    """
+    rows = []
+    for name, op in sorted(stats.items()):
+        latencies = sorted(op.latencies_ms)
+        failed = sum(op.errors.values())
+        total = len(latencies) + failed
+        recorder = recorders.get(name) if recorders is not None else None
+        rows.append(
+            {
+                "operation": name,
+                "requests": total,
+                "throughput_rps": len(latencies) / elapsed,
+                "error_rate": failed / total if total else 0.0,
+                "errors": op.errors,
+                "p50_ms": percentile(latencies, 0.50) if latencies else None,
+                "p95_ms": percentile(latencies, 0.95) if latencies else None,
+                "p99_ms": percentile(latencies, 0.99) if latencies else None,
+                "lock_wait_ms_per_request": (
+                    recorder.wait_seconds * 1000 / total if recorder and total else None
+                ),
+                "lock_acquisitions_per_request": (
+                    recorder.acquisitions / total if recorder and total else None
+                ),
+            }
+        )
+    return rows
+
+
+def run_load(
+    mix: dict[str, int],
+    rate: float,
+    duration: float,
+    spec: CorpusSpec,
+    backend: str = "file",
+    url: str | None = None,
+    max_in_flight: int = 256,
+) -> dict[str, Any]:
+    """Run a load test and build its report.
+
+    Args:
+        mix: Operation names mapped to weights
+        rate: Requests per second
+        duration: Seconds to send requests for
+        spec: Corpus to generate for a local server
+        backend: Storage backend of a local server
+        url: Base URL of a running server; a local one is started if None
+        max_in_flight: Requests allowed to be outstanding
+
+    Returns:
+        Report dictionary
+    """
+    settings = {"rate": rate, "duration": duration, "mix": mix, "max_in_flight": max_in_flight}
+    if url is not None:
+        stats, dropped, elapsed, health = asyncio.run(
+            drive(url, mix, rate, duration, max_in_flight, spec.seed)
+        )
+        recorders = None
+    else:
+        with tempfile.TemporaryDirectory(prefix="bbs-load-") as data_dir:
+            CorpusGenerator(spec).generate(Container(Path(data_dir), storage_backend=backend))
+            with LocalServer(Path(data_dir), backend) as server:
+                stats, dropped, elapsed, health = asyncio.run(
+                    drive(server.url, mix, rate, duration, max_in_flight, spec.seed)
+                )
+                recorders = server.middleware.recorders
+        settings.update(backend=backend, corpus=spec.to_dict())
+
+    operations = summarize(stats, elapsed, recorders)
+    return {
+        "settings": settings,
+        "elapsed_seconds": elapsed,
+        "dropped": dropped,
+        "throughput_rps": sum(r["throughput_rps"] for r in operations),
+        "operations": operations,
+        "server": {key: health.get(key) for key in ("executor", "locks")},
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the load test from the command line.
+
+    Args:
+        argv: Command line arguments (defaults to sys.argv)
+
+    Returns:
+        Process exit code
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rate", type=float, default=100, help="requests per second")
+    parser.add_argument("--duration", type=float, default=30, help="seconds")
+    parser.add_argument("--mix", type=parse_mix, default=DEFAULT_MIX, help="name=weight,...")
+    parser.add_argument("--posts", type=int, default=1000, help="corpus size of a local server")
+    parser.add_argument("--backend", choices=["file", "sqlite"], default="file")
+    parser.add_argument("--url", help="base URL of a running server instead of a local one")
+    parser.add_argument("--max-in-flight", type=int, default=256)
+    parser.add_argument("--seed", type=int, default=CorpusSpec.seed)
+    parser.add_argument("--output", type=Path, default=Path("load-results.json"))
+    args = parser.parse_args(argv)
+
+    report = run_load(
+        args.mix,
+        args.rate,
+        args.duration,
+        CorpusSpec(posts=args.posts, seed=args.seed),
+        backend=args.backend,
+        url=args.url,
+        max_in_flight=args.max_in_flight,
+    )
+
+    print(
+        f"{'operation':20} {'req':>6} {'rps':>7} {'err%':>6} {'p50':>8} {'p95':>8} {'p99':>8} lock ms"
+    )
+    for row in report["operations"]:
+        print(
+            f"{row['operation']:20} {row['requests']:6} {row['throughput_rps']:7.1f} "
+            f"{row['error_rate'] * 100:6.1f} "
+            + " ".join(f"{row[k] or 0:8.2f}" for k in ("p50_ms", "p95_ms", "p99_ms"))
+            + f" {row['lock_wait_ms_per_request'] or 0:8.3f}"
+        )
+    print(
+        f"\n{report['throughput_rps']:.1f} requests/s over {report['elapsed_seconds']:.1f}s, "
+        f"{report['dropped']} dropped"
+    )
+    args.output.write_text(json.dumps(report, indent=2))
+    print(f"Results written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
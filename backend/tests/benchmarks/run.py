@@ -0,0 +1,296 @@
+"""Scaling benchmarks for the read and write use cases.
+
+Usage (from the backend directory):
+    python -m tests.benchmarks.run [--sizes 1000 10000 100000] [--backend file sqlite]
+        [--iterations 200] [--output benchmark.json] [--baseline previous.json]
+
+Every (backend, size) pair runs in a fresh process on a corpus generated in a
+temporary directory, so peak RSS is not inflated by earlier sizes. Results
+are written as JSON; with ``--baseline`` each p95 is compared with the same
+measurement of an earlier run.
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import random
+import resource
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, replace
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from src.application.dtos.post_dto import SearchPostsDTO
+from src.application.dtos.reply_dto import CreateReplyDTO
+from src.interfaces.container import Container
+from tests.benchmarks.corpus import Corpus, CorpusGenerator, CorpusSpec
+
+DEFAULT_SIZES = (1000, 10000, 100000)
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    """Latency and resource use of one use case at one corpus size."""
+
+    backend: str
+    posts: int
+    use_case: str
+    iterations: int
+    mean_ms: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    read_syscalls: float | None
+    write_syscalls: float | None
+    peak_rss_mb: float
+
+    @property
+    def key(self) -> tuple[str, int, str]:
+        """Identify the same measurement across runs."""
+        return (self.backend, self.posts, self.use_case)
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    """Get a nearest-rank percentile.
+
+    Args:
+        sorted_values: Values in ascending order
+        fraction: Percentile as a fraction between 0 and 1
+
+    Returns:
+        Percentile value
+    """
+    index = max(0, min(len(sorted_values) - 1, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def syscall_counts() -> tuple[int, int] | None:
+    """Get the read and write syscalls made by this process so far (Linux only).
+
+    Returns:
+        Tuple of read and write syscall counts, or None where unavailable
+    """
+    try:
+        fields = dict(line.split(": ") for line in Path("/proc/self/io").read_text().splitlines())
+    except OSError:
+        return None
+    return int(fields["syscr"]), int(fields["syscw"])
+
+
+def peak_rss_mb() -> float:
+    """Get the peak resident set size of this process in MiB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / 1024 / (1024 if sys.platform == "darwin" else 1)
+
+
+def measure(
+    backend: str, posts: int, name: str, call: Callable[[int], Any], iterations: int
+) -> BenchmarkResult:
+    """Time repeated calls of one scenario.
+
+    Args:
+        backend: Storage backend
+        posts: Corpus size
+        name: Scenario name
+        call: Function called with the iteration number
+        iterations: Number of timed calls
+
+    Returns:
+        Benchmark result
+    """
+    call(0)  # warm up imports and lazily loaded indexes
+    latencies: list[float] = []
+    before = syscall_counts()
+    for iteration in range(iterations):
+        started = time.perf_counter()
+        call(iteration)
+        latencies.append((time.perf_counter() - started) * 1000)
+    after = syscall_counts()
+
+    latencies.sort()
+    return BenchmarkResult(
+        backend=backend,
+        posts=posts,
+        use_case=name,
+        iterations=iterations,
+        mean_ms=sum(latencies) / len(latencies),
+        p50_ms=percentile(latencies, 0.50),
+        p95_ms=percentile(latencies, 0.95),
+        p99_ms=percentile(latencies, 0.99),
+        read_syscalls=(after[0] - before[0]) / iterations if before and after else None,
+        write_syscalls=(after[1] - before[1]) / iterations if before and after else None,
+        peak_rss_mb=peak_rss_mb(),
+    )
+
+
+def scenarios(container: Container, corpus: Corpus) -> dict[str, Callable[[int], Any]]:
+    """Build the calls of every benchmarked use case.
+
+    Inputs are drawn from a seeded generator, so every run makes the same calls.
+    Writes come last because they change the corpus.
+
+    Args:
+        container: Container holding the corpus
+        corpus: Generated corpus
+
+    Returns:
+        Scenario names mapped to functions of the iteration number
+    """
+    rng = random.Random(corpus.spec.seed)
+    post_ids = corpus.post_ids
+    agents = corpus.agent_names
+    cursors: list[str | None] = [None]
+
+    def browse_deep(_: int) -> Any:
+        # Walk pages with the cursor, starting over at the end
+        page = container.browse_posts_use_case.execute(limit=20, cursor=cursors[-1])
+        cursors.append(page.next_cursor)
+        return page
+
+    return {
+        "get_post": lambda _: container.get_post_use_case.execute(rng.choice(post_ids)),
+        "browse_posts": lambda _: container.browse_posts_use_case.execute(limit=20),
+        "browse_posts_cursor": browse_deep,
+        "search_posts_text": lambda _: container.search_posts_use_case.execute(
+            SearchPostsDTO(query=rng.choice(corpus.words), limit=20)
+        ),
+        "search_posts_tag": lambda _: container.search_posts_use_case.execute(
+            SearchPostsDTO(tags=[rng.choice(corpus.tags[:20])], limit=20)
+        ),
+        "list_agents": lambda _: container.list_agents_use_case.execute(),
+        "create_reply": lambda _: container.create_reply_use_case.execute(
+            CreateReplyDTO(
+                post_id=(post_id := rng.choice(post_ids)),
+                parent_id=post_id,
+                parent_type="post",
+                agent_name=rng.choice(agents),
+                content="Benchmark reply",
+            )
+        ),
+    }
+
+
+def run_size(spec: CorpusSpec, backend: str, iterations: int) -> list[BenchmarkResult]:
+    """Generate a corpus and benchmark every use case against it.
+
+    Args:
+        spec: Corpus shape
+        backend: Storage backend
+        iterations: Timed calls per use case
+
+    Returns:
+        One result per use case
+    """
+    # Index and counter updates are applied inside the write being timed
+    os.environ["BBS_EVENT_DISPATCH"] = "inline"
+    with tempfile.TemporaryDirectory(prefix="bbs-bench-") as data_dir:
+        container = Container(Path(data_dir), storage_backend=backend)
+        started = time.perf_counter()
+        corpus = CorpusGenerator(spec).generate(container)
+        print(
+            f"  {backend}: {spec.posts} posts, {corpus.replies} replies generated "
+            f"in {time.perf_counter() - started:.1f}s",
+            flush=True,
+        )
+        results = []
+        for name, call in scenarios(container, corpus).items():
+            results.append(measure(backend, spec.posts, name, call, iterations))
+        return results
+
+
+def compare(results: list[BenchmarkResult], baseline: dict[str, Any]) -> list[str]:
+    """Compare p95 latencies with a baseline run.
+
+    Args:
+        results: Results of this run
+        baseline: Parsed JSON output of an earlier run
+
+    Returns:
+        One report line per measurement present in both runs
+    """
+    previous = {(r["backend"], r["posts"], r["use_case"]): r["p95_ms"] for r in baseline["results"]}
+    lines = []
+    for result in results:
+        if result.key in previous and previous[result.key] > 0:
+            ratio = result.p95_ms / previous[result.key]
+            lines.append(
+                f"{result.backend:6} {result.posts:>7} {result.use_case:20} "
+                f"p95 {previous[result.key]:8.2f} -> {result.p95_ms:8.2f} ms ({ratio:.2f}x)"
+            )
+    return lines
+
+
+def write_report(path: Path, spec: CorpusSpec, results: list[BenchmarkResult]) -> None:
+    """Write results as JSON.
+
+    Args:
+        path: Output file
+        spec: Corpus shape (the post count varies per result)
+        results: Benchmark results
+    """
+    report = {
+        "created_at": datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "corpus": {k: v for k, v in spec.to_dict().items() if k != "posts"},
+        "results": [asdict(result) for result in results],
+    }
+    path.write_text(json.dumps(report, indent=2))
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmark suite.
+
+    Args:
+        argv: Command line arguments (defaults to sys.argv)
+
+    Returns:
+        Process exit code
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--backend", nargs="+", choices=["file", "sqlite"], default=["file"])
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--agents", type=int, default=CorpusSpec.agents)
+    parser.add_argument("--seed", type=int, default=CorpusSpec.seed)
+    parser.add_argument("--output", type=Path, default=Path("benchmark-results.json"))
+    parser.add_argument("--baseline", type=Path, help="earlier output to compare against")
+    args = parser.parse_args(argv)
+
+    spec = CorpusSpec(agents=args.agents, seed=args.seed)
+    results: list[BenchmarkResult] = []
+    context = multiprocessing.get_context("spawn")
+    for backend in args.backend:
+        for size in args.sizes:
+            with context.Pool(1) as pool:
+                results.extend(
+                    pool.apply(run_size, (replace(spec, posts=size), backend, args.iterations))
+                )
+
+    print(f"\n{'backend':6} {'posts':>7} {'use case':20} {'p50':>8} {'p95':>8} {'p99':>8} ms")
+    for r in results:
+        print(
+            f"{r.backend:6} {r.posts:>7} {r.use_case:20} "
+            f"{r.p50_ms:8.2f} {r.p95_ms:8.2f} {r.p99_ms:8.2f}  "
+            f"syscalls r/w {r.read_syscalls or 0:.0f}/{r.write_syscalls or 0:.0f}  "
+            f"rss {r.peak_rss_mb:.0f} MiB"
+        )
+
+    write_report(args.output, spec, results)
+    print(f"\nResults written to {args.output}")
+    if args.baseline:
+        print(f"\nCompared with {args.baseline}:")
+        for line in compare(results, json.loads(args.baseline.read_text())):
+            print(line)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,60 @@
+"""Smoke tests for the corpus generator and the benchmark runner."""
+
+import json
+
+import pytest
+
+from src.domain.value_objects.post_id import PostId
+from src.interfaces.container import Container
+from tests.benchmarks.corpus import CorpusGenerator, CorpusSpec
+from tests.benchmarks.run import compare, main, run_size
+
+SMALL = CorpusSpec(posts=30, agents=5, tags=10, replies_per_post=(0, 6), post_words=(5, 20))
+
+
+@pytest.fixture(autouse=True)
+def inline_events(monkeypatch):
+    """Restore the event dispatch mode that the runner sets."""
+    monkeypatch.setenv("BBS_EVENT_DISPATCH", "inline")
+
+
+def test_corpus_is_reproducible(tmp_path):
+    """Test that a seed always produces the same posts and reply trees."""
+    first = CorpusGenerator(SMALL).generate(Container(tmp_path / "a"))
+    container = Container(tmp_path / "b")
+    second = CorpusGenerator(SMALL).generate(container)
+
+    assert first.post_ids == second.post_ids
+    assert first.replies == second.replies > 0
+    post = container.post_repository.find_by_id(PostId(second.post_ids[0]))
+    assert post is not None and post.reply_count <= SMALL.replies_per_post[1]
+    assert container.browse_posts_use_case.execute(limit=100).posts[0].post_id == first.post_ids[-1]
+
+
+@pytest.mark.parametrize("backend", ["file", "sqlite"])
+def test_run_size_measures_every_use_case(backend):
+    """Test that each use case is measured and compares equal to itself."""
+    results = run_size(SMALL, backend, iterations=5)
+
+    assert {r.use_case for r in results} >= {
+        "get_post",
+        "browse_posts",
+        "search_posts_text",
+        "list_agents",
+        "create_reply",
+    }
+    assert all(0 < r.p50_ms <= r.p95_ms <= r.p99_ms for r in results)
+
+    baseline = {"results": [r.__dict__ for r in results]}
+    assert all(line.endswith("(1.00x)") for line in compare(results, baseline))
+
+
+def test_main_writes_report(tmp_path):
+    """Test the command line entry point on a tiny corpus."""
+    output = tmp_path / "results.json"
+
+    assert main(["--sizes", "30", "--iterations", "3", "--output", str(output)]) == 0
+
+    report = json.loads(output.read_text())
+    assert report["corpus"]["seed"] == CorpusSpec.seed
+    assert {r["posts"] for r in report["results"]} == {30}
@@ -0,0 +1,32 @@
+"""Smoke tests for the load test harness."""
+
+import pytest
+
+from tests.benchmarks.corpus import CorpusSpec
+from tests.benchmarks.load import DEFAULT_MIX, parse_mix, run_load
+
+
+def test_parse_mix():
+    """Test operation mix parsing and validation."""
+    assert parse_mix("rest:get_post=3, mcp:create_reply") == {
+        "rest:get_post": 3,
+        "mcp:create_reply": 1,
+    }
+    with pytest.raises(ValueError):
+        parse_mix("rest:unknown=1")
+    with pytest.raises(ValueError):
+        parse_mix("rest:get_post=0")
+
+
+def test_run_load_against_local_server():
+    """Test that every operation is driven and lock waits are credited to it."""
+    spec = CorpusSpec(posts=20, agents=5, tags=10, post_words=(5, 20))
+
+    report = run_load(DEFAULT_MIX, rate=60, duration=1.5, spec=spec)
+
+    operations = {row["operation"]: row for row in report["operations"]}
+    assert set(operations) == set(DEFAULT_MIX)
+    assert sum(row["requests"] for row in operations.values()) == 90
+    assert all(row["error_rate"] == 0 for row in operations.values())
+    assert operations["rest:get_post"]["lock_acquisitions_per_request"] > 0
+    assert report["server"]["locks"]["exclusive"]["acquired"] > 0
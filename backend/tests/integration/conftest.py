@@ -0,0 +1,29 @@
+"""Shared fixtures for integration tests, run against every storage backend."""
+
+import pytest
+
+from src.application.dtos.agent_dto import CreateAgentDTO
+from src.application.dtos.post_dto import CreatePostDTO
+from src.interfaces.container import Container
+
+
+@pytest.fixture(autouse=True)
+def inline_events(monkeypatch):
+    """Handle events inside the use cases so that reads see every write at once."""
+    monkeypatch.setenv("BBS_EVENT_DISPATCH", "inline")
+
+
+@pytest.fixture(params=["file", "sqlite"])
+def container(request, tmp_path):
+    """Create a container with a registered agent."""
+    container = Container(tmp_path / "data", storage_backend=request.param)
+    container.register_agent_use_case.execute(
+        CreateAgentDTO(agent_name="test_agent", description="Test agent")
+    )
+    return container
+
+
+def create_post(container: Container, title: str, content: str = "Body") -> str:
+    """Create a post and return its ID."""
+    dto = CreatePostDTO(agent_name="test_agent", title=title, content=content)
+    return container.create_post_use_case.execute(dto).post_id
@@ -0,0 +1,97 @@
+"""Integration tests for per-agent activity counters, on both backends."""
+
+from src.application.dtos.agent_dto import CreateAgentDTO
+from src.application.dtos.reply_dto import CreateReplyDTO, DeletePostDTO, DeleteReplyDTO
+from src.domain.value_objects.agent_name import AgentName
+from src.infrastructure.persistence.agent_repository_impl import AgentRepositoryImpl
+from src.interfaces.container import Container
+from tests.integration.conftest import create_post
+
+
+def counts(container: Container) -> tuple[int, int, int]:
+    """Get the listed post, reply and deleted counts of the test agent."""
+    (agent,) = container.list_agents_use_case.execute()
+    profile = container.get_agent_profile_use_case.execute("test_agent")
+    assert (agent.post_count, agent.reply_count) == (profile.post_count, profile.reply_count)
+    return profile.post_count, profile.reply_count, profile.deleted_count
+
+
+class TestAgentStats:
+    """Test cases for counters maintained by the create and delete use cases."""
+
+    def test_counters_follow_writes(self, container):
+        """Test that creating and deleting posts and replies updates the counters."""
+        assert counts(container) == (0, 0, 0)
+
+        post_id = create_post(container, "First")
+        create_post(container, "Second")
+        reply = container.create_reply_use_case.execute(
+            CreateReplyDTO(
+                post_id=post_id,
+                parent_id=post_id,
+                parent_type="post",
+                agent_name="test_agent",
+                content="Reply",
+            )
+        )
+        assert counts(container) == (2, 1, 0)
+
+        container.delete_reply_use_case.execute(
+            DeleteReplyDTO(post_id=post_id, reply_id=reply.reply_id, agent_name="test_agent")
+        )
+        container.delete_post_use_case.execute(
+            DeletePostDTO(post_id=post_id, agent_name="test_agent")
+        )
+        assert counts(container) == (1, 0, 2)
+        assert container.get_agent_profile_use_case.execute("test_agent").last_active_at
+
+    def test_rebuild_matches_maintained_counters(self, container):
+        """Test that a rebuild recomputes the same counters."""
+        post_id = create_post(container, "First")
+        create_post(container, "Second")
+        container.delete_post_use_case.execute(
+            DeletePostDTO(post_id=post_id, agent_name="test_agent")
+        )
+        maintained = container.agent_repository.get_stats(AgentName("test_agent"))
+
+        assert container.agent_repository.rebuild_stats() == 1
+        rebuilt = container.agent_repository.get_stats(AgentName("test_agent"))
+
+        assert (rebuilt.post_count, rebuilt.reply_count, rebuilt.deleted_count) == (1, 0, 1)
+        assert rebuilt.post_count == maintained.post_count
+        assert rebuilt.deleted_count == maintained.deleted_count
+
+
+class TestAgentStatsBackfill:
+    """Test cases for counters of agents registered before they were stored."""
+
+    def test_missing_counters_are_backfilled_at_startup(self, tmp_path, monkeypatch):
+        """Test that reads see zeros and startup counts the data tree once."""
+        data_dir = tmp_path / "data"
+        container = Container(data_dir, storage_backend="file")
+        container.register_agent_use_case.execute(
+            CreateAgentDTO(agent_name="test_agent", description="Test agent")
+        )
+        create_post(container, "First")
+        create_post(container, "Second")
+        stats_path = data_dir / "agents" / "test_agent" / "stats.json"
+        stats_path.unlink()
+
+        walks = []
+        collect = AgentRepositoryImpl._collect_stats
+        monkeypatch.setattr(
+            AgentRepositoryImpl,
+            "_collect_stats",
+            lambda self: walks.append(1) or collect(self),
+        )
+        create_post(container, "Third")
+        assert counts(container) == (0, 0, 0)
+        assert not stats_path.exists()
+        assert walks == []
+
+        restarted = Container(data_dir, storage_backend="file")
+        assert counts(restarted) == (3, 0, 0)
+        assert walks == [1]
+
+        Container(data_dir, storage_backend="file")
+        assert walks == [1]
@@ -0,0 +1,86 @@
+"""Integration tests for the Server-Sent Events change feed."""
+
+import asyncio
+import json
+
+from fastapi.testclient import TestClient
+
+from src.application.dtos.reply_dto import CreateReplyDTO
+from src.interfaces.api.main import create_app
+from src.interfaces.api.routes.stream import change_stream
+from tests.integration.conftest import create_post
+
+
+def collect(container, last_event_id, count: int) -> list[str]:
+    """Read the first ``count`` messages of a change stream."""
+
+    async def never_disconnected() -> bool:
+        return False
+
+    async def main() -> list[str]:
+        stream = change_stream(
+            container.change_log, container.executor, last_event_id, never_disconnected, 0.01
+        )
+        messages = [message async for message in _take(stream, count)]
+        await stream.aclose()
+        return messages
+
+    return asyncio.run(main())
+
+
+async def _take(stream, count: int):
+    """Yield the first ``count`` items of an async iterator."""
+    async for item in stream:
+        yield item
+        count -= 1
+        if count == 0:
+            return
+
+
+def parse(message: str) -> dict[str, str]:
+    """Parse the fields of an SSE message."""
+    return dict(line.split(": ", 1) for line in message.strip().splitlines())
+
+
+class TestChangeStream:
+    """Test cases for the change feed."""
+
+    def test_resumes_after_last_event_id(self, container):
+        """Test that posts and replies are streamed in order from an event ID."""
+        create_post(container, "First")
+        second = create_post(container, "Second")
+        container.create_reply_use_case.execute(
+            CreateReplyDTO(
+                post_id=second,
+                parent_id=second,
+                parent_type="post",
+                agent_name="test_agent",
+                content="Hello",
+            )
+        )
+
+        messages = collect(container, 1, 3)
+
+        assert messages[0] == "retry: 3000\n\n"
+        events = [parse(m) for m in messages[1:]]
+        assert [(e["id"], e["event"]) for e in events] == [
+            ("2", "post_created"),
+            ("3", "reply_added"),
+        ]
+        assert json.loads(events[0]["data"])["post_id"] == second
+
+    def test_unknown_event_id_resets_client(self, container):
+        """Test that a client resuming from an unknown ID is told to reload."""
+        create_post(container, "Only")
+
+        messages = collect(container, 42, 2)
+
+        assert parse(messages[1])["event"] == "reset"
+
+    def test_invalid_last_event_id(self, tmp_path):
+        """Test that a malformed Last-Event-ID is rejected."""
+        client = TestClient(create_app(tmp_path / "data"))
+
+        response = client.get("/api/v1/stream", headers={"Last-Event-ID": "abc"})
+
+        assert response.status_code == 400
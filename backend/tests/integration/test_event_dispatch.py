@@ -0,0 +1,80 @@
+"""Integration tests for index and counter maintenance on the background event worker."""
+
+import pytest
+
+from src.application.dtos.agent_dto import CreateAgentDTO
+from src.application.dtos.post_dto import SearchPostsDTO
+from src.application.dtos.reply_dto import CreateReplyDTO, DeletePostDTO
+from src.interfaces.container import Container
+from tests.integration.conftest import create_post
+
+
+@pytest.fixture(params=["file", "sqlite"])
+def background_container(request, tmp_path, monkeypatch):
+    """Create a container that handles events on its background worker."""
+    monkeypatch.setenv("BBS_EVENT_DISPATCH", "background")
+    monkeypatch.setenv("BBS_EVENT_OUTBOX", "1")
+    container = Container(tmp_path / "data", storage_backend=request.param)
+    container.register_agent_use_case.execute(
+        CreateAgentDTO(agent_name="test_agent", description="Test agent")
+    )
+    yield container
+    container.event_bus.shutdown(timeout=5)
+
+
+class TestBackgroundEvents:
+    """Test cases for event-driven index and counter updates."""
+
+    def test_writes_reach_indexes_and_counters(self, background_container):
+        """Test that indexes and counters catch up once the worker is idle."""
+        container = background_container
+        post_id = create_post(container, "Event driven", "Indexes update off the request path")
+        container.create_reply_use_case.execute(
+            CreateReplyDTO(
+                post_id=post_id,
+                parent_id=post_id,
+                parent_type="post",
+                agent_name="test_agent",
+                content="A reply about zeppelins",
+            )
+        )
+        assert container.event_bus.flush(timeout=5)
+
+        search = container.search_posts_use_case.execute
+        assert [p.post_id for p in search(SearchPostsDTO(query="zeppelins")).posts] == [post_id]
+        assert [p.post_id for p in container.browse_posts_use_case.execute().posts] == [post_id]
+        profile = container.get_agent_profile_use_case.execute("test_agent")
+        assert (profile.post_count, profile.reply_count) == (1, 1)
+
+        container.delete_post_use_case.execute(
+            DeletePostDTO(post_id=post_id, agent_name="test_agent")
+        )
+        assert container.event_bus.flush(timeout=5)
+
+        assert container.browse_posts_use_case.execute().posts == []
+        profile = container.get_agent_profile_use_case.execute("test_agent")
+        assert (profile.post_count, profile.deleted_count) == (0, 1)
+        assert container.event_bus.stats().failed == 0
+
+
+class TestBackendIndexes:
+    """Test cases for which indexes each backend maintains."""
+
+    def test_sqlite_backend_keeps_no_json_indexes(self, tmp_path, monkeypatch):
+        """Test that SQLite writes only update the database and its full-text index."""
+        monkeypatch.setenv("BBS_EVENT_DISPATCH", "inline")
+        container = Container(tmp_path / "data", storage_backend="sqlite")
+        container.register_agent_use_case.execute(
+            CreateAgentDTO(agent_name="test_agent", description="Test agent")
+        )
+        post_id = create_post(container, "Database only", "Indexed by FTS5")
+        container.delete_post_use_case.execute(
+            DeletePostDTO(post_id=post_id, agent_name="test_agent")
+        )
+
+        assert container.post_index is None
+        assert container.agent_index is None
+        assert not list((tmp_path / "data" / "index").glob("*_index*"))
+        assert container.search_posts_use_case.execute(
+            SearchPostsDTO(query="fts5", include_deleted=True)
+        ).posts
@@ -0,0 +1,141 @@
+"""Integration tests for per-agent notification inboxes, on both backends."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.application.dtos.agent_dto import CreateAgentDTO
+from src.application.dtos.inbox_dto import GetInboxDTO
+from src.application.dtos.reply_dto import CreateReplyDTO
+from src.domain.events import ReplyAdded
+from src.domain.exceptions.agent_exceptions import AgentNotFoundException
+from src.domain.value_objects.post_id import PostId
+from src.interfaces.api.main import create_app
+from tests.integration.conftest import create_post
+
+
+def reply(container, post_id: str, parent_id: str, agent_name: str, content: str) -> str:
+    """Reply to a post or reply and return the reply ID."""
+    return container.create_reply_use_case.execute(
+        CreateReplyDTO(
+            post_id=post_id,
+            parent_id=parent_id,
+            parent_type="post" if parent_id == post_id else "reply",
+            agent_name=agent_name,
+            content=content,
+        )
+    ).reply_id
+
+
+def inbox(container, agent_name: str, **kwargs) -> list[tuple[str, list[str]]]:
+    """Get (reply ID, reasons) pairs from an agent's inbox."""
+    page = container.get_inbox_use_case.execute(GetInboxDTO(agent_name=agent_name, **kwargs))
+    return [(n.reply_id, n.reasons) for n in page.notifications]
+
+
+@pytest.fixture
+def agents(container):
+    """Register two more agents."""
+    for name in ("alice", "bob"):
+        container.register_agent_use_case.execute(
+            CreateAgentDTO(agent_name=name, description="Another agent")
+        )
+    return container
+
+
+class TestInbox:
+    """Test cases for notification fan-out and the inbox read cursor."""
+
+    def test_fan_out(self, agents):
+        """Test that parent authors, thread authors and mentioned agents are notified."""
+        container = agents
+        post_id = create_post(container, "Question")
+        first = reply(container, post_id, post_id, "alice", "An answer")
+        second = reply(container, post_id, first, "bob", "@alice is right, cc @nobody and @bob")
+
+        assert inbox(container, "test_agent") == [
+            (first, ["reply", "thread"]),
+            (second, ["thread"]),
+        ]
+        assert inbox(container, "alice") == [(second, ["reply", "mention"])]
+        assert inbox(container, "bob") == []
+
+        notification = container.get_inbox_use_case.execute(
+            GetInboxDTO(agent_name="alice")
+        ).notifications[0]
+        assert (notification.post_id, notification.agent_name, notification.title) == (
+            post_id,
+            "bob",
+            "Question",
+        )
+        assert notification.excerpt.startswith("@alice is right")
+
+    def test_read_cursor(self, agents):
+        """Test that marking read advances the cursor past the returned notifications only."""
+        container = agents
+        post_id = create_post(container, "Question")
+        replies = [reply(container, post_id, post_id, "alice", f"Answer {i}") for i in range(3)]
+
+        page = container.get_inbox_use_case.execute(
+            GetInboxDTO(agent_name="test_agent", limit=2, mark_read=True)
+        )
+        assert [n.reply_id for n in page.notifications] == replies[:2]
+        assert page.has_more
+
+        later = reply(container, post_id, post_id, "bob", "Late answer")
+        unread = [r for r, _ in inbox(container, "test_agent", mark_read=True)]
+        assert unread == [replies[2], later]
+        assert inbox(container, "test_agent") == []
+        assert [r for r, _ in inbox(container, "test_agent", cursor=0)] == replies + [later]
+
+    def test_redelivered_event_is_ignored(self, agents):
+        """Test that an event handled twice notifies each agent once."""
+        container = agents
+        post_id = create_post(container, "Question")
+        reply_id = reply(container, post_id, post_id, "alice", "An answer")
+        stored = container.post_repository.find_reply_by_id(PostId(post_id), reply_id)
+
+        container.event_bus.publish(
+            ReplyAdded(
+                occurred_at=stored.created_at,
+                reply_id=reply_id,
+                post_id=post_id,
+                parent_id=post_id,
+                agent_name="alice",
+            )
+        )
+
+        assert inbox(container, "test_agent") == [(reply_id, ["reply", "thread"])]
+
+    def test_invalid_requests(self, agents):
+        """Test unknown agents and cursors that do not start a notification."""
+        container = agents
+        post_id = create_post(container, "Question")
+        reply(container, post_id, post_id, "alice", "An answer")
+
+        with pytest.raises(AgentNotFoundException):
+            inbox(container, "nobody")
+        with pytest.raises(ValueError):
+            inbox(container, "test_agent", cursor=1)
+
+    def test_rest_endpoint(self, tmp_path):
+        """Test the inbox endpoint over HTTP."""
+        app = create_app(tmp_path / "data")
+        container = app.state.container
+        for name in ("test_agent", "alice"):
+            container.register_agent_use_case.execute(
+                CreateAgentDTO(agent_name=name, description="Agent")
+            )
+        post_id = create_post(container, "Question")
+        reply_id = reply(container, post_id, post_id, "alice", "An answer")
+        client = TestClient(app)
+
+        body = client.get("/api/v1/agents/test_agent/inbox").json()
+
+        assert [(n["reply_id"], n["reasons"]) for n in body["notifications"]] == [
+            (reply_id, ["reply", "thread"])
+        ]
+        assert body["has_more"] is False
+        # Reading over REST does not mark notifications read
+        assert len(client.get("/api/v1/agents/test_agent/inbox").json()["notifications"]) == 1
+        assert client.get("/api/v1/agents/nobody/inbox").status_code == 404
+        assert client.get("/api/v1/agents/test_agent/inbox?cursor=1").status_code == 400
@@ -0,0 +1,117 @@
+"""Integration tests for the Prometheus metrics endpoint."""
+
+import asyncio
+import json
+import re
+
+from fastapi.testclient import TestClient
+from fastmcp import Client
+
+from src.interfaces.api.main import create_app
+from src.interfaces.mcp import fastmcp_server
+
+
+def sample(page: str, name: str) -> float:
+    """Get the value of one sample line of a metrics page."""
+    match = re.search(rf"^{re.escape(name)} (\S+)$", page, re.MULTILINE)
+    assert match, f"{name} not found"
+    return float(match.group(1))
+
+
+class TestMetricsEndpoint:
+    """Test cases for GET /metrics."""
+
+    def test_reports_requests_tools_use_cases_and_storage(self, tmp_path):
+        """Test that REST and MCP traffic shows up in the exposition."""
+        app = create_app(tmp_path / "data")
+
+        async def call_tools() -> str:
+            async with Client(fastmcp_server.mcp) as client:
+                await client.call_tool(
+                    "register_agent", {"agent_name": "test_agent", "description": "Test"}
+                )
+                result = await client.call_tool(
+                    "create_post",
+                    {"agent_name": "test_agent", "title": "Metrics", "content": "Body"},
+                )
+                return result.data["post"]["post_id"]
+
+        post_id = asyncio.run(call_tools())
+        client = TestClient(app)
+        assert client.get(f"/api/v1/posts/{post_id}").status_code == 200
+        assert client.get("/api/v1/posts/post_missing").status_code == 404
+
+        response = client.get("/metrics")
+        page = response.text
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        route = 'route="/api/v1/posts/{post_id}",method="GET"'
+        assert sample(page, f'bbs_http_request_duration_seconds_count{{{route},status="200"}}') == 1
+        assert sample(page, f'bbs_http_request_duration_seconds_count{{{route},status="404"}}') == 1
+        assert (
+            sample(page, 'bbs_mcp_tool_duration_seconds_count{tool="create_post",outcome="ok"}')
+            == 1
+        )
+        assert (
+            sample(page, 'bbs_use_case_duration_seconds_count{use_case="get_post",outcome="error"}')
+            == 1
+        )
+        assert sample(page, "bbs_storage_files_written_total") > 0
+        assert sample(page, "bbs_storage_read_bytes_total") > 0
+        assert 'bbs_lock_wait_seconds_count{lock="post",mode="exclusive"}' in page
+        assert sample(page, 'bbs_cache_misses_total{cache="response"}') >= 1
+        assert re.search(r'^bbs_index_bytes\{file="posts_index[^"]*"\} \d+$', page, re.MULTILINE)
+
+
+class TestRequestTracing:
+    """Test cases for traces of REST requests."""
+
+    def test_get_post_trace(self, tmp_path, monkeypatch):
+        """Test that a sampled request exports its use case and storage spans."""
+        trace_file = tmp_path / "traces.jsonl"
+        monkeypatch.setenv("BBS_TRACE_SAMPLE_RATE", "1")
+        monkeypatch.setenv("BBS_TRACE_FILE", str(trace_file))
+        client = TestClient(create_app(tmp_path / "data"))
+
+        async def create_post() -> str:
+            async with Client(fastmcp_server.mcp) as mcp:
+                await mcp.call_tool(
+                    "register_agent", {"agent_name": "test_agent", "description": "Test"}
+                )
+                result = await mcp.call_tool(
+                    "create_post",
+                    {"agent_name": "test_agent", "title": "Traced", "content": "Body"},
+                )
+                return result.data["post"]["post_id"]
+
+        post_id = asyncio.run(create_post())
+        tool_names = [
+            json.loads(line)["resourceSpans"][0]["scopeSpans"][0]["spans"][-1]["name"]
+            for line in trace_file.read_text().splitlines()
+        ]
+        assert "mcp.tool create_post" in tool_names
+        trace_file.unlink()
+
+        assert client.get(f"/api/v1/posts/{post_id}").status_code == 200
+
+        monkeypatch.setenv("BBS_TRACE_SAMPLE_RATE", "0")
+        create_app(tmp_path / "data")  # turns tracing off again
+        [line] = trace_file.read_text().splitlines()
+        spans = json.loads(line)["resourceSpans"][0]["scopeSpans"][0]["spans"]
+        by_id = {s["spanId"]: s for s in spans}
+        [root] = [s for s in spans if "parentSpanId" not in s]
+
+        def ancestors(s: dict) -> list[str]:
+            names = []
+            while "parentSpanId" in s:
+                s = by_id[s["parentSpanId"]]
+                names.append(s["name"])
+            return names
+
+        assert root["name"] == "GET /api/v1/posts/{post_id}"
+        [use_case] = [s for s in spans if s["name"] == "use_case.get_post"]
+        assert ancestors(use_case)[-1] == root["name"]
+        reads = [s for s in spans if s["name"] == "storage.read_json"]
+        assert reads
+        assert all("use_case.get_post" in ancestors(s) for s in reads)
@@ -0,0 +1,81 @@
+"""Integration tests for cursor pagination, on both backends."""
+
+from datetime import UTC, datetime
+
+import pytest
+
+from src.application.dtos.post_dto import CreatePostDTO, SearchPostsDTO
+from src.domain.value_objects.page_cursor import PageCursor
+from tests.integration.conftest import create_post
+
+
+class TestBrowsePagination:
+    """Test cases for keyset pagination of browse_posts."""
+
+    def test_cursor_walk_is_stable_under_concurrent_posts(self, container):
+        """Test that new posts do not shift or repeat later pages."""
+        created = [create_post(container, f"Post {i}") for i in range(5)]
+
+        first = container.browse_posts_use_case.execute(limit=2, include_total=True)
+        create_post(container, "Newer post")
+        second = container.browse_posts_use_case.execute(limit=2, cursor=first.next_cursor)
+        third = container.browse_posts_use_case.execute(limit=2, cursor=second.next_cursor)
+
+        walked = [p.post_id for page in (first, second, third) for p in page.posts]
+        assert walked == list(reversed(created))
+        assert first.estimated_total == 5
+        assert third.next_cursor is None
+
+    def test_offset_paging_still_supported(self, container):
+        """Test legacy offset pagination."""
+        created = [create_post(container, f"Post {i}") for i in range(3)]
+
+        page = container.browse_posts_use_case.execute(limit=1, offset=1)
+
+        assert [p.post_id for p in page.posts] == [created[1]]
+        assert page.next_cursor is not None
+
+    def test_invalid_cursor(self, container):
+        """Test that garbage cursors are rejected."""
+        with pytest.raises(ValueError):
+            container.browse_posts_use_case.execute(cursor="garbage")
+
+
+class TestSearchPagination:
+    """Test cases for keyset pagination of search_posts."""
+
+    def test_cursor_walk(self, container):
+        """Test walking search results with cursors."""
+        created = [create_post(container, f"Topic {i}", "shared words") for i in range(3)]
+        create_post(container, "Unrelated", "nothing")
+
+        first = container.search_posts_use_case.execute(SearchPostsDTO(query="shared", limit=2))
+        second = container.search_posts_use_case.execute(
+            SearchPostsDTO(query="shared", limit=2, cursor=first.next_cursor)
+        )
+
+        walked = [p.post_id for page in (first, second) for p in page.posts]
+        assert walked == list(reversed(created))
+        assert second.next_cursor is None
+
+    def test_cursor_rejected_for_relevance(self, container):
+        """Test that cursors are limited to the newest sort order."""
+        create_post(container, "Topic", "shared")
+
+        with pytest.raises(ValueError):
+            container.search_posts_use_case.execute(
+                SearchPostsDTO(query="shared", sort_by="relevance", cursor="e30")
+            )
+
+    @pytest.mark.parametrize("tags", [None, ["python"]])
+    def test_offset_aware_cursor_rejected(self, container, tags):
+        """Test that a hand-made cursor with a UTC offset is rejected, not compared."""
+        container.create_post_use_case.execute(
+            CreatePostDTO(agent_name="test_agent", title="Topic", content="shared", tags=["python"])
+        )
+        cursor = PageCursor(datetime(2020, 1, 1, tzinfo=UTC), "x").encode()
+
+        with pytest.raises(ValueError):
+            container.search_posts_use_case.execute(
+                SearchPostsDTO(query="shared" if tags is None else None, tags=tags, cursor=cursor)
+            )
@@ -0,0 +1,174 @@
+"""Integration tests for post summaries in list views, on both backends."""
+
+import pytest
+
+from src.application.dtos.agent_dto import CreateAgentDTO
+from src.application.dtos.post_dto import SearchPostsDTO
+from src.application.dtos.reply_dto import CreateReplyDTO, DeleteReplyDTO
+from src.domain.entities.reply import Reply
+from src.domain.exceptions.post_exceptions import PostNotFoundException
+from src.domain.value_objects.agent_name import AgentName
+from src.domain.value_objects.content import Content
+from src.domain.value_objects.post_id import PostId
+from src.infrastructure.persistence.post_repository_impl import PostRepositoryImpl
+from src.interfaces.container import Container
+from tests.integration.conftest import create_post
+
+
+def reply(
+    container: Container, post_id: str, content: str = "Reply", parent_id: str | None = None
+) -> str:
+    """Reply to a post, or to one of its replies, and return the reply ID."""
+    dto = CreateReplyDTO(
+        post_id=post_id,
+        parent_id=parent_id or post_id,
+        parent_type="reply" if parent_id else "post",
+        agent_name="test_agent",
+        content=content,
+    )
+    return container.create_reply_use_case.execute(dto).reply_id
+
+
+def delete_reply(container: Container, post_id: str, reply_id: str) -> None:
+    """Delete a reply as test_agent."""
+    container.delete_reply_use_case.execute(
+        DeleteReplyDTO(post_id=post_id, reply_id=reply_id, agent_name="test_agent")
+    )
+
+
+def listed_reply_count(container: Container) -> int:
+    """Get the reply count shown for the only post in browse and search."""
+    browsed = container.browse_posts_use_case.execute(limit=10).posts
+    searched = container.search_posts_use_case.execute(SearchPostsDTO(query="Question")).posts
+    assert browsed[0].reply_count == searched[0].reply_count
+    return browsed[0].reply_count
+
+
+class TestPostSummaries:
+    """Test cases for reply counts and summary-only listing."""
+
+    def test_reply_count_follows_replies(self, container):
+        """Test that list views count visible replies."""
+        post_id = create_post(container, "Question")
+        first = reply(container, post_id)
+        reply(container, post_id)
+        assert listed_reply_count(container) == 2
+
+        container.delete_reply_use_case.execute(
+            DeleteReplyDTO(post_id=post_id, reply_id=first, agent_name="test_agent")
+        )
+        assert listed_reply_count(container) == 1
+
+    def test_replies_under_deleted_parent_are_not_counted(self, container):
+        """Test that replying inside a deleted subtree leaves the count unchanged."""
+        post_id = create_post(container, "Question")
+        parent = reply(container, post_id)
+        child = reply(container, post_id, parent_id=parent)
+        delete_reply(container, post_id, parent)
+        assert listed_reply_count(container) == 0
+
+        reply(container, post_id, parent_id=child)
+        reply(container, post_id, parent_id=parent)
+        assert listed_reply_count(container) == 0
+
+        reply(container, post_id)
+        assert listed_reply_count(container) == 1
+
+    def test_deleting_inside_deleted_subtree_keeps_count(self, container):
+        """Test that deleting a reply under a deleted ancestor does not subtract again."""
+        post_id = create_post(container, "Question")
+        reply(container, post_id)
+        parent = reply(container, post_id)
+        child = reply(container, post_id, parent_id=parent)
+        grandchild = reply(container, post_id, parent_id=child)
+        reply(container, post_id, parent_id=grandchild)
+        assert listed_reply_count(container) == 5
+
+        delete_reply(container, post_id, parent)
+        assert listed_reply_count(container) == 1
+
+        delete_reply(container, post_id, child)
+        delete_reply(container, post_id, grandchild)
+        assert listed_reply_count(container) == 1
+
+    def test_summary_fields(self, container):
+        """Test that summaries carry the post metadata."""
+        post_id = create_post(container, "Question")
+
+        summary = container.post_repository.find_summary(PostId(post_id))
+
+        assert summary.post_id == post_id
+        assert summary.title == "Question"
+        assert summary.agent_name == "test_agent"
+        assert summary.reply_count == 0
+        assert container.post_repository.find_summary(PostId("post_missing")) is None
+
+
+class TestFileSummaries:
+    """Test cases specific to the file backend."""
+
+    @pytest.fixture
+    def container(self, tmp_path):
+        """Create a file-backed container with a registered agent."""
+        container = Container(tmp_path / "data")
+        container.register_agent_use_case.execute(
+            CreateAgentDTO(agent_name="test_agent", description="Test agent")
+        )
+        return container
+
+    def test_browse_does_not_read_content(self, container, tmp_path):
+        """Test that browsing works from metadata alone."""
+        post_id = create_post(container, "Question")
+        (tmp_path / "data" / "posts" / post_id / "content.md").unlink()
+
+        page = container.browse_posts_use_case.execute(limit=10)
+
+        assert [p.post_id for p in page.posts] == [post_id]
+
+    def test_rebuild_reply_counts(self, container, tmp_path):
+        """Test that legacy metadata without a reply counter is repaired."""
+        post_id = create_post(container, "Question")
+        reply(container, post_id)
+
+        metadata_path = tmp_path / "data" / "posts" / post_id / "metadata.json"
+        storage = container.file_storage
+        metadata = storage.read_json(metadata_path)
+        del metadata["reply_count"]
+        storage.write_json(metadata_path, metadata)
+
+        repository = PostRepositoryImpl(storage)
+        assert repository.rebuild_reply_counts() == 1
+        assert repository.rebuild_reply_counts() == 0
+        assert listed_reply_count(container) == 1
+
+    def test_maintained_counts_match_rebuild(self, container):
+        """Test that counts kept through deleted subtrees need no repair."""
+        post_id = create_post(container, "Question")
+        parent = reply(container, post_id)
+        child = reply(container, post_id, parent_id=parent)
+        reply(container, post_id)
+        delete_reply(container, post_id, parent)
+        reply(container, post_id, parent_id=child)
+        delete_reply(container, post_id, child)
+
+        assert container.post_repository.rebuild_reply_counts() == 0
+        assert listed_reply_count(container) == 1
+
+    def test_reply_to_deleted_post_is_rejected(self, container):
+        """Test that the repository checks the post under its lock."""
+        post_id = create_post(container, "Question")
+        container.post_repository.delete(PostId(post_id))
+
+        with pytest.raises(PostNotFoundException):
+            container.post_repository.save_reply(
+                PostId(post_id),
+                Reply(
+                    reply_id=Reply.generate_id(),
+                    post_id=post_id,
+                    parent_id=post_id,
+                    parent_type="post",
+                    agent_name=AgentName("test_agent"),
+                    content=Content("Late reply"),
+                ),
+            )
+        assert not (container.file_storage.posts_dir / post_id / "replies").exists()
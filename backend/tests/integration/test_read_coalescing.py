@@ -0,0 +1,57 @@
+"""Integration tests for coalescing identical concurrent REST reads."""
+
+import asyncio
+import threading
+import time
+
+import httpx
+
+from src.application.dtos.agent_dto import CreateAgentDTO
+from src.application.use_cases.post.search_posts import SearchPostsUseCase
+from src.interfaces.api.main import create_app
+from tests.integration.conftest import create_post
+
+
+class TestCoalescedRequests:
+    """Test cases for identical reads arriving through the REST API."""
+
+    def test_identical_reads_take_one_executor_slot(self, tmp_path, monkeypatch):
+        """Test that waiting requests await the running read instead of a worker thread."""
+        app = create_app(tmp_path / "data")
+        container = app.state.container
+        container.register_agent_use_case.execute(
+            CreateAgentDTO(agent_name="test_agent", description="Test agent")
+        )
+        create_post(container, "Hello", "hello world")
+        gate = threading.Event()
+        search = SearchPostsUseCase.execute
+
+        def slow_search(self, dto):
+            gate.wait(5)
+            return search(self, dto)
+
+        monkeypatch.setattr(SearchPostsUseCase, "execute", slow_search)
+        count = 8
+
+        async def send_requests() -> list[httpx.Response]:
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                requests = [
+                    asyncio.create_task(client.get("/api/v1/search", params={"q": "hello"}))
+                    for _ in range(count)
+                ]
+                deadline = time.monotonic() + 5
+                while (
+                    container.read_coalescer.stats().shared < count - 1
+                    and time.monotonic() < deadline
+                ):
+                    await asyncio.sleep(0.001)
+                gate.set()
+                return await asyncio.gather(*requests)
+
+        submitted = container.executor.stats().submitted
+        responses = asyncio.run(send_requests())
+
+        assert [response.status_code for response in responses] == [200] * count
+        assert all(len(response.json()["results"]) == 1 for response in responses)
+        assert container.executor.stats().submitted - submitted == 1
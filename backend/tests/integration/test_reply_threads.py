@@ -0,0 +1,126 @@
+"""Integration tests for nested reply threads, on both backends."""
+
+import shutil
+
+import pytest
+
+from src.application.dtos.agent_dto import CreateAgentDTO
+from src.application.dtos.reply_dto import CreateReplyDTO, DeletePostDTO, DeleteReplyDTO
+from src.domain.value_objects.post_id import PostId
+from src.interfaces.container import Container
+from tests.integration.conftest import create_post
+
+
+def reply(container: Container, post_id: str, parent_id: str, content: str = "Reply") -> str:
+    """Reply to a post or reply and return the reply ID."""
+    dto = CreateReplyDTO(
+        post_id=post_id,
+        parent_id=parent_id,
+        parent_type="post" if parent_id == post_id else "reply",
+        agent_name="test_agent",
+        content=content,
+    )
+    return container.create_reply_use_case.execute(dto).reply_id
+
+
+class TestReplyThreads:
+    """Test cases for assembling reply trees."""
+
+    def test_nested_replies_round_trip(self, container):
+        """Test that replies to replies are loaded under their parent, oldest first."""
+        post_id = create_post(container, "Thread")
+        first = reply(container, post_id, post_id, "first")
+        second = reply(container, post_id, post_id, "second")
+        nested = reply(container, post_id, first, "nested")
+        deeper = reply(container, post_id, nested, "deeper")
+
+        post = container.get_post_use_case.execute(post_id)
+
+        assert [r.reply_id for r in post.replies] == [first, second]
+        assert [r.reply_id for r in post.replies[0].replies] == [nested]
+        assert [r.reply_id for r in post.replies[0].replies[0].replies] == [deeper]
+        assert post.reply_count == 4
+
+    def test_deleted_reply_hides_subtree(self, container):
+        """Test that a deleted reply and its subtree are only loaded on request."""
+        post_id = create_post(container, "Thread")
+        parent = reply(container, post_id, post_id)
+        reply(container, post_id, parent)
+        container.delete_reply_use_case.execute(
+            DeleteReplyDTO(post_id=post_id, reply_id=parent, agent_name="test_agent")
+        )
+
+        assert container.get_post_use_case.execute(post_id).replies == []
+        post = container.get_post_use_case.execute(post_id, include_deleted=True)
+        assert post.replies[0].deleted
+        assert len(post.replies[0].replies) == 1
+
+    def test_find_reply_is_scoped_to_post(self, container):
+        """Test that a reply is only found within its own post."""
+        post_id = create_post(container, "Thread")
+        other_id = create_post(container, "Other")
+        reply_id = reply(container, post_id, post_id)
+
+        found = container.post_repository.find_reply_by_id(PostId(post_id), reply_id)
+
+        assert found.reply_id == reply_id
+        assert container.post_repository.find_reply_by_id(PostId(other_id), reply_id) is None
+
+    def test_delete_post_keeps_thread(self, container):
+        """Test that deleting a post only flags the post."""
+        post_id = create_post(container, "Thread")
+        reply(container, post_id, post_id)
+        container.delete_post_use_case.execute(
+            DeletePostDTO(post_id=post_id, agent_name="test_agent")
+        )
+
+        post = container.post_repository.find_by_id(PostId(post_id), include_deleted=True)
+
+        assert post.deleted and post.deleted_at
+        assert len(post.replies) == 1
+        with pytest.raises(ValueError):
+            container.post_repository.delete(PostId(post_id))
+
+
+class TestLegacyReplyLayout:
+    """Test cases for posts written before reply manifests existed."""
+
+    def test_manifest_is_rebuilt_from_nested_layout(self, tmp_path):
+        """Test that replies stored under their parent's directory are found."""
+        container = Container(tmp_path / "data")
+        container.register_agent_use_case.execute(
+            CreateAgentDTO(agent_name="test_agent", description="Test agent")
+        )
+        post_id = create_post(container, "Thread")
+        parent = reply(container, post_id, post_id)
+        child = reply(container, post_id, parent)
+
+        # Recreate the old layout: child nested under its parent, no manifest
+        post_dir = tmp_path / "data" / "posts" / post_id
+        (post_dir / "reply_manifest.jsonl").unlink()
+        nested_dir = post_dir / "replies" / parent / "replies"
+        nested_dir.mkdir()
+        shutil.move(post_dir / "replies" / child, nested_dir / child)
+
+        post = container.get_post_use_case.execute(post_id)
+
+        assert [r.reply_id for r in post.replies[0].replies] == [child]
+        assert (post_dir / "replies" / child).is_dir()
+        assert (post_dir / "reply_manifest.jsonl").exists()
+
+    def test_reply_writes_do_not_read_siblings(self, tmp_path):
+        """Test that replying and deleting only touch the reply being written."""
+        container = Container(tmp_path / "data")
+        container.register_agent_use_case.execute(
+            CreateAgentDTO(agent_name="test_agent", description="Test agent")
+        )
+        post_id = create_post(container, "Thread")
+        sibling = reply(container, post_id, post_id)
+        (tmp_path / "data" / "posts" / post_id / "replies" / sibling / "content.md").unlink()
+
+        reply_id = reply(container, post_id, post_id)
+        container.delete_reply_use_case.execute(
+            DeleteReplyDTO(post_id=post_id, reply_id=reply_id, agent_name="test_agent")
+        )
+
+        assert container.post_repository.find_summary(PostId(post_id)).reply_count == 1
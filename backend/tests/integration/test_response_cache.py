@@ -0,0 +1,141 @@
+"""Integration tests for ETags and the response cache of the post endpoints."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.application.dtos.agent_dto import CreateAgentDTO
+from src.application.dtos.reply_dto import CreateReplyDTO
+from src.infrastructure.events.change_log import ChangeLog
+from src.interfaces.api.main import create_app
+from src.interfaces.api.response_cache import ResponseCache, etag_matches
+from src.interfaces.container import Container
+from tests.integration.conftest import create_post
+
+
+def reply(container: Container, post_id: str) -> None:
+    """Reply to a post as test_agent."""
+    container.create_reply_use_case.execute(
+        CreateReplyDTO(
+            post_id=post_id,
+            parent_id=post_id,
+            parent_type="post",
+            agent_name="test_agent",
+            content="A reply",
+        )
+    )
+
+
+@pytest.fixture
+def app(tmp_path):
+    """Create an app with a registered agent and one post."""
+    app = create_app(tmp_path / "data")
+    container = app.state.container
+    container.register_agent_use_case.execute(
+        CreateAgentDTO(agent_name="test_agent", description="Test agent")
+    )
+    app.state.post_id = create_post(container, "Cached")
+    return app
+
+
+class TestResponseCache:
+    """Test cases for conditional requests and cached response bodies."""
+
+    def test_not_modified(self, app):
+        """Test that a matching If-None-Match gets 304 and repeat reads are cached."""
+        client = TestClient(app)
+        url = f"/api/v1/posts/{app.state.post_id}"
+
+        first = client.get(url)
+        etag = first.headers["etag"]
+        second = client.get(url)
+        revalidated = client.get(url, headers={"If-None-Match": f'"other", W/{etag}'})
+
+        assert first.status_code == 200 and first.json()["title"] == "Cached"
+        assert "last-modified" in first.headers
+        assert second.content == first.content
+        assert revalidated.status_code == 304
+        assert revalidated.headers["etag"] == etag
+        stats = app.state.container.response_cache.stats()
+        assert (stats.hits, stats.entries) == (1, 1)
+
+    def test_writes_change_etags(self, app):
+        """Test that a reply changes the post's and the listing's tags but not other posts'."""
+        container = app.state.container
+        other_id = create_post(container, "Other")
+        client = TestClient(app)
+        post_url = f"/api/v1/posts/{app.state.post_id}"
+        urls = [post_url, f"/api/v1/posts/{other_id}", "/api/v1/posts"]
+        before = {url: client.get(url).headers["etag"] for url in urls}
+
+        reply(container, app.state.post_id)
+
+        after = {url: client.get(url) for url in urls}
+        assert after[post_url].headers["etag"] != before[post_url]
+        assert after[post_url].json()["reply_count"] == 1
+        assert after["/api/v1/posts"].headers["etag"] != before["/api/v1/posts"]
+        assert after["/api/v1/posts"].json()["posts"][1]["reply_count"] == 1
+        assert after[urls[1]].headers["etag"] == before[urls[1]]
+
+    def test_writes_by_other_processes(self, app, tmp_path, monkeypatch):
+        """Test that writes through another container are found in the change log."""
+        monkeypatch.setattr(ResponseCache, "REFRESH_SECONDS", 0.0)
+        client = TestClient(app)
+        url = f"/api/v1/posts/{app.state.post_id}"
+        etag = client.get(url).headers["etag"]
+
+        reply(Container(tmp_path / "data"), app.state.post_id)
+
+        response = client.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.json()["reply_count"] == 1
+
+    def test_etags_are_shared_by_processes(self, app, tmp_path, monkeypatch):
+        """Test that another worker on the same data validates the tags handed out by this one."""
+        monkeypatch.setattr(ResponseCache, "REFRESH_SECONDS", 0.0)
+        client = TestClient(app)
+        reply(app.state.container, app.state.post_id)
+        urls = [f"/api/v1/posts/{app.state.post_id}", "/api/v1/posts"]
+        etags = {url: client.get(url).headers["etag"] for url in urls}
+
+        worker = TestClient(create_app(tmp_path / "data"))
+
+        for url, etag in etags.items():
+            assert worker.get(url, headers={"If-None-Match": etag}).status_code == 304
+
+    def test_tracked_threads_are_bounded_by_the_change_log(self, tmp_path, monkeypatch):
+        """Test that threads whose changes were rotated out share one version."""
+        monkeypatch.setattr(ChangeLog, "SEGMENT_BYTES", 1024)
+        monkeypatch.setattr(ResponseCache, "REFRESH_SECONDS", 0.0)
+        container = Container(tmp_path / "data")
+        container.register_agent_use_case.execute(
+            CreateAgentDTO(agent_name="test_agent", description="Test agent")
+        )
+        cache = container.response_cache
+        post_ids = []
+        for i in range(30):
+            post_ids.append(create_post(container, f"Post {i}"))
+            cache.refresh()
+
+        restarted = Container(tmp_path / "data").response_cache
+        restarted.refresh()
+
+        assert len(cache._posts) < 10
+        assert cache.post_version(post_ids[0]) == cache.post_version(post_ids[1])
+        for post_id in post_ids:
+            assert restarted.post_version(post_id).etag == cache.post_version(post_id).etag
+
+    def test_errors_are_not_cached(self, app):
+        """Test that missing posts and invalid cursors are still reported."""
+        client = TestClient(app)
+
+        assert client.get("/api/v1/posts/post_missing").status_code == 404
+        assert client.get("/api/v1/posts", params={"cursor": "bogus"}).status_code == 400
+        assert app.state.container.response_cache.stats().entries == 0
+
+
+def test_etag_matches():
+    """Test If-None-Match parsing."""
+    assert etag_matches('"a", "b"', '"b"')
+    assert etag_matches('W/"b"', '"b"')
+    assert not etag_matches(None, '"b"')
+    assert not etag_matches('"a"', '"b"')
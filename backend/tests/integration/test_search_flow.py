@@ -0,0 +1,115 @@
+"""Integration tests for full-text search through the use cases, on both backends."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.application.dtos.agent_dto import CreateAgentDTO
+from src.application.dtos.post_dto import CreatePostDTO, SearchPostsDTO
+from src.application.dtos.reply_dto import CreateReplyDTO, DeletePostDTO, DeleteReplyDTO
+from src.interfaces.api.main import create_app
+from src.interfaces.container import Container
+from tests.integration.conftest import create_post
+
+
+def search(container: Container, query: str, sort_by: str = "newest") -> list[str]:
+    """Search and return matching post IDs."""
+    results = container.search_posts_use_case.execute(SearchPostsDTO(query=query, sort_by=sort_by))
+    return [post.post_id for post in results.posts]
+
+
+class TestFullTextSearch:
+    """Test cases for searching titles, bodies and replies."""
+
+    def test_matches_body_and_title_substring(self, container):
+        """Test that content is searched and title substrings still match."""
+        post_id = create_post(container, "Welcome", "Let us talk about databases")
+
+        assert search(container, "databases") == [post_id]
+        assert search(container, "welc") == [post_id]
+        assert search(container, "unrelated") == []
+
+    def test_relevance_sort(self, container):
+        """Test that relevance ordering differs from newest-first."""
+        relevant = create_post(container, "Python tips", "python python python")
+        passing = create_post(container, "Misc", "a long post that mentions python only once here")
+
+        assert search(container, "python") == [passing, relevant]
+        assert search(container, "python", sort_by="relevance") == [relevant, passing]
+
+    def test_reply_text_is_indexed_and_unindexed(self, container):
+        """Test that replies are searchable until they are deleted."""
+        post_id = create_post(container, "Question", "Any ideas?")
+        reply = container.create_reply_use_case.execute(
+            CreateReplyDTO(
+                post_id=post_id,
+                parent_id=post_id,
+                parent_type="post",
+                agent_name="test_agent",
+                content="Try a bloom filter",
+            )
+        )
+        assert search(container, "bloom") == [post_id]
+
+        container.delete_reply_use_case.execute(
+            DeleteReplyDTO(post_id=post_id, reply_id=reply.reply_id, agent_name="test_agent")
+        )
+        assert search(container, "bloom") == []
+
+    def test_invalid_sort_order(self, container):
+        """Test that unknown sort orders are rejected."""
+        with pytest.raises(ValueError):
+            search(container, "python", sort_by="oldest")
+
+
+def create_tagged_post(container: Container, title: str, tags: list[str]) -> str:
+    """Create a tagged post and return its ID."""
+    dto = CreatePostDTO(agent_name="test_agent", title=title, content="Body", tags=tags)
+    return container.create_post_use_case.execute(dto).post_id
+
+
+class TestTagSearch:
+    """Test cases for tag queries and the tag cloud."""
+
+    def test_tag_queries_and_counts(self, container):
+        """Test tag queries and counts through the use cases."""
+        python = create_tagged_post(container, "Asyncio", ["python", "async"])
+        rust = create_tagged_post(container, "Tokio", ["rust", "async"])
+        draft = create_tagged_post(container, "Draft", ["rust", "async", "draft"])
+
+        def search_tags(*terms: str) -> list[str]:
+            page = container.search_posts_use_case.execute(SearchPostsDTO(tags=list(terms)))
+            return [post.post_id for post in page.posts]
+
+        assert search_tags("python", "rust", "+async", "-draft") == [rust, python]
+        assert search_tags("+rust", "+draft") == [draft]
+
+        container.delete_post_use_case.execute(
+            DeletePostDTO(post_id=draft, agent_name="test_agent")
+        )
+        tags = container.list_tags_use_case.execute(limit=2)
+        assert [(t.tag, t.post_count) for t in tags] == [("async", 2), ("python", 1)]
+
+    def test_invalid_tag_query(self, container):
+        """Test that malformed tag terms are rejected."""
+        with pytest.raises(ValueError):
+            container.search_posts_use_case.execute(SearchPostsDTO(tags=["+"]))
+        with pytest.raises(ValueError):
+            container.list_tags_use_case.execute(limit=0)
+
+    def test_rest_endpoints(self, tmp_path):
+        """Test the tags search parameter and the tag cloud endpoint."""
+        app = create_app(tmp_path / "rest")
+        container = app.state.container
+        container.register_agent_use_case.execute(
+            CreateAgentDTO(agent_name="test_agent", description="Test agent")
+        )
+        python = create_tagged_post(container, "Asyncio", ["python", "async"])
+        create_tagged_post(container, "Threads", ["python"])
+        client = TestClient(app)
+
+        response = client.get("/api/v1/search", params={"tags": "python,+async,-draft"})
+        cloud = client.get("/api/v1/search/tags", params={"limit": 1})
+
+        assert [post["post_id"] for post in response.json()["results"]] == [python]
+        assert cloud.json() == {"tags": [{"tag": "python", "post_count": 2}]}
+        assert client.get("/api/v1/search", params={"tags": "+"}).status_code == 400
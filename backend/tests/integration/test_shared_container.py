@@ -0,0 +1,45 @@
+"""Integration tests for the container shared by the REST API and the MCP tools."""
+
+import asyncio
+
+from fastapi.testclient import TestClient
+from fastmcp import Client
+
+from src.interfaces.api.main import create_app
+from src.interfaces.container import get_container
+from src.interfaces.mcp import fastmcp_server
+
+
+class TestSharedContainer:
+    """Test cases for the application-scoped container."""
+
+    def test_app_installs_its_container(self, tmp_path):
+        """Test that the MCP tools resolve the container built by the app."""
+        app = create_app(tmp_path / "data")
+
+        assert get_container() is app.state.container
+        assert app.state.container.settings.data_dir == tmp_path / "data"
+
+    def test_mcp_writes_are_visible_through_rest(self, tmp_path):
+        """Test that a post created through MCP is served by the REST routes."""
+        app = create_app(tmp_path / "data")
+
+        async def call_tools() -> str:
+            async with Client(fastmcp_server.mcp) as client:
+                await client.call_tool(
+                    "register_agent", {"agent_name": "test_agent", "description": "Test agent"}
+                )
+                result = await client.call_tool(
+                    "create_post",
+                    {"agent_name": "test_agent", "title": "Shared", "content": "One container"},
+                )
+                return result.data["post"]["post_id"]
+
+        post_id = asyncio.run(call_tools())
+
+        client = TestClient(app)
+        listing = client.get("/api/v1/posts").json()
+        detail = client.get(f"/api/v1/posts/{post_id}").json()
+
+        assert [post["post_id"] for post in listing["posts"]] == [post_id]
+        assert detail["content"] == "One container"
@@ -0,0 +1,139 @@
+"""Integration tests for reading changes after a sequence number, on both backends."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.application.dtos.agent_dto import CreateAgentDTO
+from src.application.dtos.post_dto import CreatePostDTO
+from src.application.dtos.reply_dto import CreateReplyDTO, DeleteReplyDTO
+from src.application.dtos.update_dto import GetUpdatesDTO
+from src.interfaces.api.main import create_app
+from tests.integration.conftest import create_post
+
+
+def reply(container, post_id: str, agent_name: str, content: str) -> str:
+    """Reply to a post and return the reply ID."""
+    return container.create_reply_use_case.execute(
+        CreateReplyDTO(
+            post_id=post_id,
+            parent_id=post_id,
+            parent_type="post",
+            agent_name=agent_name,
+            content=content,
+        )
+    ).reply_id
+
+
+def updates(container, **kwargs) -> list[tuple[str, str]]:
+    """Get (type, post ID) pairs of the changes matching the filters."""
+    page = container.get_updates_use_case.execute(GetUpdatesDTO(**kwargs))
+    return [(u.type, u.post_id) for u in page.updates]
+
+
+@pytest.fixture
+def board(container):
+    """Three threads: test_agent's, one test_agent replied to, and an unrelated one."""
+    container.register_agent_use_case.execute(
+        CreateAgentDTO(agent_name="other_agent", description="Another agent")
+    )
+    mine = create_post(container, "Mine")
+    theirs = container.create_post_use_case.execute(
+        CreatePostDTO(agent_name="other_agent", title="Theirs", content="Body")
+    ).post_id
+    unrelated = container.create_post_use_case.execute(
+        CreatePostDTO(agent_name="other_agent", title="Unrelated", content="Body")
+    ).post_id
+    reply(container, theirs, "test_agent", "Me too")
+    reply(container, mine, "other_agent", "An answer")
+    reply(container, unrelated, "other_agent", "Talking to myself")
+    return mine, theirs, unrelated
+
+
+class TestGetUpdates:
+    """Test cases for GetUpdatesUseCase."""
+
+    def test_all_changes_in_order(self, container, board):
+        """Test that every change after the sequence number is returned in order."""
+        mine, theirs, unrelated = board
+
+        assert updates(container) == [
+            ("post_created", mine),
+            ("post_created", theirs),
+            ("post_created", unrelated),
+            ("reply_added", theirs),
+            ("reply_added", mine),
+            ("reply_added", unrelated),
+        ]
+        assert updates(container, since=4) == [("reply_added", mine), ("reply_added", unrelated)]
+
+    def test_thread_scopes(self, container, board):
+        """Test filtering to authored threads and to threads the agent took part in."""
+        mine, theirs, _ = board
+
+        assert updates(container, agent_name="test_agent", scope="authored") == [
+            ("post_created", mine),
+            ("reply_added", mine),
+        ]
+        assert updates(container, agent_name="test_agent", scope="participated") == [
+            ("post_created", mine),
+            ("post_created", theirs),
+            ("reply_added", theirs),
+            ("reply_added", mine),
+        ]
+
+    def test_pagination(self, container, board):
+        """Test that next_since continues a filtered listing without gaps."""
+        seen = []
+        since, has_more = 0, True
+        while has_more:
+            page = container.get_updates_use_case.execute(
+                GetUpdatesDTO(since=since, agent_name="test_agent", scope="participated", limit=1)
+            )
+            seen.extend(u.seq for u in page.updates)
+            since, has_more = page.next_since, page.has_more
+
+        assert seen == [1, 2, 4, 5]
+        assert since == 6
+
+    def test_content_and_deletions(self, container, board):
+        """Test that new text is included on request and deletions are reported."""
+        mine, _, _ = board
+        reply_id = reply(container, mine, "other_agent", "Second thoughts")
+        container.delete_reply_use_case.execute(
+            DeleteReplyDTO(post_id=mine, reply_id=reply_id, agent_name="other_agent")
+        )
+
+        page = container.get_updates_use_case.execute(GetUpdatesDTO(since=4, include_content=True))
+
+        assert [(u.type, u.content) for u in page.updates] == [
+            ("reply_added", "An answer"),
+            ("reply_added", "Talking to myself"),
+            ("reply_added", None),
+            ("reply_deleted", None),
+        ]
+        assert page.updates[-1].reply_id == reply_id
+
+    def test_invalid_requests(self, container):
+        """Test that scopes need an agent and unknown scopes are rejected."""
+        with pytest.raises(ValueError):
+            updates(container, scope="participated")
+        with pytest.raises(ValueError):
+            updates(container, agent_name="test_agent", scope="mentions")
+
+    def test_rest_endpoint(self, tmp_path):
+        """Test the updates endpoint over HTTP."""
+        app = create_app(tmp_path / "data")
+        container = app.state.container
+        container.register_agent_use_case.execute(
+            CreateAgentDTO(agent_name="test_agent", description="Test agent")
+        )
+        post_id = create_post(container, "Hello")
+        client = TestClient(app)
+
+        body = client.get("/api/v1/updates", params={"since": 0}).json()
+
+        assert [(u["seq"], u["type"], u["post_id"]) for u in body["updates"]] == [
+            (1, "post_created", post_id)
+        ]
+        assert (body["next_since"], body["has_more"], body["reset"]) == (1, False, False)
+        assert client.get("/api/v1/updates", params={"scope": "authored"}).status_code == 400
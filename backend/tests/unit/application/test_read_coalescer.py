@@ -0,0 +1,158 @@
+"""Unit tests for single-flight coalescing of read use cases."""
+
+import asyncio
+import threading
+import time
+from datetime import datetime
+
+import pytest
+
+from src.application.services.read_coalescer import ReadCoalescer
+from src.domain.events import PostCreated
+from src.infrastructure.events.event_bus import EventBus
+from src.shared.single_flight import AsyncSingleFlight, SingleFlight
+
+
+class SlowUseCase:
+    """Use case that blocks until released and counts its executions."""
+
+    def __init__(self) -> None:
+        """Initialize use case."""
+        self.release = threading.Event()
+        self.calls = 0
+
+    def execute(self, post_id: str) -> dict:
+        """Return a fresh result once released."""
+        self.calls += 1
+        self.release.wait(5)
+        if post_id == "missing":
+            raise LookupError(post_id)
+        return {"post_id": post_id}
+
+
+def run_concurrently(fn, count: int, wait_for, *args) -> tuple[list[threading.Thread], list]:
+    """Start calls to fn from several threads and wait until all but one are sharing."""
+    results: list = [None] * count
+
+    def call(i):
+        try:
+            results[i] = fn(*args)
+        except Exception as e:
+            results[i] = e
+
+    threads = [threading.Thread(target=call, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    deadline = time.monotonic() + 5
+    while wait_for() < count - 1 and time.monotonic() < deadline:
+        time.sleep(0.001)
+    return threads, results
+
+
+class TestSingleFlight:
+    """Test cases for SingleFlight."""
+
+    def test_concurrent_calls_share_one_execution(self):
+        """Test that overlapping calls with one key run once and share the result."""
+        flight = SingleFlight()
+        use_case = SlowUseCase()
+
+        threads, results = run_concurrently(
+            lambda: flight.do("key", use_case.execute, "p1"), 8, lambda: flight.stats().shared
+        )
+        use_case.release.set()
+        for thread in threads:
+            thread.join()
+
+        assert use_case.calls == 1
+        assert all(result is results[0] for result in results)
+        assert flight.stats().to_dict() == {"executed": 1, "shared": 7, "in_flight": 0}
+
+        # Finished calls are not cached
+        flight.do("key", use_case.execute, "p1")
+        assert use_case.calls == 2
+
+    def test_exceptions_are_shared(self):
+        """Test that every waiting caller receives the exception of the shared call."""
+        flight = SingleFlight()
+        use_case = SlowUseCase()
+
+        threads, results = run_concurrently(
+            lambda: flight.do("key", use_case.execute, "missing"),
+            4,
+            lambda: flight.stats().shared,
+        )
+        use_case.release.set()
+        for thread in threads:
+            thread.join()
+
+        assert use_case.calls == 1
+        assert all(isinstance(result, LookupError) for result in results)
+        with pytest.raises(LookupError):
+            flight.do("key", use_case.execute, "missing")
+
+
+class TestAsyncSingleFlight:
+    """Test cases for AsyncSingleFlight."""
+
+    def test_cancelled_caller_leaves_the_call_running(self):
+        """Test that callers share one call and a cancelled one does not cancel it."""
+        flight = AsyncSingleFlight()
+        calls = 0
+
+        async def call(release: asyncio.Event) -> dict:
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return {"post_id": "p1"}
+
+        async def run_callers() -> tuple[list[asyncio.Task], list]:
+            release = asyncio.Event()
+            callers = [
+                asyncio.create_task(flight.do("key", lambda: call(release))) for _ in range(4)
+            ]
+            await asyncio.sleep(0)
+            callers[0].cancel()
+            await asyncio.sleep(0)
+            release.set()
+            return callers, await asyncio.gather(*callers[1:])
+
+        callers, results = asyncio.run(run_callers())
+
+        assert calls == 1
+        assert callers[0].cancelled()
+        assert all(result is results[0] for result in results)
+        assert flight.stats().to_dict() == {"executed": 1, "shared": 3, "in_flight": 0}
+
+
+class TestReadCoalescer:
+    """Test cases for ReadCoalescer."""
+
+    def test_arguments_and_writes_separate_calls(self):
+        """Test that different arguments, and calls after a write, do not share results."""
+        bus = EventBus()
+        coalescer = ReadCoalescer()
+        coalescer.subscribe(bus)
+        use_case = SlowUseCase()
+        wrapped = coalescer.wrap(use_case)
+
+        threads, results = run_concurrently(
+            wrapped.execute, 3, lambda: coalescer.stats().shared, "p1"
+        )
+        other = threading.Thread(target=wrapped.execute, args=("p2",))
+        other.start()
+        bus.publish(
+            PostCreated(
+                occurred_at=datetime(2024, 1, 1), post_id="p3", agent_name="a", title="Title"
+            )
+        )
+        after_write = threading.Thread(target=wrapped.execute, args=("p1",))
+        after_write.start()
+        time.sleep(0.05)
+        use_case.release.set()
+        for thread in [*threads, other, after_write]:
+            thread.join()
+
+        assert use_case.calls == 3
+        assert results[0] is results[1] is results[2]
+        assert coalescer.stats().shared == 2
@@ -87,3 +87,8 @@ class TestContent:
         special = "Content with émojis 🎉 and spëcial çhars!"
         content = Content(special)
         assert content.value == special
+
+    def test_mentions(self):
+        """Test that @agent_name mentions are extracted once each, in order."""
+        content = Content("@alice see @bob_2's reply, cc @alice (not mail@example.com or @x)")
+        assert content.mentions() == ["alice", "bob_2"]
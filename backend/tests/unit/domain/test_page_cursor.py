@@ -0,0 +1,41 @@
+"""Unit tests for PageCursor value object."""
+
+from datetime import UTC, datetime
+
+import pytest
+
+from src.domain.value_objects.page_cursor import PageCursor
+
+
+class TestPageCursor:
+    """Test cases for PageCursor value object."""
+
+    def test_round_trip(self):
+        """Test that a cursor survives encoding and decoding."""
+        cursor = PageCursor(datetime(2026, 1, 31, 12, 0, 0, 123456), "post_1_abc")
+
+        token = cursor.encode()
+
+        assert "=" not in token
+        assert PageCursor.decode(token) == cursor
+
+    @pytest.mark.parametrize("token", ["", "not a cursor", "e30", "W10"])
+    def test_invalid_token_raises_error(self, token):
+        """Test that malformed tokens raise ValueError."""
+        with pytest.raises(ValueError, match="Invalid pagination cursor"):
+            PageCursor.decode(token)
+
+    def test_offset_aware_time_raises_error(self):
+        """Test that cursors with a UTC offset are rejected."""
+        token = PageCursor(datetime(2020, 1, 1, tzinfo=UTC), "x").encode()
+
+        with pytest.raises(ValueError, match="Invalid pagination cursor"):
+            PageCursor.decode(token)
+
+    def test_sort_key_orders_by_time_then_id(self):
+        """Test the keyset ordering."""
+        earlier = PageCursor(datetime(2026, 1, 1), "post_b")
+        later = PageCursor(datetime(2026, 1, 2), "post_a")
+
+        assert earlier.sort_key < later.sort_key
+        assert PageCursor(datetime(2026, 1, 1), "post_a").sort_key < earlier.sort_key
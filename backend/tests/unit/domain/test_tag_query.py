@@ -0,0 +1,48 @@
+"""Unit tests for TagQuery value object."""
+
+import pytest
+
+from src.domain.value_objects.tag_query import TagQuery
+
+
+class TestTagQuery:
+    """Test cases for TagQuery value object."""
+
+    def test_parse_prefixes(self):
+        """Test that '+' marks required and '-' excluded tags."""
+        query = TagQuery.parse(["Rust", " python ", "+Async", "-draft", "python"])
+
+        assert query.any_of == ("python", "rust")
+        assert query.all_of == ("async",)
+        assert query.none_of == ("draft",)
+        assert query.to_terms() == ["python", "rust", "+async", "-draft"]
+        assert TagQuery.parse(query.to_terms()) == query
+
+    def test_matches(self):
+        """Test OR, AND and NOT semantics."""
+        query = TagQuery.parse(["python", "rust", "+async", "-draft"])
+
+        assert query.matches(["python", "async"])
+        assert query.matches(["rust", "async", "web"])
+        assert not query.matches(["python"])
+        assert not query.matches(["go", "async"])
+        assert not query.matches(["python", "async", "draft"])
+
+    def test_exclusion_only_matches_untagged_posts(self):
+        """Test that a query without positive terms matches posts lacking the excluded tags."""
+        query = TagQuery.parse(["-draft"])
+
+        assert query.matches([])
+        assert not query.matches(["draft"])
+
+    def test_empty_query(self):
+        """Test that a query without terms matches every post."""
+        assert TagQuery().is_empty()
+        assert TagQuery().matches(["anything"])
+        assert not TagQuery.parse(["-draft"]).is_empty()
+
+    @pytest.mark.parametrize("term", ["+", "-", "", "+bad tag"])
+    def test_invalid_terms_raise_error(self, term):
+        """Test that empty and invalid tags are rejected."""
+        with pytest.raises(ValueError):
+            TagQuery.parse([term])
@@ -0,0 +1,104 @@
+"""Unit tests for the change log."""
+
+from datetime import datetime
+
+import pytest
+
+from src.domain.events import PostCreated
+from src.infrastructure.events.change_log import ChangeLog
+from src.infrastructure.persistence.file_storage import FileStorage
+
+
+def post_created(post_id: str) -> PostCreated:
+    """Build a post created event."""
+    return PostCreated(
+        occurred_at=datetime(2024, 1, 1), post_id=post_id, agent_name="test_agent", title="Title"
+    )
+
+
+@pytest.fixture
+def storage(tmp_path):
+    """Create file storage in a temporary directory."""
+    return FileStorage(tmp_path)
+
+
+class TestChangeLog:
+    """Test cases for ChangeLog."""
+
+    def test_sequence_is_monotonic_across_instances(self, storage):
+        """Test that every writer continues the same sequence."""
+        first, second = ChangeLog(storage), ChangeLog(storage)
+
+        assert [first.append(post_created("a")), second.append(post_created("b"))] == [1, 2]
+        assert first.append(post_created("c")) == 3
+        assert second.last_seq() == 3
+
+    def test_resume_after_event(self, storage):
+        """Test that a reader resumes just after the event it last saw."""
+        log = ChangeLog(storage)
+        for post_id in "abc":
+            log.append(post_created(post_id))
+
+        cursor, missed = log.cursor_after(1)
+        records, cursor, _ = log.read(cursor)
+        assert not missed
+        assert [(r["seq"], r["post_id"]) for r in records] == [(2, "b"), (3, "c")]
+
+        log.append(post_created("d"))
+        records, _, _ = log.read(cursor)
+        assert [r["seq"] for r in records] == [4]
+
+    def test_start_at_end(self, storage):
+        """Test that a reader without an event ID only sees new events."""
+        log = ChangeLog(storage)
+        cursor, missed = log.cursor_after(None)
+        log.append(post_created("a"))
+
+        records, _, _ = log.read(cursor)
+        assert not missed
+        assert [r["post_id"] for r in records] == ["a"]
+
+    def test_reader_follows_segment_rotation(self, storage, monkeypatch):
+        """Test that no event is skipped or repeated when a segment is rotated."""
+        monkeypatch.setattr(ChangeLog, "SEGMENT_BYTES", 400)
+        log = ChangeLog(storage)
+        log.append(post_created("p0"))
+        cursor, _ = log.cursor_after(None)
+
+        seen = []
+        for i in range(1, 20):
+            log.append(post_created(f"p{i}"))
+            if i % 2 == 0:
+                records, cursor, missed = log.read(cursor, limit=2)
+                seen.extend(r["seq"] for r in records)
+                assert not missed
+        while True:
+            records, cursor, _ = log.read(cursor)
+            if not records:
+                break
+            seen.extend(r["seq"] for r in records)
+
+        assert seen == list(range(2, 21))
+
+    def test_unknown_or_expired_event_id(self, storage, monkeypatch):
+        """Test that a reader is told when it cannot resume without a gap."""
+        monkeypatch.setattr(ChangeLog, "SEGMENT_BYTES", 400)
+        log = ChangeLog(storage)
+        for i in range(20):
+            log.append(post_created(f"p{i}"))
+
+        assert log.cursor_after(1)[1] is True
+        assert log.cursor_after(99)[1] is True
+        assert log.cursor_after(log.last_seq())[1] is False
+
+    def test_binary_search_finds_every_position(self, storage):
+        """Test that resuming lands on the right record anywhere in the log."""
+        log = ChangeLog(storage)
+        for i in range(50):
+            log.append(post_created(f"p{i}"))
+
+        for seq in range(50):
+            cursor, missed = log.cursor_after(seq)
+            records, _, _ = log.read(cursor, limit=1)
+            assert not missed
+            assert records[0]["seq"] == seq + 1
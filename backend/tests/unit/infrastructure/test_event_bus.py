@@ -0,0 +1,149 @@
+"""Unit tests for the event bus and its outbox."""
+
+import threading
+from datetime import datetime
+
+import pytest
+
+from src.domain.events import DomainEvent, PostCreated, ReplyDeleted
+from src.infrastructure.events.event_bus import EventBus
+from src.infrastructure.events.event_outbox import (
+    EventOutbox,
+    OutboxInUseError,
+    event_from_dict,
+    event_to_dict,
+)
+from src.infrastructure.persistence.file_storage import FileStorage
+
+
+def post_created(post_id: str) -> PostCreated:
+    """Build a post created event."""
+    return PostCreated(
+        occurred_at=datetime(2024, 1, 1), post_id=post_id, agent_name="test_agent", title="Title"
+    )
+
+
+class TestEventBus:
+    """Test cases for EventBus."""
+
+    def test_inline_dispatch_by_type(self):
+        """Test that handlers see the events of their type and its subclasses."""
+        bus = EventBus()
+        created, everything = [], []
+        bus.subscribe(PostCreated, created.append)
+        bus.subscribe(DomainEvent, everything.append)
+
+        deleted = ReplyDeleted(
+            occurred_at=datetime(2024, 1, 1), reply_id="r", post_id="p", agent_name="a"
+        )
+        bus.publish(post_created("p1"))
+        bus.publish(deleted)
+
+        assert [e.post_id for e in created] == ["p1"]
+        assert everything == [post_created("p1"), deleted]
+
+    def test_failing_handler_is_isolated(self):
+        """Test that a failing handler neither raises nor stops other handlers."""
+        bus = EventBus()
+        received = []
+
+        def fail(_event):
+            raise RuntimeError("boom")
+
+        bus.subscribe(PostCreated, fail)
+        bus.subscribe(PostCreated, received.append)
+        bus.publish(post_created("p1"))
+
+        assert len(received) == 1
+        assert bus.stats().failed == 1
+
+    def test_background_dispatch_keeps_order(self):
+        """Test that the worker handles events off the publishing thread, in order."""
+        bus = EventBus()
+        received = []
+        bus.subscribe(PostCreated, lambda e: received.append((e.post_id, threading.get_ident())))
+        bus.start()
+
+        for i in range(250):
+            bus.publish(post_created(f"p{i}"))
+        assert bus.flush(timeout=5)
+
+        assert [post_id for post_id, _ in received] == [f"p{i}" for i in range(250)]
+        assert threading.get_ident() not in {thread for _, thread in received}
+        assert bus.stats().pending == 0
+        bus.shutdown()
+
+    def test_shutdown_drains_queue(self):
+        """Test that queued events are handled before the worker stops."""
+        bus = EventBus()
+        received = []
+        bus.subscribe(PostCreated, received.append)
+        bus.start()
+        for i in range(10):
+            bus.publish(post_created(f"p{i}"))
+        bus.shutdown(timeout=5)
+
+        assert len(received) == 10
+
+    def test_inline_handlers_run_in_publish(self):
+        """Test that inline handlers run before publish returns while the worker is running."""
+        bus = EventBus()
+        inline = []
+        bus.subscribe(PostCreated, lambda e: inline.append(threading.get_ident()), inline=True)
+        bus.start()
+
+        bus.publish(post_created("p1"))
+
+        assert inline == [threading.get_ident()]
+        bus.shutdown(timeout=5)
+
+
+class TestEventOutbox:
+    """Test cases for EventOutbox."""
+
+    def test_round_trip(self):
+        """Test that events survive serialization."""
+        event = post_created("p1")
+        assert event_from_dict(event_to_dict(event)) == event
+        assert event_from_dict({"type": "Unknown"}) is None
+
+    def test_unhandled_events_are_replayed(self, tmp_path):
+        """Test that events appended by a stopped process are handled on start."""
+        outbox = EventOutbox(FileStorage(tmp_path))
+        outbox.append(post_created("p1"))
+        outbox.append(post_created("p2"))
+
+        bus = EventBus(EventOutbox(FileStorage(tmp_path)))
+        received = []
+        bus.subscribe(PostCreated, received.append)
+        bus.start()
+        bus.publish(post_created("p3"))
+        assert bus.flush(timeout=5)
+        bus.shutdown()
+
+        assert [e.post_id for e in received] == ["p1", "p2", "p3"]
+        assert outbox.pending() == []
+
+    def test_outbox_has_a_single_owner(self, tmp_path):
+        """Test that a second bus cannot use an outbox until the first one shuts down."""
+        bus = EventBus(EventOutbox(FileStorage(tmp_path)))
+
+        with pytest.raises(OutboxInUseError):
+            EventBus(EventOutbox(FileStorage(tmp_path)))
+
+        bus.shutdown()
+        EventBus(EventOutbox(FileStorage(tmp_path))).shutdown()
+
+    def test_compacts_when_caught_up(self, tmp_path, monkeypatch):
+        """Test that a fully handled outbox is truncated once it grows large."""
+        monkeypatch.setattr(EventOutbox, "COMPACT_BYTES", 100)
+        outbox = EventOutbox(FileStorage(tmp_path))
+        bus = EventBus(outbox)
+        bus.subscribe(PostCreated, lambda _event: None)
+
+        for i in range(5):
+            bus.publish(post_created(f"p{i}"))
+
+        assert (tmp_path / "events" / "outbox.jsonl").stat().st_size < 100
+        position = outbox.append(post_created("p5"))
+        assert [(e.post_id, p) for e, p in outbox.pending()] == [("p5", position)]
@@ -0,0 +1,110 @@
+"""Unit tests for the blocking executor."""
+
+import asyncio
+import contextvars
+import threading
+
+import pytest
+
+from src.infrastructure.executor import BlockingExecutor, ExecutorOverloadedError
+
+request_id: contextvars.ContextVar[str] = contextvars.ContextVar("request_id", default="")
+
+
+class TestBlockingExecutor:
+    """Test cases for BlockingExecutor."""
+
+    def test_runs_off_the_event_loop_thread(self):
+        """Test that calls run on a worker thread with the caller's context."""
+        executor = BlockingExecutor(max_workers=2)
+
+        async def main():
+            request_id.set("req-1")
+            return await executor.run(lambda: (threading.current_thread(), request_id.get()))
+
+        thread, seen_request_id = asyncio.run(main())
+
+        assert thread is not threading.main_thread()
+        assert seen_request_id == "req-1"
+        stats = executor.stats()
+        assert (stats.submitted, stats.completed, stats.active, stats.queued) == (1, 1, 0, 0)
+        executor.shutdown()
+
+    def test_failures_are_counted_and_raised(self):
+        """Test that exceptions propagate to the awaiting caller."""
+        executor = BlockingExecutor(max_workers=1)
+
+        def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            asyncio.run(executor.run(fail))
+        assert executor.stats().failed == 1
+        executor.shutdown()
+
+    def test_queue_limit_rejects_excess_calls(self):
+        """Test that calls beyond the queue limit fail fast."""
+        executor = BlockingExecutor(max_workers=1, queue_limit=1)
+        release = threading.Event()
+        started = threading.Event()
+
+        def block():
+            started.set()
+            release.wait(5)
+
+        async def main():
+            running = asyncio.ensure_future(executor.run(block))
+            await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+            waiting = asyncio.ensure_future(executor.run(block))
+            await asyncio.sleep(0)
+            with pytest.raises(ExecutorOverloadedError):
+                await executor.run(block)
+            release.set()
+            await asyncio.gather(running, waiting)
+
+        asyncio.run(main())
+
+        stats = executor.stats()
+        assert (stats.completed, stats.rejected) == (2, 1)
+        executor.shutdown()
+
+    def test_cancelled_waiting_calls_free_the_queue(self):
+        """Test that callers cancelled before a worker is free neither run nor hold a slot."""
+        executor = BlockingExecutor(max_workers=1, queue_limit=2)
+        release = threading.Event()
+        started = threading.Event()
+        ran = []
+
+        def block():
+            started.set()
+            release.wait(5)
+
+        async def main():
+            running = asyncio.ensure_future(executor.run(block))
+            await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+            for _ in range(2):
+                waiting = asyncio.ensure_future(executor.run(ran.append, "cancelled"))
+                await asyncio.sleep(0)
+                waiting.cancel()
+                with pytest.raises(asyncio.CancelledError):
+                    await waiting
+            assert executor.stats().queued == 0
+
+            later = asyncio.ensure_future(executor.run(ran.append, "later"))
+            await asyncio.sleep(0)
+            release.set()
+            await asyncio.gather(running, later)
+
+        asyncio.run(main())
+
+        stats = executor.stats()
+        assert ran == ["later"]
+        assert (stats.queued, stats.cancelled, stats.rejected, stats.completed) == (0, 2, 0, 2)
+        executor.shutdown()
+
+    def test_invalid_sizes(self):
+        """Test that nonsensical sizes are rejected."""
+        with pytest.raises(ValueError):
+            BlockingExecutor(max_workers=0)
+        with pytest.raises(ValueError):
+            BlockingExecutor(max_workers=1, queue_limit=-1)
@@ -0,0 +1,143 @@
+"""Unit tests for reader/writer file locks."""
+
+import threading
+import time
+
+import pytest
+
+from src.infrastructure.metrics import Histogram
+from src.infrastructure.persistence.file_storage import FileStorage
+from src.infrastructure.utils.file_lock import (
+    LockTimeoutError,
+    LockWaitRecorder,
+    lock_stats,
+    lock_stats_by_name,
+    record_lock_waits,
+)
+
+
+@pytest.fixture
+def storage(tmp_path):
+    """Create file storage in a temporary directory."""
+    return FileStorage(tmp_path)
+
+
+class TestFileLock:
+    """Test cases for FileLock."""
+
+    def test_shared_locks_are_held_together(self, storage):
+        """Test that readers share the lock and keep writers out."""
+        first = storage.get_lock("post_p1", shared=True)
+        second = storage.get_lock("post_p1", shared=True)
+        assert first.acquire(timeout=1)
+        assert second.acquire(timeout=0)
+
+        writer = storage.get_lock("post_p1")
+        assert not writer.acquire(timeout=0.05)
+        first.release()
+        assert not writer.acquire(timeout=0)
+        second.release()
+        assert writer.acquire(timeout=0)
+        writer.release()
+
+    def test_exclusive_lock_blocks_readers(self, storage):
+        """Test that a reader waits for the writer and then proceeds."""
+        order = []
+        writer = storage.get_lock("post_p1")
+        writer.acquire()
+
+        def read():
+            with storage.get_lock("post_p1", shared=True):
+                order.append("read")
+
+        thread = threading.Thread(target=read)
+        thread.start()
+        time.sleep(0.05)
+        order.append("write")
+        writer.release()
+        thread.join(timeout=5)
+
+        assert order == ["write", "read"]
+
+    def test_timeout_raises_in_context_manager(self, storage):
+        """Test that a lock that cannot be taken in time raises and is counted."""
+        timeouts = lock_stats().exclusive.timeouts
+        with (
+            storage.get_lock("post_p1", shared=True),
+            pytest.raises(LockTimeoutError),
+            storage.get_lock("post_p1", timeout=0.01),
+        ):
+            pass
+
+        assert lock_stats().exclusive.timeouts == timeouts + 1
+        with storage.get_lock("post_p1", timeout=0):
+            pass
+
+    def test_lock_files_stay_open_between_acquisitions(self, storage):
+        """Test that repeated acquisitions reuse the pooled lock file."""
+        with storage.get_lock("post_p1"):
+            pass
+        open_fds = lock_stats().open_fds
+        acquired = lock_stats().exclusive.acquired
+        for _ in range(5):
+            with storage.get_lock("post_p1"):
+                pass
+
+        stats = lock_stats()
+        assert stats.open_fds == open_fds
+        assert stats.exclusive.acquired == acquired + 5
+        assert stats.exclusive.hold_seconds.count >= acquired + 5
+
+
+class TestLockStatsByName:
+    """Test cases for per-label lock metrics."""
+
+    def test_record_locks_share_a_label(self, storage):
+        """Test that locks of individual posts are reported under one label."""
+        before = lock_stats_by_name().get(("post", "shared"))
+        with storage.get_lock("post_p1", shared=True):
+            pass
+        with storage.get_lock("post_p2", shared=True):
+            pass
+        with storage.get_lock("change_log"):
+            pass
+
+        stats = lock_stats_by_name()
+        acquired = before.acquired if before else 0
+        assert stats[("post", "shared")].acquired == acquired + 2
+        assert stats[("post", "shared")].hold_seconds.count == acquired + 2
+        assert ("change_log", "exclusive") in stats
+        assert not any(name.startswith("post_") for name, _ in stats)
+
+
+class TestHistogram:
+    """Test cases for Histogram."""
+
+    def test_buckets_are_cumulative(self):
+        """Test that bucket counts include every smaller observation."""
+        histogram = Histogram(buckets=(0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 2.0):
+            histogram.observe(value)
+
+        snapshot = histogram.snapshot()
+        assert snapshot.buckets == [(0.1, 2), (1.0, 3)]
+        assert snapshot.count == 4
+        assert snapshot.sum == pytest.approx(2.65)
+
+
+class TestLockWaitRecorder:
+    """Test cases for crediting lock waits to callers."""
+
+    def test_waits_are_recorded_in_context_only(self, storage):
+        """Test that a recorder sees acquisitions made while it is active."""
+        recorder = LockWaitRecorder()
+        with record_lock_waits(recorder):
+            with storage.get_lock("post_p1"):
+                pass
+            with storage.get_lock("post_p1", shared=True):
+                pass
+        with storage.get_lock("post_p1"):
+            pass
+
+        assert recorder.acquisitions == 2
+        assert recorder.wait_seconds >= 0
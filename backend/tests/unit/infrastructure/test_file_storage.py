@@ -0,0 +1,20 @@
+"""Unit tests for the I/O counters of FileStorage."""
+
+from src.infrastructure.persistence.file_storage import FileStorage
+
+
+class TestFileStorageIOStats:
+    """Test cases for the byte counters of FileStorage."""
+
+    def test_markdown_is_counted_in_bytes(self, tmp_path):
+        """Test that non-ASCII markdown is counted by its encoded size."""
+        storage = FileStorage(tmp_path / "data")
+        path = storage.posts_dir / "content.md"
+        content = "掲示板への投稿 ✓"
+
+        storage.write_markdown(path, content)
+        assert storage.read_markdown(path) == content
+
+        stats = storage.io_stats()
+        size = len(content.encode("utf-8"))
+        assert (stats.bytes_written, stats.bytes_read) == (size, size)
@@ -0,0 +1,381 @@
+"""Unit tests for the file-based post, agent and full-text indexes."""
+
+import json
+import os
+
+import pytest
+
+from src.domain.value_objects.tag_query import TagQuery
+from src.infrastructure.indexes.agent_index import AgentIndex
+from src.infrastructure.indexes.full_text_index import FullTextIndex, tokenize
+from src.infrastructure.indexes.index_journal import IndexJournal
+from src.infrastructure.indexes.post_index import PostIndex
+from src.infrastructure.persistence.file_storage import FileStorage
+
+
+def make_entry(post_id: str, **kwargs) -> dict:
+    """Create a post index entry."""
+    return {
+        "post_id": post_id,
+        "title": kwargs.get("title", f"Title {post_id}"),
+        "agent_name": kwargs.get("agent_name", "test_agent"),
+        "tags": kwargs.get("tags", []),
+        "deleted": kwargs.get("deleted", False),
+    }
+
+
+@pytest.fixture
+def storage(tmp_path):
+    """Create a file storage rooted in a temporary directory."""
+    return FileStorage(tmp_path)
+
+
+@pytest.fixture
+def index(storage):
+    """Create a post index."""
+    return PostIndex(storage)
+
+
+def read_snapshot(storage: FileStorage) -> dict:
+    """Read the raw index snapshot."""
+    return json.loads((storage.index_dir / "posts_index.json").read_text())
+
+
+def read_shard(storage: FileStorage, name: str) -> list[dict]:
+    """Read the entries of a shard including its journal."""
+    posts = json.loads((storage.index_dir / name).read_text())["posts"]
+    journal = (storage.index_dir / name).with_suffix(".journal").read_text().splitlines()
+    return posts + [json.loads(line) for line in journal[1:]]
+
+
+class TestPostIndexJournal:
+    """Test cases for PostIndex journaling and compaction."""
+
+    def test_writes_append_to_journal_without_touching_snapshot(self, storage, index):
+        """Test that writes go to the journal only."""
+        before = read_snapshot(storage)
+
+        index.add_post(make_entry("post_1"))
+        index.update_post("post_1", make_entry("post_1", title="Edited"))
+        index.add_post(make_entry("post_2"))
+        index.remove_post("post_2")
+
+        assert read_snapshot(storage) == before
+        assert [p["title"] for p in index.get_all_posts()] == ["Edited"]
+
+    def test_add_existing_post_is_ignored(self, index):
+        """Test that add keeps the first version of a post."""
+        index.add_post(make_entry("post_1", title="First"))
+        index.add_post(make_entry("post_1", title="Second"))
+
+        assert [p["title"] for p in index.get_all_posts()] == ["First"]
+
+    def test_search_sees_journaled_writes(self, index):
+        """Test that searches replay the journal."""
+        index.add_post(make_entry("post_1", title="Hello", tags=["intro"]))
+        index.add_post(make_entry("post_2", title="Other", deleted=True))
+
+        assert [p["post_id"] for p in index.search_posts(query="hell")] == ["post_1"]
+        assert [p["post_id"] for p in index.search_posts(tags=TagQuery(["intro"]))] == ["post_1"]
+        assert len(index.get_all_posts(include_deleted=True)) == 2
+
+    def test_compaction_folds_journal_into_snapshot(self, storage, index, monkeypatch):
+        """Test that a large journal is compacted into a new snapshot."""
+        monkeypatch.setattr(IndexJournal, "MIN_COMPACT_BYTES", 256)
+
+        for i in range(20):
+            index.add_post(make_entry(f"post_{i}"))
+
+        snapshot = read_snapshot(storage)
+        assert snapshot["generation"] > 0
+        assert len(snapshot["posts"]) < 20
+        assert len(index.get_all_posts()) == 20
+        assert len(PostIndex(storage).get_all_posts()) == 20
+
+    def test_stale_journal_is_ignored_and_reset(self, storage, index):
+        """Test recovery from a compaction interrupted after the snapshot."""
+        index.add_post(make_entry("post_1"))
+        journal_path = storage.index_dir / "posts_index.journal"
+        stale_journal = journal_path.read_bytes()
+
+        index.rebuild_from_posts([make_entry("post_2")])
+        journal_path.write_bytes(stale_journal)
+
+        assert [p["post_id"] for p in index.get_all_posts()] == ["post_2"]
+
+        reopened = PostIndex(storage)
+        reopened.add_post(make_entry("post_3"))
+        assert [p["post_id"] for p in reopened.get_all_posts()] == ["post_2", "post_3"]
+
+    def test_legacy_snapshot_without_journal(self, storage):
+        """Test that an index written before journaling is still readable."""
+        storage.index_dir.mkdir(parents=True, exist_ok=True)
+        (storage.index_dir / "posts_index.json").write_text(
+            json.dumps({"posts": [make_entry("post_1")], "last_updated": None})
+        )
+
+        index = PostIndex(storage)
+        index.add_post(make_entry("post_2"))
+
+        assert [p["post_id"] for p in index.get_all_posts()] == ["post_1", "post_2"]
+
+    def test_torn_append_is_skipped(self, storage, index):
+        """Test that a record torn by a crashed writer is not replayed."""
+        index.add_post(make_entry("post_1"))
+        with (storage.index_dir / "posts_index.journal").open("a") as f:
+            f.write('{"op": "add", "post": {"post_id": "po')
+
+        assert [p["post_id"] for p in index.get_all_posts()] == ["post_1"]
+
+        index.add_post(make_entry("post_2"))
+        assert [p["post_id"] for p in index.get_all_posts()] == ["post_1", "post_2"]
+
+
+class TestPostIndexCache:
+    """Test cases for the in-memory index shared across worker processes."""
+
+    def test_reads_only_journal_tail_when_snapshot_unchanged(self, storage, index):
+        """Test that a warm read does not re-parse the snapshot."""
+        index.add_post(make_entry("post_1"))
+        index.get_all_posts()
+
+        # Corrupt the snapshot in place without changing its stat signature
+        snapshot_path = storage.index_dir / "posts_index.json"
+        stat = snapshot_path.stat()
+        with snapshot_path.open("r+b") as f:
+            f.write(b"x" * stat.st_size)
+        os.utime(snapshot_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        index.add_post(make_entry("post_2"))
+
+        assert [p["post_id"] for p in index.get_all_posts()] == ["post_1", "post_2"]
+
+    def test_writes_from_other_instances_are_visible(self, storage, index, monkeypatch):
+        """Test that each reader sees writes made through another instance."""
+        monkeypatch.setattr(IndexJournal, "MIN_COMPACT_BYTES", 256)
+        other = PostIndex(storage)
+        assert index.get_all_posts() == []
+
+        for i in range(20):
+            other.add_post(make_entry(f"post_{i}"))
+            assert len(index.get_all_posts()) == i + 1
+
+        other.update_post("post_0", make_entry("post_0", deleted=True))
+        other.rebuild_from_posts([make_entry("post_x")])
+        assert [p["post_id"] for p in index.get_all_posts()] == ["post_x"]
+
+    def test_returned_entries_are_copies(self, index):
+        """Test that callers cannot corrupt the cache."""
+        index.add_post(make_entry("post_1"))
+
+        index.get_all_posts()[0]["title"] = "Changed"
+
+        assert index.get_all_posts()[0]["title"] == "Title post_1"
+
+
+class TestPostIndexPaging:
+    """Test cases for keyset paging over the sorted index."""
+
+    def test_page_posts_newest_first_after_key(self, index):
+        """Test ordering, keyset bounds and filters."""
+        for i in range(5):
+            entry = make_entry(f"post_{i}", deleted=i == 3)
+            index.add_post({**entry, "created_at": f"2026-01-01T12:00:0{i}"})
+        index.update_post(
+            "post_0", {**make_entry("post_0", title="Edited"), "created_at": "2026-01-01T12:00:00"}
+        )
+
+        first = index.page_posts(2)
+        rest = index.page_posts(10, after=("2026-01-01T12:00:02", "post_2"))
+
+        assert [p["post_id"] for p in first] == ["post_4", "post_2"]
+        assert [p["post_id"] for p in rest] == ["post_1", "post_0"]
+        assert rest[1]["title"] == "Edited"
+        assert index.count_posts() == 4
+        assert index.count_posts(include_deleted=True) == 5
+
+
+class TestAgentIndexCache:
+    """Test cases for the in-memory agent index."""
+
+    def test_writes_from_other_instances_are_visible(self, storage):
+        """Test that each reader sees agents registered through another instance."""
+        reader = AgentIndex(storage)
+        writer = AgentIndex(storage)
+        assert reader.find_agent("agent_a") is None
+
+        writer.add_agent({"agent_name": "agent_a", "description": "A"})
+        writer.update_agent("agent_a", {"agent_name": "agent_a", "description": "Edited"})
+
+        assert reader.find_agent("agent_a")["description"] == "Edited"
+        assert [a["agent_name"] for a in reader.get_all_agents()] == ["agent_a"]
+
+
+class TestFullTextIndex:
+    """Test cases for the BM25 full-text index."""
+
+    def test_tokenize(self):
+        """Test word and CJK tokenization."""
+        assert tokenize("Hello, World_2! 中文") == ["hello", "world", "2", "中", "文"]
+
+    def test_ranks_by_bm25(self, storage):
+        """Test that denser and title matches rank higher."""
+        index = FullTextIndex(storage)
+        index.add_document("post_1", "Cooking", "python python python snakes")
+        index.add_document("post_2", "Gardening", "a long text that mentions python once")
+        index.add_document("post_3", "Python tips", "short")
+        index.add_document("post_4", "Other", "nothing relevant")
+
+        scores = index.search("Python")
+
+        assert set(scores) == {"post_1", "post_2", "post_3"}
+        assert scores["post_1"] > scores["post_2"]
+        assert scores["post_3"] > scores["post_2"]
+
+    def test_add_and_remove_reply_text(self, storage):
+        """Test that reply text joins and leaves the post document."""
+        index = FullTextIndex(storage)
+        index.add_document("post_1", "Title", "Body")
+        index.add_text("post_1", "a reply about databases")
+        assert set(index.search("databases")) == {"post_1"}
+
+        index.remove_text("post_1", "a reply about databases")
+        assert index.search("databases") == {}
+        assert set(index.search("body")) == {"post_1"}
+
+    def test_survives_compaction_and_reopen(self, storage, monkeypatch):
+        """Test that journaled postings are folded into the snapshot."""
+        monkeypatch.setattr(IndexJournal, "MIN_COMPACT_BYTES", 256)
+        writer = FullTextIndex(storage)
+        reader = FullTextIndex(storage)
+
+        for i in range(20):
+            writer.add_document(f"post_{i}", f"Title {i}", f"common word{i}")
+
+        assert len(reader.search("common")) == 20
+        assert set(FullTextIndex(storage).search("word7")) == {"post_7"}
+
+    def test_rebuild_from_documents(self, storage):
+        """Test rebuilding the whole index."""
+        index = FullTextIndex(storage)
+        index.add_document("stale", "Old", "gone")
+
+        index.rebuild_from_documents([("post_1", FullTextIndex.document_terms("New", "body"))])
+
+        assert index.search("gone") == {}
+        assert set(index.search("new body")) == {"post_1"}
+
+
+class TestShardedPostIndex:
+    """Test cases for a post index partitioned into several shards."""
+
+    def test_pages_merge_across_shards(self, storage):
+        """Test that pages and counts cover every shard in key order."""
+        index = PostIndex(storage, shard_count=4)
+        for i in range(20):
+            entry = make_entry(f"post_{i:02d}", agent_name="a" if i % 2 else "b")
+            index.add_post({**entry, "created_at": f"2026-01-01T12:00:{i:02d}"})
+
+        shard_files = sorted(p.name for p in storage.index_dir.glob("posts_index*.json"))
+        assert shard_files == [f"posts_index.{i}-of-4.json" for i in range(4)]
+        assert sum(bool(read_shard(storage, name)) for name in shard_files) > 1
+
+        first = index.page_posts(5, offset=2)
+        rest = index.page_posts(20, after=("2026-01-01T12:00:15", "post_15"), agent_name="a")
+
+        assert [p["post_id"] for p in first] == [f"post_{i:02d}" for i in range(17, 12, -1)]
+        assert [p["post_id"] for p in rest] == [f"post_{i:02d}" for i in range(13, 0, -2)]
+        assert index.count_posts(agent_name="a") == 10
+        assert [p["post_id"] for p in index.get_all_posts()][:3] == [
+            "post_00",
+            "post_01",
+            "post_02",
+        ]
+
+    def test_changing_shard_count_redistributes_entries(self, storage):
+        """Test that reopening with another shard count keeps every entry."""
+        index = PostIndex(storage)
+        for i in range(10):
+            index.add_post(make_entry(f"post_{i}"))
+
+        sharded = PostIndex(storage, shard_count=3)
+        assert len(sharded.get_all_posts()) == 10
+
+        sharded.remove_post("post_0")
+        assert len(PostIndex(storage).get_all_posts()) == 9
+        assert len(PostIndex(storage, shard_count=3).get_all_posts()) == 9
+
+    def test_changing_shard_count_keeps_previous_files(self, storage):
+        """Test that copying entries to another layout leaves the old files alone."""
+        index = PostIndex(storage)
+        for i in range(10):
+            index.add_post(make_entry(f"post_{i}"))
+        legacy = storage.index_dir / "posts_index.json"
+        contents = legacy.read_bytes()
+
+        PostIndex(storage, shard_count=3).remove_post("post_0")
+
+        assert legacy.read_bytes() == contents
+        assert len(list(storage.index_dir.glob("posts_index.*-of-3.json"))) == 3
+
+
+class TestPostIndexTags:
+    """Test cases for the tag postings of the post index."""
+
+    @pytest.fixture
+    def tagged(self, storage):
+        """Create a sharded index with tagged posts."""
+        index = PostIndex(storage, shard_count=3)
+        tags = {
+            "post_1": ["python", "async"],
+            "post_2": ["python"],
+            "post_3": ["rust", "async"],
+            "post_4": ["rust", "async", "draft"],
+            "post_5": [],
+        }
+        for i, (post_id, post_tags) in enumerate(tags.items()):
+            entry = make_entry(post_id, tags=post_tags)
+            index.add_post({**entry, "created_at": f"2026-01-01T12:00:{i:02d}"})
+        return index
+
+    @pytest.mark.parametrize(
+        ("terms", "expected"),
+        [
+            (["python", "rust"], ["post_1", "post_2", "post_3", "post_4"]),
+            (["+python", "+async"], ["post_1"]),
+            (["python", "rust", "+async", "-draft"], ["post_1", "post_3"]),
+            (["-async"], ["post_2", "post_5"]),
+            (["+missing"], []),
+        ],
+    )
+    def test_tag_queries(self, tagged, terms, expected):
+        """Test OR, AND and NOT queries across shards, oldest first."""
+        results = tagged.search_posts(tags=TagQuery.parse(terms))
+
+        assert [p["post_id"] for p in results] == expected
+
+    def test_tag_queries_combine_with_other_filters(self, tagged):
+        """Test that tag queries respect the title and deleted filters."""
+        tagged.update_post("post_3", {**make_entry("post_3", tags=["rust"]), "deleted": True})
+        query = TagQuery.parse(["rust"])
+
+        assert [p["post_id"] for p in tagged.search_posts(tags=query)] == ["post_4"]
+        assert [p["post_id"] for p in tagged.search_posts(tags=query, include_deleted=True)] == [
+            "post_3",
+            "post_4",
+        ]
+        assert tagged.search_posts(query="title post_4", tags=query)[0]["post_id"] == "post_4"
+
+    def test_counts_follow_updates_and_removals(self, storage, tagged):
+        """Test that counts only include visible posts and survive a reload."""
+        assert tagged.tag_counts() == {"python": 2, "async": 3, "rust": 2, "draft": 1}
+
+        tagged.update_post("post_1", {**make_entry("post_1", tags=["python"]), "deleted": True})
+        tagged.update_post("post_2", make_entry("post_2", tags=["python", "web"]))
+        tagged.remove_post("post_4")
+
+        expected = {"python": 1, "async": 1, "rust": 1, "web": 1}
+        assert tagged.tag_counts() == expected
+        assert tagged.tag_count("python") == 1
+        assert tagged.tag_count("draft") == 0
+        assert PostIndex(storage, shard_count=3).tag_counts() == expected
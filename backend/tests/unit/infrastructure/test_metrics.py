@@ -0,0 +1,59 @@
+"""Unit tests for metric primitives and the Prometheus text format."""
+
+from src.infrastructure.metrics import HistogramFamily, PrometheusText
+
+
+class TestHistogramFamily:
+    """Test cases for HistogramFamily."""
+
+    def test_histograms_are_kept_per_label_values(self):
+        """Test that each combination of label values has its own histogram."""
+        family = HistogramFamily(buckets=(1.0,))
+        family.labels("get_post", "ok").observe(0.5)
+        family.labels("get_post", "ok").observe(2.0)
+        family.labels("get_post", "error").observe(0.5)
+
+        snapshots = family.snapshot()
+        assert snapshots[("get_post", "ok")].count == 2
+        assert snapshots[("get_post", "ok")].buckets == [(1.0, 1)]
+        assert snapshots[("get_post", "error")].count == 1
+
+
+class TestPrometheusText:
+    """Test cases for PrometheusText."""
+
+    def test_renders_counters_and_gauges(self):
+        """Test sample lines, label escaping and integer formatting."""
+        page = PrometheusText()
+        page.counter("bbs_reads_total", "Reads.", [({}, 3)])
+        page.gauge("bbs_ratio", "Ratio.", [({"cache": 'a"b'}, 0.25)])
+
+        assert page.render().splitlines() == [
+            "# HELP bbs_reads_total Reads.",
+            "# TYPE bbs_reads_total counter",
+            "bbs_reads_total 3",
+            "# HELP bbs_ratio Ratio.",
+            "# TYPE bbs_ratio gauge",
+            'bbs_ratio{cache="a\\"b"} 0.25',
+        ]
+
+    def test_renders_histograms_with_inf_bucket(self):
+        """Test that histograms expose cumulative buckets, sum and count."""
+        family = HistogramFamily(buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 5.0):
+            family.labels("/metrics").observe(value)
+        page = PrometheusText()
+        page.histogram(
+            "bbs_duration_seconds",
+            "Duration.",
+            [({"route": values[0]}, s) for values, s in family.snapshot().items()],
+        )
+
+        lines = page.render().splitlines()
+        assert lines[2:] == [
+            'bbs_duration_seconds_bucket{route="/metrics",le="0.1"} 1',
+            'bbs_duration_seconds_bucket{route="/metrics",le="1"} 2',
+            'bbs_duration_seconds_bucket{route="/metrics",le="+Inf"} 3',
+            'bbs_duration_seconds_sum{route="/metrics"} 5.55',
+            'bbs_duration_seconds_count{route="/metrics"} 3',
+        ]
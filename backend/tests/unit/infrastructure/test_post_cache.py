@@ -0,0 +1,123 @@
+"""Unit tests for the LRU cache and the file backend's thread cache."""
+
+import pytest
+
+from src.domain.entities.post import Post
+from src.domain.entities.reply import Reply
+from src.domain.value_objects.agent_name import AgentName
+from src.domain.value_objects.content import Content
+from src.domain.value_objects.post_id import PostId
+from src.infrastructure.lru_cache import LRUCache
+from src.infrastructure.persistence.file_storage import FileStorage
+from src.infrastructure.persistence.post_repository_impl import PostRepositoryImpl
+
+
+class TestLRUCache:
+    """Test cases for LRUCache."""
+
+    def test_evicts_least_recently_used_by_size(self):
+        """Test that entries are evicted oldest-use first once the byte budget is exceeded."""
+        cache: LRUCache[str] = LRUCache(max_bytes=100)
+        cache.put("a", "A", 40)
+        cache.put("b", "B", 40)
+        assert cache.get("a") == "A"
+
+        cache.put("c", "C", 40)
+
+        assert cache.get("b") is None
+        assert (cache.get("a"), cache.get("c")) == ("A", "C")
+        stats = cache.stats()
+        assert (stats.entries, stats.bytes, stats.evictions) == (2, 80, 1)
+        assert (stats.hits, stats.misses) == (3, 1)
+
+    def test_oversized_values_and_invalidation(self):
+        """Test that values larger than the cache are skipped and invalidation frees space."""
+        cache: LRUCache[str] = LRUCache(max_bytes=100)
+        cache.put("a", "A", 60)
+        cache.put("huge", "H", 101)
+        cache.put("a", "A2", 30)
+        cache.invalidate("a", "missing")
+
+        assert cache.get("huge") is None
+        assert cache.get("a") is None
+        stats = cache.stats()
+        assert (stats.entries, stats.bytes, stats.invalidations) == (0, 0, 1)
+
+    def test_negative_size_is_rejected(self):
+        """Test that a negative budget is rejected."""
+        with pytest.raises(ValueError):
+            LRUCache(max_bytes=-1)
+
+
+@pytest.fixture
+def cache():
+    """Create a thread cache."""
+    return LRUCache(max_bytes=1024 * 1024)
+
+
+@pytest.fixture
+def repository(tmp_path, cache):
+    """Create a file post repository with a thread cache and one stored post."""
+    repository = PostRepositoryImpl(FileStorage(tmp_path), post_cache=cache)
+    repository.save(
+        Post(
+            post_id=PostId("post_1"),
+            title="Hot thread",
+            agent_name=AgentName("test_agent"),
+            content=Content("Body"),
+        )
+    )
+    return repository
+
+
+def add_reply(repository: PostRepositoryImpl, reply_id: str) -> None:
+    """Add a top-level reply to the stored post."""
+    repository.save_reply(
+        PostId("post_1"),
+        Reply(
+            reply_id=reply_id,
+            post_id="post_1",
+            parent_id="post_1",
+            parent_type="post",
+            agent_name=AgentName("test_agent"),
+            content=Content(f"Reply {reply_id}"),
+        ),
+    )
+
+
+class TestPostCache:
+    """Test cases for caching threads in PostRepositoryImpl."""
+
+    def test_repeated_reads_are_served_from_memory(self, repository, cache):
+        """Test that a thread is read from disk once and then shared."""
+        first = repository.find_by_id(PostId("post_1"))
+        second = repository.find_by_id(PostId("post_1"))
+
+        assert second is first
+        assert (cache.stats().hits, cache.stats().misses) == (1, 1)
+        # Reads without replies are not cached
+        assert repository.find_by_id(PostId("post_1"), include_replies=False) is not first
+
+    def test_writes_invalidate(self, repository, cache):
+        """Test that adding and deleting replies and deleting the post drop the cached thread."""
+        repository.find_by_id(PostId("post_1"))
+
+        add_reply(repository, "reply_1")
+        assert [r.reply_id for r in repository.find_by_id(PostId("post_1")).replies] == ["reply_1"]
+
+        repository.delete_reply(PostId("post_1"), "reply_1")
+        assert repository.find_by_id(PostId("post_1")).replies == []
+
+        repository.delete(PostId("post_1"))
+        assert repository.find_by_id(PostId("post_1")) is None
+        assert repository.find_by_id(PostId("post_1"), include_deleted=True).deleted
+        assert cache.stats().invalidations == 3
+
+    def test_writes_by_other_processes_are_detected(self, tmp_path, repository):
+        """Test that a write through another repository instance is seen on the next read."""
+        repository.find_by_id(PostId("post_1"))
+        other = PostRepositoryImpl(FileStorage(tmp_path))
+
+        add_reply(other, "reply_1")
+
+        assert len(repository.find_by_id(PostId("post_1")).replies) == 1
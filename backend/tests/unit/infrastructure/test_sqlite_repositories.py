@@ -0,0 +1,237 @@
+"""Unit tests for the SQLite storage engine."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.domain.entities.agent import Agent
+from src.domain.entities.post import Post
+from src.domain.entities.reply import Reply
+from src.domain.exceptions.agent_exceptions import AgentAlreadyExistsException
+from src.domain.exceptions.post_exceptions import PostNotFoundException
+from src.domain.value_objects.agent_name import AgentName
+from src.domain.value_objects.content import Content
+from src.domain.value_objects.post_id import PostId
+from src.domain.value_objects.tag_query import TagQuery
+from src.domain.value_objects.tags import Tags
+from src.infrastructure.persistence.file_storage import FileStorage
+from src.infrastructure.persistence.post_repository_impl import PostRepositoryImpl
+from src.infrastructure.persistence.sqlite_agent_repository_impl import SqliteAgentRepositoryImpl
+from src.infrastructure.persistence.sqlite_database import SQLiteDatabase
+from src.infrastructure.persistence.sqlite_migration import FileTreeImporter
+from src.infrastructure.persistence.sqlite_post_repository_impl import SqlitePostRepositoryImpl
+from src.infrastructure.persistence.sqlite_search_repository_impl import (
+    SqliteSearchRepositoryImpl,
+)
+
+BASE_TIME = datetime(2026, 1, 1, 12, 0, 0)
+
+
+def make_post(post_id: str, agent: str = "test_agent", minutes: int = 0, **kwargs) -> Post:
+    """Create a post with a deterministic creation time."""
+    created_at = BASE_TIME + timedelta(minutes=minutes)
+    return Post(
+        post_id=PostId(post_id),
+        title=kwargs.get("title", f"Title {post_id}"),
+        agent_name=AgentName(agent),
+        content=Content(kwargs.get("content", "Body")),
+        tags=Tags(kwargs.get("tags", [])),
+        created_at=created_at,
+        updated_at=created_at,
+    )
+
+
+def make_reply(reply_id: str, post_id: str, parent_id: str, agent: str = "test_agent") -> Reply:
+    """Create a reply."""
+    return Reply(
+        reply_id=reply_id,
+        post_id=post_id,
+        parent_id=parent_id,
+        parent_type="post" if parent_id == post_id else "reply",
+        agent_name=AgentName(agent),
+        content=Content(f"Reply {reply_id}"),
+    )
+
+
+@pytest.fixture
+def database(tmp_path):
+    """Create a fresh SQLite database."""
+    return SQLiteDatabase(tmp_path / "bbs.sqlite3")
+
+
+@pytest.fixture
+def post_repo(database):
+    """Create a SQLite post repository."""
+    return SqlitePostRepositoryImpl(database)
+
+
+class TestSqliteDatabase:
+    """Test cases for SQLite connection management."""
+
+    def test_uses_wal_journal_mode(self, database):
+        """Test that connections run in WAL mode."""
+        mode = database.connection().execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode == "wal"
+
+
+class TestSqlitePostRepository:
+    """Test cases for SqlitePostRepositoryImpl."""
+
+    def test_save_and_find_post(self, post_repo):
+        """Test round-tripping a post."""
+        post_repo.save(make_post("post_1", tags=["python", "ai"]))
+
+        post = post_repo.find_by_id(PostId("post_1"))
+
+        assert post is not None
+        assert post.title == "Title post_1"
+        assert post.tags.values == ["python", "ai"]
+        assert post.created_at == BASE_TIME
+
+    def test_find_missing_post_returns_none(self, post_repo):
+        """Test that unknown posts are not found."""
+        assert post_repo.find_by_id(PostId("missing")) is None
+
+    def test_nested_reply_tree(self, post_repo):
+        """Test that nested replies are assembled into a tree."""
+        post_repo.save(make_post("post_1"))
+        post_repo.save_reply(PostId("post_1"), make_reply("reply_a", "post_1", "post_1"))
+        post_repo.save_reply(PostId("post_1"), make_reply("reply_b", "post_1", "reply_a"))
+
+        post = post_repo.find_by_id(PostId("post_1"))
+
+        assert post is not None
+        assert [r.reply_id for r in post.replies] == ["reply_a"]
+        assert [r.reply_id for r in post.replies[0].replies] == ["reply_b"]
+        assert post.reply_count == 2
+
+    def test_save_reply_to_missing_post_raises(self, post_repo):
+        """Test that replying to an unknown post fails."""
+        with pytest.raises(PostNotFoundException):
+            post_repo.save_reply(PostId("missing"), make_reply("reply_a", "missing", "missing"))
+
+    def test_find_all_orders_newest_first_with_paging(self, post_repo):
+        """Test ordering, offset and limit."""
+        for i in range(5):
+            post_repo.save(make_post(f"post_{i}", minutes=i))
+
+        posts = post_repo.find_all(limit=2, offset=1)
+
+        assert [p.post_id.value for p in posts] == ["post_3", "post_2"]
+
+    def test_soft_delete_hides_post(self, post_repo):
+        """Test that deleted posts are excluded by default."""
+        post_repo.save(make_post("post_1"))
+        post_repo.save(make_post("post_2", minutes=1))
+
+        post_repo.delete(PostId("post_1"))
+
+        assert post_repo.find_by_id(PostId("post_1")) is None
+        assert post_repo.find_by_id(PostId("post_1"), include_deleted=True).deleted
+        assert post_repo.count_posts() == 1
+        assert post_repo.count_posts(include_deleted=True) == 2
+
+    def test_delete_reply_hides_subtree(self, post_repo):
+        """Test that a deleted reply hides its nested replies."""
+        post_repo.save(make_post("post_1"))
+        post_repo.save_reply(PostId("post_1"), make_reply("reply_a", "post_1", "post_1"))
+        post_repo.save_reply(PostId("post_1"), make_reply("reply_b", "post_1", "reply_a"))
+
+        post_repo.delete_reply(PostId("post_1"), "reply_a")
+
+        assert post_repo.find_by_id(PostId("post_1")).reply_count == 0
+        assert post_repo.find_reply_by_id(PostId("post_1"), "reply_a").deleted
+
+
+class TestSqliteAgentRepository:
+    """Test cases for SqliteAgentRepositoryImpl."""
+
+    def test_save_twice_raises(self, database):
+        """Test that agent names are unique."""
+        repo = SqliteAgentRepositoryImpl(database)
+        repo.save(Agent(name=AgentName("test_agent"), description="First"))
+
+        with pytest.raises(AgentAlreadyExistsException):
+            repo.save(Agent(name=AgentName("test_agent"), description="Second"))
+
+    def test_counts_exclude_deleted(self, database, post_repo):
+        """Test that rebuilt post and reply counters exclude deleted posts."""
+        repo = SqliteAgentRepositoryImpl(database)
+        repo.save(Agent(name=AgentName("test_agent"), description="Test"))
+        post_repo.save(make_post("post_1"))
+        post_repo.save(make_post("post_2", minutes=1))
+        post_repo.save_reply(PostId("post_1"), make_reply("reply_a", "post_1", "post_1"))
+        post_repo.delete(PostId("post_2"))
+
+        assert repo.rebuild_stats() == 1
+        assert repo.get_post_count(AgentName("test_agent")) == 1
+        assert repo.get_reply_count(AgentName("test_agent")) == 1
+        assert repo.get_stats(AgentName("test_agent")).deleted_count == 1
+
+    def test_update_stats(self, database):
+        """Test that counter updates accumulate and keep the latest activity."""
+        repo = SqliteAgentRepositoryImpl(database)
+        repo.save(Agent(name=AgentName("test_agent"), description="Test"))
+        name = AgentName("test_agent")
+
+        repo.update_stats(name, post_delta=1, active_at=datetime(2026, 2, 1))
+        repo.update_stats(name, post_delta=-1, deleted_delta=1, active_at=datetime(2026, 1, 1))
+
+        stats = repo.get_stats(name)
+        assert (stats.post_count, stats.deleted_count) == (0, 1)
+        assert stats.last_active_at == datetime(2026, 2, 1)
+
+
+class TestSqliteSearchRepository:
+    """Test cases for SqliteSearchRepositoryImpl."""
+
+    def test_search_by_title_and_tags(self, database, post_repo):
+        """Test title and tag filters."""
+        search_repo = SqliteSearchRepositoryImpl(database, post_repo)
+        post_repo.save(make_post("post_1", title="Hello World", tags=["intro"]))
+        post_repo.save(make_post("post_2", title="Other", tags=["misc"], minutes=1))
+
+        assert [p.post_id for p in search_repo.search_posts(query="hello")] == ["post_1"]
+        assert [p.post_id for p in search_repo.search_posts(tags=TagQuery(["misc"]))] == ["post_2"]
+
+    def test_tag_queries_and_counts(self, database, post_repo):
+        """Test AND and NOT tag queries and per-tag counts of visible posts."""
+        search_repo = SqliteSearchRepositoryImpl(database, post_repo)
+        post_repo.save(make_post("post_1", tags=["python", "async"]))
+        post_repo.save(make_post("post_2", tags=["python"], minutes=1))
+        post_repo.save(make_post("post_3", tags=["rust", "async", "draft"], minutes=2))
+        deleted = make_post("post_4", tags=["rust"], minutes=3)
+        deleted.soft_delete()
+        post_repo.save(deleted)
+
+        def search(*terms: str) -> list[str]:
+            return [p.post_id for p in search_repo.search_posts(tags=TagQuery.parse(terms))]
+
+        assert search("+python", "+async") == ["post_1"]
+        assert search("python", "rust", "-draft") == ["post_2", "post_1"]
+        assert search("-async") == ["post_2"]
+        assert search_repo.tag_counts() == [("async", 2), ("python", 2), ("draft", 1), ("rust", 1)]
+        assert search_repo.tag_counts(limit=1) == [("async", 2)]
+
+
+class TestFileTreeImporter:
+    """Test cases for importing a file data tree into SQLite."""
+
+    def test_import_is_idempotent(self, tmp_path, database, post_repo):
+        """Test importing posts with nested replies twice."""
+        storage = FileStorage(tmp_path / "data")
+        file_repo = PostRepositoryImpl(storage)
+        post = make_post("post_1")
+        reply = make_reply("reply_a", "post_1", "post_1")
+        reply.add_reply(make_reply("reply_b", "post_1", "reply_a"))
+        post.add_reply(reply)
+        file_repo.save(post)
+
+        FileTreeImporter(storage, database).run()
+        report = FileTreeImporter(storage, database).run()
+
+        imported = post_repo.find_by_id(PostId("post_1"))
+        assert report.posts == 1
+        assert report.replies == 2
+        assert imported.reply_count == 2
+        assert post_repo.count_posts() == 1
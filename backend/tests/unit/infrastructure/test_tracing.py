@@ -0,0 +1,121 @@
+"""Unit tests for request tracing."""
+
+import json
+
+import pytest
+
+from src.infrastructure.tracing import (
+    JsonlSpanExporter,
+    Tracer,
+    add_span,
+    configure_tracing,
+    current_span,
+    span,
+    start_trace,
+    traced,
+)
+
+
+@pytest.fixture
+def trace_file(tmp_path):
+    """Path traces are exported to; tracing is disabled again afterwards."""
+    yield tmp_path / "traces.jsonl"
+    configure_tracing(None)
+
+
+def exported_spans(path) -> list[list[dict]]:
+    """Read the spans of every exported trace."""
+    traces = []
+    for line in path.read_text().splitlines():
+        request = json.loads(line)
+        traces.append(request["resourceSpans"][0]["scopeSpans"][0]["spans"])
+    return traces
+
+
+class TestTracing:
+    """Test cases for spans, sampling and export."""
+
+    def test_spans_nest_under_the_root(self, trace_file):
+        """Test that nested spans record their parents and attributes."""
+        configure_tracing(Tracer(JsonlSpanExporter(trace_file), sample_rate=1.0))
+
+        @traced("repository.load")
+        def load() -> None:
+            with span("storage.read_json", **{"bbs.bytes": 42}) as read:
+                assert current_span() is read
+            add_span("executor.queue_wait", 1, 2)
+
+        with start_trace("GET /posts", **{"http.request.method": "GET"}) as root:
+            load()
+            root.set("http.response.status_code", 200)
+
+        [spans] = exported_spans(trace_file)
+        by_name = {s["name"]: s for s in spans}
+        assert set(by_name) == {
+            "GET /posts",
+            "repository.load",
+            "storage.read_json",
+            "executor.queue_wait",
+        }
+        root_span = by_name["GET /posts"]
+        assert "parentSpanId" not in root_span
+        assert root_span["kind"] == 2
+        assert {"key": "http.response.status_code", "value": {"intValue": "200"}} in root_span[
+            "attributes"
+        ]
+        assert by_name["repository.load"]["parentSpanId"] == root_span["spanId"]
+        assert by_name["storage.read_json"]["parentSpanId"] == by_name["repository.load"]["spanId"]
+        assert by_name["storage.read_json"]["attributes"] == [
+            {"key": "bbs.bytes", "value": {"intValue": "42"}}
+        ]
+        assert by_name["executor.queue_wait"]["startTimeUnixNano"] == "1"
+        assert len({s["traceId"] for s in spans}) == 1
+
+    def test_errors_set_the_span_status(self, trace_file):
+        """Test that an exception marks its spans as failed."""
+        configure_tracing(Tracer(JsonlSpanExporter(trace_file), sample_rate=1.0))
+
+        with pytest.raises(KeyError), start_trace("call"), span("inner"):
+            raise KeyError("missing")
+
+        [spans] = exported_spans(trace_file)
+        assert all(s["status"] == {"code": 2, "message": "KeyError"} for s in spans)
+
+    def test_unsampled_requests_record_nothing(self, trace_file):
+        """Test that spans outside a sampled trace are no-ops."""
+        configure_tracing(Tracer(JsonlSpanExporter(trace_file), sample_rate=0.0))
+
+        with start_trace("GET /posts") as root, span("storage.read_json") as inner:
+            assert root is None
+            assert inner is None
+            assert current_span() is None
+
+        assert not trace_file.exists()
+
+    def test_fast_traces_are_not_exported(self, trace_file):
+        """Test that traces below the minimum duration are filtered out."""
+        configure_tracing(
+            Tracer(JsonlSpanExporter(trace_file), sample_rate=1.0, min_duration_ms=60_000)
+        )
+
+        with start_trace("GET /posts"), span("storage.read_json"):
+            pass
+
+        assert not trace_file.exists()
+
+    def test_traces_start_new_roots(self, trace_file):
+        """Test that a trace started inside another one is exported on its own."""
+        configure_tracing(Tracer(JsonlSpanExporter(trace_file), sample_rate=1.0))
+
+        with start_trace("POST /mcp"), start_trace("mcp.tool create_post"):
+            pass
+
+        inner, outer = exported_spans(trace_file)
+        assert [s["name"] for s in inner] == ["mcp.tool create_post"]
+        assert [s["name"] for s in outer] == ["POST /mcp"]
+        assert "parentSpanId" not in inner[0]
+
+    def test_invalid_sample_rate(self, trace_file):
+        """Test that sample rates outside 0..1 are rejected."""
+        with pytest.raises(ValueError):
+            Tracer(JsonlSpanExporter(trace_file), sample_rate=1.5)
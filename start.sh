@@ -156,6 +156,14 @@ start_backend() {
     cd "$BACKEND_DIR"
 
     if [ "$MODE" = "prod" ]; then
+        # The event outbox belongs to a single server process per data directory
+        case "${BBS_EVENT_OUTBOX:-0}" in
+            1|true|yes|TRUE|YES|True|Yes)
+                log_error "BBS_EVENT_OUTBOX is not supported with multiple workers (--prod)"
+                return 1
+                ;;
+        esac
+
         # Production mode: run with multiple workers
         uv run uvicorn src.interfaces.api.main:app \
             --host 0.0.0.0 \